@@ -1,12 +1,18 @@
 """FastAPI アプリケーション - REST API エンドポイント"""
+import asyncio
+import atexit
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
+import json
+import os
+import time
 from pathlib import Path
-from typing import Callable, Dict, Any, Optional, List
+from typing import Annotated, AsyncIterator, Callable, Dict, Any, Literal, Optional, List
 from uuid import uuid4
 
-from fastapi import FastAPI, HTTPException, Body, Query, status
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Body, Header, Query, status
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 import sys
@@ -15,24 +21,51 @@ import sys
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from infrastructure.scenario.file_finder import ScenarioFileFinder
-from infrastructure.scenario.loader_registry import ScenarioLoaderRegistry
+from infrastructure.scenario.scenario_catalog import ScenarioCatalog
 from infrastructure.secrets.env_secret_provider import EnvSecretProvider
 from infrastructure.secrets.dict_secret_provider import DictSecretProvider
+from infrastructure.logging.async_log_writer import AsyncLogWriter
 from infrastructure.logging.console_logger import ConsoleLogger
 from infrastructure.logging.composite_logger import CompositeLogger
+from infrastructure.logging.run_log_feed import RunLogFeed
 from infrastructure.logging.run_log_logger import RunLogLogger
-from infrastructure.http.http_artifact_saver import HttpArtifactSaver
+from infrastructure.http.artifact_store import ArtifactRetention, ArtifactStore
+from infrastructure.http.flight_recorder import FlightRecorder
 from infrastructure.idempotency.in_memory_idempotency_store import InMemoryIdempotencyStore
+from infrastructure.metrics import WebPostMetrics
+from infrastructure.retention import RetentionPolicy, RetentionReaper
 from infrastructure.run.in_memory_run_log_store import InMemoryRunLogStore
 from infrastructure.run.in_memory_run_repository import InMemoryRunRepository
+from infrastructure.run.bounded_run_scheduler import BoundedRunScheduler
 from infrastructure.run.in_memory_run_scheduler import InMemoryRunScheduler
+from infrastructure.run.sqlite_run_log_store import SqliteRunLogStore
+from infrastructure.run.sqlite_run_repository import SqliteRunRepository
+from infrastructure.run.asyncio_run_scheduler import AsyncioRunScheduler
+from infrastructure.run.process_pool_run_scheduler import ProcessPoolRunScheduler
+from infrastructure.run.run_event_forwarding import RunEventApplier
+from infrastructure.http.httpx_async_http_client import HttpxAsyncHttpClient, HttpxConnectionPool
+from infrastructure.http.rate_limited_http_client import RateLimitedAsyncHttpClient, RateLimitedHttpClient
+from infrastructure.http.rate_limiter import InMemoryRateLimiter, RedisRateLimiter
 from infrastructure.url.base_url_resolver import BaseUrlResolver
-from application.ports.requests_client import RequestsSessionHttpClient
+from application.ports.async_http_client import AsyncHttpClientPort
+from application.ports.browser_client import BrowserClientPort
+from application.ports.http_client import HttpClientPort
+from application.ports.logger import LogLevelPolicy
+from application.ports.metrics import NullRunMetrics, RunMetricsPort
+from application.ports.rate_limiter import RateLimiterPort
+from application.ports.requests_client import RequestsConnectionPool, RequestsSessionHttpClient
+from application.ports.run_scheduler import NullRunSlot, RunQueueFullError
 from application.services.execution_deps import ExecutionDeps, SecretProviderPort
 from application.services.template_renderer import TemplateRenderer
+from application.services.server_clock import ServerClockRegistry
+from application.services.phase_profiler import PhaseProfiler
+from application.services.response_body import BodyLimits
+from application.services.trace_pipeline import TracePipeline
 from application.executor.handler_registry import HandlerRegistry
-from application.executor.step_executor import StepExecutor
+from application.executor.step_executor import ExecutionResult, StepExecutor
+from application.executor.async_step_executor import AsyncStepExecutor
+from application.handlers.async_base import AsyncStepHandler, SyncStepHandlerAdapter
+from application.handlers.async_http_handler import AsyncHttpStepHandler
 from application.handlers.http_handler import HttpStepHandler
 from application.handlers.browser_handler import BrowserStepHandler
 from application.handlers.scrape_handler import ScrapeStepHandler
@@ -43,12 +76,15 @@ from application.services.scenario_input_validator import ScenarioInputValidator
 from application.services.idempotency_service import IdempotencyService
 from application.services.execution_error_builder import ExecutionErrorBuilder
 from application.exceptions import IdempotencyError
-from domain.run import RunContext
+from domain.run import RunBarrier, RunContext
 from domain.exceptions import ValidationError
 from domain.ids import IdempotencyKey
 from domain.run_record import RunRecord, RunStatus
+from domain.scenario import HttpRateLimit
 from domain.steps.browser import BrowserStep
-from infrastructure.browser.playwright_browser_client import PlaywrightBrowserClient
+from infrastructure.browser.browser_pool import BrowserPool
+from infrastructure.browser.playwright_browser_client import PlaywrightBrowserClient, context_options
+from api.process_worker import execute_run as execute_run_in_worker, init_worker as init_process_worker
 
 
 # リクエストモデル
@@ -64,6 +100,22 @@ class RunScenarioRequest(BaseModel):
         default=None,
         description="Prevent duplicate executions when provided.",
     )
+    fire_at: Optional[datetime] = Field(
+        default=None,
+        description="Scheduled run: wall-clock time (UTC if no offset) at which barrier_step_id is released.",
+    )
+    barrier_step_id: Optional[str] = Field(
+        default=None,
+        description="Scheduled run: steps before this one run immediately; this step waits for fire_at.",
+    )
+    fire_at_clock: Literal["local", "server"] = Field(
+        default="local",
+        description="Clock fire_at refers to: local, or the barrier step's server (estimated from Date headers).",
+    )
+    profile: bool = Field(
+        default=False,
+        description="Record per-phase timings (render, http, decode, trace ...) in step.end logs and the run record.",
+    )
 
 
 class ErrorDetailResponse(BaseModel):
@@ -98,6 +150,7 @@ class RunStatusResponse(BaseModel):
     status: str = Field(description="Run status")
     result: Optional[Dict[str, Any]] = Field(default=None, description="Run result")
     error: Optional[str] = Field(default=None, description="Run error")
+    phases: Optional[Dict[str, Any]] = Field(default=None, description="Per-phase timings of a profiled run")
     created_at: datetime = Field(description="Creation timestamp")
     updated_at: datetime = Field(description="Update timestamp")
 
@@ -107,6 +160,7 @@ class RunLogEntryResponse(BaseModel):
     timestamp: datetime = Field(description="Log timestamp")
     event: str = Field(description="Log event name")
     fields: Dict[str, Any] = Field(description="Log payload")
+    cursor: int = Field(description="Pass as ?since= to fetch only entries after this one")
 
 
 @dataclass(frozen=True)
@@ -125,13 +179,268 @@ app = FastAPI(
 )
 
 # 設定
-SCENARIOS_DIR = Path(__file__).parent.parent / "scenarios"
+SCENARIOS_DIR = Path(os.getenv("WEBPOST_SCENARIOS_DIR", str(Path(__file__).parent.parent / "scenarios")))
 TMP_DIR = Path(__file__).parent.parent / "tmp"
-IDEMPOTENCY_STORE = InMemoryIdempotencyStore()
-RUN_REPOSITORY = InMemoryRunRepository()
-RUN_LOG_STORE = InMemoryRunLogStore()
-RUN_SCHEDULER = InMemoryRunScheduler()
+SCENARIO_CATALOG = ScenarioCatalog(SCENARIOS_DIR)
 MAX_WAIT_SEC = 30
+# Profile every run's phases, not only runs that ask for it (request.profile)
+PROFILE_PHASES = os.getenv("WEBPOST_PROFILE_PHASES", "0").lower() in ("1", "true", "yes")
+# How far ahead a scheduled run may be booked (it holds a run slot while waiting)
+MAX_SCHEDULE_AHEAD_SEC = float(os.getenv("WEBPOST_MAX_SCHEDULE_AHEAD_SEC", "3600"))
+
+# Console log sink: "async" (queued, written in batches by a writer thread) or "sync" (print per event)
+LOG_WRITER_MODE = os.getenv("WEBPOST_LOG_WRITER", "async")
+LOG_FILE = os.getenv("WEBPOST_LOG_FILE") or None
+LOG_QUEUE_SIZE = int(os.getenv("WEBPOST_LOG_QUEUE_SIZE", "10000"))
+LOG_BATCH_SIZE = int(os.getenv("WEBPOST_LOG_BATCH_SIZE", "256"))
+# Minimum level for console and run logs ("debug" / "info" / "warning" / "error"),
+# with per-event overrides such as "scrape=debug,http.form_composed=debug"
+LOG_LEVELS = LogLevelPolicy.parse(
+    os.getenv("WEBPOST_LOG_LEVEL", "debug"),
+    os.getenv("WEBPOST_LOG_EVENT_LEVELS"),
+)
+
+
+def _build_log_writer() -> Optional[AsyncLogWriter]:
+    if LOG_WRITER_MODE != "async":
+        return None
+    writer = AsyncLogWriter(path=LOG_FILE, max_queue=LOG_QUEUE_SIZE, batch_size=LOG_BATCH_SIZE)
+    atexit.register(writer.close)
+    return writer
+
+
+LOG_WRITER = _build_log_writer()
+CONSOLE_LOGGER = ConsoleLogger(writer=LOG_WRITER, levels=LOG_LEVELS)
+
+# Retention of in-memory state: finished runs (and their logs) and idempotency keys
+RUN_TTL_SEC = float(os.getenv("WEBPOST_RUN_TTL_SEC", "86400"))
+RUN_MAX_RECORDS = int(os.getenv("WEBPOST_RUN_MAX_RECORDS", "10000"))
+IDEMPOTENCY_TTL_SEC = float(os.getenv("WEBPOST_IDEMPOTENCY_TTL_SEC", "86400"))
+IDEMPOTENCY_MAX_KEYS = int(os.getenv("WEBPOST_IDEMPOTENCY_MAX_KEYS", "100000"))
+RETENTION_INTERVAL_SEC = float(os.getenv("WEBPOST_RETENTION_INTERVAL_SEC", "60"))
+RUN_RETENTION = RetentionPolicy(ttl_sec=RUN_TTL_SEC, max_entries=RUN_MAX_RECORDS)
+
+IDEMPOTENCY_STORE = InMemoryIdempotencyStore(
+    policy=RetentionPolicy(ttl_sec=IDEMPOTENCY_TTL_SEC, max_entries=IDEMPOTENCY_MAX_KEYS)
+)
+
+# Run history store: "memory" (lost on restart) or "sqlite" (file at WEBPOST_RUN_DB_PATH)
+RUN_STORE = os.getenv("WEBPOST_RUN_STORE", "memory")
+RUN_DB_PATH = Path(os.getenv("WEBPOST_RUN_DB_PATH", str(TMP_DIR / "runs.sqlite3")))
+RUN_LOG_BATCH_SIZE = int(os.getenv("WEBPOST_RUN_LOG_BATCH_SIZE", "100"))
+
+
+def _build_run_repository():
+    if RUN_STORE == "sqlite":
+        return SqliteRunRepository(RUN_DB_PATH)
+    return InMemoryRunRepository(policy=RUN_RETENTION)
+
+
+def _build_run_log_store():
+    if RUN_STORE == "sqlite":
+        return SqliteRunLogStore(RUN_DB_PATH, batch_size=RUN_LOG_BATCH_SIZE)
+    return InMemoryRunLogStore(policy=RUN_RETENTION)
+
+
+RUN_REPOSITORY = _build_run_repository()
+RUN_LOG_STORE = _build_run_log_store()
+RUN_LOG_FEED = RunLogFeed()
+# HTTP artifacts (request/response manifests + deduplicated gzip bodies) of every run
+ARTIFACT_DIR = Path(os.getenv("WEBPOST_ARTIFACT_DIR", str(TMP_DIR / "http")))
+ARTIFACT_TTL_SEC = float(os.getenv("WEBPOST_ARTIFACT_TTL_SEC", "86400"))
+ARTIFACT_MAX_BYTES = int(os.getenv("WEBPOST_ARTIFACT_MAX_BYTES", str(1024 * 1024 * 1024)))
+ARTIFACT_STORE = ArtifactStore(
+    ARTIFACT_DIR,
+    retention=ArtifactRetention(ttl_sec=ARTIFACT_TTL_SEC or None, max_bytes=ARTIFACT_MAX_BYTES or None),
+)
+# "always" writes every request; "failures" keeps the last requests of each run in
+# memory and writes them only for failed runs (plus WEBPOST_ARTIFACT_SAMPLE_RATE of the rest)
+ARTIFACT_MODE = os.getenv("WEBPOST_ARTIFACT_MODE", "always")
+ARTIFACT_RING_SIZE = int(os.getenv("WEBPOST_ARTIFACT_RING_SIZE", "20"))
+ARTIFACT_RING_BYTES = int(os.getenv("WEBPOST_ARTIFACT_RING_BYTES", str(8 * 1024 * 1024)))
+ARTIFACT_SAMPLE_RATE = float(os.getenv("WEBPOST_ARTIFACT_SAMPLE_RATE", "0"))
+
+
+def _build_flight_recorder() -> Optional[FlightRecorder]:
+    if ARTIFACT_MODE != "failures":
+        return None
+    return FlightRecorder(
+        ARTIFACT_STORE,
+        max_traces=ARTIFACT_RING_SIZE,
+        max_bytes=ARTIFACT_RING_BYTES,
+        sample_rate=ARTIFACT_SAMPLE_RATE,
+    )
+
+
+FLIGHT_RECORDER = _build_flight_recorder()
+# Server clock offsets learned from Date headers, kept across runs for scheduled firing
+SERVER_CLOCKS = ServerClockRegistry()
+# Exposed at GET /metrics; worker processes forward into it (see api.process_worker)
+METRICS = WebPostMetrics()
+
+
+def _build_retention_reaper() -> RetentionReaper:
+    reaper = RetentionReaper(interval_sec=RETENTION_INTERVAL_SEC, logger=CONSOLE_LOGGER)
+    reaper.register(IDEMPOTENCY_STORE)
+    reaper.register(ARTIFACT_STORE)
+    if RUN_STORE == "memory":
+        # run logs follow their run record out of memory
+        reaper.register(RUN_REPOSITORY).register(RUN_LOG_STORE).link(RUN_REPOSITORY, RUN_LOG_STORE)
+    reaper.start()
+    return reaper
+
+
+RETENTION_REAPER = _build_retention_reaper()
+LOG_STREAM_HEARTBEAT_SEC = 15.0
+# How long a stream of a finished run waits for the trailing run.end entry
+LOG_STREAM_GRACE_SEC = 0.5
+
+# Run engine: "thread" (one scheduler thread per run), "asyncio" (runs share one event loop)
+# or "process" (runs execute in worker processes, WEBPOST_RUN_WORKERS_PER_CORE per CPU)
+RUN_ENGINE = os.getenv("WEBPOST_RUN_ENGINE", "thread")
+RUN_WORKERS_PER_CORE = float(os.getenv("WEBPOST_RUN_WORKERS_PER_CORE", "1"))
+RUN_PROCESS_WORKERS = max(1, int((os.cpu_count() or 1) * RUN_WORKERS_PER_CORE))
+
+
+# Admission control: runs in flight, runs allowed to wait, and per-scenario concurrency (0 = unlimited)
+_DEFAULT_MAX_ACTIVE = {"asyncio": 64, "process": RUN_PROCESS_WORKERS}.get(RUN_ENGINE, 4)
+RUN_MAX_ACTIVE = int(os.getenv("WEBPOST_RUN_MAX_ACTIVE", str(_DEFAULT_MAX_ACTIVE)))
+RUN_QUEUE_DEPTH = int(os.getenv("WEBPOST_RUN_QUEUE_DEPTH", "100"))
+RUN_PER_SCENARIO_LIMIT = int(os.getenv("WEBPOST_RUN_PER_SCENARIO_LIMIT", "0"))
+# Scheduled runs waiting for fire_at that may lend their slot to other runs (thread / asyncio engines)
+RUN_MAX_HELD = int(os.getenv("WEBPOST_RUN_MAX_HELD", "16"))
+
+
+def _build_run_scheduler():
+    if RUN_ENGINE == "asyncio":
+        inner = AsyncioRunScheduler()
+    elif RUN_ENGINE == "process":
+        inner = ProcessPoolRunScheduler(
+            max_workers=RUN_PROCESS_WORKERS,
+            event_handler=RunEventApplier(RUN_REPOSITORY, RUN_LOG_STORE, RUN_LOG_FEED, CONSOLE_LOGGER, METRICS),
+            worker_initializer=init_process_worker,
+        )
+    else:
+        # held runs keep their thread while they wait, so the pool has room for them too
+        inner = InMemoryRunScheduler(max_workers=RUN_MAX_ACTIVE + RUN_MAX_HELD)
+    return BoundedRunScheduler(
+        inner,
+        max_active=RUN_MAX_ACTIVE,
+        max_queue_depth=RUN_QUEUE_DEPTH,
+        per_key_limit=RUN_PER_SCENARIO_LIMIT or None,
+        # a process worker holds inside its own process, which this scheduler cannot lend
+        max_held=0 if RUN_ENGINE == "process" else RUN_MAX_HELD,
+    )
+
+
+RUN_SCHEDULER = _build_run_scheduler()
+METRICS.bind_queue(
+    active=lambda: RUN_SCHEDULER.stats().active,
+    depth=lambda: RUN_SCHEDULER.stats().pending,
+)
+if LOG_WRITER is not None:
+    METRICS.bind_log_writer(
+        depth=lambda: LOG_WRITER.stats().queued,
+        dropped=lambda: LOG_WRITER.stats().dropped,
+    )
+
+# Long-lived browsers shared by browser runs, each run in its own context; 0 launches one per run
+BROWSER_POOL_SIZE = int(os.getenv("WEBPOST_BROWSER_POOL_SIZE", "2"))
+BROWSER_MAX_CONTEXTS = int(os.getenv("WEBPOST_BROWSER_MAX_CONTEXTS", "50"))
+BROWSER_MAX_RSS_BYTES = int(os.getenv("WEBPOST_BROWSER_MAX_RSS_BYTES", "0")) or None
+BROWSER_ACQUIRE_TIMEOUT_SEC = float(os.getenv("WEBPOST_BROWSER_ACQUIRE_TIMEOUT_SEC", "120"))
+
+
+def _build_browser_pool() -> Optional[BrowserPool]:
+    if BROWSER_POOL_SIZE <= 0:
+        return None
+    pool = BrowserPool(
+        size=BROWSER_POOL_SIZE,
+        headless=True,
+        max_contexts_per_browser=BROWSER_MAX_CONTEXTS,
+        max_rss_bytes=BROWSER_MAX_RSS_BYTES,
+        acquire_timeout_sec=BROWSER_ACQUIRE_TIMEOUT_SEC,
+    )
+    atexit.register(pool.close)
+    return pool
+
+
+BROWSER_POOL = _build_browser_pool()
+if BROWSER_POOL is not None:
+    METRICS.bind_browser_pool(
+        running=lambda: BROWSER_POOL.stats().running,
+        waiting=lambda: BROWSER_POOL.stats().waiting,
+    )
+
+# Connection pools shared by all runs (cookies stay per run)
+HTTP_POOL_MAXSIZE = int(os.getenv("WEBPOST_HTTP_POOL_MAXSIZE", "32"))
+HTTP_POOL_HOSTS = int(os.getenv("WEBPOST_HTTP_POOL_HOSTS", "10"))
+HTTP_CONNECTION_POOL = RequestsConnectionPool(
+    pool_connections=HTTP_POOL_HOSTS,
+    pool_maxsize=HTTP_POOL_MAXSIZE,
+)
+ASYNC_HTTP_CONNECTION_POOL = HttpxConnectionPool(max_keepalive_connections=HTTP_POOL_MAXSIZE)
+
+# Response bodies: hard cap (0 = unlimited; steps may set max_body_bytes) and
+# the size past which a body is streamed to a temp file instead of memory
+HTTP_MAX_BODY_BYTES = int(os.getenv("WEBPOST_HTTP_MAX_BODY_BYTES", "0"))
+HTTP_SPILL_BYTES = int(os.getenv("WEBPOST_HTTP_SPILL_BYTES", str(4 * 1024 * 1024)))
+HTTP_SPILL_DIR = os.getenv("WEBPOST_HTTP_SPILL_DIR") or None
+# save_to_file paths of HTTP steps are resolved inside this directory
+DOWNLOAD_DIR = Path(os.getenv("WEBPOST_DOWNLOAD_DIR", str(TMP_DIR / "downloads")))
+HTTP_BODY_LIMITS = BodyLimits(
+    max_bytes=HTTP_MAX_BODY_BYTES or None,
+    spill_bytes=HTTP_SPILL_BYTES or None,
+    spill_dir=HTTP_SPILL_DIR,
+)
+
+# Deferred trace enrichment (HTML signals, artifact files); 0 workers runs it inline
+TRACE_WORKERS = int(os.getenv("WEBPOST_TRACE_WORKERS", "2"))
+TRACE_QUEUE_SIZE = int(os.getenv("WEBPOST_TRACE_QUEUE_SIZE", "256"))
+TRACE_BATCH_SIZE = int(os.getenv("WEBPOST_TRACE_BATCH_SIZE", "16"))
+TRACE_ENRICHER_TIMEOUT_SEC = float(os.getenv("WEBPOST_TRACE_ENRICHER_TIMEOUT_SEC", "5"))
+TRACE_OVERFLOW = os.getenv("WEBPOST_TRACE_OVERFLOW", "block")
+TRACE_FLUSH_TIMEOUT_SEC = float(os.getenv("WEBPOST_TRACE_FLUSH_TIMEOUT_SEC", "10"))
+
+
+def _build_trace_pipeline() -> Optional[TracePipeline]:
+    if TRACE_WORKERS <= 0:
+        return None
+    return TracePipeline(
+        workers=TRACE_WORKERS,
+        queue_size=TRACE_QUEUE_SIZE,
+        batch_size=TRACE_BATCH_SIZE,
+        enricher_timeout_sec=TRACE_ENRICHER_TIMEOUT_SEC,
+        overflow=TRACE_OVERFLOW,
+    )
+
+
+TRACE_PIPELINE = _build_trace_pipeline()
+
+# Per-host pacing shared by all runs: "memory" (this process) or "redis" (all processes)
+RATE_LIMITER_BACKEND = os.getenv("WEBPOST_RATE_LIMITER", "memory")
+REDIS_URL = os.getenv("WEBPOST_REDIS_URL", "redis://localhost:6379/0")
+# Default limit for scenarios without defaults.http.rate_limit; 0 disables it
+HTTP_RATE_PER_SEC = float(os.getenv("WEBPOST_HTTP_RATE_PER_SEC", "0"))
+HTTP_RATE_BURST = int(os.getenv("WEBPOST_HTTP_RATE_BURST", "1"))
+
+
+def _build_rate_limiter() -> RateLimiterPort:
+    if RATE_LIMITER_BACKEND == "redis":
+        return RedisRateLimiter.from_url(REDIS_URL)
+    return InMemoryRateLimiter()
+
+
+RATE_LIMITER = _build_rate_limiter()
+
+
+def _rate_limit_for(scenario) -> Optional[HttpRateLimit]:
+    rate_limit = getattr(scenario.defaults.http, "rate_limit", None)
+    if rate_limit is not None:
+        return rate_limit
+    if HTTP_RATE_PER_SEC > 0:
+        return HttpRateLimit(rate_per_sec=HTTP_RATE_PER_SEC, burst=max(1, HTTP_RATE_BURST))
+    return None
 
 
 @app.get("/")
@@ -170,31 +479,29 @@ def _build_secret_provider_resolver() -> SecretProviderResolver:
 def _build_logger(run_id: str) -> CompositeLogger:
     return CompositeLogger(
         [
-            ConsoleLogger(),
-            RunLogLogger(run_id=run_id, log_store=RUN_LOG_STORE),
+            CONSOLE_LOGGER,
+            RunLogLogger(run_id=run_id, log_store=RUN_LOG_STORE, feed=RUN_LOG_FEED, levels=LOG_LEVELS),
         ]
     )
 
 
 def _load_scenario(scenario_id: str):
-    finder = ScenarioFileFinder(SCENARIOS_DIR)
-    scenario_file = finder.find_by_id(scenario_id)
+    scenario = SCENARIO_CATALOG.get(scenario_id)
 
-    if scenario_file is None:
+    if scenario is None:
         raise HTTPException(
             status_code=404,
             detail=f"Scenario file not found: {scenario_id}",
         )
 
-    registry = ScenarioLoaderRegistry()
-    loader = registry.get_loader(scenario_file)
-    return loader.load_from_file(scenario_file)
+    return scenario
 
 
 def _validate_request(scenario, request: RunScenarioRequest) -> None:
     # Reason: Enforce required inputs at the API boundary.
     # Impact: Missing inputs return HTTP 400 instead of runtime failures.
     ScenarioInputValidatorService.default().validate(scenario, request.vars)
+    _validate_schedule(scenario, request)
 
     # Reason: Prevent duplicate executions when the same key is supplied.
     # Impact: Requests with a reused idempotency_key return HTTP 409.
@@ -203,104 +510,289 @@ def _validate_request(scenario, request: RunScenarioRequest) -> None:
         idempotency.register_or_raise(IdempotencyKey(request.idempotency_key))
 
 
-def _build_execution_components(
+def _release_idempotency_key(request: RunScenarioRequest) -> None:
+    # Reason: A run the scheduler turned away never executed.
+    # Impact: The client may retry a 429 with the same idempotency_key.
+    if request.idempotency_key:
+        IdempotencyService(IDEMPOTENCY_STORE).release(IdempotencyKey(request.idempotency_key))
+
+
+def _validate_schedule(scenario, request: RunScenarioRequest) -> None:
+    if request.fire_at is None and request.barrier_step_id is None:
+        return
+    if request.fire_at is None or request.barrier_step_id is None:
+        raise ValidationError("fire_at and barrier_step_id must be given together")
+    if not any(step.id == request.barrier_step_id for step in scenario.steps):
+        raise ValidationError(f"barrier_step_id not found in scenario: {request.barrier_step_id}")
+    ahead = (_run_barrier(request).fire_at - datetime.now(timezone.utc)).total_seconds()
+    if ahead > MAX_SCHEDULE_AHEAD_SEC:
+        raise ValidationError(f"fire_at must be within {int(MAX_SCHEDULE_AHEAD_SEC)} seconds")
+
+
+def _run_barrier(request: RunScenarioRequest) -> Optional[RunBarrier]:
+    if request.fire_at is None or request.barrier_step_id is None:
+        return None
+    fire_at = request.fire_at
+    if fire_at.tzinfo is None:
+        fire_at = fire_at.replace(tzinfo=timezone.utc)
+    return RunBarrier(step_id=request.barrier_step_id, fire_at=fire_at, clock=request.fire_at_clock)
+
+
+def _build_deps(
     scenario,
     request: RunScenarioRequest,
     logger: CompositeLogger,
-    run_id: str,
-) -> tuple[StepExecutor, RunContext, ExecutionDeps, Optional[PlaywrightBrowserClient]]:
+    metrics: Optional[RunMetricsPort] = None,
+    profiler: Optional[PhaseProfiler] = None,
+    run_id: Optional[str] = None,
+) -> ExecutionDeps:
     resolver = _build_secret_provider_resolver()
     secret_provider = resolver.resolve(request)
     base_url = scenario.defaults.http.base_url if scenario.defaults.http else ""
     url_resolver = BaseUrlResolver(base_url)
 
-    deps = ExecutionDeps(
+    return ExecutionDeps(
         logger=logger,
         secret_provider=secret_provider,
         url_resolver=url_resolver,
+        server_clocks=SERVER_CLOCKS,
+        metrics=metrics if metrics is not None else NullRunMetrics(),
+        profiler=profiler if profiler is not None else PhaseProfiler(),
+        trace_pipeline=TRACE_PIPELINE,
+        run_slot=RUN_SCHEDULER.slot(run_id) if run_id else NullRunSlot(),
+    )
+
+
+def _build_profiler(request: RunScenarioRequest) -> PhaseProfiler:
+    return PhaseProfiler(enabled=PROFILE_PHASES or request.profile)
+
+
+def _build_context(request: RunScenarioRequest, run_id: str) -> RunContext:
+    return RunContext(
+        run_id=run_id,
+        vars=request.vars,
+        state={},
+        last=None,
+        result={},
+        barrier=_run_barrier(request),
+    )
+
+
+def _contains_browser_step(scenario) -> bool:
+    return any(
+        isinstance(step, BrowserStep) and getattr(step, "enabled", True)
+        for step in scenario.steps
+    )
+
+
+def _build_browser_client(browser_defaults) -> BrowserClientPort:
+    viewport_width = getattr(browser_defaults, "viewport_width", None)
+    viewport_height = getattr(browser_defaults, "viewport_height", None)
+    user_agent = getattr(browser_defaults, "user_agent", None)
+    locale = getattr(browser_defaults, "locale", None)
+    timezone_id = getattr(browser_defaults, "timezone_id", None)
+    if BROWSER_POOL is not None:
+        # Reason: Starting the driver and Chromium per run dominates browser scenario start-up.
+        # Impact: The run gets a fresh context on a warm browser; close() hands the browser back.
+        return BROWSER_POOL.acquire(
+            **context_options(viewport_width, viewport_height, user_agent, locale, timezone_id)
+        )
+    return PlaywrightBrowserClient(
+        headless=True,
+        viewport_width=viewport_width,
+        viewport_height=viewport_height,
+        user_agent=user_agent,
+        locale=locale,
+        timezone_id=timezone_id,
     )
 
+
+def _build_execution_components(
+    scenario,
+    request: RunScenarioRequest,
+    logger: CompositeLogger,
+    run_id: str,
+    metrics: Optional[RunMetricsPort] = None,
+    profiler: Optional[PhaseProfiler] = None,
+) -> tuple[StepExecutor, RunContext, ExecutionDeps, Optional[BrowserClientPort]]:
+    deps = _build_deps(scenario, request, logger, metrics, profiler, run_id)
+
     renderer = TemplateRenderer()
-    http_client = RequestsSessionHttpClient()
+    http_client: HttpClientPort = RequestsSessionHttpClient(pool=HTTP_CONNECTION_POOL, body_limits=HTTP_BODY_LIMITS)
+    rate_limit = _rate_limit_for(scenario)
+    if rate_limit is not None:
+        http_client = RateLimitedHttpClient(http_client, RATE_LIMITER, rate_limit)
     handlers = [
-        HttpStepHandler(http_client, renderer),
+        HttpStepHandler(
+            http_client,
+            renderer,
+            artifact_store=ARTIFACT_STORE,
+            flight_recorder=FLIGHT_RECORDER,
+            download_root=str(DOWNLOAD_DIR),
+        ),
         ScrapeStepHandler(),
         AssertStepHandler(),
         ResultStepHandler(renderer),
         LogStepHandler(renderer),
     ]
 
-    contains_browser_step = any(
-        isinstance(step, BrowserStep) and getattr(step, "enabled", True)
-        for step in scenario.steps
-    )
-    browser_client: Optional[PlaywrightBrowserClient] = None
-    if contains_browser_step:
-        browser_defaults = getattr(scenario.defaults, "browser", None)
-        browser_client = PlaywrightBrowserClient(
-            headless=True,
-            viewport_width=getattr(browser_defaults, "viewport_width", None),
-            viewport_height=getattr(browser_defaults, "viewport_height", None),
-            user_agent=getattr(browser_defaults, "user_agent", None),
-            locale=getattr(browser_defaults, "locale", None),
-            timezone_id=getattr(browser_defaults, "timezone_id", None),
-        )
+    browser_client: Optional[BrowserClientPort] = None
+    if _contains_browser_step(scenario):
+        browser_client = _build_browser_client(getattr(scenario.defaults, "browser", None))
         handlers.insert(1, BrowserStepHandler(browser_client, renderer))
     registry = HandlerRegistry(handlers)
     executor = StepExecutor(registry)
 
-    ctx = RunContext(
-        run_id=run_id,
-        vars=request.vars,
-        state={},
-        last=None,
-        result={},
-    )
+    ctx = _build_context(request, run_id)
     return executor, ctx, deps, browser_client
 
 
+def _build_async_execution_components(
+    scenario,
+    request: RunScenarioRequest,
+    logger: CompositeLogger,
+    run_id: str,
+    metrics: Optional[RunMetricsPort] = None,
+    profiler: Optional[PhaseProfiler] = None,
+) -> tuple[AsyncStepExecutor, RunContext, ExecutionDeps, AsyncHttpClientPort]:
+    deps = _build_deps(scenario, request, logger, metrics, profiler, run_id)
+
+    renderer = TemplateRenderer()
+    http_client: AsyncHttpClientPort = HttpxAsyncHttpClient(pool=ASYNC_HTTP_CONNECTION_POOL, body_limits=HTTP_BODY_LIMITS)
+    rate_limit = _rate_limit_for(scenario)
+    if rate_limit is not None:
+        http_client = RateLimitedAsyncHttpClient(http_client, RATE_LIMITER, rate_limit)
+    handlers: List[AsyncStepHandler] = [
+        AsyncHttpStepHandler(
+            http_client,
+            renderer,
+            artifact_store=ARTIFACT_STORE,
+            flight_recorder=FLIGHT_RECORDER,
+            download_root=str(DOWNLOAD_DIR),
+        ),
+        # Reason: Scraping is CPU-bound; a worker thread keeps the loop responsive.
+        # Impact: Other runs keep making network progress while a page is parsed.
+        SyncStepHandlerAdapter(ScrapeStepHandler(), offload=True),
+        SyncStepHandlerAdapter(AssertStepHandler(), offload=False),
+        SyncStepHandlerAdapter(ResultStepHandler(renderer), offload=False),
+        SyncStepHandlerAdapter(LogStepHandler(renderer), offload=False),
+    ]
+    executor = AsyncStepExecutor(HandlerRegistry(handlers))
+
+    ctx = _build_context(request, run_id)
+    return executor, ctx, deps, http_client
+
+
+def _outcome_from_result(execution_result: ExecutionResult, ctx: RunContext) -> ExecutionOutcome:
+    if not execution_result.ok:
+        detail = ExecutionErrorBuilder().build_from_result(execution_result, ctx)
+        return ExecutionOutcome(
+            ok=False,
+            result=ctx.result,
+            error=detail.message,
+            error_detail=ErrorDetailResponse(**detail.__dict__),
+        )
+    return ExecutionOutcome(ok=True, result=ctx.result, error=None, error_detail=None)
+
+
+def _outcome_from_exception(
+    exc: Exception,
+    ctx: Optional[RunContext],
+    logger: CompositeLogger,
+    scenario,
+) -> ExecutionOutcome:
+    detail = ExecutionErrorBuilder().build_from_exception(str(exc), ctx)
+    logger.error("scenario_execution_failed", error=str(exc), scenario_id=scenario.meta.id)
+    return ExecutionOutcome(
+        ok=False,
+        result=getattr(ctx, "result", None),
+        error=str(exc),
+        error_detail=ErrorDetailResponse(**detail.__dict__),
+    )
+
+
 def _execute_scenario(
     scenario,
     request: RunScenarioRequest,
     logger: CompositeLogger,
     run_id: str,
+    metrics: Optional[RunMetricsPort] = None,
+    profiler: Optional[PhaseProfiler] = None,
 ) -> ExecutionOutcome:
     ctx: Optional[RunContext] = None
-    error_builder = ExecutionErrorBuilder()
+    outcome: Optional[ExecutionOutcome] = None
 
     try:
-        executor, ctx, deps, browser_client = _build_execution_components(scenario, request, logger, run_id)
+        executor, ctx, deps, browser_client = _build_execution_components(
+            scenario, request, logger, run_id, metrics, profiler
+        )
+        if browser_client is not None:
+            METRICS.browser_opened()
         execution_result = executor.execute(scenario.steps, ctx, deps)
-        if not execution_result.ok:
-            detail = error_builder.build_from_result(execution_result, ctx)
-            return ExecutionOutcome(
-                ok=False,
-                result=ctx.result,
-                error=detail.message,
-                error_detail=ErrorDetailResponse(**detail.__dict__),
-            )
-        return ExecutionOutcome(ok=True, result=ctx.result, error=None, error_detail=None)
+        outcome = _outcome_from_result(execution_result, ctx)
+        return outcome
     except Exception as exc:
-        detail = error_builder.build_from_exception(str(exc), ctx)
-        logger.error("scenario_execution_failed", error=str(exc), scenario_id=scenario.meta.id)
-        return ExecutionOutcome(
-            ok=False,
-            result=getattr(ctx, "result", None),
-            error=str(exc),
-            error_detail=ErrorDetailResponse(**detail.__dict__),
-        )
+        outcome = _outcome_from_exception(exc, ctx, logger, scenario)
+        return outcome
     finally:
         if "browser_client" in locals() and browser_client is not None:
             browser_client.close()
+            METRICS.browser_closed()
+        _flush_traces(run_id, logger)
+        _finish_flight_recording(run_id, outcome, logger)
+
+
+async def _execute_scenario_async(
+    scenario,
+    request: RunScenarioRequest,
+    logger: CompositeLogger,
+    run_id: str,
+    metrics: Optional[RunMetricsPort] = None,
+    profiler: Optional[PhaseProfiler] = None,
+) -> ExecutionOutcome:
+    ctx: Optional[RunContext] = None
+    http_client: Optional[AsyncHttpClientPort] = None
+    outcome: Optional[ExecutionOutcome] = None
+
+    try:
+        executor, ctx, deps, http_client = _build_async_execution_components(
+            scenario, request, logger, run_id, metrics, profiler
+        )
+        execution_result = await executor.execute(scenario.steps, ctx, deps)
+        outcome = _outcome_from_result(execution_result, ctx)
+        return outcome
+    except Exception as exc:
+        outcome = _outcome_from_exception(exc, ctx, logger, scenario)
+        return outcome
+    finally:
+        if http_client is not None:
+            await http_client.aclose()
+        await asyncio.to_thread(_flush_traces, run_id, logger)
+        await asyncio.to_thread(_finish_flight_recording, run_id, outcome, logger)
+
+
+def _flush_traces(run_id: str, logger) -> None:
+    """Wait for the run's deferred trace enrichment, so it is logged before run.end."""
+    if TRACE_PIPELINE is None:
+        return
+    if not TRACE_PIPELINE.flush(run_id, TRACE_FLUSH_TIMEOUT_SEC):
+        logger.error("http.trace.flush_timeout", timeout_sec=TRACE_FLUSH_TIMEOUT_SEC)
+
+
+def _finish_flight_recording(run_id: str, outcome: Optional[ExecutionOutcome], logger) -> None:
+    """Write the run's buffered traces if it failed (or is sampled) and release its ring; after _flush_traces."""
+    if FLIGHT_RECORDER is None:
+        return
+    FLIGHT_RECORDER.finish(run_id, failed=outcome is None or not outcome.ok, logger=logger)
 
 
-def _create_run_record(scenario_id: str, run_id: str) -> RunRecord:
+def _create_run_record(scenario_id: str, run_id: str, created_at: Optional[datetime] = None) -> RunRecord:
     now = datetime.now(timezone.utc)
     return RunRecord(
         run_id=run_id,
         scenario_id=scenario_id,
         status=RunStatus.QUEUED,
-        created_at=now,
+        created_at=created_at or now,
         updated_at=now,
         result=None,
         error=None,
@@ -327,22 +819,41 @@ def _build_response_from_record(record: RunRecord) -> RunScenarioResponse:
     )
 
 
-def _execute_async_run(
-    scenario_id: str,
-    scenario,
-    request: RunScenarioRequest,
-    run_id: str,
-) -> None:
+def _start_run(run_id: str, scenario_id: str):
     logger = _build_logger(run_id).bind(run_id=run_id)
     logger.info("run.start", scenario_id=scenario_id)
 
     try:
-        RUN_REPOSITORY.transition_status(run_id, RunStatus.QUEUED, RunStatus.RUNNING)
+        record = RUN_REPOSITORY.transition_status(run_id, RunStatus.QUEUED, RunStatus.RUNNING)
     except Exception as exc:
         logger.error("run.transition_failed", error=str(exc), run_id=run_id)
+        return None
+    METRICS.observe_queue_wait(scenario_id, (record.updated_at - record.created_at).total_seconds())
+    return logger
+
+
+def _record_phases(run_id: Optional[str], profiler: PhaseProfiler, logger) -> None:
+    if not profiler.enabled:
         return
+    phases = profiler.snapshot()
+    logger.info("run.phases", phases=phases)
+    if run_id is not None:
+        RUN_REPOSITORY.update_phases(run_id, phases)
+
 
-    outcome = _execute_scenario(scenario, request, logger, run_id)
+def _finish_run(
+    run_id: str,
+    scenario_id: str,
+    outcome: ExecutionOutcome,
+    logger,
+    started: float,
+    profiler: Optional[PhaseProfiler] = None,
+) -> None:
+    status = RunStatus.SUCCEEDED if outcome.ok else RunStatus.FAILED
+    METRICS.observe_run(scenario_id, status.value, time.perf_counter() - started)
+    if profiler is not None:
+        # before the final transition, so a waiting client sees the phases
+        _record_phases(run_id, profiler, logger)
     if outcome.ok:
         RUN_REPOSITORY.transition_status(
             run_id,
@@ -351,6 +862,7 @@ def _execute_async_run(
             result=outcome.result,
         )
         logger.info("run.end", status=RunStatus.SUCCEEDED.value)
+        RUN_LOG_STORE.flush()
         return
 
     error_detail = outcome.error_detail.model_dump() if outcome.error_detail else None
@@ -363,6 +875,57 @@ def _execute_async_run(
         error_detail=error_detail,
     )
     logger.info("run.end", status=RunStatus.FAILED.value)
+    RUN_LOG_STORE.flush()
+
+
+def _execute_async_run(
+    scenario_id: str,
+    scenario,
+    request: RunScenarioRequest,
+    run_id: str,
+) -> None:
+    logger = _start_run(run_id, scenario_id)
+    if logger is None:
+        return
+
+    started = time.perf_counter()
+    profiler = _build_profiler(request)
+    outcome = _execute_scenario(scenario, request, logger, run_id, METRICS.for_run(scenario_id), profiler)
+    _finish_run(run_id, scenario_id, outcome, logger, started, profiler)
+
+
+async def _execute_async_run_async(
+    scenario_id: str,
+    scenario,
+    request: RunScenarioRequest,
+    run_id: str,
+) -> None:
+    logger = _start_run(run_id, scenario_id)
+    if logger is None:
+        return
+
+    started = time.perf_counter()
+    profiler = _build_profiler(request)
+    outcome = await _execute_scenario_async(
+        scenario, request, logger, run_id, METRICS.for_run(scenario_id), profiler
+    )
+    _finish_run(run_id, scenario_id, outcome, logger, started, profiler)
+
+
+def _build_run_task(
+    scenario_id: str,
+    scenario,
+    request: RunScenarioRequest,
+    run_id: str,
+) -> Callable[[], Any]:
+    if RUN_ENGINE == "process":
+        # the worker loads the scenario from its own preloaded catalog
+        return partial(execute_run_in_worker, scenario_id, request, run_id, datetime.now(timezone.utc))
+    # Reason: Playwright's sync client is bound to the thread that created it.
+    # Impact: Browser scenarios keep the thread-per-run path on the asyncio engine.
+    if RUN_ENGINE == "asyncio" and not _contains_browser_step(scenario):
+        return partial(_execute_async_run_async, scenario_id, scenario, request, run_id)
+    return partial(_execute_async_run, scenario_id, scenario, request, run_id)
 
 
 @app.post("/scenarios/{scenario_id}/runs", response_model=RunScenarioResponse)
@@ -382,7 +945,7 @@ def run_scenario(
         実行結果
     """
     ctx: Optional[RunContext] = None
-    logger = ConsoleLogger()
+    logger = CONSOLE_LOGGER
 
     try:
         if not isinstance(wait_sec, int) and hasattr(wait_sec, "default"):
@@ -392,33 +955,39 @@ def run_scenario(
                 status_code=400,
                 detail=f"wait_sec must be <= {MAX_WAIT_SEC}",
             )
+        # Reason: A scheduled run may sit up to MAX_SCHEDULE_AHEAD_SEC before its barrier fires.
+        # Impact: It must be queued (wait_sec given) instead of holding the HTTP worker that long.
+        if wait_sec is None and (request.fire_at is not None or request.barrier_step_id is not None):
+            raise HTTPException(
+                status_code=400,
+                detail="fire_at and barrier_step_id require wait_sec",
+            )
 
         scenario = _load_scenario(scenario_id)
         _validate_request(scenario, request)
 
-        if wait_sec is None:
-            run_id = uuid4().hex
-            logger = _build_logger(run_id)
-            outcome = _execute_scenario(scenario, request, logger, run_id)
-            if not outcome.ok:
-                return RunScenarioResponse(
-                    success=False,
-                    result=outcome.result,
-                    error=outcome.error,
-                    error_detail=outcome.error_detail,
-                )
-            return RunScenarioResponse(success=True, result=outcome.result)
-
         run_id = uuid4().hex
         record = _create_run_record(scenario_id, run_id)
         RUN_REPOSITORY.create(record)
 
-        RUN_SCHEDULER.submit(
-            run_id,
-            lambda: _execute_async_run(scenario_id, scenario, request, run_id),
-        )
+        try:
+            RUN_SCHEDULER.submit(
+                run_id,
+                _build_run_task(scenario_id, scenario, request, run_id),
+                concurrency_key=scenario_id,
+            )
+        except RunQueueFullError as e:
+            RUN_REPOSITORY.delete(run_id)
+            _release_idempotency_key(request)
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=str(e),
+                headers={"Retry-After": str(e.retry_after_sec)},
+            )
 
-        if wait_sec and RUN_SCHEDULER.wait(run_id, wait_sec):
+        # Reason: Synchronous runs (no wait_sec) go through the same scheduler as queued ones.
+        # Impact: They share the queue depth, per-scenario limit and 429 instead of bypassing them.
+        if wait_sec != 0 and RUN_SCHEDULER.wait(run_id, wait_sec):
             completed = RUN_REPOSITORY.get(run_id)
             if completed is None:
                 raise HTTPException(status_code=404, detail="Run not found")
@@ -451,6 +1020,18 @@ def run_scenario(
         )
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+def get_metrics() -> PlainTextResponse:
+    """Prometheus text exposition of run, step, HTTP and queue metrics"""
+    return PlainTextResponse(METRICS.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.get("/stats/retention")
+def get_retention_stats() -> List[Dict[str, Any]]:
+    """Size and eviction counters of the retained in-memory stores"""
+    return [stats.__dict__ for stats in RETENTION_REAPER.stats()]
+
+
 @app.get("/runs/{run_id}", response_model=RunStatusResponse)
 def get_run_status(run_id: str) -> RunStatusResponse:
     record = RUN_REPOSITORY.get(run_id)
@@ -461,22 +1042,92 @@ def get_run_status(run_id: str) -> RunStatusResponse:
         status=record.status.value,
         result=record.result,
         error=record.error,
+        phases=record.phases,
         created_at=record.created_at,
         updated_at=record.updated_at,
     )
 
 
 @app.get("/runs/{run_id}/logs", response_model=List[RunLogEntryResponse])
-def get_run_logs(run_id: str) -> List[RunLogEntryResponse]:
+def get_run_logs(
+    run_id: str,
+    since: Annotated[int, Query(ge=0, description="Cursor of the last entry already received")] = 0,
+) -> List[RunLogEntryResponse]:
     record = RUN_REPOSITORY.get(run_id)
     if record is None:
         raise HTTPException(status_code=404, detail=f"Run not found: {run_id}")
-    entries = RUN_LOG_STORE.list(run_id)
+    entries = RUN_LOG_STORE.list(run_id, since=since)
     return [
         RunLogEntryResponse(
             timestamp=entry.timestamp,
             event=entry.event,
             fields=entry.fields,
+            cursor=since + offset + 1,
         )
-        for entry in entries
+        for offset, entry in enumerate(entries)
     ]
+
+
+def _format_log_event(entry, cursor: int, fmt: str) -> str:
+    payload = json.dumps(
+        {
+            "cursor": cursor,
+            "timestamp": entry.timestamp.isoformat(),
+            "event": entry.event,
+            "fields": entry.fields,
+        },
+        ensure_ascii=False,
+        default=str,
+    )
+    if fmt == "ndjson":
+        return payload + "\n"
+    return f"id: {cursor}\nevent: log\ndata: {payload}\n\n"
+
+
+def _is_run_finished(run_id: str) -> bool:
+    record = RUN_REPOSITORY.get(run_id)
+    return record is None or record.status in (RunStatus.SUCCEEDED, RunStatus.FAILED)
+
+
+async def _stream_run_logs(run_id: str, since: int, fmt: str) -> AsyncIterator[str]:
+    heartbeat = "\n" if fmt == "ndjson" else ": keep-alive\n\n"
+    cursor = since
+    with RUN_LOG_FEED.subscribe(run_id) as subscription:
+        while True:
+            subscription.arm()
+            entries = await asyncio.to_thread(RUN_LOG_STORE.list, run_id, cursor)
+            for entry in entries:
+                cursor += 1
+                yield _format_log_event(entry, cursor, fmt)
+                if entry.event == "run.end":
+                    return
+            if entries:
+                continue
+            if _is_run_finished(run_id):
+                if not await subscription.wait(LOG_STREAM_GRACE_SEC):
+                    return
+            elif not await subscription.wait(LOG_STREAM_HEARTBEAT_SEC):
+                yield heartbeat
+
+
+@app.get("/runs/{run_id}/logs/stream")
+def stream_run_logs(
+    run_id: str,
+    since: Annotated[int, Query(ge=0, description="Cursor of the last entry already received")] = 0,
+    format: Annotated[Literal["sse", "ndjson"], Query(description="sse or ndjson")] = "sse",
+    last_event_id: Annotated[Optional[str], Header(alias="Last-Event-ID")] = None,
+) -> StreamingResponse:
+    """
+    Push run log entries as they are appended, until run.end.
+    SSE clients reconnecting with Last-Event-ID resume from that cursor.
+    """
+    if RUN_REPOSITORY.get(run_id) is None:
+        raise HTTPException(status_code=404, detail=f"Run not found: {run_id}")
+    if last_event_id is not None and last_event_id.isdigit():
+        since = int(last_event_id)
+    media_type = "application/x-ndjson" if format == "ndjson" else "text/event-stream"
+    return StreamingResponse(
+        _stream_run_logs(run_id, since, format),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,67 @@
+"""Worker-process side of the "process" run engine (see ProcessPoolRunScheduler)."""
+from __future__ import annotations
+
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from domain.run_record import RunStatus
+from infrastructure.metrics.webpost_metrics import ForwardingMetrics
+from infrastructure.run.in_memory_run_log_store import InMemoryRunLogStore
+from infrastructure.run.in_memory_run_repository import InMemoryRunRepository
+from infrastructure.run.run_event_forwarding import (
+    ForwardingRunLogStore,
+    ForwardingRunRepository,
+    RunEventSink,
+)
+
+
+def init_worker(sink: RunEventSink) -> None:
+    """
+    Runs once per worker process.
+
+    The worker imports api.main like the API process does, but runs in-process
+    (thread engine, memory stores) and forwards status/log writes and metrics
+    through sink.
+    Scenarios are compiled up front so the first run on each worker does not
+    pay the load.
+    """
+    # Reason: api.main reads its configuration at import time.
+    # Impact: the worker never builds a nested process pool or opens the SQLite store.
+    os.environ["WEBPOST_RUN_ENGINE"] = "thread"
+    os.environ["WEBPOST_RUN_STORE"] = "memory"
+
+    from api import main
+
+    main.RUN_REPOSITORY = ForwardingRunRepository(InMemoryRunRepository(), sink)
+    main.RUN_LOG_STORE = ForwardingRunLogStore(InMemoryRunLogStore(), sink)
+    main.METRICS = ForwardingMetrics(sink)
+    main.SCENARIO_CATALOG.preload()
+
+
+def execute_run(scenario_id: str, request, run_id: str, queued_at: Optional[datetime] = None) -> None:
+    """Execute one queued run; the record was created by the API process at queued_at."""
+    from api import main
+
+    repository: ForwardingRunRepository = main.RUN_REPOSITORY
+    log_store: ForwardingRunLogStore = main.RUN_LOG_STORE
+    repository.seed(main._create_run_record(scenario_id, run_id, queued_at))
+    try:
+        scenario = main.SCENARIO_CATALOG.get(scenario_id)
+        if scenario is None:
+            repository.transition_status(
+                run_id,
+                RunStatus.QUEUED,
+                RunStatus.FAILED,
+                error=f"Scenario file not found: {scenario_id}",
+            )
+            return
+        main._execute_async_run(scenario_id, scenario, request, run_id)
+    finally:
+        repository.local.evict([run_id])
+        log_store.local.evict([run_id])
@@ -0,0 +1,75 @@
+# application/executor/async_step_executor.py
+from __future__ import annotations
+
+import asyncio
+from typing import List, Optional
+
+from application.executor.handler_registry import HandlerRegistry
+from application.executor.step_executor import BaseStepExecutor, ExecutionResult
+from application.handlers.async_base import AsyncStepHandler
+from application.outcome import StepOutcome
+from application.services.execution_deps import ExecutionDeps
+from application.services.precision_timer import PrecisionTimer
+from domain.run import RunContext
+from domain.steps.base import Step
+
+
+class AsyncStepExecutor(BaseStepExecutor):
+    """
+    asyncio version of StepExecutor.
+
+    Handlers are awaited and retry backoff uses asyncio.sleep, so many runs can
+    share one event loop instead of pinning a thread per run.
+    Wrap synchronous handlers with SyncStepHandlerAdapter.
+    """
+
+    def __init__(
+        self,
+        registry: HandlerRegistry[AsyncStepHandler],
+        timer: Optional[PrecisionTimer] = None,
+        rewarm_lead_sec: float = 1.0,
+    ):
+        super().__init__(registry, timer, rewarm_lead_sec)
+
+    async def execute(self, steps: List[Step], ctx: RunContext, deps: ExecutionDeps) -> ExecutionResult:
+        deps = self._bind_run(ctx, deps)
+
+        step_index_by_id = {step.id: idx for idx, step in enumerate(steps)}
+        retry_counts: dict[str, int] = {}
+        released: List[str] = []
+        index = 0
+
+        while index < len(steps):
+            step = steps[index]
+            if getattr(step, "enabled", True) is False:
+                index += 1
+                continue
+
+            handler = self._registry.get_handler(step)
+
+            barrier = self._pending_barrier(step, ctx, released)
+            if barrier is not None:
+                await handler.prewarm(step, ctx, deps)
+                fire_at = self._log_barrier_hold(step, barrier, deps)
+                with deps.run_slot.hold():
+                    rewarm_at = self._rewarm_at(fire_at)
+                    if rewarm_at is not None:
+                        await self._timer.async_wait_until(rewarm_at)
+                        await handler.rewarm(step, ctx, deps, self._rewarm_lead_sec / 2)
+                    late_sec = await self._timer.async_wait_until(fire_at)
+                self._log_barrier_release(step, late_sec, deps)
+
+            t0 = self._log_step_start(step, deps)
+            outcome: StepOutcome = await handler.handle(step, ctx, deps)
+            self._log_step_end(step, handler, outcome, t0, deps)
+
+            transition = self._transition(step, outcome, index, ctx, deps, retry_counts, step_index_by_id)
+            if transition.result is not None:
+                return transition.result
+
+            if transition.backoff_sec:
+                await asyncio.sleep(transition.backoff_sec)
+            self._log_retry(step, transition, deps)
+            index = transition.next_index
+
+        return ExecutionResult(ok=True)
@@ -1,17 +1,19 @@
 # application/executor/handler_registry.py
 from __future__ import annotations
 
-from typing import List
+from typing import Generic, List, TypeVar
 
-from application.handlers.base import StepHandler
 from domain.steps.base import Step
 
+# StepHandler (sync) or AsyncStepHandler
+HandlerT = TypeVar("HandlerT")
 
-class HandlerRegistry:
-    def __init__(self, handlers: List[StepHandler]):
+
+class HandlerRegistry(Generic[HandlerT]):
+    def __init__(self, handlers: List[HandlerT]):
         self._handlers = handlers
 
-    def get_handler(self, step: Step) -> StepHandler:
+    def get_handler(self, step: Step) -> HandlerT:
         for h in self._handlers:
             if h.supports(step):
                 return h
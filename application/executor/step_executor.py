@@ -2,14 +2,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
 import time
 import uuid
 
 from application.executor.handler_registry import HandlerRegistry
 from application.outcome import StepOutcome
 from application.services.execution_deps import ExecutionDeps
-from domain.run import RunContext
+from application.services.precision_timer import PrecisionTimer
+from application.services.server_clock import host_of
+from domain.exceptions import ExpressionError
+from domain.run import RunBarrier, RunContext
 from domain.steps.base import Step
 
 
@@ -20,124 +24,217 @@ class ExecutionResult:
     error_message: Optional[str] = None
 
 
-class StepExecutor:
-    def __init__(self, registry: HandlerRegistry):
+@dataclass(frozen=True)
+class StepTransition:
+    """
+    Decision taken after a step finished.
+
+    - result: terminal result (execution stops)
+    - next_index: index of the next step to run
+    - backoff_sec: wait before continuing (retry backoff)
+    - retry_count: > 0 when the same step is retried
+    """
+    next_index: int = 0
+    backoff_sec: float = 0
+    retry_count: int = 0
+    result: Optional[ExecutionResult] = None
+
+
+class BaseStepExecutor:
+    """
+    Step dispatch and retry/on_error control flow shared by the sync and async executors.
+    Subclasses only decide how a handler is invoked and how backoff is waited.
+    """
+
+    def __init__(
+        self,
+        registry: HandlerRegistry,
+        timer: Optional[PrecisionTimer] = None,
+        rewarm_lead_sec: float = 1.0,
+    ):
         self._registry = registry
+        self._timer = timer or PrecisionTimer()
+        # how long before a barrier release its connections are refreshed
+        self._rewarm_lead_sec = rewarm_lead_sec
 
-    def execute(self, steps: List[Step], ctx: RunContext, deps: ExecutionDeps) -> ExecutionResult:
+    def _bind_run(self, ctx: RunContext, deps: ExecutionDeps) -> ExecutionDeps:
         # ★run_id を付与（呼び元が指定していれば尊重）
         if not getattr(ctx, "run_id", ""):
             ctx.run_id = uuid.uuid4().hex
 
         # ★logger に run_id を bind して、以後のログに自動付与
-        deps = deps.with_logger(deps.logger.bind(run_id=ctx.run_id))
+        return deps.with_logger(deps.logger.bind(run_id=ctx.run_id))
 
-        step_index_by_id = {step.id: idx for idx, step in enumerate(steps)}
-        retry_counts: dict[str, int] = {}
-        index = 0
+    def _log_step_start(self, step: Step, deps: ExecutionDeps) -> float:
+        deps.logger.info(
+            "step.start",
+            step_id=step.id,
+            step_type=type(step).__name__,
+        )
+        return time.perf_counter()
 
-        while index < len(steps):
-            step = steps[index]
-            if getattr(step, "enabled", True) is False:
-                index += 1
-                continue
-
-            handler = self._registry.get_handler(step)
+    def _log_step_end(self, step: Step, handler: object, outcome: Optional[StepOutcome], t0: float, deps: ExecutionDeps) -> None:
+        elapsed = time.perf_counter() - t0
+        ok = outcome is not None and outcome.ok
+        phase_fields: Dict[str, object] = {}
+        if deps.profiler.enabled:
+            deps.profiler.add("step", elapsed)
+            phase_fields["phases_ms"] = deps.profiler.take_step()
+        deps.logger.info(
+            "step.end",
+            step_id=step.id,
+            ok=ok,
+            elapsed_ms=int(elapsed * 1000),
+            **phase_fields,
+        )
+        deps.metrics.observe_step(type(step).__name__, ok, elapsed)
 
-            deps.logger.info(
-                "step.start",
-                step_id=step.id,
-                step_type=type(step).__name__,
+        if outcome is None:
+            raise RuntimeError(
+                f"Handler returned None: handler={type(handler).__name__}, step={step.id} ({type(step).__name__})"
             )
-            t0 = time.perf_counter()
 
-            outcome: StepOutcome = handler.handle(step, ctx, deps)
+    def _pending_barrier(self, step: Step, ctx: RunContext, released: List[str]) -> Optional[RunBarrier]:
+        barrier = ctx.barrier
+        if barrier is None or barrier.step_id != step.id or step.id in released:
+            return None
+        released.append(step.id)
+        return barrier
+
+    def _log_barrier_hold(self, step: Step, barrier: RunBarrier, deps: ExecutionDeps) -> datetime:
+        """
+        Log the hold and return the local wall-clock release time.
+        A server-clock barrier is shifted by the offset estimated from earlier
+        responses of the step's host; without an estimate fire_at is used as-is.
+        """
+        fire_at = barrier.fire_at
+        clock_fields: Dict[str, object] = {}
+        if barrier.clock == "server":
+            url = getattr(getattr(step, "request", None), "url", None)
+            host = host_of(deps.resolve_url(url)) if url else ""
+            estimate = deps.server_clocks.estimate(host) if host else None
+            clock_fields["server_host"] = host or None
+            if estimate is not None:
+                fire_at = estimate.to_local(barrier.fire_at)
+                clock_fields.update(
+                    server_offset_ms=round(estimate.offset_sec * 1000, 1),
+                    server_uncertainty_ms=round(estimate.uncertainty_sec * 1000, 1),
+                    server_rtt_ms=round(estimate.rtt_sec * 1000, 1),
+                    server_clock_samples=estimate.samples,
+                )
+        deps.logger.info(
+            "run.barrier.hold",
+            step_id=step.id,
+            fire_at=barrier.fire_at.isoformat(),
+            clock=barrier.clock,
+            local_fire_at=fire_at.isoformat(),
+            **clock_fields,
+        )
+        return fire_at
 
+    def _rewarm_at(self, fire_at: datetime) -> Optional[datetime]:
+        """When to refresh connections during a hold; None if the hold is too short to need it."""
+        if self._rewarm_lead_sec <= 0:
+            return None
+        rewarm_at = fire_at - timedelta(seconds=self._rewarm_lead_sec)
+        return rewarm_at if rewarm_at > datetime.now(timezone.utc) else None
+
+    def _log_barrier_release(self, step: Step, late_sec: float, deps: ExecutionDeps) -> None:
+        deps.logger.info(
+            "run.barrier.release",
+            step_id=step.id,
+            late_us=int(late_sec * 1_000_000),
+        )
+
+    def _log_retry(self, step: Step, transition: StepTransition, deps: ExecutionDeps) -> None:
+        if transition.retry_count:
             deps.logger.info(
-                "step.end",
+                "step.retry",
                 step_id=step.id,
-                ok=(outcome is not None and outcome.ok),
-                elapsed_ms=int((time.perf_counter() - t0) * 1000),
+                retry_count=transition.retry_count,
             )
 
-            if outcome is None:
-                raise RuntimeError(
-                    f"Handler returned None: handler={type(handler).__name__}, step={step.id} ({type(step).__name__})"
-                )
-
-            if outcome.ok:
-                retry_counts.pop(step.id, None)
-                index += 1
-                continue
+    def _transition(
+        self,
+        step: Step,
+        outcome: StepOutcome,
+        index: int,
+        ctx: RunContext,
+        deps: ExecutionDeps,
+        retry_counts: Dict[str, int],
+        step_index_by_id: Dict[str, int],
+    ) -> StepTransition:
+        if outcome.ok:
+            retry_counts.pop(step.id, None)
+            return StepTransition(next_index=index + 1)
 
-            selected_rule = self._select_on_error_rule(step, ctx, deps)
-            action = selected_rule.action if selected_rule else None
+        selected_rule = self._select_on_error_rule(step, ctx, deps)
+        action = selected_rule.action if selected_rule else None
 
-            if action is None:
-                action = "retry" if getattr(step, "retry", None) and step.retry.max > 0 else "abort"
+        if action is None:
+            action = "retry" if getattr(step, "retry", None) and step.retry.max > 0 else "abort"
 
-            if action == "retry":
-                retries = retry_counts.get(step.id, 0)
-                if not getattr(step, "retry", None) or retries >= step.retry.max:
-                    return ExecutionResult(
+        if action == "retry":
+            retries = retry_counts.get(step.id, 0)
+            if not getattr(step, "retry", None) or retries >= step.retry.max:
+                return StepTransition(
+                    result=ExecutionResult(
                         ok=False,
                         failed_step_id=step.id,
                         error_message=outcome.error_message,
                     )
+                )
 
-                backoff = 0
-                if step.retry.backoff_sec:
-                    backoff_index = min(retries, len(step.retry.backoff_sec) - 1)
-                    backoff = max(0, step.retry.backoff_sec[backoff_index])
-
-                if backoff:
-                    deps.logger.info(
-                        "step.retry.backoff",
-                        step_id=step.id,
-                        retry_count=retries + 1,
-                        backoff_sec=backoff,
-                    )
-                    time.sleep(backoff)
+            backoff = 0
+            if step.retry.backoff_sec:
+                backoff_index = min(retries, len(step.retry.backoff_sec) - 1)
+                backoff = max(0, step.retry.backoff_sec[backoff_index])
 
-                retry_counts[step.id] = retries + 1
+            if backoff:
                 deps.logger.info(
-                    "step.retry",
+                    "step.retry.backoff",
                     step_id=step.id,
                     retry_count=retries + 1,
+                    backoff_sec=backoff,
                 )
-                continue
 
-            retry_counts.pop(step.id, None)
+            retry_counts[step.id] = retries + 1
+            return StepTransition(next_index=index, backoff_sec=backoff, retry_count=retries + 1)
 
-            if action == "goto":
-                goto_step_id = selected_rule.goto_step_id if selected_rule else None
-                if not goto_step_id:
-                    return ExecutionResult(
+        retry_counts.pop(step.id, None)
+
+        if action == "goto":
+            goto_step_id = selected_rule.goto_step_id if selected_rule else None
+            if not goto_step_id:
+                return StepTransition(
+                    result=ExecutionResult(
                         ok=False,
                         failed_step_id=step.id,
                         error_message="goto requested but goto_step_id is missing",
                     )
-                if goto_step_id not in step_index_by_id:
-                    return ExecutionResult(
+                )
+            if goto_step_id not in step_index_by_id:
+                return StepTransition(
+                    result=ExecutionResult(
                         ok=False,
                         failed_step_id=step.id,
                         error_message=f"goto target not found: {goto_step_id}",
                     )
-                deps.logger.info(
-                    "step.goto",
-                    step_id=step.id,
-                    goto_step_id=goto_step_id,
                 )
-                index = step_index_by_id[goto_step_id]
-                continue
+            deps.logger.info(
+                "step.goto",
+                step_id=step.id,
+                goto_step_id=goto_step_id,
+            )
+            return StepTransition(next_index=step_index_by_id[goto_step_id])
 
-            return ExecutionResult(
+        return StepTransition(
+            result=ExecutionResult(
                 ok=False,
                 failed_step_id=step.id,
                 error_message=outcome.error_message,
             )
-
-        return ExecutionResult(ok=True)
+        )
 
     def _select_on_error_rule(self, step: Step, ctx: RunContext, deps: ExecutionDeps):
         if not getattr(step, "on_error", None):
@@ -149,6 +246,58 @@ class StepExecutor:
                 if fallback_rule is None:
                     fallback_rule = rule
                 continue
-            if deps.eval_condition(rule.when_expr, ctx):
+            try:
+                matched = deps.eval_condition(rule.when_expr, ctx)
+            except ExpressionError as e:
+                deps.logger.error("step.on_error.invalid_expr", step_id=step.id, expr=rule.when_expr, error=str(e))
+                continue
+            if matched:
                 return rule
         return fallback_rule
+
+
+class StepExecutor(BaseStepExecutor):
+    def execute(self, steps: List[Step], ctx: RunContext, deps: ExecutionDeps) -> ExecutionResult:
+        deps = self._bind_run(ctx, deps)
+
+        step_index_by_id = {step.id: idx for idx, step in enumerate(steps)}
+        retry_counts: dict[str, int] = {}
+        released: List[str] = []
+        index = 0
+
+        while index < len(steps):
+            step = steps[index]
+            if getattr(step, "enabled", True) is False:
+                index += 1
+                continue
+
+            handler = self._registry.get_handler(step)
+
+            barrier = self._pending_barrier(step, ctx, released)
+            if barrier is not None:
+                handler.prewarm(step, ctx, deps)
+                fire_at = self._log_barrier_hold(step, barrier, deps)
+                # Reason: A hold can last up to the schedule horizon and only waits.
+                # Impact: Other runs use the slot meanwhile; pooled connections are refreshed before release.
+                with deps.run_slot.hold():
+                    rewarm_at = self._rewarm_at(fire_at)
+                    if rewarm_at is not None:
+                        self._timer.wait_until(rewarm_at)
+                        handler.rewarm(step, ctx, deps, self._rewarm_lead_sec / 2)
+                    late_sec = self._timer.wait_until(fire_at)
+                self._log_barrier_release(step, late_sec, deps)
+
+            t0 = self._log_step_start(step, deps)
+            outcome: StepOutcome = handler.handle(step, ctx, deps)
+            self._log_step_end(step, handler, outcome, t0, deps)
+
+            transition = self._transition(step, outcome, index, ctx, deps, retry_counts, step_index_by_id)
+            if transition.result is not None:
+                return transition.result
+
+            if transition.backoff_sec:
+                time.sleep(transition.backoff_sec)
+            self._log_retry(step, transition, deps)
+            index = transition.next_index
+
+        return ExecutionResult(ok=True)
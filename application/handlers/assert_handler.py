@@ -1,7 +1,7 @@
 # application/handlers/assert_handler.py
-import re
 from application.handlers.base import StepHandler
 from application.outcome import StepOutcome
+from domain.exceptions import ExpressionError
 from domain.run import RunContext
 from domain.steps.assertion import AssertStep
 
@@ -18,7 +18,10 @@ class AssertStepHandler(StepHandler):
         results = []
 
         for cond in step.conditions:
-            ok = deps.eval_condition(cond.expr, ctx)
+            try:
+                ok = deps.eval_condition(cond.expr, ctx)
+            except ExpressionError as e:
+                return StepOutcome(ok=False, error_message=f"invalid assert expression: {e}")
             results.append(ok)
             if not ok:
                 failures.append(cond.message or f"assertion failed: {cond.expr}")
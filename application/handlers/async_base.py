@@ -0,0 +1,57 @@
+# application/handlers/async_base.py
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from application.handlers.base import StepHandler
+from application.outcome import StepOutcome
+from domain.steps.base import Step
+
+if TYPE_CHECKING:
+    from domain.run import RunContext
+    from application.services.execution_deps import ExecutionDeps
+
+
+class AsyncStepHandler(ABC):
+    @abstractmethod
+    def supports(self, step: Step) -> bool: ...
+
+    @abstractmethod
+    async def handle(self, step: Step, ctx: "RunContext", deps: "ExecutionDeps") -> StepOutcome: ...
+
+    async def prewarm(self, step: Step, ctx: "RunContext", deps: "ExecutionDeps") -> None:
+        """See StepHandler.prewarm."""
+        return None
+
+    async def rewarm(self, step: Step, ctx: "RunContext", deps: "ExecutionDeps", timeout_sec: float) -> None:
+        """See StepHandler.rewarm."""
+        return None
+
+
+class SyncStepHandlerAdapter(AsyncStepHandler):
+    """
+    Run an existing synchronous StepHandler under AsyncStepExecutor.
+
+    - offload=True: run in a worker thread so blocking I/O does not stall the event loop
+    - offload=False: run inline (for cheap, non-blocking handlers such as assert/log/result)
+    """
+
+    def __init__(self, handler: StepHandler, offload: bool = True) -> None:
+        self._handler = handler
+        self._offload = offload
+
+    def supports(self, step: Step) -> bool:
+        return self._handler.supports(step)
+
+    async def handle(self, step: Step, ctx: "RunContext", deps: "ExecutionDeps") -> StepOutcome:
+        if self._offload:
+            return await asyncio.to_thread(self._handler.handle, step, ctx, deps)
+        return self._handler.handle(step, ctx, deps)
+
+    async def prewarm(self, step: Step, ctx: "RunContext", deps: "ExecutionDeps") -> None:
+        self._handler.prewarm(step, ctx, deps)
+
+    async def rewarm(self, step: Step, ctx: "RunContext", deps: "ExecutionDeps", timeout_sec: float) -> None:
+        await asyncio.to_thread(self._handler.rewarm, step, ctx, deps, timeout_sec)
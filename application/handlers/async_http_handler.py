@@ -0,0 +1,82 @@
+# application/handlers/async_http_handler.py
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+from application.handlers.async_base import AsyncStepHandler
+from application.handlers.http_handler import HttpStepWorkflow
+from application.http_trace import CookieSnapshot
+from application.outcome import StepOutcome
+from application.ports.async_http_client import AsyncHttpClientPort
+from application.services.execution_deps import ExecutionDeps
+from application.services.template_renderer import TemplateRenderer
+from domain.run import RunContext
+from domain.steps.http import HttpStep
+from infrastructure.http.artifact_store import ArtifactStore
+from infrastructure.http.flight_recorder import FlightRecorder
+
+
+class AsyncHttpStepHandler(AsyncStepHandler):
+    """
+    HttpStepHandler counterpart for AsyncStepExecutor.
+    Only the network call is awaited; preparation and trace recording are shared.
+    Recording (decode, title parse, hashing, trace enrichers) runs in a worker
+    thread so one large response does not stall every run on the event loop.
+    """
+
+    def __init__(
+        self,
+        http_client: AsyncHttpClientPort,
+        renderer: TemplateRenderer,
+        artifact_store: Optional[ArtifactStore] = None,
+        flight_recorder: Optional[FlightRecorder] = None,
+        download_root: str = "tmp/downloads",
+    ):
+        self._http = http_client
+        self._renderer = renderer
+        self._workflow = HttpStepWorkflow(
+            renderer, artifact_store=artifact_store, flight_recorder=flight_recorder, download_root=download_root
+        )
+
+    def supports(self, step) -> bool:
+        return isinstance(step, HttpStep)
+
+    async def prewarm(self, step: HttpStep, ctx: RunContext, deps: ExecutionDeps) -> None:
+        self._workflow.prewarm(step, ctx, deps)
+
+    async def rewarm(self, step: HttpStep, ctx: RunContext, deps: ExecutionDeps, timeout_sec: float) -> None:
+        url = self._workflow.warm_url(step, deps)
+        try:
+            await self._http.warm(url, timeout_sec)
+        except Exception as e:
+            self._workflow.log_rewarm(step, deps, url, e)
+            return
+        self._workflow.log_rewarm(step, deps, url, None)
+
+    async def handle(self, step: HttpStep, ctx: RunContext, deps: ExecutionDeps) -> StepOutcome:
+        try:
+            prepared = self._workflow.take_prepared(step, ctx, deps)
+
+            deps.logger.info("http.client_impl", cls=type(self._http).__name__, module=type(self._http).__module__)
+
+            cookies_before = CookieSnapshot(items=self._http.snapshot_cookies())
+
+            with deps.profiler.span("http"):
+                resp = await self._http.request(
+                    method=prepared.method,
+                    url=prepared.url,
+                    headers=prepared.headers,
+                    form_list=prepared.form_list,
+                    allow_redirects=prepared.allow_redirects,
+                    **prepared.client_options(),
+                )
+
+            cookies_after = CookieSnapshot(items=self._http.snapshot_cookies())
+
+            return await asyncio.to_thread(
+                self._workflow.record, step, ctx, deps, prepared, resp, cookies_before, cookies_after
+            )
+
+        except Exception as e:
+            return self._workflow.fail(step, deps, e)
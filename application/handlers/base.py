@@ -18,3 +18,17 @@ class StepHandler(ABC):
 
     @abstractmethod
     def handle(self, step: Step, ctx: "RunContext", deps: "ExecutionDeps") -> StepOutcome: ...
+
+    def prewarm(self, step: Step, ctx: "RunContext", deps: "ExecutionDeps") -> None:
+        """
+        Prepare everything handle() needs before a scheduled release (RunBarrier),
+        so only the critical I/O remains on the timed path. Default: nothing.
+        """
+        return None
+
+    def rewarm(self, step: Step, ctx: "RunContext", deps: "ExecutionDeps", timeout_sec: float) -> None:
+        """
+        Called shortly before a long hold is released, e.g. to refresh
+        connections that idled out while the run waited. Default: nothing.
+        """
+        return None
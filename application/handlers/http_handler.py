@@ -1,19 +1,20 @@
 # application/handlers/http_handler.py
 from __future__ import annotations
 
-import re
-import hashlib
 from collections import Counter
+from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple, Optional
 
-from bs4 import BeautifulSoup
-
 from application.handlers.base import StepHandler
 from application.outcome import StepOutcome
-from application.ports.http_client import HttpClientPort
+from application.ports.http_client import HttpClientPort, HttpResponse
+from application.ports.logger import lazy
 from application.services.execution_deps import ExecutionDeps
 from application.services.form_composer import FormComposer
+from application.services.html_document_cache import HtmlDocumentCache
 from application.services.redactor import mask_dict, mask_pairs
+from application.services.response_body import BodyLimits, ResponseBody, resolve_download_path
+from application.services.server_clock import host_of
 from application.services.template_renderer import RenderSources, TemplateRenderer
 from domain.run import LastResponse, RunContext
 from domain.steps.http import HttpStep
@@ -22,44 +23,48 @@ from application.http_trace import HttpTrace, HttpResponseMeta, CookieSnapshot
 from application.http_trace_emitter import HttpTraceEmitter
 from application.trace_enrichers.core import HttpCoreTraceLogger
 from application.trace_enrichers.html_signals import HtmlSignalLogger
+from infrastructure.http.artifact_store import ArtifactStore
+from infrastructure.http.flight_recorder import FlightRecorder
 from infrastructure.http.http_artifact_saver import HttpArtifactSaver
 from typing import List, Tuple
 
-def _try_extract_title(html: str) -> Optional[str]:
+_TITLE_MAX_CHARS = 2 * 1024 * 1024
+
+
+def _try_extract_title(html: str, documents: HtmlDocumentCache, key: Optional[str] = None) -> Optional[str]:
     try:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = documents.get(html, key)
         return soup.title.get_text(strip=True) if soup.title else None
     except Exception:
         return None
 
-# application/handlers/http_handler.py
-def _decode_html_bytes(raw: Optional[bytes], headers: Dict[str, str], fallback_text: str) -> tuple[str, Optional[str]]:
-    """
-    raw bytes + headers からHTMLを復元する。
-    戻り値: (decoded_html, decided_encoding)
-    """
-    if not raw:
-        return fallback_text, None
-
-    # 1) Content-Type の charset を優先
-    ctype = (headers or {}).get("Content-Type") or (headers or {}).get("content-type") or ""
-    m = re.search(r"charset\s*=\s*([^\s;]+)", ctype, re.I)
-    if m:
-        enc = m.group(1).strip().strip('"').strip("'")
-        try:
-            return raw.decode(enc, errors="replace"), enc
-        except Exception:
-            pass
+def _is_html(headers: Dict[str, str], size: int) -> bool:
+    # the title is for the trace only: skip downloads, JSON APIs and very large pages
+    if size > _TITLE_MAX_CHARS:
+        return False
+    ctype = next((v for k, v in headers.items() if k.lower() == "content-type"), "") or ""
+    return not ctype or "html" in ctype.lower()
 
-    # 2) ありがちな日本語サイトのフォールバック（cp932優先）
-    for enc in ("cp932", "shift_jis", "windows-31j", "utf-8"):
-        try:
-            return raw.decode(enc, errors="replace"), enc
-        except Exception:
-            continue
 
-    # 3) 最後の手段
-    return raw.decode("utf-8", errors="replace"), "utf-8"
+class _FileBodyLastResponse(LastResponse):
+    """ctx.last for a file body: text is decoded on first read, not when the response is recorded."""
+
+    def __init__(
+        self, status: int, url: str, headers: Dict[str, str], body_sha256: Optional[str], body: ResponseBody
+    ) -> None:
+        self.status = status
+        self.url = url
+        self.headers = headers
+        self.body_sha256 = body_sha256
+        self._body = body
+
+    @property
+    def text(self) -> str:
+        return self._body.text
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(status={self.status!r}, url={self.url!r}, path={self._body.path!r})"
+
 
 def _detect_collisions(base_form: List[Tuple[str, str]], merged_dict: Dict[str, Any]) -> List[str]:
     base_keys = [k for k, _ in (base_form or [])]
@@ -79,156 +84,303 @@ def _dedupe_pairs_last_wins(pairs: List[Tuple[str, str]]) -> List[Tuple[str, str
         last_index[k] = i
     return [(k, v) for i, (k, v) in enumerate(pairs) if last_index.get(k) == i]
 
-class HttpStepHandler(StepHandler):
-    def __init__(self, http_client: HttpClientPort, renderer: TemplateRenderer):
-        self._http = http_client
+@dataclass(frozen=True)
+class PreparedHttpStep:
+    url: str
+    method: str
+    headers: Optional[Dict[str, str]]
+    form_list: List[Tuple[str, str]]
+    allow_redirects: Optional[bool]
+    merged_from: Optional[str]
+    merged_count: int
+    collision_keys: List[str]
+    body_limits: Optional[BodyLimits] = None
+
+    def client_options(self) -> Dict[str, Any]:
+        # only passed when the step sets limits, so clients without body_limits keep working
+        return {"body_limits": self.body_limits} if self.body_limits is not None else {}
+
+
+class HttpStepWorkflow:
+    """
+    Transport-independent part of an HTTP step, shared by the sync and async handlers:
+    - prepare(): URL resolution, template rendering and form composition
+    - prewarm() / take_prepared(): prepare ahead of a scheduled release, consume once
+    - record(): decoding, trace emission and ctx.last update
+    """
+
+    def __init__(
+        self,
+        renderer: TemplateRenderer,
+        trace: Optional[HttpTraceEmitter] = None,
+        artifact_store: Optional[ArtifactStore] = None,
+        flight_recorder: Optional[FlightRecorder] = None,
+        download_root: str = "tmp/downloads",
+    ):
         self._renderer = renderer
         self._composer = FormComposer(renderer)
-
-        self._trace = HttpTraceEmitter([
+        # save_to_file is rendered from templates (vars, last response ...): it must not pick any path
+        self._download_root = download_root
+        self._trace = trace or HttpTraceEmitter([
             HttpCoreTraceLogger(),
             HtmlSignalLogger(),
-            HttpArtifactSaver(root="tmp/http"),
+            HttpArtifactSaver(root="tmp/http", store=artifact_store, recorder=flight_recorder),
         ])
+        self._prewarmed: Dict[str, PreparedHttpStep] = {}
+
+    def prewarm(self, step: HttpStep, ctx: RunContext, deps: ExecutionDeps) -> None:
+        self._prewarmed[step.id] = self.prepare(step, ctx, deps)
+
+    def warm_url(self, step: HttpStep, deps: ExecutionDeps) -> str:
+        prepared = self._prewarmed.get(step.id)
+        return prepared.url if prepared is not None else deps.resolve_url(step.request.url)
+
+    def log_rewarm(self, step: HttpStep, deps: ExecutionDeps, url: str, error: Optional[Exception]) -> None:
+        if error is None:
+            deps.logger.info("http.rewarm", step_id=step.id, host=host_of(url))
+        else:
+            # the step still runs; it just may pay a new connection
+            deps.logger.info("http.rewarm_failed", step_id=step.id, host=host_of(url), error=str(error))
+
+    def take_prepared(self, step: HttpStep, ctx: RunContext, deps: ExecutionDeps) -> PreparedHttpStep:
+        # a prewarmed request is used once; retries render again
+        prepared = self._prewarmed.pop(step.id, None)
+        if prepared is not None:
+            return prepared
+        return self.prepare(step, ctx, deps)
+
+    def prepare(self, step: HttpStep, ctx: RunContext, deps: ExecutionDeps) -> PreparedHttpStep:
+        url = deps.resolve_url(step.request.url)
+
+        secrets = deps.secret_provider.get()
+
+        # ctx.last itself (attribute access): its text is decoded only when a template reads last.text
+        src = RenderSources(
+            vars=ctx.vars,
+            state=ctx.state,
+            secrets=secrets,
+            last=ctx.last or {},
+        )
+
+        # form_list 合成（テンプレ展開 + vars merge）
+        base_form = step.request.form_list or []
+        merge_from = getattr(step.request, "merge_from_vars", None)
+
+        composed = self._composer.compose(
+            form_list=base_form,
+            src=src,
+            vars_dict=ctx.vars,
+            merge_from_vars=merge_from,
+            profiler=deps.profiler,
+        )
+
+        deduped_form = _dedupe_pairs_last_wins(composed.form_list)
+        collision_keys = _detect_collisions(base_form, ctx.vars.get(merge_from, {}) if merge_from else {})
+
+        # DEBUG: form / headers はマスクしてログ (built only when debug is enabled)
+        deps.logger.debug(
+            "http.form_composed",
+            step_id=step.id,
+            method=step.request.method,
+            url=url,
+            merged_from=composed.merged_from,
+            merged_count=composed.merged_count,
+            duplicate_keys=lazy(lambda: _dup_keys(composed.form_list)),
+            collision_keys=collision_keys,
+            form=lazy(lambda: mask_pairs(composed.form_list)),
+            headers=lazy(lambda: mask_dict(step.request.headers or {})),
+        )
+
+        # ログインPOSTだけ redirect を切りたいならここで条件分岐
+        allow_redirects: Optional[bool] = None
+        if step.request.method.upper() == "POST":
+            # 切り分け優先：まず False 推奨（必要なら後でTrueに戻す）
+            allow_redirects = False
+
+        body_limits: Optional[BodyLimits] = None
+        if step.max_body_bytes is not None or step.save_to_file:
+            save_to = self._renderer.render_value(step.save_to_file, src) if step.save_to_file else None
+            body_limits = BodyLimits(
+                max_bytes=step.max_body_bytes,
+                save_to=resolve_download_path(self._download_root, str(save_to)) if save_to else None,
+            )
+
+        return PreparedHttpStep(
+            url=url,
+            method=step.request.method,
+            headers=step.request.headers,
+            form_list=deduped_form,
+            allow_redirects=allow_redirects,
+            merged_from=composed.merged_from,
+            merged_count=composed.merged_count,
+            collision_keys=collision_keys,
+            body_limits=body_limits,
+        )
+
+    def record(
+        self,
+        step: HttpStep,
+        ctx: RunContext,
+        deps: ExecutionDeps,
+        prepared: PreparedHttpStep,
+        resp: HttpResponse,
+        cookies_before: CookieSnapshot,
+        cookies_after: CookieSnapshot,
+    ) -> StepOutcome:
+        profiler = deps.profiler
+        # Reason: A file body (spilled past spill_bytes, or a save_to download) can be far larger than memory wants.
+        # Impact: Only in-memory bodies are decoded here; a file body is decoded on demand (ctx.last.text, scrapers).
+        in_memory = resp.body.path is None
+        with profiler.span("decode"):
+            body = resp.body.text if in_memory else ""
+            text_head = body[:4000] if in_memory else resp.body.head(4000)
+        with profiler.span("hash"):
+            body_sha = resp.body.sha256
+
+        # history 正規化
+        hist = []
+        for h in (resp.history or []):
+            hist.append({
+                "status": h.status,
+                "url": h.url,
+                "location": h.location,
+                "set_cookie": bool(h.set_cookie),
+            })
+
+        sent_at = getattr(resp, "sent_at", None)
+        received_at = getattr(resp, "received_at", None)
+        if sent_at is not None and received_at is not None:
+            deps.metrics.observe_http(host_of(prepared.url), resp.status, received_at - sent_at)
+        server_clock = deps.server_clocks.observe(
+            resp.url,
+            sent_at,
+            received_at,
+            resp.headers or {},
+        )
+
+        html_title = None
+        if in_memory and _is_html(resp.headers or {}, len(body)):
+            with profiler.span("parse"):
+                html_title = _try_extract_title(body, deps.documents, body_sha)
+
+        trace = HttpTrace(
+            run_id=ctx.run_id,
+            step_id=step.id,
+            method=prepared.method,
+            url=prepared.url,
+            allow_redirects=prepared.allow_redirects,
+            request_headers=prepared.headers or {},
+            request_form=prepared.form_list,
+            merged_from=prepared.merged_from,
+            merged_count=prepared.merged_count,
+            collision_keys=prepared.collision_keys,
+            cookies_before=cookies_before,
+            cookies_after=cookies_after,
+            response=HttpResponseMeta(
+                status=resp.status,
+                url=resp.url,
+                headers=resp.headers or {},
+                encoding=(resp.body.encoding if in_memory else None) or getattr(resp, "encoding", None),
+                content_type=(resp.headers or {}).get("Content-Type"),
+                history=hist,
+                body_len=len(body) if body else resp.body.size,
+                body_sha256=body_sha,
+            ),
+            text_head=text_head,
+            html_title=html_title,
+            full_text=body,
+            raw_bytes=resp.body.raw,
+            server_clock=server_clock,
+            rate_limit_wait_sec=getattr(resp, "rate_limit_wait_sec", 0.0),
+            body=resp.body,
+        )
+        self._trace.emit(trace, deps)
+
+        # 既存ログ（簡易）
+        deps.logger.info(
+            "http.response",
+            step_id=step.id,
+            status=resp.status,
+            final_url=resp.url,
+            text_head=text_head[:200],
+        )
+
+        if step.save_as_last:
+            if in_memory:
+                ctx.last = LastResponse(
+                    status=resp.status,
+                    url=resp.url,
+                    text=body,
+                    headers=resp.headers,
+                    body_sha256=body_sha,
+                )
+            else:
+                ctx.last = _FileBodyLastResponse(resp.status, resp.url, resp.headers, body_sha, resp.body)
+        return StepOutcome(ok=True)
+
+    def fail(self, step: HttpStep, deps: ExecutionDeps, exc: Exception) -> StepOutcome:
+        deps.logger.error(
+            "http.step_failed",
+            step_id=getattr(step, "id", "unknown"),
+            error=str(exc),
+        )
+        return StepOutcome(ok=False, error_message=str(exc))
+
+
+class HttpStepHandler(StepHandler):
+    def __init__(
+        self,
+        http_client: HttpClientPort,
+        renderer: TemplateRenderer,
+        artifact_store: Optional[ArtifactStore] = None,
+        flight_recorder: Optional[FlightRecorder] = None,
+        download_root: str = "tmp/downloads",
+    ):
+        self._http = http_client
+        self._renderer = renderer
+        self._workflow = HttpStepWorkflow(
+            renderer, artifact_store=artifact_store, flight_recorder=flight_recorder, download_root=download_root
+        )
 
     def supports(self, step) -> bool:
         return isinstance(step, HttpStep)
 
-    def handle(self, step: HttpStep, ctx: RunContext, deps: ExecutionDeps) -> StepOutcome:
-        try:
-            url = deps.resolve_url(step.request.url)
-
-            last_dict: Dict[str, Any] = {}
-            if ctx.last:
-                last_dict = {
-                    "status": ctx.last.status,
-                    "url": ctx.last.url,
-                    "text": ctx.last.text,
-                    "headers": ctx.last.headers,
-                }
-
-            secrets = deps.secret_provider.get()
-
-            src = RenderSources(
-                vars=ctx.vars,
-                state=ctx.state,
-                secrets=secrets,
-                last=last_dict,
-            )
-
-            # form_list 合成（テンプレ展開 + vars merge）
-            base_form = step.request.form_list or []
-            merge_from = getattr(step.request, "merge_from_vars", None)
+    def prewarm(self, step: HttpStep, ctx: RunContext, deps: ExecutionDeps) -> None:
+        self._workflow.prewarm(step, ctx, deps)
 
-            composed = self._composer.compose(
-                form_list=base_form,
-                src=src,
-                vars_dict=ctx.vars,
-                merge_from_vars=merge_from,
-            )
+    def rewarm(self, step: HttpStep, ctx: RunContext, deps: ExecutionDeps, timeout_sec: float) -> None:
+        url = self._workflow.warm_url(step, deps)
+        warm = getattr(self._http, "warm", None)
+        if warm is None:
+            return
+        try:
+            warm(url, timeout_sec)
+        except Exception as e:
+            self._workflow.log_rewarm(step, deps, url, e)
+            return
+        self._workflow.log_rewarm(step, deps, url, None)
 
-            deduped_form = _dedupe_pairs_last_wins(composed.form_list)
-
-            # DEBUG: form / headers はマスクしてログ
-            deps.logger.debug(
-                "http.form_composed",
-                step_id=step.id,
-                method=step.request.method,
-                url=url,
-                merged_from=composed.merged_from,
-                merged_count=composed.merged_count,
-                duplicate_keys=_dup_keys(composed.form_list),
-                collision_keys=_detect_collisions(base_form, ctx.vars.get(merge_from, {}) if merge_from else {}),
-                form=mask_pairs(composed.form_list),
-                headers=mask_dict(step.request.headers or {}),
-            )
+    def handle(self, step: HttpStep, ctx: RunContext, deps: ExecutionDeps) -> StepOutcome:
+        try:
+            prepared = self._workflow.take_prepared(step, ctx, deps)
 
             deps.logger.info("http.client_impl", cls=type(self._http).__name__, module=type(self._http).__module__)
 
             cookies_before = CookieSnapshot(items=self._http.snapshot_cookies())
 
-            # ログインPOSTだけ redirect を切りたいならここで条件分岐
-            allow_redirects: Optional[bool] = None
-            if step.request.method.upper() == "POST":
-                # 切り分け優先：まず False 推奨（必要なら後でTrueに戻す）
-                allow_redirects = False
-
-            resp = self._http.request(
-                method=step.request.method,
-                url=url,
-                headers=step.request.headers,
-                form_list=deduped_form,
-                allow_redirects=allow_redirects,
-            )
+            with deps.profiler.span("http"):
+                resp = self._http.request(
+                    method=prepared.method,
+                    url=prepared.url,
+                    headers=prepared.headers,
+                    form_list=prepared.form_list,
+                    allow_redirects=prepared.allow_redirects,
+                    **prepared.client_options(),
+                )
 
             cookies_after = CookieSnapshot(items=self._http.snapshot_cookies())
 
-            raw = resp.content
-            body, decided_enc = _decode_html_bytes(raw, resp.headers or {}, resp.text or "")
-            body_sha = hashlib.sha256(raw).hexdigest() if raw is not None else hashlib.sha256(body.encode("utf-8", errors="replace")).hexdigest()
-
-            # history 正規化
-            hist = []
-            for h in (resp.history or []):
-                hist.append({
-                    "status": h.status,
-                    "url": h.url,
-                    "location": h.location,
-                    "set_cookie": bool(h.set_cookie),
-                })
-
-            trace = HttpTrace(
-                run_id=ctx.run_id,
-                step_id=step.id,
-                method=step.request.method,
-                url=url,
-                allow_redirects=allow_redirects,
-                request_headers=step.request.headers or {},
-                request_form=deduped_form,
-                merged_from=composed.merged_from,
-                merged_count=composed.merged_count,
-                collision_keys=_detect_collisions(base_form, ctx.vars.get(merge_from, {}) if merge_from else {}),
-                cookies_before=cookies_before,
-                cookies_after=cookies_after,
-                response=HttpResponseMeta(
-                    status=resp.status,
-                    url=resp.url,
-                    headers=resp.headers or {},
-                    encoding=decided_enc or getattr(resp, "encoding", None),
-                    content_type=(resp.headers or {}).get("Content-Type"),
-                    history=hist,
-                    body_len=len(body),
-                    body_sha256=body_sha,
-                ),
-                text_head=body[:4000],
-                html_title=_try_extract_title(body),
-                full_text=body,
-                raw_bytes=getattr(resp, "content", None),
-            )
-            self._trace.emit(trace, deps)
-
-            # 既存ログ（簡易）
-            deps.logger.info(
-                "http.response",
-                step_id=step.id,
-                status=resp.status,
-                final_url=resp.url,
-                text_head=body[:200],
-            )
-
-            if step.save_as_last:
-                ctx.last = LastResponse(
-                    status=resp.status,
-                    url=resp.url,
-                    text=body,
-                    headers=resp.headers,
-                )
-            return StepOutcome(ok=True)
+            return self._workflow.record(step, ctx, deps, prepared, resp, cookies_before, cookies_after)
 
         except Exception as e:
-            deps.logger.error(
-                "http.step_failed",
-                step_id=getattr(step, "id", "unknown"),
-                error=str(e),
-            )
-            return StepOutcome(ok=False, error_message=str(e))
+            return self._workflow.fail(step, deps, e)
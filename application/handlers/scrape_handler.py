@@ -7,6 +7,7 @@ from bs4 import BeautifulSoup
 
 from application.handlers.base import StepHandler
 from application.outcome import StepOutcome
+from application.ports.logger import lazy
 from application.services.execution_deps import ExecutionDeps
 from application.services.scrape_source_registry import ScrapeSourceRegistry, ScrapeSourceError
 from application.services.scrape_target_registry import ScrapeTargetRegistry, ScrapeTargetError
@@ -46,7 +47,7 @@ class ScrapeStepHandler(StepHandler):
         try:
             source = self._source_registry.get(step.source)
             html = source.get_text(ctx)
-            soup = BeautifulSoup(html, "lxml")
+            soup = deps.documents.get(html, source.get_key(ctx))
 
             cmd = (step.command or "").strip().lower()
 
@@ -101,14 +102,13 @@ class ScrapeStepHandler(StepHandler):
         target.save(ctx, save_as, hidden)
 
         # Log summary (avoid huge output)
-        keys = list(hidden.keys())
         deps.logger.debug(
             "scrape.hidden_inputs",
             step_id=step.id,
             save_as=save_as,
             save_to=step.save_to,
             count=len(hidden),
-            keys_preview=keys[:10],
+            keys_preview=lazy(lambda: list(hidden)[:10]),
         )
 
         return StepOutcome(ok=True)
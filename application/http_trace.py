@@ -3,6 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
+from application.services.response_body import ResponseBody
+from application.services.server_clock import ServerClockEstimate
+
 HeaderDict = Dict[str, str]
 PairList = List[Tuple[str, str]]
 
@@ -39,4 +42,8 @@ class HttpTrace:
     text_head: str = ""
     html_title: Optional[str] = None
     full_text: str = ""
-    raw_bytes: Optional[bytes] = None
\ No newline at end of file
+    raw_bytes: Optional[bytes] = None
+    server_clock: Optional[ServerClockEstimate] = None
+    rate_limit_wait_sec: float = 0.0
+    # the shared body; keeps a spilled body file alive until the trace is processed
+    body: Optional[ResponseBody] = None
\ No newline at end of file
@@ -10,7 +10,25 @@ from application.services.execution_deps import ExecutionDeps
 class HttpTraceEmitter:
     def __init__(self, enrichers: Iterable[HttpTraceEnricher]):
         self._enrichers = list(enrichers)
+        self._inline = [e for e in self._enrichers if not e.deferrable]
+        self._deferred = [e for e in self._enrichers if e.deferrable]
 
     def emit(self, trace: HttpTrace, deps: ExecutionDeps) -> None:
-        for e in self._enrichers:
-            e.enrich_and_log(trace, deps)
\ No newline at end of file
+        pipeline = deps.trace_pipeline
+        if pipeline is None:
+            self._run(self._enrichers, trace, deps)
+            return
+        self._run(self._inline, trace, deps)
+        if self._deferred:
+            pipeline.submit(trace, deps, self._deferred)
+
+    @staticmethod
+    def _run(enrichers: Iterable[HttpTraceEnricher], trace: HttpTrace, deps: ExecutionDeps) -> None:
+        profiler = deps.profiler
+        if not profiler.enabled:
+            for e in enrichers:
+                e.enrich_and_log(trace, deps)
+            return
+        for e in enrichers:
+            with profiler.span(f"trace.{type(e).__name__}"):
+                e.enrich_and_log(trace, deps)
@@ -8,6 +8,10 @@ from application.services.execution_deps import ExecutionDeps
 
 
 class HttpTraceEnricher(ABC):
+    # True when nothing later in the run depends on this enricher, so it may
+    # run after the step returns (on deps.trace_pipeline) instead of inline
+    deferrable: bool = False
+
     @abstractmethod
     def enrich_and_log(self, trace: HttpTrace, deps: ExecutionDeps) -> None:
         ...
\ No newline at end of file
@@ -0,0 +1,35 @@
+# application/ports/async_http_client.py
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Dict, List, Tuple, Optional
+
+from application.ports.http_client import HttpResponse
+from application.services.response_body import BodyLimits
+
+
+class AsyncHttpClientPort(ABC):
+    @abstractmethod
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        form_list: Optional[List[Tuple[str, str]]] = None,
+        allow_redirects: Optional[bool] = None,
+        body_limits: Optional[BodyLimits] = None,
+    ) -> HttpResponse:
+        """body_limits: per-request overrides of the client's default BodyLimits."""
+        ...
+
+    @abstractmethod
+    def snapshot_cookies(self) -> List[Dict[str, object]]:
+        ...
+
+    async def warm(self, url: str, timeout_sec: float) -> None:
+        """See HttpClientPort.warm."""
+        return None
+
+    @abstractmethod
+    async def aclose(self) -> None:
+        ...
@@ -2,9 +2,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Dict, List, Tuple, Optional
 
+from application.services.response_body import BodyLimits, ResponseBody
+
 
 @dataclass(frozen=True)
 class HttpHistoryItem:
@@ -16,13 +19,31 @@ class HttpHistoryItem:
 
 @dataclass(frozen=True)
 class HttpResponse:
+    """
+    Clients pass the raw bytes as content and leave text None; the body is
+    decoded on first use of .body.text. text is only for clients (and test
+    doubles) that have no bytes. Streaming clients pass the collected body as
+    streamed_body (content is None when it was spilled to a file).
+    """
     status: int
     url: str
-    text: str
+    text: Optional[str]
     headers: Dict[str, str]
     encoding: Optional[str] = None
     history: Optional[List[HttpHistoryItem]] = None
     content: Optional[bytes] = None
+    # local wall clock (time.time()) around the exchange, for server clock estimation
+    sent_at: Optional[float] = None
+    received_at: Optional[float] = None
+    # time spent waiting for a rate limiter slot before sending
+    rate_limit_wait_sec: float = 0.0
+    streamed_body: Optional[ResponseBody] = field(default=None, repr=False, compare=False)
+
+    @cached_property
+    def body(self) -> ResponseBody:
+        if self.streamed_body is not None:
+            return self.streamed_body
+        return ResponseBody(self.content, self.headers or {}, text=self.text)
 
 
 class HttpClientPort(ABC):
@@ -34,9 +55,18 @@ class HttpClientPort(ABC):
         headers: Optional[Dict[str, str]] = None,
         form_list: Optional[List[Tuple[str, str]]] = None,
         allow_redirects: Optional[bool] = None,
+        body_limits: Optional[BodyLimits] = None,
     ) -> HttpResponse:
+        """body_limits: per-request overrides of the client's default BodyLimits."""
         ...
 
     @abstractmethod
     def snapshot_cookies(self) -> List[Dict[str, object]]:
         ...
+
+    def warm(self, url: str, timeout_sec: float) -> None:
+        """
+        Open (or refresh) a pooled keep-alive connection to url's host without
+        touching the run's cookies. Default: nothing.
+        """
+        return None
@@ -9,3 +9,6 @@ from domain.ids import IdempotencyKey
 class IdempotencyStorePort(Protocol):
     def register(self, key: IdempotencyKey) -> bool:
         ...
+
+    def release(self, key: IdempotencyKey) -> None:
+        ...
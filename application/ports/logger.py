@@ -2,10 +2,94 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Mapping, Optional
+
+LEVELS: Dict[str, int] = {"debug": 10, "info": 20, "warning": 30, "error": 40}
+
+
+@dataclass(frozen=True)
+class Lazy:
+    """A log field computed only if its event is actually emitted."""
+
+    fn: Callable[[], Any]
+
+    def __call__(self) -> Any:
+        return self.fn()
+
+
+def lazy(fn: Callable[[], Any]) -> Lazy:
+    return Lazy(fn)
+
+
+def resolve_fields(fields: Mapping[str, Any]) -> Dict[str, Any]:
+    """Evaluate Lazy fields; a failing one is logged as its error instead of raising."""
+    resolved: Dict[str, Any] = {}
+    for key, value in fields.items():
+        if isinstance(value, Lazy):
+            try:
+                value = value()
+            except Exception as e:
+                value = f"<lazy field failed: {type(e).__name__}: {e}>"
+        resolved[key] = value
+    return resolved
+
+
+@dataclass(frozen=True)
+class LogLevelPolicy:
+    """
+    Minimum level per logger, with overrides per event name or dotted prefix.
+
+    LogLevelPolicy("info", {"scrape": "debug", "http.form_composed": "debug"})
+    emits scrape.* and http.form_composed at debug, everything else from info.
+    """
+
+    default: str = "debug"
+    events: Mapping[str, str] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        for level in (self.default, *self.events.values()):
+            if level not in LEVELS:
+                raise ValueError(f"unknown log level: {level!r} (expected one of {', '.join(LEVELS)})")
+
+    @classmethod
+    def parse(cls, default: str, spec: Optional[str] = None) -> "LogLevelPolicy":
+        """Build from WEBPOST_LOG_LEVEL / WEBPOST_LOG_EVENT_LEVELS style strings ("scrape=debug,http=info")."""
+        events: Dict[str, str] = {}
+        for item in (spec or "").split(","):
+            if not item.strip():
+                continue
+            name, sep, level = item.partition("=")
+            if not sep or not name.strip():
+                raise ValueError(f"invalid event level override: {item.strip()!r} (expected event=level)")
+            events[name.strip()] = level.strip().lower()
+        return cls(default=default.strip().lower(), events=events)
+
+    def allows(self, level: str, event: Optional[str] = None) -> bool:
+        return LEVELS.get(level, LEVELS["error"]) >= LEVELS[self.minimum(event)]
+
+    def minimum(self, event: Optional[str] = None) -> str:
+        # the most specific override wins: "http.form_composed" before "http"
+        name = event
+        while self.events and name:
+            level = self.events.get(name)
+            if level is not None:
+                return level
+            name = name.rpartition(".")[0]
+        return self.default
+
+
+def log_enabled(logger: Any, level: str, event: Optional[str] = None) -> bool:
+    """is_enabled() for any logger; ones without it (plain duck-typed sinks) log everything."""
+    check = getattr(logger, "is_enabled", None)
+    return True if check is None else check(level, event)
 
 
 class LoggerPort(ABC):
+    """
+    Fields may be Lazy (see lazy()); sinks evaluate them only for events they emit.
+    """
+
     @abstractmethod
     def debug(self, event: str, **fields: Any) -> None:
         ...
@@ -18,6 +102,13 @@ class LoggerPort(ABC):
     def error(self, event: str, **fields: Any) -> None:
         ...
 
+    def warning(self, event: str, **fields: Any) -> None:
+        self.info(event, **fields)
+
+    def is_enabled(self, level: str, event: Optional[str] = None) -> bool:
+        """Whether an event at this level would be emitted; lets callers skip building payloads."""
+        return True
+
     @abstractmethod
     def bind(self, **fields: Any) -> "LoggerPort":
         """
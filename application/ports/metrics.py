@@ -0,0 +1,24 @@
+# application/ports/metrics.py
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class RunMetricsPort(ABC):
+    """Measurements taken while a run executes (already bound to the run's scenario)."""
+
+    @abstractmethod
+    def observe_step(self, step_type: str, ok: bool, elapsed_sec: float) -> None:
+        ...
+
+    @abstractmethod
+    def observe_http(self, host: str, status: int, elapsed_sec: float) -> None:
+        ...
+
+
+class NullRunMetrics(RunMetricsPort):
+    def observe_step(self, step_type: str, ok: bool, elapsed_sec: float) -> None:
+        return None
+
+    def observe_http(self, host: str, status: int, elapsed_sec: float) -> None:
+        return None
@@ -0,0 +1,20 @@
+# application/ports/rate_limiter.py
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from domain.scenario import HttpRateLimit
+
+
+class RateLimiterPort(ABC):
+    """
+    Shared pacing of outgoing requests, keyed by target host.
+
+    reserve() takes one slot and returns how long the caller must wait before
+    sending. Slots are handed out in arrival order, so concurrent runs are
+    served first come first served instead of racing for freed tokens.
+    """
+
+    @abstractmethod
+    def reserve(self, key: str, limit: HttpRateLimit) -> float:
+        ...
@@ -1,18 +1,68 @@
 # application/ports/requests_client.py
 from __future__ import annotations
 
+import time
+
 import requests
+from requests.adapters import HTTPAdapter
 from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional
+from urllib.parse import urlsplit
 
 from application.ports.http_client import HttpResponse, HttpHistoryItem
+from application.services.response_body import BodyCollector, BodyLimits, content_length
+
+# Bytes read per iteration while streaming a body
+_CHUNK_BYTES = 64 * 1024
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}/"
+
+
+class RequestsConnectionPool:
+    """
+    Process-wide urllib3 connection pool shared by every run's requests.Session.
+
+    urllib3 keeps one keep-alive pool per (scheme, host, port), so runs hitting the
+    same base_url reuse TCP/TLS connections. Cookies stay in each Session, so
+    sharing the adapter does not leak cookies between runs.
+
+    - pool_connections: number of host pools kept
+    - pool_maxsize: connections kept alive per host
+    - pool_block: wait for a free connection instead of opening an extra one
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 32, pool_block: bool = False) -> None:
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+    def mount(self, session: requests.Session) -> None:
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+
+    def close(self) -> None:
+        self._adapter.close()
 
 
 class RequestsSessionHttpClient:
-    def __init__(self, base_headers: Optional[Dict[str, str]] = None, timeout_sec: int = 20):
+    def __init__(
+        self,
+        base_headers: Optional[Dict[str, str]] = None,
+        timeout_sec: int = 20,
+        pool: Optional[RequestsConnectionPool] = None,
+        body_limits: Optional[BodyLimits] = None,
+    ):
         self._session = requests.Session()
+        if pool is not None:
+            pool.mount(self._session)
         self._base_headers = base_headers or {}
         self._timeout = timeout_sec
+        self._body_limits = body_limits or BodyLimits()
 
     def request(
         self,
@@ -21,6 +71,7 @@ class RequestsSessionHttpClient:
         headers: Optional[Dict[str, str]] = None,
         form_list: Optional[List[Tuple[str, str]]] = None,
         allow_redirects: Optional[bool] = None,
+        body_limits: Optional[BodyLimits] = None,
     ) -> HttpResponse:
         merged = dict(self._base_headers)
         if headers:
@@ -29,6 +80,7 @@ class RequestsSessionHttpClient:
         # requests のデフォルトは True。NoneならTrueとして扱う
         follow = True if allow_redirects is None else bool(allow_redirects)
 
+        sent_at = time.time()
         resp = self._session.request(
             method=method.upper(),
             url=url,
@@ -36,7 +88,24 @@ class RequestsSessionHttpClient:
             data=form_list,              # list[tuple] OK、同名キー複数OK
             timeout=self._timeout,
             allow_redirects=follow,
+            stream=True,
         )
+        # headers are in; the Date header cannot be newer than this
+        received_at = time.time()
+        try:
+            headers_dict = dict(resp.headers)
+            # Reason: The body is streamed so limits apply before it is fully in memory.
+            # Impact: Oversized bodies fail early; large ones spill to disk instead of RAM.
+            collector = BodyCollector(self._body_limits.override(body_limits), content_length(headers_dict))
+            try:
+                for chunk in resp.iter_content(chunk_size=_CHUNK_BYTES):
+                    collector.feed(chunk)
+            except BaseException:
+                collector.abort()
+                raise
+            body = collector.finish(headers_dict)
+        finally:
+            resp.close()
 
         history_items: List[HttpHistoryItem] = []
         for h in resp.history or []:
@@ -52,13 +121,22 @@ class RequestsSessionHttpClient:
         return HttpResponse(
             status=resp.status_code,
             url=str(resp.url),
-            text=resp.text,
-            headers=dict(resp.headers),
+            text=None,
+            headers=headers_dict,
             encoding=resp.encoding,
             history=history_items,
-            content=resp.content,
+            content=body.raw,
+            sent_at=sent_at,
+            received_at=received_at,
+            streamed_body=body,
         )
 
+    def warm(self, url: str, timeout_sec: float) -> None:
+        # Reason: A HEAD sent through the adapter skips the session, so no cookies change.
+        # Impact: The host pool gets a fresh keep-alive connection for the next request.
+        prepared = requests.Request("HEAD", _origin(url), headers=self._base_headers).prepare()
+        self._session.get_adapter(prepared.url).send(prepared, stream=False, timeout=timeout_sec)
+
     def snapshot_cookies(self) -> List[Dict[str, object]]:
         out: List[Dict[str, object]] = []
         for c in self._session.cookies:
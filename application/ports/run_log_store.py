@@ -12,5 +12,13 @@ class RunLogStorePort(ABC):
         ...
 
     @abstractmethod
-    def list(self, run_id: str) -> List[RunLogEntry]:
+    def list(self, run_id: str, since: int = 0) -> List[RunLogEntry]:
+        """
+        Entries of the run in append order, skipping the first `since` entries.
+        `since` is a cursor: the number of entries the caller already has.
+        """
         ...
+
+    def flush(self) -> None:
+        """Persist buffered entries (no-op for unbuffered stores)."""
+        return None
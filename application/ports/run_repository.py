@@ -34,3 +34,11 @@ class RunRepositoryPort(ABC):
     @abstractmethod
     def update_error(self, run_id: str, error: str, error_detail: Optional[dict] = None) -> RunRecord:
         ...
+
+    @abstractmethod
+    def update_phases(self, run_id: str, phases: dict) -> RunRecord:
+        ...
+
+    @abstractmethod
+    def delete(self, run_id: str) -> None:
+        ...
@@ -1,14 +1,27 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Callable, Optional
+from contextlib import nullcontext
+from typing import Callable, ContextManager, Optional
 
 from concurrent.futures import Future
 
 
+class RunQueueFullError(Exception):
+    """Raised by submit() when the scheduler cannot admit another run."""
+
+    def __init__(self, message: str, retry_after_sec: int) -> None:
+        super().__init__(message)
+        self.retry_after_sec = retry_after_sec
+
+
 class RunSchedulerPort(ABC):
     @abstractmethod
-    def submit(self, run_id: str, task: Callable[[], None]) -> Future:
+    def submit(self, run_id: str, task: Callable[[], None], concurrency_key: Optional[str] = None) -> Future:
+        """
+        concurrency_key groups runs that share a concurrency limit (scenario id).
+        Schedulers without admission control ignore it.
+        """
         ...
 
     @abstractmethod
@@ -18,3 +31,20 @@ class RunSchedulerPort(ABC):
     @abstractmethod
     def get_future(self, run_id: str) -> Optional[Future]:
         ...
+
+
+class RunSlotPort(ABC):
+    """A running run's admission slot, as seen from inside the run."""
+
+    @abstractmethod
+    def hold(self) -> ContextManager[None]:
+        """
+        Lend the slot to other runs while this run only waits (scheduled hold);
+        the run counts as active again when the block exits.
+        """
+        ...
+
+
+class NullRunSlot(RunSlotPort):
+    def hold(self) -> ContextManager[None]:
+        return nullcontext()
@@ -1,12 +1,18 @@
 # application/services/execution_deps.py
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
-from typing import Any, Dict, Protocol, TYPE_CHECKING
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Optional, Protocol, TYPE_CHECKING
 
 from application.ports.logger import LoggerPort
+from application.ports.metrics import NullRunMetrics, RunMetricsPort
+from application.ports.run_scheduler import NullRunSlot, RunSlotPort
+from application.services.html_document_cache import HtmlDocumentCache
+from application.services.phase_profiler import PhaseProfiler
+from application.services.server_clock import ServerClockRegistry
 
 if TYPE_CHECKING:
+    from application.services.trace_pipeline import TracePipeline
     from domain.run import RunContext
 
 
@@ -25,6 +31,17 @@ class ExecutionDeps:
     secret_provider: SecretProviderPort
     url_resolver: UrlResolverPort
     logger: LoggerPort
+    # Per-run parsed HTML shared by the HTTP handler, trace enrichers and scrape steps
+    documents: HtmlDocumentCache = field(default_factory=HtmlDocumentCache)
+    # Server clock offsets per host; api.main shares one registry across runs
+    server_clocks: ServerClockRegistry = field(default_factory=ServerClockRegistry)
+    metrics: RunMetricsPort = field(default_factory=NullRunMetrics)
+    # Per-run phase timings (render / http / decode / trace ...); disabled unless requested
+    profiler: PhaseProfiler = field(default_factory=PhaseProfiler)
+    # Runs deferrable trace enrichers off the step path; None runs them inline
+    trace_pipeline: Optional["TracePipeline"] = None
+    # The run's admission slot; a scheduled hold lends it to other runs
+    run_slot: RunSlotPort = field(default_factory=NullRunSlot)
 
     def resolve_url(self, url: str) -> str:
         return self.url_resolver.resolve_url(url)
@@ -35,57 +52,10 @@ class ExecutionDeps:
 
     def eval_condition(self, expr: str, ctx: "RunContext") -> bool:
         """
-        Simple condition evaluator for assertion expressions.
-        Supports basic comparisons: ==, >=, <=, >, <
+        Evaluate an assert / on_error condition against the run context.
+        Expressions are compiled once (cached by string) and read ctx directly.
+        Raises ExpressionError for malformed expressions.
         """
-        from domain.steps.expr import ExpressionEvaluator
-        
-        evaluator = ExpressionEvaluator()
-        
-        # Build context for template resolution
-        template_ctx = {}
-        if ctx.vars:
-            for k, v in ctx.vars.items():
-                template_ctx[f"vars.{k}"] = v
-        if ctx.state:
-            for k, v in ctx.state.items():
-                template_ctx[f"state.{k}"] = v
-        if ctx.last:
-            template_ctx["last.status"] = getattr(ctx.last, "status", 0)
-            template_ctx["last.url"] = getattr(ctx.last, "url", "")
-            template_ctx["last.text"] = getattr(ctx.last, "text", "")
-        
-        # Resolve templates in the expression
-        resolved = evaluator.resolve(expr, template_ctx)
-        
-        # Evaluate the condition
-        if "==" in resolved:
-            left, right = resolved.split("==", 1)
-            return left.strip() == right.strip()
-        elif ">=" in resolved:
-            left, right = resolved.split(">=", 1)
-            try:
-                return float(left.strip()) >= float(right.strip())
-            except (ValueError, TypeError):
-                return False
-        elif "<=" in resolved:
-            left, right = resolved.split("<=", 1)
-            try:
-                return float(left.strip()) <= float(right.strip())
-            except (ValueError, TypeError):
-                return False
-        elif ">" in resolved:
-            left, right = resolved.split(">", 1)
-            try:
-                return float(left.strip()) > float(right.strip())
-            except (ValueError, TypeError):
-                return False
-        elif "<" in resolved:
-            left, right = resolved.split("<", 1)
-            try:
-                return float(left.strip()) < float(right.strip())
-            except (ValueError, TypeError):
-                return False
-        
-        # If no operator, evaluate as boolean
-        return bool(resolved and resolved.lower() not in ("false", "0", ""))
+        from domain.steps.condition import compile_condition
+
+        return compile_condition(expr).evaluate(ctx)
@@ -4,8 +4,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple, Optional
 
+from application.services.phase_profiler import PhaseProfiler
 from application.services.template_renderer import TemplateRenderer, RenderSources
 
+_NO_PROFILER = PhaseProfiler()
+
 
 @dataclass(frozen=True)
 class FormComposeResult:
@@ -33,9 +36,19 @@ class FormComposer:
         src: RenderSources,
         vars_dict: Dict[str, Any],
         merge_from_vars: Optional[str],
+        profiler: PhaseProfiler = _NO_PROFILER,
     ) -> FormComposeResult:
-        rendered = self._renderer.render_form_list(form_list, src)
+        with profiler.span("render"):
+            rendered = self._renderer.render_form_list(form_list, src)
+        with profiler.span("compose"):
+            return self._merge(rendered, vars_dict, merge_from_vars)
 
+    def _merge(
+        self,
+        rendered: List[Tuple[str, str]],
+        vars_dict: Dict[str, Any],
+        merge_from_vars: Optional[str],
+    ) -> FormComposeResult:
         if not merge_from_vars:
             return FormComposeResult(form_list=rendered)
 
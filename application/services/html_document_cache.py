@@ -0,0 +1,47 @@
+# application/services/html_document_cache.py
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+
+from bs4 import BeautifulSoup
+
+HTML_PARSER = "lxml"
+
+
+class HtmlDocumentCache:
+    """
+    Per-run cache of parsed HTML documents, keyed by body_sha256.
+
+    The HTTP handler (title), trace enrichers and scrape steps all read the same
+    response; the first caller parses it and the others reuse the tree.
+    Documents are shared, so callers must treat them as read-only.
+    """
+
+    def __init__(self, max_documents: int = 4, parser: str = HTML_PARSER) -> None:
+        self._max_documents = max_documents
+        self._parser = parser
+        self._documents: "OrderedDict[str, BeautifulSoup]" = OrderedDict()
+        self._lock = Lock()
+        self.parse_count = 0
+
+    def get(self, html: str, key: Optional[str] = None) -> BeautifulSoup:
+        """
+        Return the parsed document for html, parsing it on first use.
+        key: body_sha256 of the response when known; otherwise derived from html.
+        """
+        cache_key = key or hashlib.sha256(html.encode("utf-8", errors="replace")).hexdigest()
+        with self._lock:
+            soup = self._documents.get(cache_key)
+            if soup is not None:
+                self._documents.move_to_end(cache_key)
+                return soup
+
+            soup = BeautifulSoup(html, self._parser)
+            self.parse_count += 1
+            self._documents[cache_key] = soup
+            while len(self._documents) > self._max_documents:
+                self._documents.popitem(last=False)
+            return soup
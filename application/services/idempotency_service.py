@@ -15,3 +15,7 @@ class IdempotencyService:
     def register_or_raise(self, key: IdempotencyKey) -> None:
         if not self.store.register(key):
             raise IdempotencyError("Idempotency key already used")
+
+    def release(self, key: IdempotencyKey) -> None:
+        """Give a key back when the request it guarded was never executed."""
+        self.store.release(key)
@@ -0,0 +1,80 @@
+# application/services/phase_profiler.py
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, List
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *_exc: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("_profiler", "_phase", "_t0")
+
+    def __init__(self, profiler: "PhaseProfiler", phase: str) -> None:
+        self._profiler = profiler
+        self._phase = phase
+        self._t0 = 0.0
+
+    def __enter__(self) -> None:
+        self._t0 = self._profiler._clock()
+
+    def __exit__(self, *_exc: Any) -> None:
+        self._profiler.add(self._phase, self._profiler._clock() - self._t0)
+
+
+class PhaseProfiler:
+    """
+    Per-run phase timings: `with deps.profiler.span("decode"): ...`
+
+    Disabled (the default) span() returns one shared no-op context manager, so
+    instrumented code costs an attribute lookup and a call. Phases are timed
+    where they are, not nested: callers keep spans disjoint so the per-phase
+    totals add up to (at most) the step time.
+    A run executes one step at a time, so no locking is needed.
+    """
+
+    def __init__(self, enabled: bool = False, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.enabled = enabled
+        self._clock = clock
+        self._run: Dict[str, List[float]] = {}  # phase -> [count, total_sec, max_sec]
+        self._step: Dict[str, float] = {}
+
+    def span(self, phase: str) -> Any:
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, phase)
+
+    def add(self, phase: str, seconds: float) -> None:
+        if not self.enabled:
+            return
+        stats = self._run.get(phase)
+        if stats is None:
+            self._run[phase] = [1, seconds, seconds]
+        else:
+            stats[0] += 1
+            stats[1] += seconds
+            if seconds > stats[2]:
+                stats[2] = seconds
+        self._step[phase] = self._step.get(phase, 0.0) + seconds
+
+    def take_step(self) -> Dict[str, float]:
+        """Milliseconds per phase since the previous call (i.e. for the step that just ended)."""
+        step, self._step = self._step, {}
+        return {phase: round(sec * 1000, 3) for phase, sec in step.items()}
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            phase: {"count": int(count), "total_ms": round(total * 1000, 3), "max_ms": round(peak * 1000, 3)}
+            for phase, (count, total, peak) in self._run.items()
+        }
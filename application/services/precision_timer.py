@@ -0,0 +1,60 @@
+# application/services/precision_timer.py
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Callable
+
+
+class PrecisionTimer:
+    """
+    Wait until an absolute wall-clock instant with sub-millisecond jitter.
+
+    The wall-clock target is converted once to a perf_counter deadline (monotonic,
+    high resolution). The wait sleeps until spin_sec before the deadline (OS
+    sleep granularity is ~1ms or worse) and busy-waits the rest.
+    """
+
+    def __init__(
+        self,
+        spin_sec: float = 0.002,
+        wall_clock: Callable[[], float] = time.time,
+        perf_counter: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._spin_sec = spin_sec
+        self._wall_clock = wall_clock
+        self._perf_counter = perf_counter
+
+    def deadline(self, fire_at: datetime) -> float:
+        """perf_counter() value corresponding to fire_at."""
+        return self._perf_counter() + (fire_at.timestamp() - self._wall_clock())
+
+    def wait_until(self, fire_at: datetime) -> float:
+        """Block until fire_at; returns how late the release was (seconds, >= 0 when on time)."""
+        deadline = self.deadline(fire_at)
+        while True:
+            remaining = deadline - self._perf_counter()
+            if remaining <= self._spin_sec:
+                break
+            time.sleep(remaining - self._spin_sec)
+        return self._spin(deadline)
+
+    async def async_wait_until(self, fire_at: datetime) -> float:
+        """
+        asyncio version: sleeps on the loop, then spins at most spin_sec inline
+        (a short, bounded stall of the loop that buys the precision).
+        """
+        deadline = self.deadline(fire_at)
+        while True:
+            remaining = deadline - self._perf_counter()
+            if remaining <= self._spin_sec:
+                break
+            await asyncio.sleep(remaining - self._spin_sec)
+        return self._spin(deadline)
+
+    def _spin(self, deadline: float) -> float:
+        now = self._perf_counter()
+        while now < deadline:
+            now = self._perf_counter()
+        return now - deadline
@@ -0,0 +1,335 @@
+# application/services/response_body.py
+from __future__ import annotations
+
+import codecs
+import hashlib
+import mmap
+import os
+import re
+import tempfile
+import weakref
+from dataclasses import dataclass, replace
+from pathlib import Path
+from threading import Lock
+from typing import BinaryIO, List, Mapping, Optional, Tuple
+
+# Reason: Pages labelled Shift_JIS routinely contain Windows-31J extensions (①, ㈱ ...).
+# Impact: Those labels decode as cp932, the superset browsers use, instead of producing U+FFFD.
+_CODEC_ALIASES = {
+    "shift_jis": "cp932",
+    "shift-jis": "cp932",
+    "sjis": "cp932",
+    "x-sjis": "cp932",
+    "ms_kanji": "cp932",
+    "windows-31j": "cp932",
+}
+_BOMS: Tuple[Tuple[bytes, str], ...] = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_HEADER_CHARSET = re.compile(r"charset\s*=\s*[\"']?([^\s;\"']+)", re.I)
+_META_CHARSET = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?\s*([A-Za-z0-9._:-]+)", re.I)
+# Like browsers, only the start of the document is searched for <meta charset>
+_META_SNIFF_BYTES = 4096
+_FALLBACK_ENCODING = "cp932"
+_TEXTUAL_TYPES = ("html", "xml", "json", "javascript", "csv")
+
+
+def _codec(label: Optional[str]) -> Optional[str]:
+    if not label:
+        return None
+    name = _CODEC_ALIASES.get(label.strip().lower(), label.strip())
+    try:
+        codecs.lookup(name)
+    except LookupError:
+        return None
+    return name
+
+
+def _header(headers: Mapping[str, str], name: str) -> str:
+    value = headers.get(name)
+    if value is None:
+        lowered = name.lower()
+        value = next((v for k, v in headers.items() if k.lower() == lowered), None)
+    return value or ""
+
+
+def sniff_encoding(raw: bytes, headers: Mapping[str, str]) -> Optional[str]:
+    """
+    Encoding declared for raw (bytes or an mmap): BOM, then the Content-Type
+    charset, then a <meta charset> / http-equiv declaration near the top.
+    None if undeclared.
+    """
+    for bom, encoding in _BOMS:
+        if raw[: len(bom)] == bom:
+            return encoding
+    m = _HEADER_CHARSET.search(_header(headers, "Content-Type"))
+    declared = _codec(m.group(1)) if m else None
+    if declared:
+        return declared
+    m = _META_CHARSET.search(raw[:_META_SNIFF_BYTES])
+    return _codec(m.group(1).decode("ascii", errors="ignore")) if m else None
+
+
+def decode_body(raw: bytes, headers: Mapping[str, str]) -> Tuple[str, str]:
+    """
+    Decode raw once: the declared encoding (sniff_encoding), otherwise strict
+    UTF-8, otherwise cp932 (the usual encoding of the Japanese sites we target).
+    Returns (text, encoding used).
+    """
+    encoding = sniff_encoding(raw, headers)
+    if encoding:
+        return str(raw, encoding, "replace"), encoding
+    try:
+        return str(raw, "utf-8"), "utf-8"
+    except UnicodeDecodeError:
+        return str(raw, _FALLBACK_ENCODING, "replace"), _FALLBACK_ENCODING
+
+
+def is_textual(headers: Mapping[str, str]) -> bool:
+    """True unless Content-Type names a non-text type (PDF, images, archives ...)."""
+    ctype = _header(headers, "Content-Type").lower()
+    return not ctype or ctype.startswith("text/") or any(kind in ctype for kind in _TEXTUAL_TYPES)
+
+
+def content_length(headers: Mapping[str, str]) -> Optional[int]:
+    value = _header(headers, "Content-Length")
+    return int(value) if value.isdigit() else None
+
+
+class ResponseBodyTooLargeError(Exception):
+    pass
+
+
+class DownloadPathError(Exception):
+    pass
+
+
+def resolve_download_path(root: str, path: str) -> str:
+    """
+    path (a rendered save_to_file) as an absolute path inside root.
+    Relative paths are taken from root; one that leaves it ("../", an
+    absolute path elsewhere, a symlink out) raises DownloadPathError.
+    """
+    base = Path(root).resolve()
+    target = (base / path).resolve()
+    if target == base or not target.is_relative_to(base):
+        raise DownloadPathError(f"save_to_file must stay inside {base}: {path}")
+    return str(target)
+
+
+@dataclass(frozen=True)
+class BodyLimits:
+    """
+    How a client reads a response body.
+
+    - max_bytes: fail the request once the (decoded transfer) body exceeds this; None = unlimited
+    - spill_bytes: bodies growing past this go to a temp file instead of memory; None = never
+    - spill_dir: directory for spilled bodies (None: the system temp dir)
+    - save_to: write the body to this file whatever its size (kept after the run)
+    """
+    max_bytes: Optional[int] = None
+    spill_bytes: Optional[int] = None
+    spill_dir: Optional[str] = None
+    save_to: Optional[str] = None
+
+    def override(self, other: Optional["BodyLimits"]) -> "BodyLimits":
+        """self with every field set in other taking precedence (per-step over client defaults)."""
+        if other is None:
+            return self
+        return replace(
+            self,
+            max_bytes=other.max_bytes if other.max_bytes is not None else self.max_bytes,
+            spill_bytes=other.spill_bytes if other.spill_bytes is not None else self.spill_bytes,
+            spill_dir=other.spill_dir if other.spill_dir is not None else self.spill_dir,
+            save_to=other.save_to if other.save_to is not None else self.save_to,
+        )
+
+
+class ResponseBody:
+    """
+    A response body held once and decoded lazily, at most once.
+
+    The body is either bytes in memory or a file (spilled or saved download).
+    The decoded text and the digest are cached, so ctx.last, the HTTP trace,
+    the artifact saver and the scrapers all share the same objects instead of
+    each keeping a decoded copy. A file body is decoded straight from a
+    memory map, and only when its Content-Type is textual; a spilled temp
+    file is deleted once the body is garbage collected.
+    A body built from text only (clients or test doubles without raw bytes)
+    serves that text as-is.
+    """
+
+    def __init__(
+        self,
+        raw: Optional[bytes],
+        headers: Mapping[str, str],
+        text: Optional[str] = None,
+        sha256: Optional[str] = None,
+    ) -> None:
+        self._raw = raw if raw else None
+        self._headers = headers
+        self._text = text if self._raw is None else None
+        self._encoding: Optional[str] = None
+        self._sha256 = sha256
+        self._path: Optional[str] = None
+        self._size = len(self._raw) if self._raw is not None else len(text or "")
+        self._lock = Lock()
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str,
+        headers: Mapping[str, str],
+        size: int,
+        sha256: str,
+        temporary: bool = False,
+    ) -> "ResponseBody":
+        body = cls(None, headers, sha256=sha256)
+        body._path = path
+        body._size = size
+        if temporary:
+            weakref.finalize(body, _remove_quietly, path)
+        return body
+
+    @property
+    def raw(self) -> Optional[bytes]:
+        """The bytes when held in memory; None for file bodies (see path)."""
+        return self._raw
+
+    @property
+    def path(self) -> Optional[str]:
+        return self._path
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            with self._lock:
+                if self._text is None:
+                    self._text, self._encoding = self._decode()
+        return self._text
+
+    @property
+    def encoding(self) -> Optional[str]:
+        """Encoding the text was decoded with (None when nothing was decoded)."""
+        self.text
+        return self._encoding
+
+    @property
+    def sha256(self) -> str:
+        """Digest of the raw bytes, or of the UTF-8 text when only text is known."""
+        if self._sha256 is None:
+            data = self._raw if self._raw is not None else self.text.encode("utf-8", errors="replace")
+            self._sha256 = hashlib.sha256(data).hexdigest()
+        return self._sha256
+
+    def head(self, chars: int) -> str:
+        """
+        The first chars characters. A file body that was not decoded yet is
+        read only that far, so a large download stays undecoded.
+        """
+        if self._text is not None or self._path is None:
+            return self.text[:chars]
+        if self._size == 0 or not is_textual(self._headers):
+            return ""
+        with open(self._path, "rb") as f:
+            raw = f.read(chars * 4)
+        encoding = sniff_encoding(raw, self._headers)
+        if encoding is None:
+            try:
+                # incremental: a character cut at the end of the read is not an error
+                return codecs.getincrementaldecoder("utf-8")().decode(raw)[:chars]
+            except UnicodeDecodeError:
+                encoding = _FALLBACK_ENCODING
+        return codecs.getincrementaldecoder(encoding)("replace").decode(raw)[:chars]
+
+    def _decode(self) -> Tuple[str, Optional[str]]:
+        if self._raw is not None:
+            return decode_body(self._raw, self._headers)
+        if self._path is None or self._size == 0 or not is_textual(self._headers):
+            return "", None
+        with open(self._path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            return decode_body(view, self._headers)
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+class BodyCollector:
+    """
+    Assemble a streamed body chunk by chunk under BodyLimits.
+
+    The SHA-256 is updated as chunks arrive; the body stays in memory until it
+    passes spill_bytes and is then moved to a temp file (or goes to save_to
+    from the first chunk). Call abort() if reading fails midway.
+    """
+
+    def __init__(self, limits: BodyLimits, expected_length: Optional[int] = None) -> None:
+        self._limits = limits
+        if limits.max_bytes is not None and expected_length is not None and expected_length > limits.max_bytes:
+            raise ResponseBodyTooLargeError(f"response body is {expected_length} bytes (limit {limits.max_bytes})")
+        self._chunks: List[bytes] = []
+        self._size = 0
+        self._sha = hashlib.sha256()
+        self._file: Optional[BinaryIO] = None
+        self._path: Optional[str] = None
+        self._temporary = False
+        if limits.save_to:
+            target = Path(limits.save_to)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            self._file = target.open("wb")
+            self._path = str(target)
+
+    def feed(self, chunk: bytes) -> None:
+        if not chunk:
+            return
+        self._size += len(chunk)
+        if self._limits.max_bytes is not None and self._size > self._limits.max_bytes:
+            self.abort()
+            raise ResponseBodyTooLargeError(f"response body exceeds {self._limits.max_bytes} bytes")
+        self._sha.update(chunk)
+        if self._file is not None:
+            self._file.write(chunk)
+            return
+        self._chunks.append(chunk)
+        if self._limits.spill_bytes is not None and self._size > self._limits.spill_bytes:
+            self._spill()
+
+    def finish(self, headers: Mapping[str, str]) -> ResponseBody:
+        if self._file is None:
+            raw = b"".join(self._chunks)
+            self._chunks = []
+            return ResponseBody(raw, headers, sha256=self._sha.hexdigest())
+        self._file.close()
+        self._file = None
+        return ResponseBody.from_file(
+            self._path, headers, size=self._size, sha256=self._sha.hexdigest(), temporary=self._temporary
+        )
+
+    def abort(self) -> None:
+        self._chunks = []
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._path is not None:
+            _remove_quietly(self._path)
+            self._path = None
+
+    def _spill(self) -> None:
+        if self._limits.spill_dir:
+            Path(self._limits.spill_dir).mkdir(parents=True, exist_ok=True)
+        fd, self._path = tempfile.mkstemp(prefix="webpost-body-", dir=self._limits.spill_dir)
+        self._temporary = True
+        self._file = os.fdopen(fd, "wb")
+        for chunk in self._chunks:
+            self._file.write(chunk)
+        self._chunks = []
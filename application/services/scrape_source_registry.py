@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Protocol
+from typing import Dict, Optional, Protocol
 
 from domain.run import RunContext
 
@@ -14,6 +14,10 @@ class ScrapeSource(Protocol):
     def get_text(self, ctx: RunContext) -> str:
         ...
 
+    def get_key(self, ctx: RunContext) -> Optional[str]:
+        """Cache key of the source document (body_sha256), or None if unknown."""
+        ...
+
 
 @dataclass(frozen=True)
 class LastTextSource:
@@ -22,6 +26,9 @@ class LastTextSource:
             raise ScrapeSourceError("scrape requires ctx.last.text (no previous response)")
         return ctx.last.text
 
+    def get_key(self, ctx: RunContext) -> Optional[str]:
+        return ctx.last.body_sha256 if ctx.last else None
+
 
 @dataclass(frozen=True)
 class ScrapeSourceRegistry:
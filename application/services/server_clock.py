@@ -0,0 +1,144 @@
+# application/services/server_clock.py
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import Deque, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+
+@dataclass(frozen=True)
+class ClockSample:
+    sent_at: float      # local wall clock (time.time()) before the request
+    received_at: float  # local wall clock after the response
+    server_at: float    # Date header (epoch seconds, 1s resolution)
+
+    @property
+    def rtt(self) -> float:
+        return self.received_at - self.sent_at
+
+    @property
+    def bounds(self) -> tuple[float, float]:
+        """
+        Offset interval (server - local) consistent with this sample.
+        The server stamped Date somewhere between send and receive, and Date
+        truncates to the second, so server time was in [Date, Date + 1).
+        """
+        return self.server_at - self.received_at, self.server_at + 1.0 - self.sent_at
+
+
+@dataclass(frozen=True)
+class ServerClockEstimate:
+    offset_sec: float       # server clock - local clock
+    uncertainty_sec: float  # half width of the consistent interval
+    rtt_sec: float          # best (minimum) round trip seen
+    samples: int            # samples behind the estimate
+
+    def to_local(self, server_time: datetime) -> datetime:
+        return server_time - timedelta(seconds=self.offset_sec)
+
+
+class ServerClockEstimator:
+    """
+    NTP-style offset estimate for one server from HTTP Date headers.
+
+    Each response bounds the offset to an interval of width rtt + 1s, and the
+    bound holds whatever the RTT was, so all retained samples are intersected;
+    samples that straddle a Date second boundary shrink the interval far below
+    the header's 1s resolution. The minimum RTT is reported as link quality.
+    If the intervals stop overlapping (a clock was stepped), older samples are
+    discarded and the estimate restarts from the newest one.
+    """
+
+    def __init__(self, max_samples: int = 64) -> None:
+        self._samples: Deque[ClockSample] = deque(maxlen=max_samples)
+        self._lock = Lock()
+
+    def observe(self, sent_at: float, received_at: float, date_header: Optional[str]) -> Optional[ServerClockEstimate]:
+        server_at = _parse_http_date(date_header)
+        if server_at is None or received_at < sent_at:
+            return self.estimate()
+        with self._lock:
+            self._samples.append(ClockSample(sent_at, received_at, server_at))
+            if self._intersect() is None:
+                newest = self._samples[-1]
+                self._samples.clear()
+                self._samples.append(newest)
+            return self._estimate_locked()
+
+    def estimate(self) -> Optional[ServerClockEstimate]:
+        with self._lock:
+            return self._estimate_locked()
+
+    def _intersect(self) -> Optional[tuple[float, float]]:
+        if not self._samples:
+            return None
+        lo = max(s.bounds[0] for s in self._samples)
+        hi = min(s.bounds[1] for s in self._samples)
+        if lo > hi:
+            return None
+        return lo, hi
+
+    def _estimate_locked(self) -> Optional[ServerClockEstimate]:
+        bounds = self._intersect()
+        if bounds is None:
+            return None
+        lo, hi = bounds
+        return ServerClockEstimate(
+            offset_sec=(lo + hi) / 2,
+            uncertainty_sec=(hi - lo) / 2,
+            rtt_sec=min(s.rtt for s in self._samples),
+            samples=len(self._samples),
+        )
+
+
+class ServerClockRegistry:
+    """Per-host ServerClockEstimator, shared by all runs talking to the same site."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._by_host: Dict[str, ServerClockEstimator] = {}
+
+    def observe(
+        self,
+        url: str,
+        sent_at: Optional[float],
+        received_at: Optional[float],
+        headers: Mapping[str, str],
+    ) -> Optional[ServerClockEstimate]:
+        host = host_of(url)
+        if not host or sent_at is None or received_at is None:
+            return None
+        lowered = {k.lower(): v for k, v in headers.items()}
+        if "age" in lowered:
+            # served from a cache: Date is when the origin produced it, not now
+            return self.estimate(host)
+        return self._estimator(host).observe(sent_at, received_at, lowered.get("date"))
+
+    def estimate(self, host: str) -> Optional[ServerClockEstimate]:
+        with self._lock:
+            estimator = self._by_host.get(host)
+        return estimator.estimate() if estimator else None
+
+    def _estimator(self, host: str) -> ServerClockEstimator:
+        with self._lock:
+            estimator = self._by_host.get(host)
+            if estimator is None:
+                estimator = self._by_host[host] = ServerClockEstimator()
+            return estimator
+
+
+def host_of(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+def _parse_http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Tuple
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple, Union
 
 
 class TemplateRenderError(Exception):
@@ -16,6 +17,98 @@ class RenderSources:
     last: Dict[str, Any]
 
 
+_ROOTS = ("vars", "state", "secrets", "last")
+
+# Path part kinds (pre-classified at compile time)
+_KEY = 0
+_INDEX = 1
+_EXPAND = 2
+_INVALID = 3
+
+PathPart = Tuple[int, Union[str, int]]
+
+
+@dataclass(frozen=True)
+class PathSegment:
+    """${root.a.b} reference with the path already split and classified."""
+    root: str
+    parts: Tuple[PathPart, ...]
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """A template string parsed into literal (str) and PathSegment pieces."""
+    segments: Tuple[Union[str, PathSegment], ...]
+
+
+def _compile_part(part: str) -> PathPart:
+    if part.endswith("[*]"):
+        return (_EXPAND, part[:-3])
+    if "[*]" in part:
+        return (_INVALID, part)
+    if part.isdigit():
+        return (_INDEX, int(part))
+    return (_KEY, part)
+
+
+def _compile_path(expr: str) -> PathSegment:
+    root_name, _, rest = expr.partition(".")
+    if root_name not in _ROOTS:
+        raise TemplateRenderError(f"unknown root: {root_name}")
+    parts = tuple(_compile_part(p) for p in rest.split(".")) if rest else ()
+    return PathSegment(root=root_name, parts=parts)
+
+
+@lru_cache(maxsize=8192)
+def compile_template(s: str) -> CompiledTemplate:
+    """
+    Parse a template string once. Scenario templates are immutable, so the
+    compiled form is cached process-wide by the template string itself.
+    """
+    segments: List[Union[str, PathSegment]] = []
+    i = 0
+    while i < len(s):
+        start = s.find("${", i)
+        if start < 0:
+            segments.append(s[i:])
+            break
+        if start > i:
+            segments.append(s[i:start])
+        end = s.find("}", start + 2)
+        if end < 0:
+            raise TemplateRenderError(f"unclosed template: {s}")
+        segments.append(_compile_path(s[start + 2 : end].strip()))
+        i = end + 1
+    return CompiledTemplate(segments=tuple(segments))
+
+
+def precompile_templates(obj: Any) -> int:
+    """
+    Compile every template string reachable from obj (scenario, steps, dicts, lists).
+    Called at scenario load so the first run does not pay the parse.
+    Invalid templates are skipped here; they still fail when the step renders them.
+    Returns the number of template strings visited.
+    """
+    count = 0
+    if isinstance(obj, str):
+        if "${" in obj:
+            try:
+                compile_template(obj)
+            except TemplateRenderError:
+                pass
+            count += 1
+    elif isinstance(obj, dict):
+        for k, v in obj.items():
+            count += precompile_templates(k) + precompile_templates(v)
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            count += precompile_templates(item)
+    elif is_dataclass(obj) and not isinstance(obj, type):
+        for f in fields(obj):
+            count += precompile_templates(getattr(obj, f.name))
+    return count
+
+
 class TemplateRenderer:
     """
     ${vars.xxx}, ${state.xxx}, ${secrets.xxx}, ${last.xxx} を展開する。
@@ -46,93 +139,53 @@ class TemplateRenderer:
         if "${" not in s:
             return s
 
-        # 複数埋め込みを順に処理
-        result = ""
-        i = 0
-        while i < len(s):
-            start = s.find("${", i)
-            if start < 0:
-                result += s[i:]
-                break
-            result += s[i:start]
-            end = s.find("}", start + 2)
-            if end < 0:
-                raise TemplateRenderError(f"unclosed template: {s}")
-            expr = s[start + 2 : end].strip()
-            value = self._eval(expr, src)
+        # 複数埋め込みを順に処理（パースは compile_template でキャッシュ済み）
+        out: List[str] = []
+        for seg in compile_template(s).segments:
+            if isinstance(seg, str):
+                out.append(seg)
+                continue
+
+            value = self._eval_segment(seg, src)
 
             if isinstance(value, list):
                 # form value としては join して文字列化
                 value = ",".join("" if x is None else str(x) for x in value)
 
-            result += "" if value is None else str(value)
-            i = end + 1
-
-        return result
-
-    def _eval(self, expr: str, src: RenderSources) -> Any:
-        # expr: vars.xxx / state.xxx / secrets.xxx / last.xxx
-        root_name, rest = self._split_root(expr)
-
-        root = {
-            "vars": src.vars,
-            "state": src.state,
-            "secrets": src.secrets,
-            "last": src.last,
-        }.get(root_name)
+            out.append("" if value is None else str(value))
 
-        if root is None:
-            raise TemplateRenderError(f"unknown root: {root_name}")
+        return "".join(out)
 
-        if rest == "":
-            return root
-
-        return self._resolve_path(root, rest)
+    def _eval_segment(self, seg: PathSegment, src: RenderSources) -> Any:
+        cur = getattr(src, seg.root)
+        for part in seg.parts:
+            cur = self._apply_part(cur, part)
+        return cur
 
-    def _split_root(self, expr: str) -> Tuple[str, str]:
-        if "." in expr:
-            a, b = expr.split(".", 1)
-            return a, b
-        return expr, ""
+    def _apply_part(self, cur: Any, part: PathPart) -> Any:
+        kind, value = part
 
-    def _resolve_path(self, obj: Any, path: str) -> Any:
-        """
-        path examples:
-          a.b.c
-          items[*].id
-          items.0.id
-        """
-        cur = obj
-        parts = path.split(".")
-        for p in parts:
-            cur = self._resolve_part(cur, p)
-        return cur
+        # normal dict key
+        if kind == _KEY:
+            return self._get_key(cur, value)
 
-    def _resolve_part(self, cur: Any, part: str) -> Any:
         # [*]
-        if part.endswith("[*]"):
-            key = part[:-3]
-            arr = self._get_key(cur, key)
+        if kind == _EXPAND:
+            arr = self._get_key(cur, value)
             if not isinstance(arr, list):
-                raise TemplateRenderError(f"{key} is not list for [*] expansion")
+                raise TemplateRenderError(f"{value} is not list for [*] expansion")
             return arr
 
-        # key[*].x 形式のために、part に [*] が含まれていたら分解
-        if "[*]" in part:
-            # e.g. items[*] handled above, so here is like items[*]something => invalid
-            raise TemplateRenderError(f"invalid [*] usage: {part}")
-
         # list index
-        if part.isdigit():
-            idx = int(part)
+        if kind == _INDEX:
             if not isinstance(cur, list):
-                raise TemplateRenderError(f"index access on non-list: {part}")
-            if idx < 0 or idx >= len(cur):
+                raise TemplateRenderError(f"index access on non-list: {value}")
+            if value < 0 or value >= len(cur):
                 return ""
-            return cur[idx]
+            return cur[value]
 
-        # normal dict key
-        return self._get_key(cur, part)
+        # e.g. items[*]something => invalid
+        raise TemplateRenderError(f"invalid [*] usage: {value}")
 
     def _get_key(self, cur: Any, key: str) -> Any:
         if isinstance(cur, dict):
@@ -0,0 +1,235 @@
+# application/services/trace_pipeline.py
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from threading import Condition, Thread
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from application.http_trace import HttpTrace
+    from application.http_trace_enricher import HttpTraceEnricher
+    from application.services.execution_deps import ExecutionDeps
+
+OVERFLOW_POLICIES = ("block", "drop_newest", "drop_oldest")
+
+
+@dataclass(frozen=True)
+class TraceJob:
+    trace: "HttpTrace"
+    deps: "ExecutionDeps"
+    enrichers: Sequence["HttpTraceEnricher"]
+
+
+@dataclass(frozen=True)
+class TracePipelineStats:
+    submitted: int
+    processed: int
+    dropped: int
+    timeouts: int
+    failures: int
+    queued: int
+
+
+class _Shard:
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.jobs: Deque[TraceJob] = deque()
+        self.cond = Condition()
+        # enricher calls run here so a stuck one can be abandoned by the worker
+        self.runner = _new_runner(index)
+
+
+def _new_runner(index: int) -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"trace-enricher-{index}")
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class TracePipeline:
+    """
+    Runs deferred trace enrichers (HTML signals, artifact files ...) on
+    background workers, so the next step does not wait for them.
+
+    - Traces are sharded by run_id: one worker enriches a run's traces, in order
+    - A worker drains up to batch_size queued traces per wake-up
+    - Each enricher call is bounded by enricher_timeout_sec; a call that overruns
+      is abandoned (logged as http.trace.enricher_timeout), not killed
+    - When a shard is full: "block" waits up to block_timeout_sec and then
+      enriches in the caller (backpressure, nothing lost), "drop_newest"
+      discards the new trace, "drop_oldest" discards the oldest queued one
+    - A caller on an event loop thread never blocks: "block" acts as
+      "drop_newest" there, since waiting would stall every run on the loop
+    - flush(run_id) waits until every trace submitted for the run is done or dropped
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        queue_size: int = 256,
+        batch_size: int = 16,
+        enricher_timeout_sec: float = 5.0,
+        overflow: str = "block",
+        block_timeout_sec: float = 1.0,
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}: {overflow}")
+        self._capacity = max(1, queue_size // max(1, workers))
+        self._batch_size = max(1, batch_size)
+        self._enricher_timeout_sec = enricher_timeout_sec
+        self._overflow = overflow
+        self._block_timeout_sec = block_timeout_sec
+        self._shards = [_Shard(index) for index in range(max(1, workers))]
+        self._pending: Dict[str, int] = {}
+        self._pending_cond = Condition()
+        self._counts = {"submitted": 0, "processed": 0, "dropped": 0, "timeouts": 0, "failures": 0}
+        self._closed = False
+        self._threads: List[Thread] = []
+        for index, shard in enumerate(self._shards):
+            thread = Thread(target=self._work, args=(shard,), name=f"trace-pipeline-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, trace: "HttpTrace", deps: "ExecutionDeps", enrichers: Sequence["HttpTraceEnricher"]) -> bool:
+        """Queue the trace for enrichment. False if it was dropped."""
+        job = TraceJob(trace=trace, deps=deps, enrichers=tuple(enrichers))
+        shard = self._shards[hash(trace.run_id) % len(self._shards)]
+        policy = self._overflow
+        if policy == "block" and _on_event_loop():
+            policy = "drop_newest"
+        self._begin(trace.run_id)
+        dropped: Optional[TraceJob] = None
+        queued = False
+        with shard.cond:
+            if not self._closed:
+                if len(shard.jobs) >= self._capacity:
+                    if policy == "drop_newest":
+                        dropped = job
+                    elif policy == "drop_oldest":
+                        dropped = shard.jobs.popleft()
+                    else:
+                        shard.cond.wait_for(
+                            lambda: len(shard.jobs) < self._capacity or self._closed, self._block_timeout_sec
+                        )
+                if dropped is not job and len(shard.jobs) < self._capacity and not self._closed:
+                    shard.jobs.append(job)
+                    shard.cond.notify_all()
+                    queued = True
+        if dropped is not None:
+            self._drop(dropped, policy)
+        if dropped is job:
+            return False
+        if not queued:
+            # still full after block_timeout_sec (backpressure) or closed: enrich
+            # in the caller, unbounded like the inline path without a pipeline
+            self._process(None, job)
+        return True
+
+    def flush(self, run_id: str, timeout_sec: float) -> bool:
+        """Wait for the run's queued traces; False if some were still pending at the timeout."""
+        with self._pending_cond:
+            return self._pending_cond.wait_for(lambda: not self._pending.get(run_id), timeout_sec)
+
+    def stats(self) -> TracePipelineStats:
+        queued = sum(len(shard.jobs) for shard in self._shards)
+        with self._pending_cond:
+            return TracePipelineStats(queued=queued, **self._counts)
+
+    def close(self, timeout_sec: float = 5.0) -> None:
+        """Stop accepting work, let workers drain their queues and stop."""
+        self._closed = True
+        for shard in self._shards:
+            with shard.cond:
+                shard.cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout_sec)
+        for shard in self._shards:
+            shard.runner.shutdown(wait=False)
+
+    def _work(self, shard: _Shard) -> None:
+        while True:
+            with shard.cond:
+                shard.cond.wait_for(lambda: shard.jobs or self._closed)
+                if not shard.jobs:
+                    return
+                batch = [shard.jobs.popleft() for _ in range(min(self._batch_size, len(shard.jobs)))]
+                # wake producers blocked on a full shard
+                shard.cond.notify_all()
+            for job in batch:
+                self._process(shard, job)
+
+    def _process(self, shard: Optional[_Shard], job: TraceJob) -> None:
+        try:
+            for enricher in job.enrichers:
+                self._call(shard, enricher, job)
+        finally:
+            self._finish(job.trace.run_id, "processed")
+
+    def _call(self, shard: Optional[_Shard], enricher: "HttpTraceEnricher", job: TraceJob) -> None:
+        name = type(enricher).__name__
+        try:
+            if shard is None or self._enricher_timeout_sec <= 0:
+                enricher.enrich_and_log(job.trace, job.deps)
+                return
+            future = shard.runner.submit(enricher.enrich_and_log, job.trace, job.deps)
+            # Reason: future.result(timeout=...) raises the builtin TimeoutError, which an enricher may raise too.
+            # Impact: Only a call still running at the deadline counts as a timeout; its own errors are failures.
+            done, _ = wait([future], timeout=self._enricher_timeout_sec)
+            if future in done:
+                future.result()
+                return
+        except Exception as e:
+            self._count("failures")
+            job.deps.logger.error(
+                "http.trace.enricher_failed",
+                step_id=job.trace.step_id,
+                enricher=name,
+                error=str(e),
+            )
+            return
+        # the stuck call keeps its thread; later calls get a fresh one
+        shard.runner.shutdown(wait=False)
+        shard.runner = _new_runner(shard.index)
+        self._count("timeouts")
+        job.deps.logger.error(
+            "http.trace.enricher_timeout",
+            step_id=job.trace.step_id,
+            enricher=name,
+            timeout_sec=self._enricher_timeout_sec,
+        )
+
+    def _drop(self, job: TraceJob, policy: str) -> None:
+        job.deps.logger.error(
+            "http.trace.dropped",
+            step_id=job.trace.step_id,
+            policy=policy,
+            enrichers=[type(e).__name__ for e in job.enrichers],
+        )
+        self._finish(job.trace.run_id, "dropped")
+
+    def _begin(self, run_id: str) -> None:
+        with self._pending_cond:
+            self._counts["submitted"] += 1
+            self._pending[run_id] = self._pending.get(run_id, 0) + 1
+
+    def _finish(self, run_id: str, outcome: str) -> None:
+        with self._pending_cond:
+            self._counts[outcome] += 1
+            remaining = self._pending.get(run_id, 1) - 1
+            if remaining > 0:
+                self._pending[run_id] = remaining
+            else:
+                self._pending.pop(run_id, None)
+                self._pending_cond.notify_all()
+
+    def _count(self, key: str) -> None:
+        with self._pending_cond:
+            self._counts[key] += 1
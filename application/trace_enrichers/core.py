@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from application.http_trace import HttpTrace
 from application.http_trace_enricher import HttpTraceEnricher
+from application.ports.logger import lazy
 from application.services.execution_deps import ExecutionDeps
 from application.services.redactor import mask_dict, mask_pairs
 
@@ -52,13 +53,15 @@ class HttpCoreTraceLogger(HttpTraceEnricher):
             set_cookie=bool(trace.response.headers.get("Set-Cookie")),
             location=trace.response.headers.get("Location"),
             collision_keys=trace.collision_keys,
+            rate_limit_wait_ms=round(trace.rate_limit_wait_sec * 1000, 1),
+            **_server_clock_fields(trace),
         )
 
         deps.logger.debug(
             "http.request_detail",
             step_id=trace.step_id,
-            headers=mask_dict(trace.request_headers),
-            form=mask_pairs(trace.request_form),
+            headers=lazy(lambda: mask_dict(trace.request_headers)),
+            form=lazy(lambda: mask_pairs(trace.request_form)),
         )
 
         deps.logger.debug(
@@ -67,3 +70,14 @@ class HttpCoreTraceLogger(HttpTraceEnricher):
             cookies_before_count=len(trace.cookies_before.items),
             cookies_after_count=len(trace.cookies_after.items),
         )
+
+
+def _server_clock_fields(trace: HttpTrace) -> dict:
+    estimate = trace.server_clock
+    if estimate is None:
+        return {}
+    return {
+        "server_offset_ms": round(estimate.offset_sec * 1000, 1),
+        "server_uncertainty_ms": round(estimate.uncertainty_sec * 1000, 1),
+        "server_rtt_ms": round(estimate.rtt_sec * 1000, 1),
+    }
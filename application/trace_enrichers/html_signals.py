@@ -35,6 +35,8 @@ class HtmlSignalLogger(HttpTraceEnricher):
     - 必要最小限の hidden（ホワイトリスト）
     """
 
+    deferrable = True
+
     # 必要なら増やす（機密性の高いものは入れない）
     _HIDDEN_WHITELIST = [
         "screenID",
@@ -57,7 +59,7 @@ class HtmlSignalLogger(HttpTraceEnricher):
         hidden_summary: dict[str, str | None] = {}
 
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = deps.documents.get(html, trace.response.body_sha256 if trace.response else None)
             action = _get_first_form_action(soup)
 
             # screenID は特別扱い（判定の軸）
@@ -0,0 +1 @@
+"""Throughput and latency benchmarks for the scenario runner (not part of the test suite)."""
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+End-to-end throughput benchmark: fun_navi_reserve against a local stand-in site.
+
+Modes:
+  executor  drive StepExecutor directly from a thread pool (one run per worker at a time)
+  api       drive the FastAPI app in-process over ASGI (POST /scenarios/{id}/runs?wait_sec=...),
+            so admission control, the run engine and the run stores are included.
+            WEBPOST_* settings (engine, max active runs ...) are read from the environment as usual.
+
+Usage:
+  python -m benchmarks.e2e --mode executor --runs 200 --concurrency 1,8,32
+  WEBPOST_RUN_ENGINE=asyncio python -m benchmarks.e2e --mode api --page-kb 64 --latency-ms 20
+
+The report (stdout, or --output) is JSON with one entry per concurrency level:
+runs/sec, p50/p95/p99 run latency, CPU ms per run and peak RSS of this process.
+Run logs go through ConsoleLogger as in production; stdout is redirected to
+/dev/null while measuring.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import re
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from application.executor.handler_registry import HandlerRegistry
+from application.executor.step_executor import StepExecutor
+from application.handlers.assert_handler import AssertStepHandler
+from application.handlers.http_handler import HttpStepHandler
+from application.handlers.log_handler import LogStepHandler
+from application.handlers.result_handler import ResultStepHandler
+from application.handlers.scrape_handler import ScrapeStepHandler
+from application.ports.requests_client import RequestsConnectionPool, RequestsSessionHttpClient
+from application.services.execution_deps import ExecutionDeps
+from application.services.template_renderer import TemplateRenderer
+from benchmarks.stats import UsageSnapshot, latency_summary_ms, peak_rss_mb
+from benchmarks.target_site import SiteOptions, TargetSite
+from domain.run import RunContext
+from domain.scenario import Scenario
+from infrastructure.http.artifact_store import ArtifactStore
+from infrastructure.logging.console_logger import ConsoleLogger
+from infrastructure.scenario.loader_registry import ScenarioLoaderRegistry
+from infrastructure.secrets.dict_secret_provider import DictSecretProvider
+from infrastructure.url.base_url_resolver import BaseUrlResolver
+
+SCENARIO_ID = "fun_navi_reserve"
+SCENARIO_PATH = PROJECT_ROOT / "scenarios" / f"{SCENARIO_ID}.yaml"
+RUN_VARS: Dict[str, Any] = {
+    "mansionGNo": "12345",
+    "facilityID": "001",
+    "facilityNo": "01",
+    "appliStart": "2026-02-01",
+    "eventFlg": "0",
+    "eventFacilityNo": "",
+    "rsvNo": "",
+    "spEventFlg": "0",
+    "selectDate": "2026-02-02",
+    "toNo": "1",
+    "roomNo": "1",
+    "dates": ["2026-02-02", "2026-02-03"],
+    "hiddenUserId": "user01",
+}
+RUN_SECRETS = {"FUNNAVI_FULLTIME_ID": "bench-user", "FUNNAVI_PASSWORD": "bench-pass"}
+API_WAIT_SEC = 30
+
+RunOnce = Callable[[], bool]
+
+
+def load_scenario(base_url: str) -> Scenario:
+    """fun_navi_reserve with its base_url pointed at the stand-in site."""
+    scenario = ScenarioLoaderRegistry().get_loader(SCENARIO_PATH).load_from_file(str(SCENARIO_PATH))
+    http = replace(scenario.defaults.http, base_url=base_url)
+    return replace(scenario, defaults=replace(scenario.defaults, http=http))
+
+
+class ExecutorTarget:
+    """
+    Builds the same components per run as the API's thread engine and calls StepExecutor.
+    HTTP artifacts go to a private store that is removed on close().
+    """
+
+    def __init__(self, base_url: str, pool_maxsize: int) -> None:
+        self._scenario = load_scenario(base_url)
+        self._base_url = base_url
+        self._pool = RequestsConnectionPool(pool_maxsize=pool_maxsize)
+        self._artifact_dir = tempfile.TemporaryDirectory(prefix="webpost-bench-artifacts-")
+        self._artifact_store = ArtifactStore(self._artifact_dir.name)
+
+    def run_once(self) -> bool:
+        renderer = TemplateRenderer()
+        registry = HandlerRegistry(
+            [
+                HttpStepHandler(
+                    RequestsSessionHttpClient(pool=self._pool), renderer, artifact_store=self._artifact_store
+                ),
+                ScrapeStepHandler(),
+                AssertStepHandler(),
+                ResultStepHandler(renderer),
+                LogStepHandler(renderer),
+            ]
+        )
+        deps = ExecutionDeps(
+            logger=ConsoleLogger(),
+            secret_provider=DictSecretProvider(RUN_SECRETS),
+            url_resolver=BaseUrlResolver(self._base_url),
+        )
+        ctx = RunContext(run_id=uuid4().hex, vars=dict(RUN_VARS), state={}, last=None, result={})
+        result = StepExecutor(registry).execute(list(self._scenario.steps), ctx, deps)
+        return result.ok and bool(ctx.result and ctx.result.get("reservationNo"))
+
+    def close(self) -> None:
+        self._pool.close()
+        self._artifact_dir.cleanup()
+
+
+class ApiTarget:
+    """
+    Posts runs to the FastAPI app over an in-process ASGI transport.
+
+    The scenario is copied into a private scenarios directory with its base_url
+    rewritten; api.main reads WEBPOST_SCENARIOS_DIR at import, so this must be
+    built before anything imports api.main.
+    """
+
+    def __init__(self, base_url: str) -> None:
+        self._scenarios_dir = tempfile.TemporaryDirectory(prefix="webpost-bench-")
+        text = SCENARIO_PATH.read_text(encoding="utf-8")
+        text = re.sub(r"(?m)^(\s*base_url:).*$", rf"\g<1> {base_url}", text)
+        (Path(self._scenarios_dir.name) / SCENARIO_PATH.name).write_text(text, encoding="utf-8")
+        os.environ["WEBPOST_SCENARIOS_DIR"] = self._scenarios_dir.name
+
+        import httpx
+        from api import main
+
+        self.engine = main.RUN_ENGINE
+        self._client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=main.app),
+            base_url="http://webpost",
+            timeout=API_WAIT_SEC + 10,
+        )
+
+    async def run_once(self) -> bool:
+        response = await self._client.post(
+            f"/scenarios/{SCENARIO_ID}/runs",
+            params={"wait_sec": API_WAIT_SEC},
+            json={"vars": RUN_VARS, "secrets": RUN_SECRETS},
+        )
+        return response.status_code == 200 and response.json().get("success") is True
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+        self._scenarios_dir.cleanup()
+
+
+def _level_report(concurrency: int, outcomes: List[Tuple[bool, float]], used: UsageSnapshot) -> Dict[str, Any]:
+    latencies = [elapsed for _ok, elapsed in outcomes]
+    runs = len(outcomes)
+    return {
+        "concurrency": concurrency,
+        "runs": runs,
+        "failures": sum(1 for ok, _elapsed in outcomes if not ok),
+        "wall_sec": round(used.wall, 3),
+        "runs_per_sec": round(runs / used.wall, 2) if used.wall > 0 else 0.0,
+        "latency_ms": latency_summary_ms(latencies),
+        "cpu_ms_per_run": round(used.cpu / runs * 1000, 3) if runs else 0.0,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def measure_threads(run_once: RunOnce, runs: int, concurrency: int) -> Dict[str, Any]:
+    def timed(_index: int) -> Tuple[bool, float]:
+        t0 = time.perf_counter()
+        try:
+            ok = run_once()
+        except Exception:
+            ok = False
+        return ok, time.perf_counter() - t0
+
+    start = UsageSnapshot.take()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(timed, range(runs)))
+    return _level_report(concurrency, outcomes, UsageSnapshot.take().since(start))
+
+
+async def measure_async(run_once: Callable[[], Awaitable[bool]], runs: int, concurrency: int) -> Dict[str, Any]:
+    gate = asyncio.Semaphore(concurrency)
+
+    async def timed() -> Tuple[bool, float]:
+        async with gate:
+            t0 = time.perf_counter()
+            try:
+                ok = await run_once()
+            except Exception:
+                ok = False
+            return ok, time.perf_counter() - t0
+
+    start = UsageSnapshot.take()
+    outcomes = await asyncio.gather(*(timed() for _ in range(runs)))
+    return _level_report(concurrency, list(outcomes), UsageSnapshot.take().since(start))
+
+
+def run_executor_benchmark(base_url: str, runs: int, levels: List[int], warmup: int) -> List[Dict[str, Any]]:
+    target = ExecutorTarget(base_url, pool_maxsize=max(levels))
+    try:
+        measure_threads(target.run_once, warmup, 1)
+        return [measure_threads(target.run_once, runs, level) for level in levels]
+    finally:
+        target.close()
+
+
+async def run_api_benchmark(target: ApiTarget, runs: int, levels: List[int], warmup: int) -> List[Dict[str, Any]]:
+    try:
+        await measure_async(target.run_once, warmup, 1)
+        return [await measure_async(target.run_once, runs, level) for level in levels]
+    finally:
+        await target.aclose()
+
+
+def _parse_levels(value: str) -> List[int]:
+    levels = [int(part) for part in value.split(",") if part.strip()]
+    if not levels or any(level < 1 for level in levels):
+        raise argparse.ArgumentTypeError("concurrency levels must be positive integers")
+    return levels
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description="End-to-end run throughput benchmark")
+    parser.add_argument("--mode", choices=("executor", "api"), default="executor")
+    parser.add_argument("--runs", type=int, default=100, help="runs per concurrency level")
+    parser.add_argument("--concurrency", type=_parse_levels, default=[1, 8, 32], help="comma separated, e.g. 1,8,32")
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--page-kb", type=int, default=SiteOptions.page_kb)
+    parser.add_argument("--latency-ms", type=float, default=SiteOptions.latency_ms)
+    parser.add_argument("--hidden-inputs", type=int, default=SiteOptions.hidden_inputs)
+    parser.add_argument("--output", type=Path, default=None, help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    options = SiteOptions(page_kb=args.page_kb, latency_ms=args.latency_ms, hidden_inputs=args.hidden_inputs)
+    report: Dict[str, Any] = {
+        "benchmark": "e2e",
+        "mode": args.mode,
+        "scenario": SCENARIO_ID,
+        "site": {"page_kb": options.page_kb, "latency_ms": options.latency_ms, "hidden_inputs": options.hidden_inputs},
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+    }
+    with TargetSite(options) as site, open(os.devnull, "w") as devnull:
+        if args.mode == "api":
+            target = ApiTarget(site.base_url)
+            report["engine"] = target.engine
+            with contextlib.redirect_stdout(devnull):
+                levels = asyncio.run(run_api_benchmark(target, args.runs, args.concurrency, args.warmup))
+        else:
+            with contextlib.redirect_stdout(devnull):
+                levels = run_executor_benchmark(site.base_url, args.runs, args.concurrency, args.warmup)
+    report["levels"] = levels
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return report
+
+
+if __name__ == "__main__":
+    main()
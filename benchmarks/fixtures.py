@@ -0,0 +1,97 @@
+"""
+Deterministic inputs for the micro-benchmarks.
+
+Everything is generated from a fixed seed so a baseline taken today is
+compared against the same bytes tomorrow.
+"""
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, List, Tuple
+
+SEED = 20240601
+PAGE_SIZES = {"small": 8 * 1024, "medium": 200 * 1024, "large": 2 * 1024 * 1024}
+RESERVATION_LABEL = "予約番号"
+RESERVATION_NO = "00003217694"
+NEWS_SELECTOR = "div.news a"
+
+
+def _rng(*salt: object) -> random.Random:
+    return random.Random(f"{SEED}:{':'.join(str(part) for part in salt)}")
+
+
+def html_page(size_bytes: int, hidden_inputs: int = 50) -> str:
+    """
+    A fun_navi style page of roughly size_bytes (UTF-8): a login form with
+    hidden inputs at the top, repeated news rows as bulk, and the result
+    table (label_next_td target) at the very end so searches walk the tree.
+    """
+    rng = _rng("page", size_bytes, hidden_inputs)
+    head = [
+        '<!DOCTYPE HTML PUBLIC "-//W3C//DTD HTML 4.01//EN">',
+        "<html><head><meta charset=\"utf-8\"><title>Fun Life Navi</title></head><body>",
+        '<form name="loginForm" method="POST" action="/FRPC010G_LoginAction.do">',
+    ]
+    head.extend(
+        f'<input type="hidden" name="h{i:03d}" value="{rng.getrandbits(48):012x}">' for i in range(hidden_inputs)
+    )
+    head.append('<input type="text" name="fulltimeID" value=""></form>')
+    tail = (
+        f"<table><tr><th>{RESERVATION_LABEL}</th></tr><tr><td>{RESERVATION_NO}</td></tr>"
+        "<tr><th>施設名</th></tr><tr><td>テニスコート</td></tr></table></body></html>"
+    )
+
+    parts = ["\n".join(head)]
+    size = len(parts[0].encode("utf-8")) + len(tail.encode("utf-8"))
+    row = 0
+    while size < size_bytes:
+        line = (
+            f'<div class="news" id="n{row}"><span>お知らせ {row}</span>'
+            f'<a href="/info/{rng.getrandbits(32):08x}">施設の利用について</a></div>'
+        )
+        parts.append(line)
+        size += len(line.encode("utf-8")) + 1
+        row += 1
+    parts.append(tail)
+    return "\n".join(parts)
+
+
+def form_list(size: int) -> List[Tuple[str, str]]:
+    """A form_list where every other value is a template, like real scenarios."""
+    pairs: List[Tuple[str, str]] = []
+    for i in range(size):
+        if i % 4 == 0:
+            pairs.append((f"field{i}", f"${{vars.v{i % 50}}}"))
+        elif i % 4 == 1:
+            pairs.append((f"field{i}", f"prefix-${{vars.v{i % 50}}}-${{state.s{i % 10}}}"))
+        elif i % 4 == 2:
+            pairs.append((f"field{i}", "literal value"))
+        else:
+            pairs.append((f"field{i}", "${secrets.password}"))
+    return pairs
+
+
+def render_sources_data() -> Dict[str, Dict[str, Any]]:
+    return {
+        "vars": {f"v{i}": f"value-{i}" for i in range(50)},
+        "state": {f"s{i}": i for i in range(10)},
+        "secrets": {"password": "p@ss"},
+        "last": {"status": 200, "url": "https://fun-navi.net/", "text": "", "headers": {}},
+    }
+
+
+def hidden_dict(size: int) -> Dict[str, str]:
+    rng = _rng("hidden", size)
+    return {f"h{i:05d}": f"{rng.getrandbits(48):012x}" for i in range(size)}
+
+
+def header_dict(size: int) -> Dict[str, str]:
+    headers = {"Cookie": "JSESSIONID=abc", "Authorization": "Bearer x", "Set-Cookie": "a=b"}
+    headers.update({f"X-Header-{i}": f"value-{i}" for i in range(max(0, size - len(headers)))})
+    return headers
+
+
+def form_pairs(size: int) -> List[Tuple[str, str]]:
+    pairs = [("password", "secret"), ("pass", "secret"), ("fulltimeID", "user")]
+    pairs.extend((f"field{i}", f"value-{i}") for i in range(max(0, size - len(pairs))))
+    return pairs
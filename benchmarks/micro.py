@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the hot helpers of a run, with baselines and regression checks.
+
+Covered: TemplateRenderer.render_form_list, FormComposer.compose with large
+merge_from_vars dicts, mask_pairs/mask_dict, and every ScrapeStepHandler
+command on small (8 KB), medium (200 KB) and large (2 MB) pages. Scrape cases
+run "cold" (fresh document cache, so parsing is included) and ".cached"
+(command only, the tree is already parsed).
+
+Usage:
+  python -m benchmarks.micro                                   # print results as JSON
+  python -m benchmarks.micro --save-baseline benchmarks/baselines/micro.json
+  python -m benchmarks.micro --compare benchmarks/baselines/micro.json --threshold 0.15
+  python -m benchmarks.micro --filter 'scrape\\..*\\.small'
+
+Each case is timed like timeit: the loop count is calibrated to --min-time,
+then --repeat loops are measured and the best per-op time is compared (the
+minimum is the least noisy statistic on a shared machine). --compare exits
+with status 1 when any case is slower than baseline by more than --threshold.
+Baselines are only meaningful on the machine (and Python) that produced them.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import re
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from application.handlers.scrape_handler import ScrapeStepHandler
+from application.ports.logger import LoggerPort
+from application.services.execution_deps import ExecutionDeps
+from application.services.form_composer import FormComposer
+from application.services.redactor import mask_dict, mask_pairs
+from application.services.template_renderer import RenderSources, TemplateRenderer
+from benchmarks import fixtures
+from domain.run import LastResponse, RunContext
+from domain.steps.scrape import ScrapeStep
+from infrastructure.secrets.dict_secret_provider import DictSecretProvider
+from infrastructure.url.base_url_resolver import BaseUrlResolver
+
+DEFAULT_THRESHOLD = 0.15
+
+Timed = Callable[[], Any]
+
+
+@dataclass(frozen=True)
+class MicroCase:
+    """build() prepares fixtures outside the timing and returns the timed callable."""
+    name: str
+    build: Callable[[], Timed]
+
+
+class _QuietLogger(LoggerPort):
+    def debug(self, event: str, **fields: Any) -> None:
+        pass
+
+    def info(self, event: str, **fields: Any) -> None:
+        pass
+
+    def error(self, event: str, **fields: Any) -> None:
+        pass
+
+    def bind(self, **fields: Any) -> "_QuietLogger":
+        return self
+
+
+def _render_sources() -> RenderSources:
+    return RenderSources(**fixtures.render_sources_data())
+
+
+def _render_case(size: int) -> MicroCase:
+    def build() -> Timed:
+        renderer = TemplateRenderer()
+        pairs = fixtures.form_list(size)
+        src = _render_sources()
+        return lambda: renderer.render_form_list(pairs, src)
+
+    return MicroCase(f"render_form_list.{size}", build)
+
+
+def _compose_case(merge_size: int) -> MicroCase:
+    def build() -> Timed:
+        composer = FormComposer(TemplateRenderer())
+        pairs = fixtures.form_list(20)
+        src = _render_sources()
+        vars_dict = {"login_hidden": fixtures.hidden_dict(merge_size)}
+        return lambda: composer.compose(pairs, src, vars_dict, "login_hidden")
+
+    return MicroCase(f"compose.merge.{merge_size}", build)
+
+
+def _mask_cases(size: int) -> List[MicroCase]:
+    def build_pairs() -> Timed:
+        pairs = fixtures.form_pairs(size)
+        return lambda: mask_pairs(pairs)
+
+    def build_dict() -> Timed:
+        headers = fixtures.header_dict(size)
+        return lambda: mask_dict(headers)
+
+    return [MicroCase(f"mask_pairs.{size}", build_pairs), MicroCase(f"mask_dict.{size}", build_dict)]
+
+
+_SCRAPE_STEPS = {
+    "hidden_inputs": ScrapeStep(id="bench", name="bench", command="hidden_inputs", save_as="hidden"),
+    "css": ScrapeStep(
+        id="bench", name="bench", command="css", save_as="links", selector=fixtures.NEWS_SELECTOR, attr="href", multiple=True
+    ),
+    "label_next_td": ScrapeStep(
+        id="bench", name="bench", command="label_next_td", save_as="reservationNo", label=fixtures.RESERVATION_LABEL
+    ),
+}
+
+
+def _deps() -> ExecutionDeps:
+    return ExecutionDeps(
+        secret_provider=DictSecretProvider({}),
+        url_resolver=BaseUrlResolver(""),
+        logger=_QuietLogger(),
+    )
+
+
+def _scrape_cases(command: str, size_name: str) -> List[MicroCase]:
+    step = _SCRAPE_STEPS[command]
+
+    def context() -> RunContext:
+        html = fixtures.html_page(fixtures.PAGE_SIZES[size_name])
+        sha = hashlib.sha256(html.encode("utf-8")).hexdigest()
+        return RunContext(last=LastResponse(status=200, url="https://fun-navi.net/", text=html, headers={}, body_sha256=sha))
+
+    def build_cold() -> Timed:
+        handler = ScrapeStepHandler()
+        ctx = context()
+        return lambda: _expect_ok(handler.handle(step, ctx, _deps()))
+
+    def build_cached() -> Timed:
+        handler = ScrapeStepHandler()
+        ctx = context()
+        deps = _deps()
+        _expect_ok(handler.handle(step, ctx, deps))
+        return lambda: _expect_ok(handler.handle(step, ctx, deps))
+
+    name = f"scrape.{command}.{size_name}"
+    return [MicroCase(name, build_cold), MicroCase(f"{name}.cached", build_cached)]
+
+
+def _expect_ok(outcome) -> None:
+    if not outcome.ok:
+        raise RuntimeError(f"benchmark case failed: {outcome.error_message}")
+
+
+def all_cases() -> List[MicroCase]:
+    cases: List[MicroCase] = [_render_case(size) for size in (100, 1000, 5000)]
+    cases.extend(_compose_case(size) for size in (100, 1000, 10000))
+    for size in (100, 1000):
+        cases.extend(_mask_cases(size))
+    for command in _SCRAPE_STEPS:
+        for size_name in fixtures.PAGE_SIZES:
+            cases.extend(_scrape_cases(command, size_name))
+    return cases
+
+
+def measure(fn: Timed, repeat: int, min_time: float) -> Dict[str, Any]:
+    """Calibrate a loop count that runs for at least min_time, then time repeat loops."""
+    number = 1
+    while True:
+        elapsed = _time_loop(fn, number)
+        if elapsed >= min_time:
+            break
+        number = max(number * 2, int(number * min_time / elapsed) + 1) if elapsed > 0 else number * 10
+    per_op = [_time_loop(fn, number) / number for _ in range(repeat)]
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min_us": round(min(per_op) * 1e6, 3),
+        "median_us": round(statistics.median(per_op) * 1e6, 3),
+    }
+
+
+def _time_loop(fn: Timed, number: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return time.perf_counter() - t0
+
+
+def run_cases(cases: List[MicroCase], repeat: int, min_time: float) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for case in cases:
+        results[case.name] = measure(case.build(), repeat, min_time)
+        print(f"{case.name:40s} {results[case.name]['min_us']:>14.3f} us", file=sys.stderr)
+    return {
+        "benchmark": "micro",
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "cases": results,
+    }
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """
+    Per-case ratio of current to baseline best time.
+    status: "regression" (slower than 1 + threshold), "improvement", "ok" or "new".
+    """
+    rows: List[Dict[str, Any]] = []
+    for name, result in current["cases"].items():
+        base = baseline.get("cases", {}).get(name)
+        if base is None or not base.get("min_us"):
+            rows.append({"case": name, "status": "new", "min_us": result["min_us"]})
+            continue
+        ratio = result["min_us"] / base["min_us"]
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 - threshold:
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append(
+            {
+                "case": name,
+                "status": status,
+                "ratio": round(ratio, 3),
+                "min_us": result["min_us"],
+                "baseline_min_us": base["min_us"],
+            }
+        )
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for render/compose/redact/scrape")
+    parser.add_argument("--filter", default=None, help="regex matched against case names")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per timed loop")
+    parser.add_argument("--output", type=Path, default=None, help="write the JSON report here instead of stdout")
+    parser.add_argument("--save-baseline", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None, help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown, 0.15 = 15%%")
+    args = parser.parse_args(argv)
+
+    cases = all_cases()
+    if args.filter:
+        pattern = re.compile(args.filter)
+        cases = [case for case in cases if pattern.search(case.name)]
+    report = run_cases(cases, args.repeat, args.min_time)
+
+    exit_code = 0
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        rows = compare_results(report, baseline, args.threshold)
+        regressions = [row for row in rows if row["status"] == "regression"]
+        report["comparison"] = {"baseline": str(args.compare), "threshold": args.threshold, "cases": rows}
+        report["regressions"] = [row["case"] for row in regressions]
+        for row in regressions:
+            print(f"REGRESSION {row['case']}: x{row['ratio']} ({row['baseline_min_us']} -> {row['min_us']} us)", file=sys.stderr)
+        exit_code = 1 if regressions else 0
+
+    if args.save_baseline:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        baseline_report = {key: value for key, value in report.items() if key not in ("comparison", "regressions")}
+        args.save_baseline.write_text(json.dumps(baseline_report, indent=2) + "\n", encoding="utf-8")
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""Latency percentiles and process resource usage for benchmark reports."""
+from __future__ import annotations
+
+import math
+import resource
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, Sequence
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile (pct in 0..100); 0.0 for no samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def latency_summary_ms(samples_sec: Sequence[float]) -> Dict[str, float]:
+    return {
+        "p50": round(percentile(samples_sec, 50) * 1000, 3),
+        "p95": round(percentile(samples_sec, 95) * 1000, 3),
+        "p99": round(percentile(samples_sec, 99) * 1000, 3),
+        "max": round(max(samples_sec, default=0.0) * 1000, 3),
+        "mean": round(sum(samples_sec) / len(samples_sec) * 1000, 3) if samples_sec else 0.0,
+    }
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far."""
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(maxrss / divisor, 1)
+
+
+@dataclass(frozen=True)
+class UsageSnapshot:
+    wall: float
+    cpu: float
+
+    @classmethod
+    def take(cls) -> "UsageSnapshot":
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return cls(wall=time.perf_counter(), cpu=usage.ru_utime + usage.ru_stime)
+
+    def since(self, start: "UsageSnapshot") -> "UsageSnapshot":
+        return UsageSnapshot(wall=self.wall - start.wall, cpu=self.cpu - start.cpu)
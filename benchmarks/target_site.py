@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the fun_navi site used by the end-to-end benchmarks.
+
+Serves the login -> hidden inputs -> login POST -> reservation POST -> result
+flow of scenarios/fun_navi_reserve.yaml with Shift_JIS pages, a session cookie
+and a per-session token, so the benchmarked runs do the same parsing and
+merging work as against the real site.
+
+Usage:
+  python -m benchmarks.target_site [--port 0] [--page-kb 8] [--latency-ms 0] [--hidden-inputs 20]
+
+The server prints "READY <port>" once it accepts connections.
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import os
+import secrets
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import parse_qsl
+
+LOGIN_PATH = "/FRPC010G_LoginAction.do"
+RESERVE_PATH = "/FRPC0400G_RegAction.do"
+SESSION_COOKIE = "JSESSIONID"
+CHARSET = "Shift_JIS"
+
+
+@dataclass(frozen=True)
+class SiteOptions:
+    """
+    - page_kb: approximate size of every HTML page (filler markup is appended)
+    - latency_ms: server think time added before each response
+    - hidden_inputs: extra hidden inputs on the login form (scraped and merged)
+    """
+    page_kb: int = 8
+    latency_ms: float = 0.0
+    hidden_inputs: int = 20
+
+
+class _Sessions:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tokens: Dict[str, str] = {}
+        self._logged_in: Dict[str, bool] = {}
+        self._reservation_no = itertools.count(10_000_000_000)
+
+    def open(self) -> tuple[str, str]:
+        session_id = secrets.token_hex(16)
+        token = secrets.token_hex(8)
+        with self._lock:
+            self._tokens[session_id] = token
+            self._logged_in[session_id] = False
+        return session_id, token
+
+    def login(self, session_id: str, token: str) -> bool:
+        with self._lock:
+            if self._tokens.get(session_id) != token:
+                return False
+            self._logged_in[session_id] = True
+            return True
+
+    def reserve(self, session_id: str) -> Optional[str]:
+        with self._lock:
+            if not self._logged_in.pop(session_id, False):
+                return None
+            self._tokens.pop(session_id, None)
+            return f"{next(self._reservation_no):011d}"
+
+
+def _page(title: str, body: str, page_kb: int) -> bytes:
+    head = (
+        '<!DOCTYPE HTML PUBLIC "-//W3C//DTD HTML 4.01//EN">\n<html><head>'
+        f'<meta http-equiv="Content-Type" content="text/html; charset={CHARSET}">'
+        f"<title>{title}</title></head><body>\n{body}\n"
+    )
+    html = head.encode(CHARSET)
+    filler_row = "<div class=\"news\"><span>お知らせ</span><a href=\"/info\">施設の利用について</a></div>\n".encode(CHARSET)
+    missing = page_kb * 1024 - len(html) - len(b"</body></html>")
+    if missing > 0:
+        html += filler_row * (missing // len(filler_row) + 1)
+    return html + b"</body></html>"
+
+
+class TargetSiteHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Reason: Headers and body go out in separate writes.
+    # Impact: Without TCP_NODELAY keep-alive responses stall on delayed ACKs (~40 ms each).
+    disable_nagle_algorithm = True
+
+    server: "TargetSiteServer"
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+    def do_GET(self) -> None:
+        if self.path.split("?")[0] != LOGIN_PATH:
+            self._send(404, _page("Not Found", "<h1>404</h1>", 0))
+            return
+        session_id, token = self.server.sessions.open()
+        hidden = [
+            '<input type="hidden" name="screenID" value="FRPC010G">',
+            '<input type="hidden" name="referrer" value="">',
+            f'<input type="hidden" name="org.apache.struts.taglib.html.TOKEN" value="{token}">',
+        ]
+        hidden.extend(
+            f'<input type="hidden" name="h{i:03d}" value="{secrets.token_hex(4)}">'
+            for i in range(self.server.options.hidden_inputs)
+        )
+        form = (
+            f'<form name="loginForm" method="POST" action="{LOGIN_PATH}">\n'
+            + "\n".join(hidden)
+            + '\n<input type="text" name="fulltimeID" value="">'
+            '<input type="password" name="password" value="">'
+            '<input type="submit" name="loginBTN" value="ログイン"></form>'
+        )
+        self._send(
+            200,
+            _page("Fun Life Navi ログインページ", form, self.server.options.page_kb),
+            cookie=f"{SESSION_COOKIE}={session_id}; Path=/; HttpOnly",
+        )
+
+    def do_POST(self) -> None:
+        form = dict(parse_qsl(self._read_body(), keep_blank_values=True, encoding=CHARSET))
+        session_id = self._session_id()
+        path = self.path.split("?")[0]
+        if path == LOGIN_PATH:
+            token = form.get("org.apache.struts.taglib.html.TOKEN", "")
+            if not form.get("fulltimeID") or not form.get("password") or not self.server.sessions.login(session_id, token):
+                self._send(403, _page("ログインエラー", "<p>ログインできませんでした。</p>", 0))
+                return
+            self._send(200, _page("Fun Life Navi メニュー", "<h1>メニュー</h1>", self.server.options.page_kb))
+        elif path == RESERVE_PATH:
+            reservation_no = self.server.sessions.reserve(session_id)
+            if reservation_no is None:
+                self._send(401, _page("セッションエラー", "<p>再度ログインしてください。</p>", 0))
+                return
+            table = (
+                "<h1>予約完了</h1><table>"
+                f"<tr><th>予約番号</th></tr><tr><td>{reservation_no}</td></tr>"
+                f"<tr><th>施設名</th></tr><tr><td>{form.get('facilityID', '')}</td></tr>"
+                "</table><p>予約が完了しました。</p>"
+            )
+            self._send(200, _page("Fun Life Navi 予約完了", table, self.server.options.page_kb))
+        else:
+            self._send(404, _page("Not Found", "<h1>404</h1>", 0))
+
+    def _read_body(self) -> str:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length).decode("latin-1") if length else ""
+
+    def _session_id(self) -> str:
+        for part in (self.headers.get("Cookie") or "").split(";"):
+            name, _, value = part.strip().partition("=")
+            if name == SESSION_COOKIE:
+                return value
+        return ""
+
+    def _send(self, status: int, body: bytes, cookie: Optional[str] = None) -> None:
+        if self.server.options.latency_ms > 0:
+            time.sleep(self.server.options.latency_ms / 1000)
+        self.send_response(status)
+        self.send_header("Content-Type", f"text/html; charset={CHARSET}")
+        self.send_header("Content-Length", str(len(body)))
+        if cookie:
+            self.send_header("Set-Cookie", cookie)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TargetSiteServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, port: int, options: SiteOptions) -> None:
+        super().__init__(("127.0.0.1", port), TargetSiteHandler)
+        self.options = options
+        self.sessions = _Sessions()
+
+
+class TargetSite:
+    """
+    Run the stand-in site in a child process for the duration of a with-block.
+
+    A separate process keeps the site's CPU time and memory out of the
+    benchmarked process's rusage figures.
+    """
+
+    def __init__(self, options: SiteOptions = SiteOptions()) -> None:
+        self._options = options
+        self._process: Optional[subprocess.Popen] = None
+        self.port = 0
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self) -> "TargetSite":
+        project_root = Path(__file__).resolve().parents[1]
+        args: List[str] = [
+            sys.executable,
+            "-m",
+            "benchmarks.target_site",
+            "--page-kb",
+            str(self._options.page_kb),
+            "--latency-ms",
+            str(self._options.latency_ms),
+            "--hidden-inputs",
+            str(self._options.hidden_inputs),
+        ]
+        self._process = subprocess.Popen(
+            args,
+            cwd=project_root,
+            stdout=subprocess.PIPE,
+            text=True,
+            env={**os.environ, "PYTHONPATH": str(project_root)},
+        )
+        # Blocks until the child is listening; an early exit yields "" (EOF)
+        line = self._process.stdout.readline() if self._process.stdout else ""
+        if not line.startswith("READY "):
+            self.__exit__(None, None, None)
+            raise RuntimeError(f"target site failed to start: {line!r}")
+        self.port = int(line.split()[1])
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._process is None:
+            return
+        self._process.terminate()
+        try:
+            self._process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        if self._process.stdout:
+            self._process.stdout.close()
+        self._process = None
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in for the fun_navi reservation flow")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--page-kb", type=int, default=SiteOptions.page_kb)
+    parser.add_argument("--latency-ms", type=float, default=SiteOptions.latency_ms)
+    parser.add_argument("--hidden-inputs", type=int, default=SiteOptions.hidden_inputs)
+    args = parser.parse_args(argv)
+
+    options = SiteOptions(page_kb=args.page_kb, latency_ms=args.latency_ms, hidden_inputs=args.hidden_inputs)
+    server = TargetSiteServer(args.port, options)
+    print(f"READY {server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,3 +7,7 @@ class ValidationError(Exception):
 
 class RunStateError(Exception):
     pass
+
+
+class ExpressionError(ValueError):
+    pass
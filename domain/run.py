@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Any, Dict, Optional
 
 
@@ -11,6 +12,20 @@ class LastResponse:
     url: str
     text: str
     headers: Dict[str, str]
+    body_sha256: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class RunBarrier:
+    """
+    Scheduled run: steps before step_id run immediately, step_id itself is
+    prepared and then released at fire_at (timezone-aware).
+    clock="server" means fire_at is the target server's time, as estimated from
+    the Date headers of earlier responses from the step's host.
+    """
+    step_id: str
+    fire_at: datetime
+    clock: str = "local"  # local | server
 
 
 @dataclass
@@ -21,3 +36,4 @@ class RunContext:
     state: Dict[str, Any] = field(default_factory=dict)
     last: Optional[LastResponse] = None
     result: Optional[Dict[str, Any]] = None
+    barrier: Optional[RunBarrier] = None
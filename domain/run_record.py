@@ -23,6 +23,8 @@ class RunRecord:
     result: Optional[Dict[str, Any]]
     error: Optional[str]
     error_detail: Optional[Dict[str, Any]]
+    # phase -> {count, total_ms, max_ms} when the run was profiled
+    phases: Optional[Dict[str, Any]] = None
 
     def with_status(
         self,
@@ -41,4 +43,5 @@ class RunRecord:
             result=result if result is not None else self.result,
             error=error if error is not None else self.error,
             error_detail=error_detail if error_detail is not None else self.error_detail,
+            phases=self.phases,
         )
@@ -26,11 +26,19 @@ class ScenarioInputs:
     optional: List[str] = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class HttpRateLimit:
+    """Token bucket per target host: rate_per_sec sustained, bursts of up to burst requests."""
+    rate_per_sec: float
+    burst: int = 1
+
+
 @dataclass(frozen=True)
 class HttpDefaults:
     base_url: str = ""
     timeout_sec: int = 20
     headers: Dict[str, str] = field(default_factory=dict)
+    rate_limit: Optional[HttpRateLimit] = None
 
 
 @dataclass(frozen=True)
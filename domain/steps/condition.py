@@ -0,0 +1,416 @@
+# domain/steps/condition.py
+"""
+Condition expressions for assert conditions and on_error rules.
+
+Grammar:
+  expr  := and ("or" and)*
+  and   := not ("and" not)*
+  not   := "not" not | cmp
+  cmp   := value (OP value)?          OP: == != >= <= > < contains not_contains matches
+  value := ${ref} | 'str' | "str" | word | func(expr, ...) | "(" expr ")"
+
+- ${vars.x} / ${state.x} / ${last.status} are read from RunContext at evaluation time
+- words: numbers, true / false / null, anything else is a plain string
+- ordering operators compare numerically; == / != compare numerically when both sides
+  are numeric, otherwise as text
+"""
+from __future__ import annotations
+
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from domain.exceptions import ExpressionError
+from domain.run import RunContext
+
+
+# ---------------------------------------------------------------------------
+# tokenizer
+# ---------------------------------------------------------------------------
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<ws>\s+)
+    |(?P<ref>\$\{[^}]*\})
+    |(?P<str>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+    |(?P<op>==|!=|>=|<=|>|<)
+    |(?P<lparen>\()
+    |(?P<rparen>\))
+    |(?P<comma>,)
+    |(?P<word>[^\s(),'"=!<>]+)
+    """,
+    re.VERBOSE,
+)
+
+_WORD_OPERATORS = {"contains", "not_contains", "matches"}
+
+
+@dataclass(frozen=True)
+class Token:
+    kind: str
+    text: str
+    pos: int
+
+
+def tokenize(expr: str) -> List[Token]:
+    tokens: List[Token] = []
+    pos = 0
+    while pos < len(expr):
+        m = _TOKEN_RE.match(expr, pos)
+        if m is None:
+            raise ExpressionError(f"unexpected character at {pos}: {expr!r}")
+        kind = m.lastgroup or ""
+        if kind != "ws":
+            tokens.append(Token(kind=kind, text=m.group(), pos=pos))
+        pos = m.end()
+    return tokens
+
+
+# ---------------------------------------------------------------------------
+# AST
+# ---------------------------------------------------------------------------
+
+
+class Node(ABC):
+    @abstractmethod
+    def eval(self, ctx: RunContext) -> Any:
+        ...
+
+
+@dataclass(frozen=True)
+class Literal(Node):
+    value: Any
+
+    def eval(self, ctx: RunContext) -> Any:
+        return self.value
+
+
+@dataclass(frozen=True)
+class Ref(Node):
+    root: str
+    parts: Tuple[str, ...]
+
+    def eval(self, ctx: RunContext) -> Any:
+        cur: Any = getattr(ctx, self.root, None)
+        for part in self.parts:
+            cur = _get(cur, part)
+            if cur is None:
+                return None
+        return cur
+
+
+@dataclass(frozen=True)
+class Compare(Node):
+    op: str
+    left: Node
+    right: Node
+
+    def eval(self, ctx: RunContext) -> Any:
+        return _COMPARATORS[self.op](self.left.eval(ctx), self.right.eval(ctx))
+
+
+@dataclass(frozen=True)
+class Call(Node):
+    name: str
+    args: Tuple[Node, ...]
+
+    def eval(self, ctx: RunContext) -> Any:
+        return _COMPARATORS[self.name](*(a.eval(ctx) for a in self.args))
+
+
+@dataclass(frozen=True)
+class Not(Node):
+    operand: Node
+
+    def eval(self, ctx: RunContext) -> Any:
+        return not truthy(self.operand.eval(ctx))
+
+
+@dataclass(frozen=True)
+class And(Node):
+    left: Node
+    right: Node
+
+    def eval(self, ctx: RunContext) -> Any:
+        return truthy(self.left.eval(ctx)) and truthy(self.right.eval(ctx))
+
+
+@dataclass(frozen=True)
+class Or(Node):
+    left: Node
+    right: Node
+
+    def eval(self, ctx: RunContext) -> Any:
+        return truthy(self.left.eval(ctx)) or truthy(self.right.eval(ctx))
+
+
+# ---------------------------------------------------------------------------
+# value semantics
+# ---------------------------------------------------------------------------
+
+_REF_ROOTS = ("vars", "state", "last")
+
+
+def _get(cur: Any, part: str) -> Any:
+    if isinstance(cur, dict):
+        return cur.get(part)
+    if isinstance(cur, list):
+        if part.isdigit() and int(part) < len(cur):
+            return cur[int(part)]
+        return None
+    return getattr(cur, part, None)
+
+
+def truthy(value: Any) -> bool:
+    if value is None:
+        return False
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return value != 0
+    if isinstance(value, str):
+        return value.strip().lower() not in ("", "false", "0")
+    return bool(value)
+
+
+def _as_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            return None
+    return None
+
+
+def _as_text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value).strip()
+
+
+def _equals(left: Any, right: Any) -> bool:
+    ln, rn = _as_number(left), _as_number(right)
+    if ln is not None and rn is not None:
+        return ln == rn
+    return _as_text(left) == _as_text(right)
+
+
+def _ordered(compare: Callable[[float, float], bool]) -> Callable[[Any, Any], bool]:
+    def op(left: Any, right: Any) -> bool:
+        ln, rn = _as_number(left), _as_number(right)
+        if ln is None or rn is None:
+            return False
+        return compare(ln, rn)
+    return op
+
+
+def _contains(haystack: Any, needle: Any) -> bool:
+    if isinstance(haystack, (list, tuple, set)):
+        return any(_equals(item, needle) for item in haystack)
+    if isinstance(haystack, dict):
+        return _as_text(needle) in haystack
+    return _as_text(needle) in _as_text(haystack)
+
+
+@lru_cache(maxsize=512)
+def _regex(pattern: str) -> "re.Pattern[str]":
+    return re.compile(pattern)
+
+
+def _matches(text: Any, pattern: Any) -> bool:
+    return _regex(_as_text(pattern)).match(_as_text(text)) is not None
+
+
+_COMPARATORS: Dict[str, Callable[..., bool]] = {
+    "==": _equals,
+    "!=": lambda a, b: not _equals(a, b),
+    ">=": _ordered(lambda a, b: a >= b),
+    "<=": _ordered(lambda a, b: a <= b),
+    ">": _ordered(lambda a, b: a > b),
+    "<": _ordered(lambda a, b: a < b),
+    "contains": _contains,
+    "not_contains": lambda a, b: not _contains(a, b),
+    "matches": _matches,
+}
+
+
+# ---------------------------------------------------------------------------
+# parser
+# ---------------------------------------------------------------------------
+
+
+class _Parser:
+    def __init__(self, expr: str) -> None:
+        self._expr = expr
+        self._tokens = tokenize(expr)
+        self._pos = 0
+
+    def parse(self) -> Node:
+        if not self._tokens:
+            return Literal(None)
+        node = self._or()
+        if self._peek() is not None:
+            tok = self._peek()
+            raise ExpressionError(f"unexpected token {tok.text!r} at {tok.pos}: {self._expr!r}")
+        return node
+
+    def _peek(self) -> Optional[Token]:
+        return self._tokens[self._pos] if self._pos < len(self._tokens) else None
+
+    def _next(self) -> Token:
+        tok = self._peek()
+        if tok is None:
+            raise ExpressionError(f"unexpected end of expression: {self._expr!r}")
+        self._pos += 1
+        return tok
+
+    def _accept_word(self, word: str) -> bool:
+        tok = self._peek()
+        if tok is not None and tok.kind == "word" and tok.text == word:
+            self._pos += 1
+            return True
+        return False
+
+    def _expect(self, kind: str) -> Token:
+        tok = self._next()
+        if tok.kind != kind:
+            raise ExpressionError(f"expected {kind} at {tok.pos}, got {tok.text!r}: {self._expr!r}")
+        return tok
+
+    def _or(self) -> Node:
+        node = self._and()
+        while self._accept_word("or"):
+            node = Or(node, self._and())
+        return node
+
+    def _and(self) -> Node:
+        node = self._not()
+        while self._accept_word("and"):
+            node = And(node, self._not())
+        return node
+
+    def _not(self) -> Node:
+        if self._accept_word("not"):
+            return Not(self._not())
+        return self._compare()
+
+    def _compare(self) -> Node:
+        left = self._value()
+        tok = self._peek()
+        if tok is not None and (tok.kind == "op" or (tok.kind == "word" and tok.text in _WORD_OPERATORS)):
+            self._pos += 1
+            return Compare(tok.text, left, self._value())
+        return left
+
+    def _value(self) -> Node:
+        tok = self._next()
+        if tok.kind == "ref":
+            return _compile_ref(tok.text[2:-1].strip(), self._expr)
+        if tok.kind == "str":
+            return Literal(_unquote(tok.text))
+        if tok.kind == "lparen":
+            node = self._or()
+            self._expect("rparen")
+            return node
+        if tok.kind == "word":
+            nxt = self._peek()
+            if nxt is not None and nxt.kind == "lparen":
+                return self._call(tok)
+            return Literal(_word_value(tok.text))
+        raise ExpressionError(f"unexpected token {tok.text!r} at {tok.pos}: {self._expr!r}")
+
+    def _call(self, name: Token) -> Node:
+        if name.text not in _WORD_OPERATORS:
+            raise ExpressionError(f"unknown function {name.text!r}: {self._expr!r}")
+        self._expect("lparen")
+        args: List[Node] = []
+        if not (self._peek() is not None and self._peek().kind == "rparen"):
+            args.append(self._or())
+            while self._peek() is not None and self._peek().kind == "comma":
+                self._pos += 1
+                args.append(self._or())
+        self._expect("rparen")
+        if len(args) != 2:
+            raise ExpressionError(f"{name.text}() takes 2 arguments: {self._expr!r}")
+        return Call(name.text, tuple(args))
+
+
+def _compile_ref(path: str, expr: str) -> Ref:
+    root, _, rest = path.partition(".")
+    if root not in _REF_ROOTS:
+        raise ExpressionError(f"unknown reference root {root!r}: {expr!r}")
+    return Ref(root=root, parts=tuple(rest.split(".")) if rest else ())
+
+
+def _unquote(text: str) -> str:
+    return re.sub(r"\\(.)", r"\1", text[1:-1])
+
+
+def _word_value(word: str) -> Any:
+    lowered = word.lower()
+    if lowered == "true":
+        return True
+    if lowered == "false":
+        return False
+    if lowered in ("null", "none"):
+        return None
+    try:
+        return int(word)
+    except ValueError:
+        pass
+    try:
+        return float(word)
+    except ValueError:
+        return word
+
+
+# ---------------------------------------------------------------------------
+# public API
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class CompiledCondition:
+    source: str
+    root: Node
+
+    def evaluate(self, ctx: RunContext) -> bool:
+        return truthy(self.root.eval(ctx))
+
+
+@lru_cache(maxsize=4096)
+def compile_condition(expr: str) -> CompiledCondition:
+    """
+    Parse a condition once. Conditions are scenario constants, so the compiled
+    form is cached by expression string.
+    """
+    return CompiledCondition(source=expr, root=_Parser(expr).parse())
+
+
+def precompile_conditions(steps: Iterable[Any]) -> int:
+    """
+    Compile every on_error when_expr and assert condition of the given steps.
+    Invalid expressions are skipped here; they surface when evaluated.
+    Returns the number of expressions visited.
+    """
+    count = 0
+    for step in steps:
+        exprs = [rule.when_expr for rule in getattr(step, "on_error", None) or ()]
+        exprs += [cond.expr for cond in getattr(step, "conditions", None) or ()]
+        for expr in exprs:
+            if not expr:
+                continue
+            try:
+                compile_condition(expr)
+            except ExpressionError:
+                pass
+            count += 1
+    return count
@@ -20,3 +20,7 @@ class HttpRequestSpec:
 class HttpStep(Step):
     request: HttpRequestSpec
     save_as_last: bool = True
+    # fail the step when the response body is larger (None: the client default)
+    max_body_bytes: Optional[int] = None
+    # stream the body into this file (template) instead of memory
+    save_to_file: Optional[str] = None
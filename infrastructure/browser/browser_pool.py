@@ -0,0 +1,378 @@
+# infrastructure/browser/browser_pool.py
+from __future__ import annotations
+
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Condition, Lock
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from infrastructure.browser.playwright_browser_client import PlaywrightBrowserClient
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class BrowserPoolTimeout(RuntimeError):
+    """No browser became free within the acquire timeout."""
+
+
+@dataclass(frozen=True)
+class LaunchedBrowser:
+    browser: Any
+    # closes the browser and its driver; called on the slot thread
+    stop: Callable[[], None]
+    # resident memory of the browser processes in bytes, None when unknown
+    rss: Callable[[], Optional[int]] = lambda: None
+
+
+@dataclass(frozen=True)
+class BrowserPoolStats:
+    size: int
+    running: int
+    leased: int
+    waiting: int
+    launches: int
+    recycles: int
+    contexts: int
+
+
+_SPAWN_LOCK = Lock()
+
+
+def _parent_pids() -> Dict[int, int]:
+    parents: Dict[int, int] = {}
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry.name}/stat", encoding="utf-8") as f:
+                # "pid (comm) state ppid ...": comm may contain spaces, so split after ")"
+                parents[int(entry.name)] = int(f.read().rpartition(")")[2].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+    return parents
+
+
+def _child_pids(pid: int) -> Set[int]:
+    try:
+        return {child for child, parent in _parent_pids().items() if parent == pid}
+    except OSError:
+        return set()
+
+
+def _tree_rss(pid: int) -> Optional[int]:
+    """RSS of pid and all its descendants (Linux /proc); pages shared between them count per process."""
+    try:
+        parents = _parent_pids()
+    except OSError:
+        return None
+    if pid not in parents:
+        return None
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f"/proc/{current}/statm", encoding="utf-8") as f:
+                total += int(f.read().split()[1]) * page_size
+        except (OSError, ValueError, IndexError):
+            pass
+        pending.extend(child for child, parent in parents.items() if parent == current)
+    return total
+
+
+def launch_chromium(headless: bool = True) -> LaunchedBrowser:
+    from playwright.sync_api import sync_playwright
+
+    # the new child of this process is the driver; Chromium runs below it
+    with _SPAWN_LOCK:
+        before = _child_pids(os.getpid())
+        playwright = sync_playwright().start()
+        driver = _child_pids(os.getpid()) - before
+    try:
+        browser = playwright.chromium.launch(headless=headless)
+    except Exception:
+        playwright.stop()
+        raise
+    driver_pid = next(iter(driver)) if len(driver) == 1 else None
+
+    def stop() -> None:
+        try:
+            browser.close()
+        except Exception as exc:
+            LOGGER.warning("Failed to close browser instance", exc_info=exc)
+        try:
+            playwright.stop()
+        except Exception as exc:
+            LOGGER.warning("Failed to stop playwright runtime", exc_info=exc)
+
+    return LaunchedBrowser(
+        browser=browser,
+        stop=stop,
+        rss=(lambda: _tree_rss(driver_pid)) if driver_pid is not None else (lambda: None),
+    )
+
+
+class _Slot:
+    """One long-lived browser and the single thread every Playwright call on it runs on."""
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.executor = self._new_executor()
+        self.launched: Optional[LaunchedBrowser] = None
+        self.contexts = 0
+
+    def call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return self.executor.submit(fn, *args, **kwargs).result()
+
+    def retire(self) -> None:
+        """Stop the current browser on its old thread; later calls go to a fresh thread."""
+        launched, executor = self.launched, self.executor
+        self.launched = None
+        self.contexts = 0
+        self.executor = self._new_executor()
+        if launched is not None:
+            executor.submit(launched.stop)
+        executor.shutdown(wait=False)
+
+    def _new_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"browser-{self.index}")
+
+
+class BrowserPool:
+    """
+    Process-wide pool of long-lived Chromium instances.
+
+    Each run leases one browser and gets a fresh BrowserContext on it
+    (cookies / storage isolated per run); closing the client closes the
+    context and returns the browser to the pool.
+
+    - size browsers at most; they are launched on first use and kept
+    - acquire() waits up to acquire_timeout_sec for a free browser, then raises
+      BrowserPoolTimeout
+    - A browser is recycled after max_contexts_per_browser runs, when its
+      processes exceed max_rss_bytes, or when it is found disconnected; the
+      replacement is launched in the background
+    - The Playwright sync API is bound to the thread that started it, so all
+      calls on a browser (and its contexts) run on that browser's own thread
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        headless: bool = True,
+        max_contexts_per_browser: int = 50,
+        max_rss_bytes: Optional[int] = None,
+        acquire_timeout_sec: float = 120.0,
+        launcher: Optional[Callable[[bool], LaunchedBrowser]] = None,
+    ) -> None:
+        self._slots = [_Slot(i) for i in range(max(1, size))]
+        self._free: List[_Slot] = list(self._slots)
+        self._headless = headless
+        self._max_contexts = max(1, max_contexts_per_browser)
+        self._max_rss_bytes = max_rss_bytes
+        self._acquire_timeout_sec = acquire_timeout_sec
+        self._launcher = launcher or launch_chromium
+        self._cond = Condition()
+        self._waiting = 0
+        self._launches = 0
+        self._recycles = 0
+        self._contexts = 0
+        self._closed = False
+
+    def acquire(self, timeout_sec: Optional[float] = None, **options: Any) -> "PooledBrowserClient":
+        """Lease a browser and open a new context on it; options go to Browser.new_context()."""
+        slot = self._take(self._acquire_timeout_sec if timeout_sec is None else timeout_sec)
+        try:
+            context, page = slot.call(self._open_context, slot, options)
+        except BaseException:
+            self._recycle(slot, "launch_failed")
+            self._give_back(slot)
+            raise
+        return PooledBrowserClient(self, slot, PlaywrightBrowserClient.for_context(context, page))
+
+    def stats(self) -> BrowserPoolStats:
+        with self._cond:
+            return BrowserPoolStats(
+                size=len(self._slots),
+                running=sum(1 for slot in self._slots if slot.launched is not None),
+                leased=len(self._slots) - len(self._free),
+                waiting=self._waiting,
+                launches=self._launches,
+                recycles=self._recycles,
+                contexts=self._contexts,
+            )
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        for slot in self._slots:
+            launched = slot.launched
+            slot.launched = None
+            try:
+                if launched is not None:
+                    slot.call(launched.stop)
+            finally:
+                slot.executor.shutdown(wait=False)
+
+    def _take(self, timeout_sec: float) -> _Slot:
+        deadline = time.monotonic() + timeout_sec
+        with self._cond:
+            self._waiting += 1
+            try:
+                while not self._free:
+                    if self._closed:
+                        raise RuntimeError("browser pool is closed")
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._cond.wait(remaining):
+                        if not self._free:
+                            raise BrowserPoolTimeout(
+                                f"no browser free within {timeout_sec}s (pool size {len(self._slots)})"
+                            )
+                if self._closed:
+                    raise RuntimeError("browser pool is closed")
+                # a running browser first: only start another when all running ones are busy
+                slot = next((s for s in self._free if s.launched is not None), self._free[0])
+                self._free.remove(slot)
+                return slot
+            finally:
+                self._waiting -= 1
+
+    def _give_back(self, slot: _Slot) -> None:
+        with self._cond:
+            self._free.append(slot)
+            self._cond.notify()
+
+    def _open_context(self, slot: _Slot, options: Dict[str, Any]) -> tuple:
+        # runs on the slot thread
+        if slot.launched is not None and not _is_connected(slot.launched.browser):
+            LOGGER.warning("browser %s disconnected; relaunching", slot.index)
+            slot.launched.stop()
+            slot.launched = None
+            slot.contexts = 0
+            with self._cond:
+                self._recycles += 1
+        if slot.launched is None:
+            self._launch(slot)
+        context = slot.launched.browser.new_context(**options)
+        try:
+            page = context.new_page()
+        except Exception:
+            context.close()
+            raise
+        with self._cond:
+            self._contexts += 1
+        return context, page
+
+    def _launch(self, slot: _Slot) -> None:
+        # runs on the slot thread
+        if slot.launched is not None:
+            return
+        slot.launched = self._launcher(self._headless)
+        slot.contexts = 0
+        with self._cond:
+            self._launches += 1
+
+    def _release(self, slot: _Slot, client: PlaywrightBrowserClient) -> None:
+        if self._closed:
+            # close() already stopped every browser, contexts included
+            return
+        try:
+            slot.call(client.close)
+            slot.contexts += 1
+            reason = self._recycle_reason(slot)
+            if reason is not None:
+                self._recycle(slot, reason)
+                if not self._closed:
+                    # warm the replacement while the slot is idle
+                    slot.executor.submit(self._launch_quietly, slot)
+        finally:
+            self._give_back(slot)
+
+    def _recycle_reason(self, slot: _Slot) -> Optional[str]:
+        if slot.contexts >= self._max_contexts:
+            return "max_contexts"
+        if self._max_rss_bytes is not None and slot.launched is not None:
+            rss = slot.launched.rss()
+            if rss is not None and rss > self._max_rss_bytes:
+                return "memory"
+        return None
+
+    def _recycle(self, slot: _Slot, reason: str) -> None:
+        if slot.launched is None:
+            return
+        LOGGER.info("recycling browser %s after %s contexts (%s)", slot.index, slot.contexts, reason)
+        slot.retire()
+        with self._cond:
+            self._recycles += 1
+
+    def _launch_quietly(self, slot: _Slot) -> None:
+        try:
+            self._launch(slot)
+        except Exception as exc:
+            # the next acquire() launches again and reports the error to its run
+            LOGGER.warning("Failed to prelaunch browser %s", slot.index, exc_info=exc)
+
+
+def _is_connected(browser: Any) -> bool:
+    try:
+        return bool(browser.is_connected())
+    except Exception:
+        return False
+
+
+class PooledBrowserClient:
+    """BrowserClientPort over a pooled context; every call runs on the owning browser's thread."""
+
+    def __init__(self, pool: BrowserPool, slot: _Slot, client: PlaywrightBrowserClient) -> None:
+        self._pool = pool
+        self._slot = slot
+        self._client: Optional[PlaywrightBrowserClient] = client
+
+    def goto(self, url: str, timeout_ms: Optional[int] = None) -> None:
+        self._call("goto", url, timeout_ms)
+
+    def click(self, selector: str, timeout_ms: Optional[int] = None) -> None:
+        self._call("click", selector, timeout_ms)
+
+    def fill(self, selector: str, value: str, timeout_ms: Optional[int] = None) -> None:
+        self._call("fill", selector, value, timeout_ms)
+
+    def select(self, selector: str, value: str, timeout_ms: Optional[int] = None) -> None:
+        self._call("select", selector, value, timeout_ms)
+
+    def wait_for_selector(self, selector: str, timeout_ms: Optional[int] = None) -> None:
+        self._call("wait_for_selector", selector, timeout_ms)
+
+    def wait_for_url(self, url: str, timeout_ms: Optional[int] = None) -> None:
+        self._call("wait_for_url", url, timeout_ms)
+
+    def wait_for_load_state(self, state: str = "load", timeout_ms: Optional[int] = None) -> None:
+        self._call("wait_for_load_state", state, timeout_ms)
+
+    def text(self, selector: str) -> str:
+        return self._call("text", selector)
+
+    def attr(self, selector: str, attr: str) -> str:
+        return self._call("attr", selector, attr)
+
+    def screenshot(self, path: Optional[str] = None) -> str:
+        return self._call("screenshot", path)
+
+    def close(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            self._pool._release(self._slot, client)
+
+    def _call(self, name: str, *args: Any) -> Any:
+        client = self._client
+        if client is None:
+            raise RuntimeError("browser client is closed")
+        return self._slot.call(getattr(client, name), *args)
@@ -2,12 +2,32 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 
 LOGGER = logging.getLogger(__name__)
 
 
+def context_options(
+    viewport_width: Optional[int] = None,
+    viewport_height: Optional[int] = None,
+    user_agent: Optional[str] = None,
+    locale: Optional[str] = None,
+    timezone_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Keyword arguments for Browser.new_context(); unset options are left to Playwright."""
+    options: Dict[str, Any] = {}
+    if viewport_width and viewport_height:
+        options["viewport"] = {"width": viewport_width, "height": viewport_height}
+    if user_agent:
+        options["user_agent"] = user_agent
+    if locale:
+        options["locale"] = locale
+    if timezone_id:
+        options["timezone_id"] = timezone_id
+    return options
+
+
 class PlaywrightBrowserClient:
     def __init__(
         self,
@@ -22,18 +42,21 @@ class PlaywrightBrowserClient:
 
         self._playwright = sync_playwright().start()
         self._browser = self._playwright.chromium.launch(headless=headless)
-        context_kwargs = {}
-        if viewport_width and viewport_height:
-            context_kwargs["viewport"] = {"width": viewport_width, "height": viewport_height}
-        if user_agent:
-            context_kwargs["user_agent"] = user_agent
-        if locale:
-            context_kwargs["locale"] = locale
-        if timezone_id:
-            context_kwargs["timezone_id"] = timezone_id
-        self._context = self._browser.new_context(**context_kwargs)
+        self._context = self._browser.new_context(
+            **context_options(viewport_width, viewport_height, user_agent, locale, timezone_id)
+        )
         self._page = self._context.new_page()
 
+    @classmethod
+    def for_context(cls, context: Any, page: Any) -> "PlaywrightBrowserClient":
+        """Client over a context owned by someone else's browser; close() closes only the context."""
+        client = cls.__new__(cls)
+        client._playwright = None
+        client._browser = None
+        client._context = context
+        client._page = page
+        return client
+
     def goto(self, url: str, timeout_ms: Optional[int] = None) -> None:
         self._page.goto(url, timeout=timeout_ms)
 
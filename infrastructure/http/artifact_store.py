@@ -0,0 +1,276 @@
+# infrastructure/http/artifact_store.py
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from infrastructure.retention.policy import RetentionCounters, RetentionStats
+
+_BLOB_SUFFIX = ".gz"
+_TMP_PREFIX = ".tmp-"
+_MANIFEST_SUFFIX = ".jsonl"
+_UNSAFE_NAME = re.compile(r"[^A-Za-z0-9_.-]")
+_COPY_CHUNK = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ArtifactRetention:
+    """
+    ttl_sec: run manifests not written to for this long are deleted (None = keep)
+    max_bytes: cap on blobs + manifests; the oldest runs go first (None = unbounded)
+    """
+    ttl_sec: Optional[float] = None
+    max_bytes: Optional[int] = None
+
+
+@dataclass
+class _Manifest:
+    run_id: str
+    path: Path
+    mtime: float
+    size: int
+    blobs: Set[str] = field(default_factory=set)
+
+
+class ArtifactStore:
+    """
+    Content-addressed store for HTTP artifacts, shared by all runs.
+
+    root/
+      blobs/<sha[:2]>/<sha256>.gz   each distinct response body once, gzip-compressed
+      runs/<run_id>.jsonl           one line per request: request/response metadata
+                                    and the body_sha256 of the blob it references
+
+    - A blob is written to a temp file and renamed, so concurrent runs (threads
+      or worker processes) storing the same body never see a partial file
+    - prune() (RetentionReaper) deletes manifests idle past ttl_sec, then the
+      oldest ones while the store is over max_bytes, then unreferenced blobs
+    - Blobs younger than orphan_grace_sec are never swept: a run may have
+      stored one and not yet written the manifest line that references it;
+      for the same reason max_bytes only evicts runs idle past that grace
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        retention: ArtifactRetention = ArtifactRetention(),
+        compress_level: int = 6,
+        orphan_grace_sec: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._root = Path(root)
+        self._blobs = self._root / "blobs"
+        self._runs = self._root / "runs"
+        self._blobs.mkdir(parents=True, exist_ok=True)
+        self._runs.mkdir(parents=True, exist_ok=True)
+        self.retention = retention
+        self._compress_level = compress_level
+        self._orphan_grace_sec = orphan_grace_sec
+        self._clock = clock
+        self._lock = Lock()
+        self._counters = RetentionCounters()
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def put_blob(self, sha256: str, data: Optional[bytes] = None, path: Optional[str] = None) -> Path:
+        """Store the body (bytes, or the file at path) under sha256 unless already present."""
+        target = self.blob_path(sha256)
+        try:
+            # refresh the age so a concurrent prune keeps it
+            os.utime(target)
+            return target
+        except FileNotFoundError:
+            pass
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=_TMP_PREFIX, dir=target.parent)
+        try:
+            with os.fdopen(fd, "wb") as out, gzip.GzipFile(
+                fileobj=out, mode="wb", compresslevel=self._compress_level, mtime=0
+            ) as gz:
+                if path is not None:
+                    with open(path, "rb") as src:
+                        shutil.copyfileobj(src, gz, _COPY_CHUNK)
+                else:
+                    gz.write(data or b"")
+            os.replace(tmp, target)
+        except BaseException:
+            _unlink_quietly(Path(tmp))
+            raise
+        return target
+
+    def read_blob(self, sha256: str) -> bytes:
+        with gzip.open(self.blob_path(sha256), "rb") as f:
+            return f.read()
+
+    def blob_path(self, sha256: str) -> Path:
+        return self._blobs / sha256[:2] / f"{sha256}{_BLOB_SUFFIX}"
+
+    def manifest_path(self, run_id: str) -> Path:
+        return self._runs / f"{_UNSAFE_NAME.sub('_', run_id)}{_MANIFEST_SUFFIX}"
+
+    def append(self, run_id: str, entry: Dict[str, Any]) -> Path:
+        """Add one line to the run's manifest (a single O_APPEND write, safe across processes)."""
+        path = self.manifest_path(run_id)
+        line = (json.dumps(entry, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+        return path
+
+    def manifest(self, run_id: str) -> List[Dict[str, Any]]:
+        path = self.manifest_path(run_id)
+        if not path.exists():
+            return []
+        return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line]
+
+    def disk_usage(self) -> int:
+        return sum(p.stat().st_size for p in self._root.rglob("*") if p.is_file())
+
+    # --- RetainedStore ---
+
+    def prune(self) -> List[str]:
+        evicted: List[str] = []
+        with self._lock:
+            now = self._clock()
+            manifests = self._scan_manifests()
+            ttl = self.retention.ttl_sec
+            if ttl is not None:
+                live: List[_Manifest] = []
+                for m in manifests:
+                    if m.mtime <= now - ttl and _unlink_unless_touched(m.path, m.mtime):
+                        evicted.append(m.run_id)
+                        self._counters.evicted_ttl += 1
+                    else:
+                        live.append(m)
+                manifests = live
+
+            refs: Dict[str, int] = {}
+            for m in manifests:
+                for sha in m.blobs:
+                    refs[sha] = refs.get(sha, 0) + 1
+            blobs = self._scan_blobs()
+            swept = self._sweep(blobs, [sha for sha in blobs if sha not in refs], now)
+            total = sum(m.size for m in manifests) + sum(blobs[sha][1] for sha in blobs if sha not in swept)
+
+            cap = self.retention.max_bytes
+            if cap is not None:
+                # Reason: Blobs younger than orphan_grace_sec are never swept, so a run still writing frees nothing.
+                # Impact: Only runs idle past the grace period are evicted; young data waits for a later prune.
+                candidates = sorted(
+                    (m for m in manifests if m.mtime <= now - self._orphan_grace_sec), key=lambda m: m.mtime
+                )
+                capped = 0
+                while total > cap and candidates:
+                    m = candidates.pop(0)
+                    if not _unlink_unless_touched(m.path, m.mtime):
+                        # its run appended since the scan: it is the newest now
+                        continue
+                    total -= m.size
+                    evicted.append(m.run_id)
+                    capped += 1
+                    released = []
+                    for sha in m.blobs:
+                        refs[sha] -= 1
+                        if refs[sha] == 0:
+                            released.append(sha)
+                    for sha in self._sweep(blobs, released, now):
+                        total -= blobs[sha][1]
+                self._counters.evicted_lru += capped
+        return evicted
+
+    def evict(self, keys: Iterable[str]) -> int:
+        """Delete the manifests of these runs; their blobs go at the next prune."""
+        count = 0
+        with self._lock:
+            for run_id in keys:
+                path = self.manifest_path(run_id)
+                if path.exists():
+                    _unlink_quietly(path)
+                    count += 1
+        return count
+
+    def retention_stats(self) -> RetentionStats:
+        with self._lock:
+            size = sum(1 for _ in self._runs.glob(f"*{_MANIFEST_SUFFIX}"))
+            return self._counters.snapshot("http_artifacts", size)
+
+    def _scan_manifests(self) -> List[_Manifest]:
+        manifests: List[_Manifest] = []
+        for path in self._runs.glob(f"*{_MANIFEST_SUFFIX}"):
+            try:
+                stat = path.stat()
+                text = path.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                continue
+            blobs: Set[str] = set()
+            for line in text.splitlines():
+                try:
+                    sha = json.loads(line).get("body_sha256")
+                except ValueError:
+                    # a line still being written by another process
+                    continue
+                if sha:
+                    blobs.add(sha)
+            manifests.append(_Manifest(path.stem, path, stat.st_mtime, stat.st_size, blobs))
+        return manifests
+
+    def _scan_blobs(self) -> Dict[str, tuple[Path, int, float]]:
+        blobs: Dict[str, tuple[Path, int, float]] = {}
+        now = self._clock()
+        for path in self._blobs.glob("*/*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if path.name.startswith(_TMP_PREFIX):
+                # left behind by a writer that died mid-blob
+                if stat.st_mtime <= now - self._orphan_grace_sec:
+                    _unlink_quietly(path)
+                continue
+            blobs[path.name[: -len(_BLOB_SUFFIX)]] = (path, stat.st_size, stat.st_mtime)
+        return blobs
+
+    def _sweep(self, blobs: Dict[str, tuple[Path, int, float]], candidates: Iterable[str], now: float) -> List[str]:
+        swept: List[str] = []
+        for sha in candidates:
+            entry = blobs.get(sha)
+            if entry is None or entry[2] > now - self._orphan_grace_sec:
+                continue
+            if _unlink_unless_touched(entry[0], entry[2]):
+                swept.append(sha)
+        return swept
+
+
+def _unlink_unless_touched(path: Path, mtime: float) -> bool:
+    """
+    Delete path unless it changed after the scan that saw it at mtime: a
+    put_blob() reusing the blob or an append() to the manifest from another
+    process in between refreshes the mtime, so the file is kept.
+    """
+    try:
+        if path.stat().st_mtime > mtime:
+            return False
+        path.unlink()
+    except FileNotFoundError:
+        pass
+    return True
+
+
+def _unlink_quietly(path: Path) -> None:
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
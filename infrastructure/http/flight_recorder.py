@@ -0,0 +1,96 @@
+# infrastructure/http/flight_recorder.py
+from __future__ import annotations
+
+import random
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+from application.http_trace import HttpTrace
+from application.ports.logger import LoggerPort
+from infrastructure.http.artifact_store import ArtifactStore
+from infrastructure.http.http_artifact_saver import write_trace
+
+
+@dataclass
+class _Ring:
+    traces: Deque[Tuple[HttpTrace, datetime, int]] = field(default_factory=deque)
+    size: int = 0
+    dropped: int = 0
+
+
+def _held_bytes(trace: HttpTrace) -> int:
+    # bodies spilled to disk stay there; only what the trace holds in memory counts
+    return len(trace.raw_bytes or b"") + len(trace.full_text or "")
+
+
+class FlightRecorder:
+    """
+    Keeps the last HTTP traces of each run in memory and writes them to the
+    ArtifactStore only when the run ends badly, so successful runs cost no
+    artifact disk I/O.
+
+    - max_traces / max_bytes bound each run's ring; the oldest traces go first
+    - sample_rate: fraction of successful runs written anyway (0 = none)
+    - finish(run_id, failed) must be called once per run; it releases the ring
+    """
+
+    def __init__(
+        self,
+        store: ArtifactStore,
+        max_traces: int = 20,
+        max_bytes: int = 8 * 1024 * 1024,
+        sample_rate: float = 0.0,
+        sampler: Callable[[], float] = random.random,
+    ) -> None:
+        self._store = store
+        self._max_traces = max(1, max_traces)
+        self._max_bytes = max_bytes
+        self._sample_rate = sample_rate
+        self._sampler = sampler
+        self._rings: Dict[str, _Ring] = {}
+        self._lock = Lock()
+
+    def record(self, trace: HttpTrace) -> None:
+        size = _held_bytes(trace)
+        with self._lock:
+            ring = self._rings.setdefault(trace.run_id, _Ring())
+            ring.traces.append((trace, datetime.now(timezone.utc), size))
+            ring.size += size
+            while ring.traces and (len(ring.traces) > self._max_traces or ring.size > self._max_bytes):
+                _, _, evicted = ring.traces.popleft()
+                ring.size -= evicted
+                ring.dropped += 1
+
+    def buffered(self, run_id: str) -> int:
+        with self._lock:
+            ring = self._rings.get(run_id)
+            return len(ring.traces) if ring is not None else 0
+
+    def finish(self, run_id: str, failed: bool, logger: Optional[LoggerPort] = None) -> int:
+        """Write the run's ring if it failed or is sampled, then drop it. Returns traces written."""
+        with self._lock:
+            ring = self._rings.pop(run_id, None)
+        if ring is None:
+            return 0
+        if failed:
+            reason = "failed"
+        elif self._sample_rate > 0 and self._sampler() < self._sample_rate:
+            reason = "sampled"
+        else:
+            return 0
+
+        manifest = None
+        for trace, recorded_at, _ in ring.traces:
+            manifest, _ = write_trace(self._store, trace, recorded_at)
+        if logger is not None:
+            logger.info(
+                "http.artifacts.saved",
+                reason=reason,
+                traces=len(ring.traces),
+                dropped=ring.dropped,
+                manifest=str(manifest) if manifest is not None else None,
+            )
+        return len(ring.traces)
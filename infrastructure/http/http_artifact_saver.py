@@ -1,83 +1,79 @@
 # infrastructure/http/http_artifact_saver.py
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from pathlib import Path
-from datetime import datetime
-from typing import Dict
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from application.http_trace import HttpTrace
 from application.http_trace_enricher import HttpTraceEnricher
 from application.services.execution_deps import ExecutionDeps
+from infrastructure.http.artifact_store import ArtifactStore
 
+if TYPE_CHECKING:
+    from infrastructure.http.flight_recorder import FlightRecorder
 
-class HttpArtifactSaver(HttpTraceEnricher):
-    """
-    1 request  -> 1_
-    2 response -> 2_
-    3 html     -> 3_
-
-    同一 run_id + body_sha256 は同一フォルダに集約する
-    """
-
-    def __init__(self, root: str = "tmp/http"):
-        self._root = Path(root)
-        self._root.mkdir(parents=True, exist_ok=True)
 
-        # run_id + sha256 -> timestamp
-        self._dir_cache: Dict[tuple[str, str], str] = {}
-        self._index: int = 0
+def write_trace(store: ArtifactStore, trace: HttpTrace, recorded_at: Optional[datetime] = None) -> Tuple[Path, Path]:
+    """Store the trace's body blob and append its manifest line; returns (manifest, blob)."""
+    response = trace.response
+    body_path = trace.body.path if trace.body is not None else None
+    if body_path is not None:
+        blob = store.put_blob(response.body_sha256, path=body_path)
+    elif trace.raw_bytes is not None:
+        blob = store.put_blob(response.body_sha256, data=trace.raw_bytes)
+    else:
+        blob = store.put_blob(response.body_sha256, data=(trace.full_text or "").encode("utf-8", errors="replace"))
 
-    def enrich_and_log(self, trace: HttpTrace, deps: ExecutionDeps) -> None:
+    manifest = store.append(
+        trace.run_id,
+        {
+            "ts": (recorded_at or datetime.now(timezone.utc)).isoformat(),
+            "step_id": trace.step_id,
+            "method": trace.method,
+            "url": trace.url,
+            "request_headers": trace.request_headers or {},
+            "request_form": [list(pair) for pair in trace.request_form or []],
+            "status": response.status,
+            "response_url": response.url,
+            "response_headers": response.headers,
+            "body_len": response.body_len,
+            "body_sha256": response.body_sha256,
+        },
+    )
+    return manifest, blob
 
-        # ★ 同一 run_id + sha256 は同一 timestamp を使う
-        if trace.run_id not in self._dir_cache:
-            ts = datetime.now().strftime("%Y%m%d_%H%M%S%f")[:-3]
-            self._dir_cache[trace.run_id] = ts
-        else:
-            ts = self._dir_cache[trace.run_id]
 
-        base = self._root / f"{ts}_{trace.run_id}"
-        base.mkdir(parents=True, exist_ok=True)
-
-        step = trace.step_id
+class HttpArtifactSaver(HttpTraceEnricher):
+    """
+    Request / response / body of every HTTP step, kept in an ArtifactStore:
+    one manifest line per request in runs/<run_id>.jsonl, the body once per
+    body_sha256 in blobs/ (同じログイン画面は何度取得しても 1 ファイル)
 
-        # ---------- 1. REQUEST ----------
-        req_path = base / f"{ts}_{self._index:03}_{step}.req"
-        if not req_path.exists():
-            with req_path.open("w", encoding="utf-8", errors="ignore") as f:
-                f.write(f"{trace.method} {trace.url}\n")
-                for k, v in trace.request_headers.items():
-                    f.write(f"{k}: {v}\n")
-                f.write("\n")
-                for k, v in trace.request_form:
-                    f.write(f"{k}={v}\n")
-        self._index += 1
+    With a FlightRecorder, traces are only buffered here; the recorder writes
+    them when the run ends, if it failed or was sampled.
+    """
 
-        # ---------- 2. RESPONSE HEADER ----------
-        resp_path = base / f"{ts}_{self._index:03}_{step}.resp"
-        if not resp_path.exists():
-            with resp_path.open("w", encoding="utf-8", errors="ignore") as f:
-                f.write(f"HTTP {trace.response.status}\n")
-                for k, v in trace.response.headers.items():
-                    f.write(f"{k}: {v}\n")
-        self._index += 1
+    deferrable = True
 
-        # ---------- 3. HTML ----------
-        html_path = base / f"{ts}_{self._index:03}_{step}.html"
-        if not html_path.exists():
-            if trace.raw_bytes is not None:
-                html_path.write_bytes(trace.raw_bytes)
-            else:
-                html_path.write_text(
-                    trace.full_text or "",
-                    encoding="utf-8",
-                    errors="ignore",
-                )
-        self._index += 1
+    def __init__(
+        self,
+        root: str = "tmp/http",
+        store: Optional[ArtifactStore] = None,
+        recorder: Optional["FlightRecorder"] = None,
+    ):
+        self._store = store or ArtifactStore(root)
+        self._recorder = recorder
 
+    def enrich_and_log(self, trace: HttpTrace, deps: ExecutionDeps) -> None:
+        if self._recorder is not None:
+            self._recorder.record(trace)
+            return
+        manifest, blob = write_trace(self._store, trace)
         deps.logger.info(
             "http.artifacts.saved",
             step_id=trace.step_id,
-            dir=str(base),
+            manifest=str(manifest),
+            blob=str(blob),
             sha256=trace.response.body_sha256,
         )
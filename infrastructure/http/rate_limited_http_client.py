@@ -0,0 +1,100 @@
+# infrastructure/http/rate_limited_http_client.py
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import replace
+from typing import Callable, Dict, List, Optional, Tuple
+
+from application.ports.async_http_client import AsyncHttpClientPort
+from application.ports.http_client import HttpClientPort, HttpResponse
+from application.ports.rate_limiter import RateLimiterPort
+from application.services.response_body import BodyLimits
+from application.services.server_clock import host_of
+from domain.scenario import HttpRateLimit
+
+
+def _limits_kwarg(body_limits: Optional[BodyLimits]) -> Dict[str, BodyLimits]:
+    # only forwarded when set, so clients predating body_limits keep working
+    return {"body_limits": body_limits} if body_limits is not None else {}
+
+
+class RateLimitedHttpClient(HttpClientPort):
+    """Waits for a per-host slot from the shared limiter before each request."""
+
+    def __init__(
+        self,
+        inner: HttpClientPort,
+        limiter: RateLimiterPort,
+        limit: HttpRateLimit,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._inner = inner
+        self._limiter = limiter
+        self._limit = limit
+        self._sleep = sleep
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        form_list: Optional[List[Tuple[str, str]]] = None,
+        allow_redirects: Optional[bool] = None,
+        body_limits: Optional[BodyLimits] = None,
+    ) -> HttpResponse:
+        wait = self._limiter.reserve(host_of(url), self._limit)
+        if wait > 0:
+            self._sleep(wait)
+        resp = self._inner.request(
+            method, url, headers=headers, form_list=form_list, allow_redirects=allow_redirects, **_limits_kwarg(body_limits)
+        )
+        return replace(resp, rate_limit_wait_sec=wait)
+
+    def warm(self, url: str, timeout_sec: float) -> None:
+        # a connection warm-up is not a scenario request; it does not take a token
+        warm = getattr(self._inner, "warm", None)
+        if warm is not None:
+            warm(url, timeout_sec)
+
+    def snapshot_cookies(self) -> List[Dict[str, object]]:
+        return self._inner.snapshot_cookies()
+
+
+class RateLimitedAsyncHttpClient(AsyncHttpClientPort):
+    """Async counterpart of RateLimitedHttpClient; waiting does not block the event loop."""
+
+    def __init__(self, inner: AsyncHttpClientPort, limiter: RateLimiterPort, limit: HttpRateLimit) -> None:
+        self._inner = inner
+        self._limiter = limiter
+        self._limit = limit
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        form_list: Optional[List[Tuple[str, str]]] = None,
+        allow_redirects: Optional[bool] = None,
+        body_limits: Optional[BodyLimits] = None,
+    ) -> HttpResponse:
+        # Reason: reserve() is synchronous; the Redis limiter does a blocking EVAL round trip.
+        # Impact: Other runs on the event loop keep going while the token is reserved.
+        wait = await asyncio.to_thread(self._limiter.reserve, host_of(url), self._limit)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        resp = await self._inner.request(
+            method, url, headers=headers, form_list=form_list, allow_redirects=allow_redirects, **_limits_kwarg(body_limits)
+        )
+        return replace(resp, rate_limit_wait_sec=wait)
+
+    async def warm(self, url: str, timeout_sec: float) -> None:
+        warm = getattr(self._inner, "warm", None)
+        if warm is not None:
+            await warm(url, timeout_sec)
+
+    def snapshot_cookies(self) -> List[Dict[str, object]]:
+        return self._inner.snapshot_cookies()
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
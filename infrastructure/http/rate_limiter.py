@@ -0,0 +1,95 @@
+# infrastructure/http/rate_limiter.py
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Dict
+
+from application.ports.rate_limiter import RateLimiterPort
+from domain.scenario import HttpRateLimit
+
+
+@dataclass
+class _Bucket:
+    tokens: float
+    updated_at: float
+
+
+class InMemoryRateLimiter(RateLimiterPort):
+    """
+    Process-wide token buckets.
+
+    A reservation always takes its token, so tokens may go negative; the debt
+    is the queue in front of the caller and -tokens / rate is its wait.
+    Buckets that have refilled completely are dropped once more than max_keys
+    hosts are tracked (a full bucket is the same as no bucket).
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, max_keys: int = 1024) -> None:
+        self._clock = clock
+        self._max_keys = max_keys
+        self._lock = Lock()
+        self._buckets: Dict[str, _Bucket] = {}
+
+    def reserve(self, key: str, limit: HttpRateLimit) -> float:
+        with self._lock:
+            now = self._clock()
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self._max_keys:
+                    self._drop_full_locked(now, limit)
+                bucket = self._buckets[key] = _Bucket(tokens=float(limit.burst), updated_at=now)
+            bucket.tokens = min(float(limit.burst), bucket.tokens + (now - bucket.updated_at) * limit.rate_per_sec) - 1
+            bucket.updated_at = now
+            return 0.0 if bucket.tokens >= 0 else -bucket.tokens / limit.rate_per_sec
+
+    def _drop_full_locked(self, now: float, limit: HttpRateLimit) -> None:
+        for key in [
+            k for k, b in self._buckets.items()
+            if b.tokens + (now - b.updated_at) * limit.rate_per_sec >= limit.burst
+        ]:
+            del self._buckets[key]
+
+
+# KEYS[1] = bucket key; ARGV = rate_per_sec, burst. Uses the Redis clock so all
+# API processes and workers agree on time. Returns the wait as a string
+# (Lua numbers are truncated to integers on the way out).
+_RESERVE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + (now - ts) * rate) - 1
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil((burst - tokens) / rate) + 1)
+if tokens >= 0 then
+  return '0'
+end
+return tostring(-tokens / rate)
+"""
+
+
+class RedisRateLimiter(RateLimiterPort):
+    """
+    Token buckets shared by every process using the same Redis (API replicas,
+    process-engine workers). Same reservation semantics as InMemoryRateLimiter,
+    done atomically in a Lua script.
+    """
+
+    def __init__(self, client: Any, prefix: str = "webpost:rate:") -> None:
+        self._prefix = prefix
+        self._script = client.register_script(_RESERVE_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "webpost:rate:") -> "RedisRateLimiter":
+        import redis
+
+        return cls(redis.Redis.from_url(url), prefix=prefix)
+
+    def reserve(self, key: str, limit: HttpRateLimit) -> float:
+        wait = self._script(keys=[self._prefix + key], args=[limit.rate_per_sec, limit.burst])
+        return float(wait)
@@ -1,21 +1,66 @@
 # infrastructure/idempotency/in_memory_idempotency_store.py
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from threading import Lock
-from typing import Set
+from typing import Callable, Iterable, List
 
 from domain.ids import IdempotencyKey
+from infrastructure.retention.policy import RetentionCounters, RetentionPolicy, RetentionStats
 
 
 @dataclass
 class InMemoryIdempotencyStore:
+    policy: RetentionPolicy = field(default_factory=RetentionPolicy)
+    clock: Callable[[], float] = time.monotonic
     _lock: Lock = field(default_factory=Lock, init=False)
-    _keys: Set[str] = field(default_factory=set, init=False)
+    # key -> registration time, oldest first
+    _keys: "OrderedDict[str, float]" = field(default_factory=OrderedDict, init=False)
+    _counters: RetentionCounters = field(default_factory=RetentionCounters, init=False)
 
     def register(self, key: IdempotencyKey) -> bool:
         with self._lock:
             if key.value in self._keys:
                 return False
-            self._keys.add(key.value)
+            self._keys[key.value] = self.clock()
+            self._enforce_cap()
             return True
+
+    def release(self, key: IdempotencyKey) -> None:
+        with self._lock:
+            self._keys.pop(key.value, None)
+
+    def prune(self) -> List[str]:
+        evicted: List[str] = []
+        with self._lock:
+            if self.policy.ttl_sec is not None:
+                deadline = self.clock() - self.policy.ttl_sec
+                while self._keys:
+                    key, registered_at = next(iter(self._keys.items()))
+                    if registered_at > deadline:
+                        break
+                    self._keys.popitem(last=False)
+                    evicted.append(key)
+                self._counters.evicted_ttl += len(evicted)
+            evicted += self._enforce_cap()
+        return evicted
+
+    def evict(self, keys: Iterable[str]) -> int:
+        with self._lock:
+            return sum(1 for k in keys if self._keys.pop(k, None) is not None)
+
+    def retention_stats(self) -> RetentionStats:
+        with self._lock:
+            return self._counters.snapshot("idempotency_keys", len(self._keys))
+
+    def _enforce_cap(self) -> List[str]:
+        evicted: List[str] = []
+        cap = self.policy.max_entries
+        if cap is None:
+            return evicted
+        while len(self._keys) > cap:
+            evicted.append(self._keys.popitem(last=False)[0])
+        self._counters.evicted_lru += len(evicted)
+        return evicted
@@ -0,0 +1,160 @@
+# infrastructure/logging/async_log_writer.py
+from __future__ import annotations
+
+import json
+import sys
+from collections import deque
+from dataclasses import dataclass
+from threading import Condition, Event, Lock, Thread
+from typing import Any, Callable, Deque, Dict, List, Optional, TextIO, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib encoder is used without it
+    orjson = None
+
+
+def _dumps_stdlib(payload: Dict[str, Any]) -> str:
+    return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+def _dumps_orjson(payload: Dict[str, Any]) -> str:
+    try:
+        return orjson.dumps(payload, default=str).decode("utf-8")
+    except TypeError:
+        # non-str keys and the like: keep the stdlib behaviour
+        return _dumps_stdlib(payload)
+
+
+_dumps: Callable[[Dict[str, Any]], str] = _dumps_orjson if orjson is not None else _dumps_stdlib
+
+
+def _serialize(payload: Dict[str, Any]) -> str:
+    try:
+        return _dumps(payload)
+    except Exception as e:
+        # one bad payload (e.g. a circular reference) must not stop the writer
+        return _dumps_stdlib({"type": payload.get("type"), "log_error": str(e)})
+
+
+@dataclass(frozen=True)
+class LogWriterStats:
+    queued: int
+    written: int
+    dropped: int
+    batches: int
+    write_errors: int
+
+
+class AsyncLogWriter:
+    """
+    Console/file log sink that takes serialization and I/O off the caller's thread.
+
+    - submit() only appends (event, payload) to a deque (atomic, no lock), so
+      worker threads never wait on stdout or on each other
+    - A writer thread wakes every flush_interval_sec (or when batch_size
+      events are waiting), serializes them and writes the batch in one call
+    - At most max_queue events wait; further ones are dropped and counted
+    - Payloads are serialized later, so callers must not mutate them after logging
+    """
+
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        path: Optional[str] = None,
+        max_queue: int = 10000,
+        batch_size: int = 256,
+        flush_interval_sec: float = 0.05,
+    ) -> None:
+        self._owns_stream = stream is None and path is not None
+        self._stream = stream if stream is not None else (open(path, "a", encoding="utf-8") if path else None)
+        self._max_queue = max_queue
+        self._batch_size = max(1, batch_size)
+        self._flush_interval_sec = flush_interval_sec
+        self._queue: Deque[Tuple[str, Dict[str, Any]]] = deque()
+        self._wake = Event()
+        self._idle = Condition()
+        self._writing = False
+        self._counts_lock = Lock()
+        self._written = 0
+        self._dropped = 0
+        self._batches = 0
+        self._write_errors = 0
+        self._closed = False
+        self._thread = Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, event: str, payload: Dict[str, Any]) -> bool:
+        """Queue one event; False if it was dropped because the queue is full."""
+        if self._closed or len(self._queue) >= self._max_queue:
+            with self._counts_lock:
+                self._dropped += 1
+            return False
+        self._queue.append((event, payload))
+        if len(self._queue) >= self._batch_size:
+            self._wake.set()
+        return True
+
+    def flush(self, timeout_sec: float = 5.0) -> bool:
+        """Wait until everything submitted so far is written."""
+        self._wake.set()
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._queue and not self._writing, timeout_sec)
+
+    def close(self, timeout_sec: float = 5.0) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._thread.join(timeout_sec)
+        if self._owns_stream and self._stream is not None:
+            self._stream.close()
+
+    def stats(self) -> LogWriterStats:
+        with self._counts_lock:
+            return LogWriterStats(
+                queued=len(self._queue),
+                written=self._written,
+                dropped=self._dropped,
+                batches=self._batches,
+                write_errors=self._write_errors,
+            )
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self._flush_interval_sec)
+            self._wake.clear()
+            self._drain()
+            if self._closed and not self._queue:
+                with self._idle:
+                    self._idle.notify_all()
+                return
+
+    def _drain(self) -> None:
+        while self._queue:
+            with self._idle:
+                self._writing = True
+            batch: List[str] = []
+            try:
+                while self._queue and len(batch) < self._batch_size:
+                    event, payload = self._queue.popleft()
+                    batch.append(f"{event} {_serialize(payload)}\n")
+                self._write("".join(batch), len(batch))
+            finally:
+                with self._idle:
+                    self._writing = False
+                    self._idle.notify_all()
+
+    def _write(self, text: str, count: int) -> None:
+        # resolved per batch so a replaced sys.stdout (tests, reloaders) is honoured
+        stream = self._stream if self._stream is not None else sys.stdout
+        try:
+            stream.write(text)
+            stream.flush()
+        except Exception:
+            with self._counts_lock:
+                self._write_errors += 1
+            return
+        with self._counts_lock:
+            self._written += count
+            self._batches += 1
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, List
+from typing import Any, List, Optional
 
-from application.ports.logger import LoggerPort
+from application.ports.logger import LoggerPort, log_enabled, resolve_fields
 
 
 @dataclass(frozen=True)
@@ -13,15 +13,27 @@ class CompositeLogger(LoggerPort):
     def bind(self, **fields: Any) -> "CompositeLogger":
         return CompositeLogger([logger.bind(**fields) for logger in self.loggers])
 
+    def is_enabled(self, level: str, event: Optional[str] = None) -> bool:
+        return any(log_enabled(logger, level, event) for logger in self.loggers)
+
     def debug(self, event: str, **fields: Any) -> None:
         self._emit("debug", event, fields)
 
     def info(self, event: str, **fields: Any) -> None:
         self._emit("info", event, fields)
 
+    def warning(self, event: str, **fields: Any) -> None:
+        self._emit("warning", event, fields)
+
     def error(self, event: str, **fields: Any) -> None:
         self._emit("error", event, fields)
 
     def _emit(self, level: str, event: str, fields: dict[str, Any]) -> None:
-        for logger in self.loggers:
-            getattr(logger, level)(event, **fields)
+        # Reason: Each child would otherwise evaluate the same lazy fields again.
+        # Impact: Payloads are built once, and not at all when no child wants the event.
+        enabled = [logger for logger in self.loggers if log_enabled(logger, level, event)]
+        if not enabled:
+            return
+        resolved = resolve_fields(fields)
+        for logger in enabled:
+            getattr(logger, level)(event, **resolved)
@@ -1,33 +1,48 @@
-# infrastructure/logging/console_logger.py
 from __future__ import annotations
 
 import json
 from dataclasses import dataclass, field
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from application.ports.logger import LoggerPort
+from application.ports.logger import LoggerPort, LogLevelPolicy, resolve_fields
+from infrastructure.logging.async_log_writer import AsyncLogWriter
 
 
 @dataclass(frozen=True)
 class ConsoleLogger(LoggerPort):
     bound: Dict[str, Any] = field(default_factory=dict)
+    # Reason: json.dumps + print on the step thread serialize workers on stdout.
+    # Impact: With a writer, events are queued and written in batches by its thread.
+    writer: Optional[AsyncLogWriter] = None
+    levels: LogLevelPolicy = field(default_factory=LogLevelPolicy)
 
     def bind(self, **fields: Any) -> "ConsoleLogger":
         merged = dict(self.bound)
         merged.update(fields)
-        return ConsoleLogger(bound=merged)
+        return ConsoleLogger(bound=merged, writer=self.writer, levels=self.levels)
+
+    def is_enabled(self, level: str, event: Optional[str] = None) -> bool:
+        return self.levels.allows(level, event)
 
     def debug(self, event: str, **fields: Any) -> None:
-        self._emit(event, fields)
+        self._emit("debug", event, fields)
 
     def info(self, event: str, **fields: Any) -> None:
-        self._emit(event, fields)
+        self._emit("info", event, fields)
+
+    def warning(self, event: str, **fields: Any) -> None:
+        self._emit("warning", event, fields)
 
     def error(self, event: str, **fields: Any) -> None:
-        self._emit(event, fields)
+        self._emit("error", event, fields)
 
-    def _emit(self, event: str, fields: Dict[str, Any]) -> None:
+    def _emit(self, level: str, event: str, fields: Dict[str, Any]) -> None:
+        if not self.levels.allows(level, event):
+            return
         payload = dict(self.bound)
-        payload.update(fields)
+        payload.update(resolve_fields(fields))
         payload.setdefault("type", event)
+        if self.writer is not None:
+            self.writer.submit(event, payload)
+            return
         print(f"{event} {json.dumps(payload, ensure_ascii=False)}")
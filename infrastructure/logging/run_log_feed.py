@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+from threading import Lock
+from typing import Dict, List, Optional
+
+
+class RunLogSubscription:
+    """
+    Wake-up signal for one reader of one run's log.
+
+    Call arm() before reading the store and wait() after; an append that lands
+    in between still wakes the reader because arm() cleared the flag first.
+    """
+
+    def __init__(self, feed: "RunLogFeed", run_id: str) -> None:
+        self._feed = feed
+        self.run_id = run_id
+        self._loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+
+    def arm(self) -> None:
+        self._event.clear()
+
+    async def wait(self, timeout_sec: float) -> bool:
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=timeout_sec)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def _notify(self) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:
+            # loop already closed: the reader is gone
+            pass
+
+    def close(self) -> None:
+        self._feed._unsubscribe(self)
+
+    def __enter__(self) -> "RunLogSubscription":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+
+class RunLogFeed:
+    """
+    Push notification for streamed run logs.
+
+    RunLogLogger publishes the run_id after every append (from any thread);
+    streaming endpoints subscribe on the event loop and re-read the store
+    from their cursor when woken. No entry data goes through the feed.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._subscribers: Dict[str, List[RunLogSubscription]] = {}
+
+    def subscribe(self, run_id: str) -> RunLogSubscription:
+        sub = RunLogSubscription(self, run_id)
+        with self._lock:
+            self._subscribers.setdefault(run_id, []).append(sub)
+        return sub
+
+    def publish(self, run_id: str) -> None:
+        with self._lock:
+            subs = list(self._subscribers.get(run_id, ()))
+        for sub in subs:
+            sub._notify()
+
+    def subscriber_count(self, run_id: Optional[str] = None) -> int:
+        with self._lock:
+            if run_id is not None:
+                return len(self._subscribers.get(run_id, ()))
+            return sum(len(v) for v in self._subscribers.values())
+
+    def _unsubscribe(self, sub: RunLogSubscription) -> None:
+        with self._lock:
+            subs = self._subscribers.get(sub.run_id)
+            if not subs:
+                return
+            if sub in subs:
+                subs.remove(sub)
+            if not subs:
+                self._subscribers.pop(sub.run_id, None)
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from application.ports.logger import LoggerPort
+from application.ports.logger import LoggerPort, LogLevelPolicy, resolve_fields
 from application.ports.run_log_store import RunLogStorePort
 from domain.run_log import RunLogEntry
+from infrastructure.logging.run_log_feed import RunLogFeed
 
 
 @dataclass(frozen=True)
@@ -14,24 +15,40 @@ class RunLogLogger(LoggerPort):
     run_id: str
     log_store: RunLogStorePort
     bound: Dict[str, Any] = field(default_factory=dict)
+    feed: Optional[RunLogFeed] = None
+    levels: LogLevelPolicy = field(default_factory=LogLevelPolicy)
 
     def bind(self, **fields: Any) -> "RunLogLogger":
         merged = dict(self.bound)
         merged.update(fields)
-        return RunLogLogger(run_id=self.run_id, log_store=self.log_store, bound=merged)
+        return RunLogLogger(
+            run_id=self.run_id,
+            log_store=self.log_store,
+            bound=merged,
+            feed=self.feed,
+            levels=self.levels,
+        )
+
+    def is_enabled(self, level: str, event: Optional[str] = None) -> bool:
+        return self.levels.allows(level, event)
 
     def debug(self, event: str, **fields: Any) -> None:
-        self._emit(event, fields)
+        self._emit("debug", event, fields)
 
     def info(self, event: str, **fields: Any) -> None:
-        self._emit(event, fields)
+        self._emit("info", event, fields)
+
+    def warning(self, event: str, **fields: Any) -> None:
+        self._emit("warning", event, fields)
 
     def error(self, event: str, **fields: Any) -> None:
-        self._emit(event, fields)
+        self._emit("error", event, fields)
 
-    def _emit(self, event: str, fields: Dict[str, Any]) -> None:
+    def _emit(self, level: str, event: str, fields: Dict[str, Any]) -> None:
+        if not self.levels.allows(level, event):
+            return
         payload = dict(self.bound)
-        payload.update(fields)
+        payload.update(resolve_fields(fields))
         payload.setdefault("type", event)
         entry = RunLogEntry(
             timestamp=datetime.now(timezone.utc),
@@ -39,3 +56,5 @@ class RunLogLogger(LoggerPort):
             fields=payload,
         )
         self.log_store.append(self.run_id, entry)
+        if self.feed is not None:
+            self.feed.publish(self.run_id)
@@ -0,0 +1,13 @@
+"""Prometheus metrics for runs, steps and HTTP requests."""
+from infrastructure.metrics.registry import Counter, Gauge, Histogram, MetricsRegistry
+from infrastructure.metrics.webpost_metrics import ForwardingMetrics, ScenarioRunMetrics, WebPostMetrics
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "ForwardingMetrics",
+    "ScenarioRunMetrics",
+    "WebPostMetrics",
+]
@@ -0,0 +1,115 @@
+# infrastructure/metrics/webpost_metrics.py
+from __future__ import annotations
+
+from typing import Any, Callable, Optional, Tuple
+
+from application.ports.metrics import RunMetricsPort
+from infrastructure.metrics.registry import Counter, Gauge, Histogram, MetricsRegistry
+
+RUN_DURATION_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+# ("metric", family name, label values, value): same channel as the run events
+MetricEvent = Tuple[str, str, Tuple[str, ...], float]
+
+
+class WebPostMetrics:
+    """
+    Metric families of the runner and the recording API used by api.main.
+
+    Every measurement goes through record(name, labels, value) so that a
+    worker process can forward it to the API process (see ForwardingMetrics)
+    where it is applied to the registry that /metrics renders.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None) -> None:
+        self.registry = registry or MetricsRegistry()
+        reg = self.registry.register
+        self.step_duration = reg(Histogram(
+            "webpost_step_duration_seconds", "Step execution time", ("scenario", "step_type", "ok"),
+        ))
+        self.http_duration = reg(Histogram(
+            "webpost_http_request_duration_seconds", "HTTP request latency (send to response headers)", ("host", "status"),
+        ))
+        self.queue_wait = reg(Histogram(
+            "webpost_run_queue_wait_seconds", "Time from run accepted to run started", ("scenario",),
+            buckets=RUN_DURATION_BUCKETS,
+        ))
+        self.run_duration = reg(Histogram(
+            "webpost_run_duration_seconds", "Run execution time", ("scenario", "status"),
+            buckets=RUN_DURATION_BUCKETS,
+        ))
+        self.runs = reg(Counter("webpost_runs_total", "Finished runs by outcome", ("scenario", "status")))
+        self.active_runs = reg(Gauge("webpost_runs_active", "Runs currently executing"))
+        self.queue_depth = reg(Gauge("webpost_run_queue_depth", "Runs waiting for a run slot"))
+        self.browser_instances = reg(Gauge("webpost_browser_instances", "Open browser instances"))
+        self.browser_pool_running = reg(Gauge("webpost_browser_pool_running", "Pooled browsers currently launched"))
+        self.browser_pool_waiting = reg(Gauge("webpost_browser_pool_waiting", "Runs waiting for a pooled browser"))
+        self.log_queue_depth = reg(Gauge("webpost_log_queue_depth", "Console log events waiting to be written"))
+        self.log_dropped = reg(Counter(
+            "webpost_log_events_dropped_total", "Console log events dropped on a full queue",
+        ))
+
+    def bind_queue(self, active: Callable[[], float], depth: Callable[[], float]) -> None:
+        self.active_runs.set_function(active)
+        self.queue_depth.set_function(depth)
+
+    def bind_log_writer(self, depth: Callable[[], float], dropped: Callable[[], float]) -> None:
+        self.log_queue_depth.set_function(depth)
+        self.log_dropped.set_function(dropped)
+
+    def bind_browser_pool(self, running: Callable[[], float], waiting: Callable[[], float]) -> None:
+        self.browser_pool_running.set_function(running)
+        self.browser_pool_waiting.set_function(waiting)
+
+    def for_run(self, scenario_id: str) -> RunMetricsPort:
+        return ScenarioRunMetrics(self, scenario_id)
+
+    def observe_queue_wait(self, scenario_id: str, seconds: float) -> None:
+        self.record(self.queue_wait.name, (scenario_id,), seconds)
+
+    def observe_run(self, scenario_id: str, status: str, seconds: float) -> None:
+        self.record(self.run_duration.name, (scenario_id, status), seconds)
+        self.record(self.runs.name, (scenario_id, status), 1.0)
+
+    def browser_opened(self) -> None:
+        self.record(self.browser_instances.name, (), 1.0)
+
+    def browser_closed(self) -> None:
+        self.record(self.browser_instances.name, (), -1.0)
+
+    def record(self, name: str, labels: Tuple[str, ...], value: float) -> None:
+        family: Any = self.registry.get(name)
+        if family is None:
+            raise KeyError(f"unknown metric: {name}")
+        if isinstance(family, Histogram):
+            family.observe(value, *labels)
+        else:
+            family.inc(*labels, amount=value)
+
+    def render(self) -> str:
+        return self.registry.render()
+
+
+class ForwardingMetrics(WebPostMetrics):
+    """Worker-side metrics: measurements are shipped to the API process instead of kept."""
+
+    def __init__(self, sink: Callable[[MetricEvent], None]) -> None:
+        super().__init__()
+        self._sink = sink
+
+    def record(self, name: str, labels: Tuple[str, ...], value: float) -> None:
+        self._sink(("metric", name, tuple(labels), value))
+
+
+class ScenarioRunMetrics(RunMetricsPort):
+    def __init__(self, metrics: WebPostMetrics, scenario_id: str) -> None:
+        self._metrics = metrics
+        self._scenario_id = scenario_id
+
+    def observe_step(self, step_type: str, ok: bool, elapsed_sec: float) -> None:
+        self._metrics.record(
+            self._metrics.step_duration.name, (self._scenario_id, step_type, "true" if ok else "false"), elapsed_sec
+        )
+
+    def observe_http(self, host: str, status: int, elapsed_sec: float) -> None:
+        self._metrics.record(self._metrics.http_duration.name, (host, str(status)), elapsed_sec)
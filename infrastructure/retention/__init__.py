@@ -0,0 +1,16 @@
+"""Retention (TTL + LRU cap) for in-memory stores."""
+from infrastructure.retention.policy import (
+    RetainedStore,
+    RetentionCounters,
+    RetentionPolicy,
+    RetentionStats,
+)
+from infrastructure.retention.reaper import RetentionReaper
+
+__all__ = [
+    "RetainedStore",
+    "RetentionCounters",
+    "RetentionPolicy",
+    "RetentionStats",
+    "RetentionReaper",
+]
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Protocol
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """
+    ttl_sec: entries idle longer than this are evicted by the reaper (None = keep)
+    max_entries: cap; least recently used entries are evicted first (None = unbounded)
+    """
+    ttl_sec: Optional[float] = None
+    max_entries: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class RetentionStats:
+    name: str
+    size: int
+    evicted_ttl: int
+    evicted_lru: int
+
+
+class RetentionCounters:
+    """Eviction counters kept by each retained store (updated under the store's lock)."""
+
+    def __init__(self) -> None:
+        self.evicted_ttl = 0
+        self.evicted_lru = 0
+
+    def snapshot(self, name: str, size: int) -> RetentionStats:
+        return RetentionStats(name=name, size=size, evicted_ttl=self.evicted_ttl, evicted_lru=self.evicted_lru)
+
+
+class RetainedStore(Protocol):
+    def prune(self) -> List[str]:
+        """Apply TTL and size cap; return the evicted keys."""
+        ...
+
+    def evict(self, keys: Iterable[str]) -> int:
+        """Drop the given keys (cascade from another store)."""
+        ...
+
+    def retention_stats(self) -> RetentionStats:
+        ...
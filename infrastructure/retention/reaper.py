@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from threading import Event, Lock, Thread
+from typing import Dict, List, Optional
+
+from application.ports.logger import LoggerPort
+from infrastructure.retention.policy import RetainedStore, RetentionStats
+
+
+class RetentionReaper:
+    """
+    Background thread that prunes retained stores every interval_sec.
+
+    link(source, target): keys evicted from source are also evicted from target
+    (e.g. run records -> run logs), so dependent data never outlives its owner.
+    """
+
+    def __init__(self, interval_sec: float = 60.0, logger: Optional[LoggerPort] = None) -> None:
+        self._interval_sec = interval_sec
+        self._logger = logger
+        self._lock = Lock()
+        self._stores: List[RetainedStore] = []
+        self._links: Dict[int, List[RetainedStore]] = {}
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    def register(self, store: RetainedStore) -> "RetentionReaper":
+        with self._lock:
+            self._stores.append(store)
+        return self
+
+    def link(self, source: RetainedStore, target: RetainedStore) -> "RetentionReaper":
+        with self._lock:
+            self._links.setdefault(id(source), []).append(target)
+        return self
+
+    def run_once(self) -> int:
+        with self._lock:
+            stores = list(self._stores)
+            links = {k: list(v) for k, v in self._links.items()}
+        total = 0
+        for store in stores:
+            evicted = store.prune()
+            total += len(evicted)
+            if evicted:
+                for target in links.get(id(store), ()):
+                    target.evict(evicted)
+        return total
+
+    def stats(self) -> List[RetentionStats]:
+        with self._lock:
+            stores = list(self._stores)
+        return [store.retention_stats() for store in stores]
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = Thread(target=self._loop, name="retention-reaper", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout_sec: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout_sec)
+            self._thread = None
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self._interval_sec):
+            try:
+                evicted = self.run_once()
+            except Exception as exc:
+                if self._logger is not None:
+                    self._logger.error("retention.prune_failed", error=str(exc))
+                continue
+            if evicted and self._logger is not None:
+                self._logger.info("retention.pruned", evicted=evicted)
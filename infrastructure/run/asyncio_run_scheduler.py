@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from concurrent.futures import Future
+from threading import Thread
+from typing import Any, Callable, Optional
+
+from application.ports.run_scheduler import RunSchedulerPort
+from infrastructure.run.future_registry import FutureRegistry
+
+
+class AsyncioRunScheduler(RunSchedulerPort):
+    """
+    Run scheduler that multiplexes runs on a single event loop thread.
+
+    - task returning a coroutine: awaited on the loop (AsyncStepExecutor runs)
+    - plain callable: executed in the loop's default executor (sync fallback,
+      e.g. browser scenarios whose Playwright sync client is thread-bound)
+    """
+
+    def __init__(self, max_sync_workers: int = 4, keep_finished: int = 1000) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._sync_workers = asyncio.Semaphore(max_sync_workers)
+        self._thread = Thread(target=self._run_loop, name="run-scheduler-loop", daemon=True)
+        self._thread.start()
+        self._futures = FutureRegistry(keep_finished=keep_finished)
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    async def _run(self, task: Callable[[], Any]) -> None:
+        if inspect.iscoroutinefunction(task):
+            await task()
+            return
+        async with self._sync_workers:
+            result = await self._loop.run_in_executor(None, task)
+        if inspect.isawaitable(result):
+            await result
+
+    def submit(self, run_id: str, task: Callable[[], Any], concurrency_key: Optional[str] = None) -> Future:
+        future = asyncio.run_coroutine_threadsafe(self._run(task), self._loop)
+        self._futures.add(run_id, future)
+        return future
+
+    def wait(self, run_id: str, timeout_sec: float) -> bool:
+        future = self.get_future(run_id)
+        if future is None:
+            return False
+        try:
+            future.result(timeout=timeout_sec)
+        except Exception:
+            return future.done()
+        return True
+
+    def get_future(self, run_id: str) -> Optional[Future]:
+        return self._futures.get(run_id)
+
+    def shutdown(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
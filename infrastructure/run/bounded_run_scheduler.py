@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import Future
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Deque, Dict, Iterator, List, Optional
+
+from application.ports.run_scheduler import RunQueueFullError, RunSchedulerPort, RunSlotPort
+from infrastructure.run.future_registry import FutureRegistry
+
+
+@dataclass(frozen=True)
+class RunQueueStats:
+    pending: int
+    active: int
+    rejected: int
+    drain_rate_per_sec: float
+    held: int = 0
+
+
+_NOT_ACTIVE = object()
+
+
+@dataclass
+class _PendingRun:
+    run_id: str
+    task: Callable[[], None]
+    key: Optional[str]
+    future: Future
+
+
+class BoundedRunScheduler(RunSchedulerPort):
+    """
+    Admission control in front of another scheduler.
+
+    - at most max_active runs are handed to the inner scheduler at once
+    - at most per_key_limit of them share a concurrency_key (scenario id);
+      a saturated scenario does not block runs of other scenarios
+    - at most max_queue_depth runs wait; beyond that submit() raises
+      RunQueueFullError with a Retry-After estimate from the observed drain rate
+    - up to max_held runs may lend their slot while they wait for a scheduled
+      release (slot(run_id).hold()); they are not counted as active meanwhile,
+      so the inner scheduler needs room for max_active + max_held runs
+    """
+
+    def __init__(
+        self,
+        inner: RunSchedulerPort,
+        max_active: int = 4,
+        max_queue_depth: int = 100,
+        per_key_limit: Optional[int] = None,
+        drain_window_sec: float = 60.0,
+        default_retry_after_sec: int = 5,
+        max_retry_after_sec: int = 300,
+        clock: Callable[[], float] = time.monotonic,
+        keep_finished: int = 1000,
+        max_held: int = 0,
+    ) -> None:
+        self._inner = inner
+        self._max_active = max(1, max_active)
+        self._max_queue_depth = max(0, max_queue_depth)
+        self._per_key_limit = per_key_limit
+        self._drain_window_sec = drain_window_sec
+        self._default_retry_after_sec = default_retry_after_sec
+        self._max_retry_after_sec = max_retry_after_sec
+        self._clock = clock
+
+        self._lock = Lock()
+        self._pending: Deque[_PendingRun] = deque()
+        self._active: Dict[str, Optional[str]] = {}
+        self._active_by_key: Dict[str, int] = {}
+        self._max_held = max(0, max_held)
+        self._held: Dict[str, Optional[str]] = {}
+        self._completions: Deque[float] = deque()
+        self._futures = FutureRegistry(keep_finished=keep_finished)
+        self._rejected = 0
+
+    def submit(self, run_id: str, task: Callable[[], None], concurrency_key: Optional[str] = None) -> Future:
+        with self._lock:
+            if len(self._pending) >= self._max_queue_depth and not self._can_start(concurrency_key):
+                self._rejected += 1
+                raise RunQueueFullError(
+                    f"Run queue is full ({len(self._pending)} waiting)",
+                    retry_after_sec=self._retry_after_locked(),
+                )
+            future: Future = Future()
+            self._futures.add(run_id, future)
+            self._pending.append(_PendingRun(run_id, task, concurrency_key, future))
+            ready = self._take_ready_locked()
+        self._dispatch(ready)
+        return future
+
+    def wait(self, run_id: str, timeout_sec: float) -> bool:
+        future = self.get_future(run_id)
+        if future is None:
+            return False
+        try:
+            future.result(timeout=timeout_sec)
+        except Exception:
+            return future.done()
+        return True
+
+    def get_future(self, run_id: str) -> Optional[Future]:
+        return self._futures.get(run_id)
+
+    def retry_after_sec(self) -> int:
+        with self._lock:
+            return self._retry_after_locked()
+
+    def stats(self) -> RunQueueStats:
+        with self._lock:
+            return RunQueueStats(
+                pending=len(self._pending),
+                active=len(self._active),
+                rejected=self._rejected,
+                drain_rate_per_sec=self._drain_rate_locked(),
+                held=len(self._held),
+            )
+
+    def slot(self, run_id: str) -> RunSlotPort:
+        return _BoundedRunSlot(self, run_id)
+
+    def _park(self, run_id: str) -> bool:
+        with self._lock:
+            if run_id not in self._active or len(self._held) >= self._max_held:
+                # unknown here (e.g. a process worker's own copy) or no room: hold in the slot
+                return False
+            key = self._active.pop(run_id)
+            self._held[run_id] = key
+            self._release_key_locked(key)
+            ready = self._take_ready_locked()
+        self._dispatch(ready)
+        return True
+
+    def _unpark(self, run_id: str) -> None:
+        with self._lock:
+            if run_id not in self._held:
+                return
+            # back to active even beyond max_active: the run is already executing
+            key = self._held.pop(run_id)
+            self._active[run_id] = key
+            if key is not None:
+                self._active_by_key[key] = self._active_by_key.get(key, 0) + 1
+
+    # ------------------------------------------------------------------
+
+    def _can_start(self, key: Optional[str]) -> bool:
+        if len(self._active) >= self._max_active:
+            return False
+        if key is not None and self._per_key_limit is not None:
+            return self._active_by_key.get(key, 0) < self._per_key_limit
+        return True
+
+    def _take_ready_locked(self) -> List[_PendingRun]:
+        ready: List[_PendingRun] = []
+        if not self._pending:
+            return ready
+        remaining: Deque[_PendingRun] = deque()
+        while self._pending:
+            item = self._pending.popleft()
+            if self._can_start(item.key):
+                self._active[item.run_id] = item.key
+                if item.key is not None:
+                    self._active_by_key[item.key] = self._active_by_key.get(item.key, 0) + 1
+                ready.append(item)
+            else:
+                remaining.append(item)
+        self._pending = remaining
+        return ready
+
+    def _dispatch(self, ready: List[_PendingRun]) -> None:
+        # Reason: the inner future may already be done, so add_done_callback can run inline.
+        # Impact: dispatch happens outside the lock to avoid re-entering it.
+        for item in ready:
+            try:
+                inner_future = self._inner.submit(item.run_id, item.task, item.key)
+            except Exception as exc:
+                self._finish(item, None, exc)
+                continue
+            inner_future.add_done_callback(lambda f, item=item: self._finish(item, f, None))
+
+    def _finish(self, item: _PendingRun, inner_future: Optional[Future], error: Optional[BaseException]) -> None:
+        with self._lock:
+            if self._active.pop(item.run_id, _NOT_ACTIVE) is not _NOT_ACTIVE:
+                self._release_key_locked(item.key)
+            else:
+                # finished while lending its slot; the key was released when it was parked
+                self._held.pop(item.run_id, None)
+            self._completions.append(self._clock())
+            ready = self._take_ready_locked()
+
+        if error is None and inner_future is not None:
+            error = inner_future.exception()
+        if error is not None:
+            item.future.set_exception(error)
+        else:
+            item.future.set_result(inner_future.result() if inner_future is not None else None)
+        self._dispatch(ready)
+
+    def _release_key_locked(self, key: Optional[str]) -> None:
+        if key is None:
+            return
+        left = self._active_by_key.get(key, 1) - 1
+        if left > 0:
+            self._active_by_key[key] = left
+        else:
+            self._active_by_key.pop(key, None)
+
+    def _drain_rate_locked(self) -> float:
+        now = self._clock()
+        while self._completions and now - self._completions[0] > self._drain_window_sec:
+            self._completions.popleft()
+        if len(self._completions) < 2:
+            return 0.0
+        span = max(now - self._completions[0], 1e-3)
+        return len(self._completions) / span
+
+    def _retry_after_locked(self) -> int:
+        rate = self._drain_rate_locked()
+        if rate <= 0:
+            return self._default_retry_after_sec
+        # time until this caller's run would reach the head of the queue
+        estimate = math.ceil((len(self._pending) + 1) / rate)
+        return max(1, min(self._max_retry_after_sec, estimate))
+
+
+class _BoundedRunSlot(RunSlotPort):
+    def __init__(self, scheduler: BoundedRunScheduler, run_id: str) -> None:
+        self._scheduler = scheduler
+        self._run_id = run_id
+
+    @contextmanager
+    def hold(self) -> Iterator[None]:
+        parked = self._scheduler._park(self._run_id)
+        try:
+            yield
+        finally:
+            if parked:
+                self._scheduler._unpark(self._run_id)
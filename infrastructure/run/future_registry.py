@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import Lock
+from typing import Dict, Optional
+
+
+class FutureRegistry:
+    """
+    run_id -> Future map shared by the schedulers.
+
+    A future leaves the active map as soon as it completes; the last
+    `keep_finished` completed futures stay reachable so a wait() issued right
+    after a fast run still sees its result. Memory is bounded by active runs
+    plus keep_finished.
+    """
+
+    def __init__(self, keep_finished: int = 1000) -> None:
+        self._lock = Lock()
+        self._active: Dict[str, Future] = {}
+        self._finished: "OrderedDict[str, Future]" = OrderedDict()
+        self._keep_finished = max(0, keep_finished)
+
+    def add(self, run_id: str, future: Future) -> None:
+        with self._lock:
+            self._active[run_id] = future
+        future.add_done_callback(lambda _f: self._release(run_id, future))
+
+    def get(self, run_id: str) -> Optional[Future]:
+        with self._lock:
+            return self._active.get(run_id) or self._finished.get(run_id)
+
+    def active_count(self) -> int:
+        with self._lock:
+            return len(self._active)
+
+    def finished_count(self) -> int:
+        with self._lock:
+            return len(self._finished)
+
+    def _release(self, run_id: str, future: Future) -> None:
+        with self._lock:
+            if self._active.get(run_id) is future:
+                del self._active[run_id]
+            if self._keep_finished == 0:
+                return
+            self._finished[run_id] = future
+            self._finished.move_to_end(run_id)
+            while len(self._finished) > self._keep_finished:
+                self._finished.popitem(last=False)
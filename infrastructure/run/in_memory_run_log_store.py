@@ -1,21 +1,130 @@
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
+from contextlib import ExitStack
 from threading import Lock
-from typing import Dict, List
+from typing import Callable, Dict, Iterable, List, Optional
 
 from application.ports.run_log_store import RunLogStorePort
 from domain.run_log import RunLogEntry
+from infrastructure.retention.policy import RetentionCounters, RetentionPolicy, RetentionStats
 
 
-class InMemoryRunLogStore(RunLogStorePort):
+class _Shard:
     def __init__(self) -> None:
-        self._logs: Dict[str, List[RunLogEntry]] = {}
-        self._lock = Lock()
+        self.lock = Lock()
+        self.logs: Dict[str, List[RunLogEntry]] = {}
+        self.touched: "OrderedDict[str, float]" = OrderedDict()
+
+
+class InMemoryRunLogStore(RunLogStorePort):
+    """
+    Run logs kept in process memory.
+    Retention (policy) is applied by RetentionReaper via prune(); a run's logs are
+    "used" whenever they are appended to or read.
+
+    Runs are spread over `shards` lock stripes by run_id, so concurrent runs
+    appending their step logs do not contend on one lock.
+    """
+
+    def __init__(
+        self,
+        policy: Optional[RetentionPolicy] = None,
+        clock: Callable[[], float] = time.monotonic,
+        shards: int = 16,
+    ) -> None:
+        self._shards = [_Shard() for _ in range(max(1, shards))]
+        self._policy = policy or RetentionPolicy()
+        self._clock = clock
+        self._counters = RetentionCounters()
+        self._counters_lock = Lock()
 
     def append(self, run_id: str, entry: RunLogEntry) -> None:
-        with self._lock:
-            self._logs.setdefault(run_id, []).append(entry)
+        shard = self._shard(run_id)
+        with shard.lock:
+            shard.logs.setdefault(run_id, []).append(entry)
+            self._touch(shard, run_id)
+
+    def list(self, run_id: str, since: int = 0) -> List[RunLogEntry]:
+        shard = self._shard(run_id)
+        with shard.lock:
+            if run_id in shard.logs:
+                self._touch(shard, run_id)
+            return shard.logs.get(run_id, [])[max(0, since):]
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.logs.clear()
+                shard.touched.clear()
+
+    def prune(self) -> List[str]:
+        evicted: List[str] = []
+        if self._policy.ttl_sec is not None:
+            deadline = self._clock() - self._policy.ttl_sec
+            for shard in self._shards:
+                with shard.lock:
+                    while shard.touched:
+                        run_id, touched_at = next(iter(shard.touched.items()))
+                        if touched_at > deadline:
+                            break
+                        self._drop(shard, run_id)
+                        evicted.append(run_id)
+            with self._counters_lock:
+                self._counters.evicted_ttl += len(evicted)
+        cap = self._policy.max_entries
+        if cap is not None:
+            lru = self._enforce_cap(cap)
+            with self._counters_lock:
+                self._counters.evicted_lru += len(lru)
+            evicted += lru
+        return evicted
+
+    def evict(self, keys: Iterable[str]) -> int:
+        count = 0
+        for run_id in keys:
+            shard = self._shard(run_id)
+            with shard.lock:
+                if run_id in shard.logs:
+                    count += 1
+                self._drop(shard, run_id)
+        return count
+
+    def retention_stats(self) -> RetentionStats:
+        size = 0
+        for shard in self._shards:
+            with shard.lock:
+                size += len(shard.logs)
+        with self._counters_lock:
+            return self._counters.snapshot("run_logs", size)
+
+    def _enforce_cap(self, cap: int) -> List[str]:
+        # the least recently used run overall goes first, so every stripe is held
+        evicted: List[str] = []
+        with ExitStack() as stack:
+            for shard in self._shards:
+                stack.enter_context(shard.lock)
+            total = sum(len(shard.touched) for shard in self._shards)
+            while total > cap:
+                oldest = min(
+                    (shard for shard in self._shards if shard.touched),
+                    key=lambda shard: next(iter(shard.touched.values())),
+                )
+                run_id = next(iter(oldest.touched))
+                self._drop(oldest, run_id)
+                evicted.append(run_id)
+                total -= 1
+        return evicted
+
+    def _shard(self, run_id: str) -> _Shard:
+        return self._shards[hash(run_id) % len(self._shards)]
+
+    def _touch(self, shard: _Shard, run_id: str) -> None:
+        shard.touched[run_id] = self._clock()
+        shard.touched.move_to_end(run_id)
 
-    def list(self, run_id: str) -> List[RunLogEntry]:
-        with self._lock:
-            return list(self._logs.get(run_id, []))
+    @staticmethod
+    def _drop(shard: _Shard, run_id: str) -> None:
+        shard.logs.pop(run_id, None)
+        shard.touched.pop(run_id, None)
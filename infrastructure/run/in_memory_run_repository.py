@@ -1,29 +1,48 @@
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
 from dataclasses import replace
 from datetime import datetime, timezone
 from threading import Lock
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterable, List, Optional
 
 from application.ports.run_repository import RunRepositoryPort
 from domain.exceptions import RunStateError
 from domain.run_record import RunRecord, RunStatus
+from infrastructure.retention.policy import RetentionCounters, RetentionPolicy, RetentionStats
+
+_TERMINAL = (RunStatus.SUCCEEDED, RunStatus.FAILED)
 
 
 class InMemoryRunRepository(RunRepositoryPort):
-    def __init__(self) -> None:
+    """
+    Run records kept in process memory.
+    Retention (policy) only ever evicts finished runs; queued/running records
+    stay even past the TTL or the size cap.
+    """
+
+    def __init__(self, policy: Optional[RetentionPolicy] = None, clock: Callable[[], float] = time.monotonic) -> None:
         self._runs: Dict[str, RunRecord] = {}
+        self._touched: "OrderedDict[str, float]" = OrderedDict()
         self._lock = Lock()
+        self._policy = policy or RetentionPolicy()
+        self._clock = clock
+        self._counters = RetentionCounters()
 
     def create(self, record: RunRecord) -> None:
         with self._lock:
             if record.run_id in self._runs:
                 raise RunStateError(f"Run already exists: {record.run_id}")
             self._runs[record.run_id] = record
+            self._touch(record.run_id)
 
     def get(self, run_id: str) -> Optional[RunRecord]:
         with self._lock:
-            return self._runs.get(run_id)
+            record = self._runs.get(run_id)
+            if record is not None:
+                self._touch(run_id)
+            return record
 
     def transition_status(
         self,
@@ -50,6 +69,7 @@ class InMemoryRunRepository(RunRepositoryPort):
                 error_detail=error_detail,
             )
             self._runs[run_id] = updated
+            self._touch(run_id)
             return updated
 
     def update_result(self, run_id: str, result: dict) -> RunRecord:
@@ -63,6 +83,7 @@ class InMemoryRunRepository(RunRepositoryPort):
                 updated_at=datetime.now(timezone.utc),
             )
             self._runs[run_id] = updated
+            self._touch(run_id)
             return updated
 
     def update_error(self, run_id: str, error: str, error_detail: Optional[dict] = None) -> RunRecord:
@@ -77,4 +98,77 @@ class InMemoryRunRepository(RunRepositoryPort):
                 updated_at=datetime.now(timezone.utc),
             )
             self._runs[run_id] = updated
+            self._touch(run_id)
+            return updated
+
+    def update_phases(self, run_id: str, phases: dict) -> RunRecord:
+        with self._lock:
+            record = self._runs.get(run_id)
+            if record is None:
+                raise RunStateError(f"Run not found: {run_id}")
+            updated = replace(
+                record,
+                phases=phases,
+                updated_at=datetime.now(timezone.utc),
+            )
+            self._runs[run_id] = updated
+            self._touch(run_id)
             return updated
+
+    def prune(self) -> List[str]:
+        with self._lock:
+            expired: List[str] = []
+            if self._policy.ttl_sec is not None:
+                deadline = self._clock() - self._policy.ttl_sec
+                for run_id, touched_at in self._touched.items():
+                    if touched_at > deadline:
+                        break
+                    if self._is_finished(run_id):
+                        expired.append(run_id)
+                for run_id in expired:
+                    self._drop(run_id)
+                self._counters.evicted_ttl += len(expired)
+
+            lru: List[str] = []
+            cap = self._policy.max_entries
+            if cap is not None and len(self._runs) > cap:
+                excess = len(self._runs) - cap
+                for run_id in self._touched:
+                    if len(lru) >= excess:
+                        break
+                    if self._is_finished(run_id):
+                        lru.append(run_id)
+                for run_id in lru:
+                    self._drop(run_id)
+                self._counters.evicted_lru += len(lru)
+            return expired + lru
+
+    def delete(self, run_id: str) -> None:
+        with self._lock:
+            self._drop(run_id)
+
+    def evict(self, keys: Iterable[str]) -> int:
+        with self._lock:
+            count = 0
+            for run_id in keys:
+                if run_id in self._runs:
+                    count += 1
+                self._drop(run_id)
+            return count
+
+    def retention_stats(self) -> RetentionStats:
+        with self._lock:
+            return self._counters.snapshot("run_records", len(self._runs))
+
+    def _is_finished(self, run_id: str) -> bool:
+        record = self._runs.get(run_id)
+        # records cleared behind our back are dropped from the LRU too
+        return record is None or record.status in _TERMINAL
+
+    def _touch(self, run_id: str) -> None:
+        self._touched[run_id] = self._clock()
+        self._touched.move_to_end(run_id)
+
+    def _drop(self, run_id: str) -> None:
+        self._runs.pop(run_id, None)
+        self._touched.pop(run_id, None)
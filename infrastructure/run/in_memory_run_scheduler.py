@@ -1,23 +1,21 @@
 from __future__ import annotations
 
 from concurrent.futures import Future, ThreadPoolExecutor
-from threading import Lock
-from typing import Callable, Dict, Optional
+from typing import Callable, Optional
 
 from application.ports.run_scheduler import RunSchedulerPort
+from infrastructure.run.future_registry import FutureRegistry
 
 
 class InMemoryRunScheduler(RunSchedulerPort):
-    def __init__(self, max_workers: int = 4) -> None:
+    def __init__(self, max_workers: int = 4, keep_finished: int = 1000) -> None:
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
-        self._lock = Lock()
-        self._futures: Dict[str, Future] = {}
+        self._futures = FutureRegistry(keep_finished=keep_finished)
 
-    def submit(self, run_id: str, task: Callable[[], None]) -> Future:
-        with self._lock:
-            future = self._executor.submit(task)
-            self._futures[run_id] = future
-            return future
+    def submit(self, run_id: str, task: Callable[[], None], concurrency_key: Optional[str] = None) -> Future:
+        future = self._executor.submit(task)
+        self._futures.add(run_id, future)
+        return future
 
     def wait(self, run_id: str, timeout_sec: float) -> bool:
         future = self.get_future(run_id)
@@ -30,5 +28,4 @@ class InMemoryRunScheduler(RunSchedulerPort):
         return True
 
     def get_future(self, run_id: str) -> Optional[Future]:
-        with self._lock:
-            return self._futures.get(run_id)
+        return self._futures.get(run_id)
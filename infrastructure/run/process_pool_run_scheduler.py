@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import multiprocessing
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from application.ports.run_scheduler import RunSchedulerPort
+from infrastructure.run.future_registry import FutureRegistry
+from infrastructure.run.run_event_forwarding import RunEvent
+
+# Set in each worker by _bootstrap_worker
+_WORKER_EVENTS: Any = None
+
+_DONE = "done"
+_STOP = "stop"
+
+
+def _bootstrap_worker(events: Any, initializer: Optional[Callable[..., None]], initargs: Tuple[Any, ...]) -> None:
+    global _WORKER_EVENTS
+    _WORKER_EVENTS = events
+    if initializer is not None:
+        initializer(events.put, *initargs)
+
+
+def _run_job(run_id: str, task: Callable[[], Any]) -> None:
+    """
+    Worker entry point. The done marker goes through the same queue as the
+    run's events, so the API process has applied every status/log event of
+    the run before the run's future resolves.
+    """
+    error: Optional[str] = None
+    try:
+        task()
+    except BaseException:
+        error = traceback.format_exc()
+    _WORKER_EVENTS.put((_DONE, run_id, error))
+
+
+class WorkerRunError(RuntimeError):
+    pass
+
+
+class ProcessPoolRunScheduler(RunSchedulerPort):
+    """
+    Run scheduler that executes runs in worker processes (one GIL per worker).
+
+    - task must be picklable (a functools.partial of a module-level function)
+    - worker_initializer(sink, *initargs) runs once per worker; it wires the
+      worker's stores to `sink`, which ships RunEvents back to this process
+    - event_handler is called on a listener thread for every forwarded event
+    Workers use the spawn start method, so no threads or locks are inherited.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        event_handler: Callable[[RunEvent], None],
+        worker_initializer: Optional[Callable[..., None]] = None,
+        initargs: Tuple[Any, ...] = (),
+        keep_finished: int = 1000,
+    ) -> None:
+        self._max_workers = max(1, max_workers)
+        self._event_handler = event_handler
+        self._worker_initializer = worker_initializer
+        self._initargs = initargs
+        self._mp = multiprocessing.get_context("spawn")
+        self._events = self._mp.Queue()
+        self._lock = Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._listener: Optional[Thread] = None
+        self._pending: Dict[str, Future] = {}
+        self._futures = FutureRegistry(keep_finished=keep_finished)
+
+    def submit(self, run_id: str, task: Callable[[], None], concurrency_key: Optional[str] = None) -> Future:
+        future: Future = Future()
+        with self._lock:
+            executor = self._ensure_started()
+            self._pending[run_id] = future
+        self._futures.add(run_id, future)
+        try:
+            worker_future = executor.submit(_run_job, run_id, task)
+        except Exception as exc:
+            self._resolve(run_id, exc)
+            return future
+        worker_future.add_done_callback(lambda f: self._on_worker_done(run_id, f))
+        return future
+
+    def wait(self, run_id: str, timeout_sec: float) -> bool:
+        future = self.get_future(run_id)
+        if future is None:
+            return False
+        try:
+            future.result(timeout=timeout_sec)
+        except Exception:
+            return future.done()
+        return True
+
+    def get_future(self, run_id: str) -> Optional[Future]:
+        return self._futures.get(run_id)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+            listener, self._listener = self._listener, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if listener is not None:
+            self._events.put((_STOP,))
+            listener.join(timeout=5)
+
+    def _ensure_started(self) -> ProcessPoolExecutor:
+        # Reason: api.main builds the scheduler at import time, and spawned workers import it too.
+        # Impact: processes and the listener thread only start on the first submit.
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=self._mp,
+                initializer=_bootstrap_worker,
+                initargs=(self._events, self._worker_initializer, self._initargs),
+            )
+            self._listener = Thread(target=self._listen, name="process-run-events", daemon=True)
+            self._listener.start()
+        return self._executor
+
+    def _listen(self) -> None:
+        while True:
+            event = self._events.get()
+            kind = event[0]
+            if kind == _STOP:
+                return
+            if kind == _DONE:
+                _, run_id, error = event
+                self._resolve(run_id, WorkerRunError(error) if error else None)
+                continue
+            self._event_handler(event)
+
+    def _on_worker_done(self, run_id: str, worker_future: Future) -> None:
+        # A crashed worker (BrokenProcessPool) never sends its done marker.
+        error = worker_future.exception()
+        if error is not None:
+            self._resolve(run_id, error)
+
+    def _resolve(self, run_id: str, error: Optional[BaseException]) -> None:
+        with self._lock:
+            future = self._pending.pop(run_id, None)
+        if future is None:
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(None)
+
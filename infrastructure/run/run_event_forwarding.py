@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from typing import Any, Callable, List, Optional, Tuple
+
+from application.ports.logger import LoggerPort
+from application.ports.run_log_store import RunLogStorePort
+from application.ports.run_repository import RunRepositoryPort
+from domain.run_log import RunLogEntry
+from domain.run_record import RunRecord, RunStatus
+from infrastructure.logging.run_log_feed import RunLogFeed
+
+# ("repo", method, args) | ("log", run_id, entry) | ("metric", name, labels, value)
+RunEvent = Tuple[Any, ...]
+RunEventSink = Callable[[RunEvent], None]
+
+
+class ForwardingRunRepository(RunRepositoryPort):
+    """
+    Worker-side repository: mutations are applied to a local store first (so
+    transition checks behave as in-process) and then forwarded to the API
+    process, which replays them on the real repository.
+    """
+
+    def __init__(self, local: RunRepositoryPort, sink: RunEventSink) -> None:
+        self.local = local
+        self._sink = sink
+
+    def seed(self, record: RunRecord) -> None:
+        """Register a record created by the API process without forwarding it back."""
+        self.local.create(record)
+
+    def create(self, record: RunRecord) -> None:
+        self.local.create(record)
+        self._sink(("repo", "create", (record,)))
+
+    def get(self, run_id: str) -> Optional[RunRecord]:
+        return self.local.get(run_id)
+
+    def transition_status(
+        self,
+        run_id: str,
+        expected: RunStatus,
+        new_status: RunStatus,
+        result: Optional[dict] = None,
+        error: Optional[str] = None,
+        error_detail: Optional[dict] = None,
+    ) -> RunRecord:
+        args = (run_id, expected, new_status, result, error, error_detail)
+        record = self.local.transition_status(*args)
+        self._sink(("repo", "transition_status", args))
+        return record
+
+    def update_result(self, run_id: str, result: dict) -> RunRecord:
+        record = self.local.update_result(run_id, result)
+        self._sink(("repo", "update_result", (run_id, result)))
+        return record
+
+    def update_error(self, run_id: str, error: str, error_detail: Optional[dict] = None) -> RunRecord:
+        record = self.local.update_error(run_id, error, error_detail)
+        self._sink(("repo", "update_error", (run_id, error, error_detail)))
+        return record
+
+    def update_phases(self, run_id: str, phases: dict) -> RunRecord:
+        record = self.local.update_phases(run_id, phases)
+        self._sink(("repo", "update_phases", (run_id, phases)))
+        return record
+
+    def delete(self, run_id: str) -> None:
+        self.local.delete(run_id)
+        self._sink(("repo", "delete", (run_id,)))
+
+
+class ForwardingRunLogStore(RunLogStorePort):
+    """Worker-side log store: entries are kept locally and forwarded to the API process."""
+
+    def __init__(self, local: RunLogStorePort, sink: RunEventSink) -> None:
+        self.local = local
+        self._sink = sink
+
+    def append(self, run_id: str, entry: RunLogEntry) -> None:
+        self.local.append(run_id, entry)
+        self._sink(("log", run_id, entry))
+
+    def list(self, run_id: str, since: int = 0) -> List[RunLogEntry]:
+        return self.local.list(run_id, since)
+
+
+class RunEventApplier:
+    """API-process side: replay forwarded events on the real stores."""
+
+    def __init__(
+        self,
+        repository: RunRepositoryPort,
+        log_store: RunLogStorePort,
+        feed: Optional[RunLogFeed] = None,
+        logger: Optional[LoggerPort] = None,
+        metrics: Optional[Any] = None,
+    ) -> None:
+        self._repository = repository
+        self._log_store = log_store
+        self._feed = feed
+        self._logger = logger
+        # WebPostMetrics; typed loosely to keep this module free of the metrics package
+        self._metrics = metrics
+
+    def __call__(self, event: RunEvent) -> None:
+        kind = event[0]
+        try:
+            if kind == "log":
+                _, run_id, entry = event
+                self._log_store.append(run_id, entry)
+                if self._feed is not None:
+                    self._feed.publish(run_id)
+            elif kind == "repo":
+                _, method, args = event
+                getattr(self._repository, method)(*args)
+            elif kind == "metric" and self._metrics is not None:
+                _, name, labels, value = event
+                self._metrics.record(name, labels, value)
+            elif self._logger is not None:
+                self._logger.error("run_event.unknown", kind=str(kind))
+        except Exception as exc:
+            if self._logger is not None:
+                self._logger.error("run_event.apply_failed", kind=str(kind), error=str(exc))
+
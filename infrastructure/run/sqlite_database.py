@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+
+def connect_sqlite(path: str | Path, busy_timeout_ms: int = 5000) -> sqlite3.Connection:
+    """
+    Open a connection tuned for one writer process with concurrent readers.
+
+    - WAL: readers never block the writer (GET /runs while runs are logging)
+    - synchronous=NORMAL: durable across process crashes, fsync only at checkpoints
+    The connection is shared between threads; callers serialize access with a lock.
+    """
+    if str(path) != ":memory:":
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+    conn.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def dump_json(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def load_json(text: Optional[str]) -> Any:
+    if text is None:
+        return None
+    return json.loads(text)
+
+
+def dump_datetime(value: datetime) -> str:
+    return value.isoformat()
+
+
+def load_datetime(text: str) -> datetime:
+    return datetime.fromisoformat(text)
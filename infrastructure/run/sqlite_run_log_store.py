@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import logging
+import time
+from pathlib import Path
+from threading import Lock
+from typing import List, Tuple
+
+from application.ports.run_log_store import RunLogStorePort
+from domain.run_log import RunLogEntry
+from infrastructure.run.sqlite_database import (
+    connect_sqlite,
+    dump_datetime,
+    dump_json,
+    load_datetime,
+    load_json,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS run_logs (
+    id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id    TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    event     TEXT NOT NULL,
+    fields    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_run_logs_run_id ON run_logs (run_id, id);
+"""
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SqliteRunLogStore(RunLogStorePort):
+    """
+    RunLogStorePort backed by SQLite.
+
+    append() only buffers; entries are written in one transaction when the
+    buffer reaches batch_size, when the oldest buffered entry is older than
+    flush_interval_sec, on list() (so readers always see their own writes)
+    and on flush()/close().
+
+    A failed write from append() or list() (locked database, full disk) is
+    logged and the batch is kept for the next attempt, so logging never fails
+    a step and reading never fails a request;
+    at most max_pending entries wait, the oldest are dropped beyond that.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        batch_size: int = 100,
+        flush_interval_sec: float = 0.5,
+        max_pending: int = 10000,
+    ) -> None:
+        self._conn = connect_sqlite(path)
+        self._lock = Lock()
+        self._batch_size = max(1, batch_size)
+        self._flush_interval_sec = flush_interval_sec
+        self._pending: List[Tuple[str, str, str, str]] = []
+        self._pending_since = 0.0
+        self._max_pending = max(self._batch_size, max_pending)
+        self._retry_at = 0.0
+        self._dropped = 0
+        with self._lock:
+            self._conn.executescript(_SCHEMA)
+
+    def append(self, run_id: str, entry: RunLogEntry) -> None:
+        row = (run_id, dump_datetime(entry.timestamp), entry.event, dump_json(entry.fields) or "{}")
+        with self._lock:
+            now = time.monotonic()
+            if not self._pending:
+                self._pending_since = now
+            self._pending.append(row)
+            if len(self._pending) > self._max_pending:
+                overflow = len(self._pending) - self._max_pending
+                del self._pending[:overflow]
+                self._dropped += overflow
+            if now < self._retry_at:
+                return
+            if len(self._pending) >= self._batch_size or now - self._pending_since >= self._flush_interval_sec:
+                self._try_flush_locked(now)
+
+    def list(self, run_id: str, since: int = 0) -> List[RunLogEntry]:
+        with self._lock:
+            # a failed write must not fail the reader: serve what is committed,
+            # the pending batch goes out with the next flush
+            self._try_flush_locked(time.monotonic())
+            rows = self._conn.execute(
+                "SELECT timestamp, event, fields FROM run_logs WHERE run_id = ? ORDER BY id LIMIT -1 OFFSET ?",
+                (run_id, max(0, since)),
+            ).fetchall()
+        return [
+            RunLogEntry(timestamp=load_datetime(ts), event=event, fields=load_json(fields))
+            for ts, event, fields in rows
+        ]
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+    def _try_flush_locked(self, now: float) -> None:
+        try:
+            self._flush_locked()
+        except Exception as exc:
+            # back off for one interval instead of retrying on every append
+            self._retry_at = now + self._flush_interval_sec
+            LOGGER.warning(
+                "Failed to write %s run log entries; keeping them for retry (%s dropped so far)",
+                len(self._pending),
+                self._dropped,
+                exc_info=exc,
+            )
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        rows = self._pending
+        try:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT INTO run_logs (run_id, timestamp, event, fields) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            raise
+        self._pending = []
+        self._retry_at = 0.0
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+from application.ports.run_repository import RunRepositoryPort
+from domain.exceptions import RunStateError
+from domain.run_record import RunRecord, RunStatus
+from infrastructure.run.sqlite_database import (
+    connect_sqlite,
+    dump_datetime,
+    dump_json,
+    load_datetime,
+    load_json,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id       TEXT PRIMARY KEY,
+    scenario_id  TEXT NOT NULL,
+    status       TEXT NOT NULL,
+    created_at   TEXT NOT NULL,
+    updated_at   TEXT NOT NULL,
+    result       TEXT,
+    error        TEXT,
+    error_detail TEXT,
+    phases       TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_runs_scenario_id ON runs (scenario_id);
+CREATE INDEX IF NOT EXISTS ix_runs_status ON runs (status);
+CREATE INDEX IF NOT EXISTS ix_runs_created_at ON runs (created_at);
+"""
+
+_COLUMNS = "run_id, scenario_id, status, created_at, updated_at, result, error, error_detail, phases"
+
+# Columns added after the first schema: (name, type), applied to older files on open
+_ADDED_COLUMNS = (("phases", "TEXT"),)
+
+
+class SqliteRunRepository(RunRepositoryPort):
+    """
+    RunRepositoryPort backed by a SQLite file, so run history survives restarts.
+    Status transitions are a single conditional UPDATE (compare-and-set on status).
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._conn = connect_sqlite(path)
+        self._lock = Lock()
+        with self._lock:
+            self._conn.executescript(_SCHEMA)
+            self._migrate()
+
+    def create(self, record: RunRecord) -> None:
+        with self._lock:
+            cur = self._conn.execute(
+                f"INSERT OR IGNORE INTO runs ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    record.run_id,
+                    record.scenario_id,
+                    record.status.value,
+                    dump_datetime(record.created_at),
+                    dump_datetime(record.updated_at),
+                    dump_json(record.result),
+                    record.error,
+                    dump_json(record.error_detail),
+                    dump_json(record.phases),
+                ),
+            )
+            if cur.rowcount == 0:
+                raise RunStateError(f"Run already exists: {record.run_id}")
+
+    def get(self, run_id: str) -> Optional[RunRecord]:
+        with self._lock:
+            return self._get(run_id)
+
+    def transition_status(
+        self,
+        run_id: str,
+        expected: RunStatus,
+        new_status: RunStatus,
+        result: Optional[dict] = None,
+        error: Optional[str] = None,
+        error_detail: Optional[dict] = None,
+    ) -> RunRecord:
+        with self._lock:
+            # None keeps the stored value (same as RunRecord.with_status)
+            cur = self._conn.execute(
+                """
+                UPDATE runs
+                   SET status = ?, updated_at = ?,
+                       result = COALESCE(?, result),
+                       error = COALESCE(?, error),
+                       error_detail = COALESCE(?, error_detail)
+                 WHERE run_id = ? AND status = ?
+                """,
+                (
+                    new_status.value,
+                    dump_datetime(datetime.now(timezone.utc)),
+                    dump_json(result),
+                    error,
+                    dump_json(error_detail),
+                    run_id,
+                    expected.value,
+                ),
+            )
+            if cur.rowcount == 0:
+                record = self._get(run_id)
+                if record is None:
+                    raise RunStateError(f"Run not found: {run_id}")
+                raise RunStateError(
+                    f"Invalid run transition: {run_id} {record.status} -> {new_status}"
+                )
+            return self._require(run_id)
+
+    def update_result(self, run_id: str, result: dict) -> RunRecord:
+        with self._lock:
+            self._update(run_id, "result = ?", (dump_json(result),))
+            return self._require(run_id)
+
+    def update_error(self, run_id: str, error: str, error_detail: Optional[dict] = None) -> RunRecord:
+        with self._lock:
+            self._update(run_id, "error = ?, error_detail = ?", (error, dump_json(error_detail)))
+            return self._require(run_id)
+
+    def update_phases(self, run_id: str, phases: dict) -> RunRecord:
+        with self._lock:
+            self._update(run_id, "phases = ?", (dump_json(phases),))
+            return self._require(run_id)
+
+    def delete(self, run_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _migrate(self) -> None:
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(runs)")}
+        for name, sql_type in _ADDED_COLUMNS:
+            if name not in existing:
+                self._conn.execute(f"ALTER TABLE runs ADD COLUMN {name} {sql_type}")
+
+    def _update(self, run_id: str, assignments: str, params: tuple) -> None:
+        cur = self._conn.execute(
+            f"UPDATE runs SET {assignments}, updated_at = ? WHERE run_id = ?",
+            (*params, dump_datetime(datetime.now(timezone.utc)), run_id),
+        )
+        if cur.rowcount == 0:
+            raise RunStateError(f"Run not found: {run_id}")
+
+    def _require(self, run_id: str) -> RunRecord:
+        record = self._get(run_id)
+        if record is None:
+            raise RunStateError(f"Run not found: {run_id}")
+        return record
+
+    def _get(self, run_id: str) -> Optional[RunRecord]:
+        row = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM runs WHERE run_id = ?", (run_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return RunRecord(
+            run_id=row[0],
+            scenario_id=row[1],
+            status=RunStatus(row[2]),
+            created_at=load_datetime(row[3]),
+            updated_at=load_datetime(row[4]),
+            result=load_json(row[5]),
+            error=row[6],
+            error_detail=load_json(row[7]),
+            phases=load_json(row[8]),
+        )
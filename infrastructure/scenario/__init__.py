@@ -2,12 +2,15 @@
 from infrastructure.scenario.base_loader import ScenarioLoadError, ScenarioLoaderBase
 from infrastructure.scenario.json_loader import JsonScenarioLoader
 from infrastructure.scenario.loader_registry import ScenarioLoaderRegistry
+from infrastructure.scenario.scenario_catalog import ScenarioCatalog, ScenarioCatalogStats
 from infrastructure.scenario.yaml_loader import YamlScenarioLoader
 
 __all__ = [
     "ScenarioLoadError",
     "ScenarioLoaderBase",
     "ScenarioLoaderRegistry",
+    "ScenarioCatalog",
+    "ScenarioCatalogStats",
     "YamlScenarioLoader",
     "JsonScenarioLoader",
 ]
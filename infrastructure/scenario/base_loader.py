@@ -5,12 +5,15 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from application.services.template_renderer import precompile_templates
+from domain.steps.condition import precompile_conditions
 from domain.scenario import (
     Scenario,
     ScenarioMeta,
     ScenarioInputs,
     ScenarioDefaults,
     HttpDefaults,
+    HttpRateLimit,
     BrowserDefaults,
 )
 from domain.steps.base import Step, RetryPolicy, OnErrorRule
@@ -46,6 +49,11 @@ class ScenarioLoaderBase(ABC):
         defaults = self._load_defaults(data.get("defaults", {}))
         steps = self._load_steps(data.get("steps", []))
 
+        # Reason: form_list / result / log / browser templates are rendered on every run and retry.
+        # Impact: Their ${...} parsing happens once here instead of on each render.
+        precompile_templates(steps)
+        precompile_conditions(steps)
+
         return Scenario(
             meta=meta,
             inputs=inputs,
@@ -75,6 +83,15 @@ class ScenarioLoaderBase(ABC):
             optional=data.get("optional", []),
         )
 
+    def _load_rate_limit(self, data: Optional[Dict[str, Any]]) -> Optional[HttpRateLimit]:
+        if not data:
+            return None
+        rate = float(data.get("rate_per_sec", 0))
+        burst = int(data.get("burst", 1))
+        if rate <= 0 or burst < 1:
+            raise ScenarioLoadError(f"Invalid http.rate_limit (rate_per_sec > 0, burst >= 1): {data}")
+        return HttpRateLimit(rate_per_sec=rate, burst=burst)
+
     def _load_defaults(self, data: Dict[str, Any]) -> ScenarioDefaults:
         if data is None:
             data = {}
@@ -87,6 +104,7 @@ class ScenarioLoaderBase(ABC):
                 base_url=http_data.get("base_url", ""),
                 timeout_sec=http_data.get("timeout_sec", 20),
                 headers=http_data.get("headers", {}),
+                rate_limit=self._load_rate_limit(http_data.get("rate_limit")),
             )
         if browser_data:
             browser_defaults = BrowserDefaults(
@@ -175,9 +193,17 @@ class ScenarioLoaderBase(ABC):
             merge_from_vars=req_data.get("merge_from_vars"),
         )
 
+        max_body_bytes = data.get("max_body_bytes")
+        if max_body_bytes is not None and (
+            not isinstance(max_body_bytes, int) or isinstance(max_body_bytes, bool) or max_body_bytes <= 0
+        ):
+            raise ScenarioLoadError(f"Invalid max_body_bytes (positive integer): {max_body_bytes!r}")
+
         return HttpStep(
             request=request,
             save_as_last=data.get("save_as_last", True),
+            max_body_bytes=max_body_bytes,
+            save_to_file=data.get("save_to_file"),
             **common,
         )
 
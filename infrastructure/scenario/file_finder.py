@@ -1,6 +1,8 @@
 """Find scenario files by ID."""
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+
+PRIORITY = [".json", ".yaml", ".yml"]
 
 
 class ScenarioFileFinder:
@@ -8,6 +10,25 @@ class ScenarioFileFinder:
     
     def __init__(self, base_dir: Path):
         self.base_dir = base_dir
+
+    def index_all(self) -> Dict[str, Path]:
+        """
+        Map every scenario ID under base_dir to its file in a single directory walk.
+
+        Returns:
+            scenario_id -> Path, using the same priority as find_by_id.
+        """
+        best: Dict[str, Path] = {}
+        for file_path in self.base_dir.rglob("*"):
+            if file_path.suffix not in PRIORITY or not file_path.is_file():
+                continue
+            current = best.get(file_path.stem)
+            if current is None or self._sort_key(file_path) < self._sort_key(current):
+                best[file_path.stem] = file_path
+        return best
+
+    def _sort_key(self, path: Path) -> tuple[int, str]:
+        return (PRIORITY.index(path.suffix), str(path))
     
     def find_by_id(self, scenario_id: str) -> Optional[Path]:
         """
@@ -19,7 +40,7 @@ class ScenarioFileFinder:
         Returns:
             The Path if found, otherwise None.
         """
-        priority = [".json", ".yaml", ".yml"]
+        priority = PRIORITY
         candidates: list[Path] = []
 
         # Reason: Define deterministic priority when multiple extensions exist.
@@ -33,5 +54,5 @@ class ScenarioFileFinder:
         if not candidates:
             return None
 
-        candidates.sort(key=lambda path: (priority.index(path.suffix), str(path)))
+        candidates.sort(key=self._sort_key)
         return candidates[0]
@@ -0,0 +1,159 @@
+"""In-memory catalog of compiled scenarios."""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Dict, Optional
+
+from domain.scenario import Scenario
+from infrastructure.scenario.file_finder import ScenarioFileFinder
+from infrastructure.scenario.loader_registry import ScenarioLoaderRegistry
+
+
+@dataclass(frozen=True)
+class ScenarioCatalogStats:
+    hits: int
+    misses: int
+    reloads: int
+    rescans: int
+    size: int
+
+
+@dataclass(frozen=True)
+class _CatalogEntry:
+    path: Path
+    mtime_ns: int
+    size: int
+    scenario: Scenario
+
+
+class ScenarioCatalog:
+    """
+    Index scenario files once and keep compiled Scenario objects keyed by ID.
+
+    - The directory is walked on first use and again when an unknown ID is
+      requested (new files) or an indexed file disappears; unknown IDs
+      trigger at most one walk per rescan_interval_sec, so repeated 404s
+      are answered from the index.
+    - Cached entries are validated with a single stat(); a changed mtime or
+      size reloads the file.
+    - Walking and parsing happen outside the lock; only the index and entry
+      swaps are serialized.
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        registry: Optional[ScenarioLoaderRegistry] = None,
+        rescan_interval_sec: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._finder = ScenarioFileFinder(base_dir)
+        self._registry = registry or ScenarioLoaderRegistry()
+        self._rescan_interval_sec = rescan_interval_sec
+        self._clock = clock
+        self._lock = Lock()
+        self._index: Optional[Dict[str, Path]] = None
+        self._last_rescan: Optional[float] = None
+        self._entries: Dict[str, _CatalogEntry] = {}
+        self._hits = 0
+        self._misses = 0
+        self._reloads = 0
+        self._rescans = 0
+
+    def get(self, scenario_id: str) -> Optional[Scenario]:
+        path = self._resolve_path(scenario_id)
+        if path is None:
+            with self._lock:
+                self._misses += 1
+            return None
+
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            # Reason: The file was moved or deleted since the last walk.
+            # Impact: The index is rebuilt and the lookup is retried once.
+            with self._lock:
+                self._entries.pop(scenario_id, None)
+            path = self._rescan().get(scenario_id)
+            if path is None:
+                with self._lock:
+                    self._misses += 1
+                return None
+            stat = path.stat()
+
+        with self._lock:
+            entry = self._entries.get(scenario_id)
+            if entry is not None and entry.path == path and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                self._hits += 1
+                return entry.scenario
+            self._misses += 1
+            if entry is not None:
+                self._reloads += 1
+
+        scenario = self._registry.get_loader(path).load_from_file(path)
+        with self._lock:
+            self._entries[scenario_id] = _CatalogEntry(
+                path=path,
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                scenario=scenario,
+            )
+        return scenario
+
+    def preload(self) -> int:
+        """
+        Compile every indexed scenario up front (e.g. in a fresh worker process).
+        Files that fail to load are skipped; get() reports them as usual.
+        Returns the number of scenarios loaded.
+        """
+        ids = list(self._rescan())
+        loaded = 0
+        for scenario_id in ids:
+            try:
+                if self.get(scenario_id) is not None:
+                    loaded += 1
+            except Exception:
+                continue
+        return loaded
+
+    def invalidate(self, scenario_id: Optional[str] = None) -> None:
+        """Drop one compiled scenario, or the whole index when scenario_id is None."""
+        with self._lock:
+            if scenario_id is None:
+                self._entries.clear()
+                self._index = None
+                return
+            self._entries.pop(scenario_id, None)
+
+    def stats(self) -> ScenarioCatalogStats:
+        with self._lock:
+            return ScenarioCatalogStats(
+                hits=self._hits,
+                misses=self._misses,
+                reloads=self._reloads,
+                rescans=self._rescans,
+                size=len(self._entries),
+            )
+
+    def _resolve_path(self, scenario_id: str) -> Optional[Path]:
+        with self._lock:
+            index = self._index
+            if index is not None and scenario_id in index:
+                return index[scenario_id]
+            now = self._clock()
+            if index is not None and self._last_rescan is not None and now - self._last_rescan < self._rescan_interval_sec:
+                return None
+            # claimed here so concurrent misses do not walk the directory again
+            self._last_rescan = now
+        return self._rescan().get(scenario_id)
+
+    def _rescan(self) -> Dict[str, Path]:
+        index = self._finder.index_all()
+        with self._lock:
+            self._index = index
+            self._last_rescan = self._clock()
+            self._rescans += 1
+        return index
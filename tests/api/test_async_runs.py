@@ -1,16 +1,25 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
 
 from api import main
 from api.main import RunScenarioRequest
 from application.executor.step_executor import ExecutionResult
+from application.http_trace import HttpResponseMeta, HttpTrace
+from application.ports.run_scheduler import RunQueueFullError
 from domain.run_record import RunStatus
+from infrastructure.http.artifact_store import ArtifactStore
+from infrastructure.http.flight_recorder import FlightRecorder
 
 
 def _reset_run_stores() -> None:
     main.RUN_REPOSITORY._runs.clear()
-    main.RUN_LOG_STORE._logs.clear()
+    main.RUN_LOG_STORE.clear()
 
 
 def test_async_run_returns_accepted_and_updates_status(monkeypatch) -> None:
@@ -79,3 +88,277 @@ def test_run_logs_endpoint_returns_entries(monkeypatch) -> None:
     # Assert
     assert any(entry.event == "custom.event" for entry in logs)
     assert all("run_id" in entry.fields for entry in logs)
+
+
+def test_asyncio_engine_builds_coroutine_task_for_http_scenarios(monkeypatch) -> None:
+    # Arrange
+    monkeypatch.setattr(main, "RUN_ENGINE", "asyncio")
+    scenario = main._load_scenario("simple_test")
+    request = RunScenarioRequest(vars={}, secrets={})
+
+    # Act
+    task = main._build_run_task("simple_test", scenario, request, "run-asyncio")
+
+    # Assert
+    assert task.func is main._execute_async_run_async
+
+
+def test_run_returns_429_with_retry_after_when_queue_is_full(monkeypatch) -> None:
+    # Arrange
+    _reset_run_stores()
+
+    class FullScheduler:
+        def submit(self, run_id, task, concurrency_key=None):
+            raise RunQueueFullError("Run queue is full (100 waiting)", retry_after_sec=12)
+
+    monkeypatch.setattr(main, "RUN_SCHEDULER", FullScheduler())
+    request = RunScenarioRequest(vars={}, secrets={})
+
+    # Act
+    with pytest.raises(HTTPException) as exc_info:
+        main.run_scenario("simple_test", request, wait_sec=0)
+
+    # Assert
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.headers == {"Retry-After": "12"}
+    assert main.RUN_REPOSITORY._runs == {}
+
+
+def test_sync_run_goes_through_admission_and_gets_429_when_queue_is_full(monkeypatch) -> None:
+    # Arrange
+    _reset_run_stores()
+    executed = []
+
+    def fake_execute(self, steps, ctx, deps):
+        executed.append(ctx.run_id)
+        return ExecutionResult(ok=True)
+
+    class FullScheduler:
+        def submit(self, run_id, task, concurrency_key=None):
+            raise RunQueueFullError("Run queue is full (100 waiting)", retry_after_sec=7)
+
+    monkeypatch.setattr(main.StepExecutor, "execute", fake_execute)
+    monkeypatch.setattr(main, "RUN_SCHEDULER", FullScheduler())
+    request = RunScenarioRequest(vars={}, secrets={})
+
+    # Act
+    with pytest.raises(HTTPException) as exc_info:
+        main.run_scenario("simple_test", request, wait_sec=None)
+
+    # Assert
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.headers == {"Retry-After": "7"}
+    assert executed == []
+    assert main.RUN_REPOSITORY._runs == {}
+
+
+def test_sync_run_waits_for_the_scheduled_run_and_returns_its_result(monkeypatch) -> None:
+    # Arrange
+    _reset_run_stores()
+
+    def fake_execute(self, steps, ctx, deps):
+        ctx.result = {"status": "ok"}
+        return ExecutionResult(ok=True)
+
+    monkeypatch.setattr(main.StepExecutor, "execute", fake_execute)
+    request = RunScenarioRequest(vars={}, secrets={})
+
+    # Act
+    response = main.run_scenario("simple_test", request, wait_sec=None)
+
+    # Assert
+    assert response.success is True
+    assert response.result == {"status": "ok"}
+    (record,) = main.RUN_REPOSITORY._runs.values()
+    assert record.status == RunStatus.SUCCEEDED
+
+
+def test_run_rejected_with_429_can_be_retried_with_the_same_idempotency_key(monkeypatch) -> None:
+    # Arrange
+    _reset_run_stores()
+
+    def fake_execute(self, steps, ctx, deps):
+        ctx.result = {"status": "ok"}
+        return ExecutionResult(ok=True)
+
+    class FullScheduler:
+        def submit(self, run_id, task, concurrency_key=None):
+            raise RunQueueFullError("Run queue is full (100 waiting)", retry_after_sec=12)
+
+    monkeypatch.setattr(main.StepExecutor, "execute", fake_execute)
+    scheduler = main.RUN_SCHEDULER
+    request = RunScenarioRequest(vars={}, secrets={}, idempotency_key=f"retry-{uuid4().hex}")
+    monkeypatch.setattr(main, "RUN_SCHEDULER", FullScheduler())
+    with pytest.raises(HTTPException) as rejected:
+        main.run_scenario("simple_test", request, wait_sec=0)
+    monkeypatch.setattr(main, "RUN_SCHEDULER", scheduler)
+
+    # Act
+    response = main.run_scenario("simple_test", request, wait_sec=0)
+
+    # Assert
+    assert rejected.value.status_code == 429
+    assert response.status_code == 202
+    run_id = json.loads(response.body.decode())["run_id"]
+    assert main.RUN_SCHEDULER.wait(run_id, timeout_sec=1) is True
+    assert list(main.RUN_REPOSITORY._runs) == [run_id]
+
+
+def test_scheduled_run_requires_fire_at_and_known_barrier_step() -> None:
+    # Arrange
+    _reset_run_stores()
+    fire_at = datetime.now(timezone.utc) + timedelta(seconds=5)
+    only_fire_at = RunScenarioRequest(vars={}, secrets={}, fire_at=fire_at)
+    unknown_step = RunScenarioRequest(vars={}, secrets={}, fire_at=fire_at, barrier_step_id="nope")
+
+    # Act / Assert
+    for request in (only_fire_at, unknown_step):
+        with pytest.raises(HTTPException) as exc_info:
+            main.run_scenario("simple_test", request, wait_sec=0)
+        assert exc_info.value.status_code == 400
+
+
+def test_scheduled_run_without_wait_sec_is_rejected_before_the_key_is_used(monkeypatch) -> None:
+    # Arrange
+    _reset_run_stores()
+    executed = []
+
+    def fake_execute(self, steps, ctx, deps):
+        executed.append(ctx.run_id)
+        return ExecutionResult(ok=True)
+
+    monkeypatch.setattr(main.StepExecutor, "execute", fake_execute)
+    key = f"scheduled-{uuid4().hex}"
+    request = RunScenarioRequest(
+        vars={},
+        secrets={},
+        idempotency_key=key,
+        fire_at=datetime.now(timezone.utc) + timedelta(seconds=5),
+        barrier_step_id="log_result",
+    )
+
+    # Act
+    with pytest.raises(HTTPException) as exc_info:
+        main.run_scenario("simple_test", request, wait_sec=None)
+
+    # Assert
+    assert exc_info.value.status_code == 400
+    assert "wait_sec" in exc_info.value.detail
+    assert executed == []
+    assert main.RUN_REPOSITORY._runs == {}
+    assert key not in main.IDEMPOTENCY_STORE._keys
+
+
+def test_scheduled_run_context_carries_utc_barrier() -> None:
+    # Arrange
+    request = RunScenarioRequest(
+        vars={}, secrets={}, fire_at=datetime(2030, 1, 1, 9, 0, 0), barrier_step_id="log_result"
+    )
+
+    # Act
+    ctx = main._build_context(request, "run-x")
+
+    # Assert
+    assert ctx.barrier is not None
+    assert ctx.barrier.step_id == "log_result"
+    assert ctx.barrier.fire_at == datetime(2030, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+    assert ctx.barrier.clock == "local"
+
+
+def test_scheduled_run_can_target_server_clock() -> None:
+    # Arrange
+    request = RunScenarioRequest(
+        vars={}, secrets={}, fire_at=datetime(2030, 1, 1, 9, 0, 0), barrier_step_id="log_result", fire_at_clock="server"
+    )
+
+    # Act
+    ctx = main._build_context(request, "run-x")
+
+    # Assert
+    assert ctx.barrier.clock == "server"
+
+
+def test_metrics_endpoint_exports_run_and_step_metrics(monkeypatch) -> None:
+    # Arrange
+    _reset_run_stores()
+    monkeypatch.setattr(main, "METRICS", main.WebPostMetrics())
+    main.METRICS.bind_queue(active=lambda: 0, depth=lambda: 0)
+
+    def fake_execute(self, steps, ctx, deps):
+        deps.metrics.observe_step("LogStep", True, 0.01)
+        ctx.result = {"status": "ok"}
+        return ExecutionResult(ok=True)
+
+    monkeypatch.setattr(main.StepExecutor, "execute", fake_execute)
+    response = main.run_scenario("simple_test", RunScenarioRequest(vars={}, secrets={}), wait_sec=0)
+    run_id = json.loads(response.body.decode())["run_id"]
+    assert main.RUN_SCHEDULER.wait(run_id, timeout_sec=1) is True
+
+    # Act
+    text = main.get_metrics().body.decode()
+
+    # Assert
+    assert 'webpost_step_duration_seconds_count{scenario="simple_test",step_type="LogStep",ok="true"} 1' in text
+    assert 'webpost_runs_total{scenario="simple_test",status="succeeded"} 1' in text
+    assert 'webpost_run_queue_wait_seconds_count{scenario="simple_test"} 1' in text
+    assert "webpost_run_queue_depth 0" in text
+
+
+def test_profiled_run_stores_phases_on_the_record(monkeypatch) -> None:
+    # Arrange
+    _reset_run_stores()
+
+    def fake_execute(self, steps, ctx, deps):
+        with deps.profiler.span("render"):
+            pass
+        ctx.result = {"status": "ok"}
+        return ExecutionResult(ok=True)
+
+    monkeypatch.setattr(main.StepExecutor, "execute", fake_execute)
+    request = RunScenarioRequest(vars={}, secrets={}, profile=True)
+
+    # Act
+    response = main.run_scenario("simple_test", request, wait_sec=0)
+    run_id = json.loads(response.body.decode())["run_id"]
+    assert main.RUN_SCHEDULER.wait(run_id, timeout_sec=1) is True
+
+    # Assert
+    status = main.get_run_status(run_id)
+    assert status.phases["render"]["count"] == 1
+    events = [entry.event for entry in main.RUN_LOG_STORE.list(run_id)]
+    assert "run.phases" in events
+
+
+def test_sync_failed_run_writes_its_flight_recording_and_releases_the_ring(monkeypatch, tmp_path) -> None:
+    # Arrange
+    store = ArtifactStore(tmp_path)
+    recorder = FlightRecorder(store)
+    monkeypatch.setattr(main, "FLIGHT_RECORDER", recorder)
+    run_ids = []
+
+    def fake_execute(self, steps, ctx, deps):
+        run_ids.append(ctx.run_id)
+        recorder.record(HttpTrace(
+            run_id=ctx.run_id,
+            step_id="login",
+            method="POST",
+            url="https://example.com/login",
+            response=HttpResponseMeta(
+                status=500, url="https://example.com/login", headers={}, encoding="utf-8",
+                content_type="text/html", history=[], body_len=5, body_sha256="0" * 64,
+            ),
+            raw_bytes=b"error",
+        ))
+        return ExecutionResult(ok=False, failed_step_id="login", error_message="status 500")
+
+    monkeypatch.setattr(main.StepExecutor, "execute", fake_execute)
+    request = RunScenarioRequest(vars={}, secrets={})
+
+    # Act
+    response = main.run_scenario("simple_test", request, wait_sec=None)
+
+    # Assert
+    assert response.success is False
+    (run_id,) = run_ids
+    assert recorder.buffered(run_id) == 0
+    assert [entry["step_id"] for entry in store.manifest(run_id)] == ["login"]
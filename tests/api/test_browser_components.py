@@ -50,6 +50,7 @@ def test_build_components_with_browser_step_registers_browser_handler(monkeypatc
             created["count"] += 1
 
     monkeypatch.setattr(main, "PlaywrightBrowserClient", DummyBrowserClient)
+    monkeypatch.setattr(main, "BROWSER_POOL", None)
 
     scenario = _scenario_with_steps([
         BrowserStep(id="b1", name="b1", action="goto", url="/home")
@@ -92,3 +93,32 @@ def test_build_components_with_only_disabled_browser_steps_does_not_create_playw
     assert browser_client is None
     assert created["count"] == 0
     assert all(not isinstance(h, BrowserStepHandler) for h in executor._registry._handlers)
+
+
+def test_build_components_with_browser_pool_leases_a_context_with_scenario_options(monkeypatch) -> None:
+    leased: list[dict] = []
+
+    class DummyPool:
+        def acquire(self, **options):
+            leased.append(options)
+            return SimpleNamespace(close=lambda: None)
+
+    monkeypatch.setattr(main, "BROWSER_POOL", DummyPool())
+    scenario = _scenario_with_steps([
+        BrowserStep(id="b1", name="b1", action="goto", url="/home")
+    ])
+    scenario.defaults.browser = SimpleNamespace(
+        viewport_width=1280, viewport_height=720, user_agent=None, locale="ja-JP", timezone_id=None
+    )
+    request = RunScenarioRequest(vars={}, secrets={})
+
+    executor, _ctx, _deps, browser_client = main._build_execution_components(
+        scenario,
+        request,
+        main._build_logger("run-4"),
+        "run-4",
+    )
+
+    assert browser_client is not None
+    assert leased == [{"viewport": {"width": 1280, "height": 720}, "locale": "ja-JP"}]
+    assert any(isinstance(h, BrowserStepHandler) for h in executor._registry._handlers)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+
+from api import main
+from domain.run_log import RunLogEntry
+from domain.run_record import RunRecord, RunStatus
+from infrastructure.logging.run_log_logger import RunLogLogger
+
+
+def _create_run(run_id: str, status: RunStatus) -> None:
+    now = datetime.now(timezone.utc)
+    main.RUN_REPOSITORY.create(
+        RunRecord(
+            run_id=run_id,
+            scenario_id="1",
+            status=status,
+            created_at=now,
+            updated_at=now,
+            result=None,
+            error=None,
+            error_detail=None,
+        )
+    )
+
+
+def _append(run_id: str, event: str) -> None:
+    main.RUN_LOG_STORE.append(
+        run_id, RunLogEntry(timestamp=datetime.now(timezone.utc), event=event, fields={"type": event})
+    )
+
+
+def test_get_run_logs_since_returns_only_new_entries() -> None:
+    # Arrange
+    _create_run("since-run", RunStatus.RUNNING)
+    for event in ("run.start", "step.start", "step.end"):
+        _append("since-run", event)
+
+    # Act
+    first = main.get_run_logs("since-run")
+    delta = main.get_run_logs("since-run", since=first[1].cursor)
+
+    # Assert
+    assert [e.cursor for e in first] == [1, 2, 3]
+    assert [e.event for e in delta] == ["step.end"]
+    assert delta[0].cursor == 3
+
+
+def test_stream_replays_finished_run_as_sse_and_stops_at_run_end() -> None:
+    # Arrange
+    _create_run("sse-run", RunStatus.SUCCEEDED)
+    for event in ("run.start", "step.end", "run.end"):
+        _append("sse-run", event)
+    client = TestClient(main.app)
+
+    # Act
+    response = client.get("/runs/sse-run/logs/stream", headers={"Last-Event-ID": "1"})
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    blocks = [b for b in response.text.split("\n\n") if b]
+    assert blocks[0].splitlines()[0] == "id: 2"
+    data = [json.loads(b.splitlines()[2][len("data: "):]) for b in blocks]
+    assert [d["event"] for d in data] == ["step.end", "run.end"]
+
+
+def test_stream_ndjson_pushes_entries_appended_after_subscribe() -> None:
+    # Arrange
+    _create_run("live-run", RunStatus.RUNNING)
+    logger = RunLogLogger(run_id="live-run", log_store=main.RUN_LOG_STORE, feed=main.RUN_LOG_FEED)
+
+    async def consume() -> list:
+        lines = []
+        async for chunk in main._stream_run_logs("live-run", 0, "ndjson"):
+            lines.append(json.loads(chunk))
+        return lines
+
+    async def produce() -> None:
+        while main.RUN_LOG_FEED.subscriber_count("live-run") == 0:
+            await asyncio.sleep(0.01)
+        await asyncio.to_thread(logger.info, "step.start", step_id="s1")
+        await asyncio.to_thread(logger.info, "run.end", status="succeeded")
+
+    async def scenario() -> list:
+        lines, _ = await asyncio.wait_for(asyncio.gather(consume(), produce()), timeout=5)
+        return lines
+
+    # Act
+    lines = asyncio.run(scenario())
+
+    # Assert
+    assert [(line["cursor"], line["event"]) for line in lines] == [(1, "step.start"), (2, "run.end")]
+    assert main.RUN_LOG_FEED.subscriber_count("live-run") == 0
+
+
+def test_stream_unknown_run_returns_404() -> None:
+    client = TestClient(main.app)
+
+    response = client.get("/runs/missing-run/logs/stream")
+
+    assert response.status_code == 404
@@ -0,0 +1,161 @@
+# tests/application/executor/test_async_step_executor.py
+import asyncio
+
+from application.executor.async_step_executor import AsyncStepExecutor
+from application.executor.handler_registry import HandlerRegistry
+from application.handlers.async_base import AsyncStepHandler, SyncStepHandlerAdapter
+from application.handlers.base import StepHandler
+from application.outcome import StepOutcome
+from application.services.execution_deps import ExecutionDeps
+from domain.run import RunContext
+from domain.steps.base import OnErrorRule, RetryPolicy, Step
+
+
+class DummyTestStep(Step):
+    pass
+
+
+class MockSecretProvider:
+    def get(self):
+        return {}
+
+
+class MockUrlResolver:
+    def resolve_url(self, url):
+        return url
+
+
+class MockLogger:
+    def __init__(self):
+        self.logs = []
+
+    def info(self, message, **kwargs):
+        self.logs.append({"message": message, **kwargs})
+
+    def bind(self, **kwargs):
+        return self
+
+
+def _deps(logger=None) -> ExecutionDeps:
+    return ExecutionDeps(
+        secret_provider=MockSecretProvider(),
+        url_resolver=MockUrlResolver(),
+        logger=logger or MockLogger(),
+    )
+
+
+class RecordingAsyncHandler(AsyncStepHandler):
+    def __init__(self, failures_before_success: int = 0):
+        self.handled_steps = []
+        self._remaining_failures = failures_before_success
+
+    def supports(self, step: Step) -> bool:
+        return isinstance(step, DummyTestStep)
+
+    async def handle(self, step, ctx, deps):
+        self.handled_steps.append(step.id)
+        await asyncio.sleep(0)
+        if self._remaining_failures > 0:
+            self._remaining_failures -= 1
+            return StepOutcome(ok=False, error_message="transient")
+        return StepOutcome(ok=True)
+
+
+class SyncSuccessHandler(StepHandler):
+    def __init__(self):
+        self.handled_steps = []
+
+    def supports(self, step: Step) -> bool:
+        return isinstance(step, DummyTestStep)
+
+    def handle(self, step, ctx, deps):
+        self.handled_steps.append(step.id)
+        return StepOutcome(ok=True)
+
+
+def test_async_executor_runs_steps_in_order() -> None:
+    handler = RecordingAsyncHandler()
+    executor = AsyncStepExecutor(HandlerRegistry([handler]))
+    steps = [DummyTestStep(id="s1", name="s1"), DummyTestStep(id="s2", name="s2")]
+
+    result = asyncio.run(executor.execute(steps, RunContext(), _deps()))
+
+    assert result.ok is True
+    assert handler.handled_steps == ["s1", "s2"]
+
+
+def test_async_executor_retries_with_async_backoff(monkeypatch) -> None:
+    waited = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay, *args, **kwargs):
+        waited.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr("application.executor.async_step_executor.asyncio.sleep", fake_sleep)
+    handler = RecordingAsyncHandler(failures_before_success=1)
+    executor = AsyncStepExecutor(HandlerRegistry([handler]))
+    steps = [DummyTestStep(id="s1", name="s1", retry=RetryPolicy(max=1, backoff_sec=[2]))]
+    logger = MockLogger()
+
+    result = asyncio.run(executor.execute(steps, RunContext(), _deps(logger)))
+
+    assert result.ok is True
+    assert handler.handled_steps == ["s1", "s1"]
+    assert 2 in waited
+    messages = [log["message"] for log in logger.logs]
+    assert messages.index("step.retry.backoff") < messages.index("step.retry")
+
+
+def test_async_executor_returns_failure_on_abort() -> None:
+    handler = RecordingAsyncHandler(failures_before_success=5)
+    executor = AsyncStepExecutor(HandlerRegistry([handler]))
+    steps = [
+        DummyTestStep(id="s1", name="s1", on_error=[OnErrorRule(when_expr=None, action="abort")]),
+        DummyTestStep(id="s2", name="s2"),
+    ]
+
+    result = asyncio.run(executor.execute(steps, RunContext(), _deps()))
+
+    assert result.ok is False
+    assert result.failed_step_id == "s1"
+    assert result.error_message == "transient"
+    assert handler.handled_steps == ["s1"]
+
+
+def test_sync_handler_adapter_runs_sync_handler() -> None:
+    sync_handler = SyncSuccessHandler()
+    executor = AsyncStepExecutor(HandlerRegistry([SyncStepHandlerAdapter(sync_handler)]))
+    steps = [DummyTestStep(id="s1", name="s1")]
+
+    result = asyncio.run(executor.execute(steps, RunContext(), _deps()))
+
+    assert result.ok is True
+    assert sync_handler.handled_steps == ["s1"]
+
+
+def test_async_executor_interleaves_concurrent_runs() -> None:
+    order = []
+
+    class InterleavingHandler(AsyncStepHandler):
+        def supports(self, step: Step) -> bool:
+            return True
+
+        async def handle(self, step, ctx, deps):
+            order.append((ctx.run_id, step.id))
+            await asyncio.sleep(0)
+            return StepOutcome(ok=True)
+
+    executor = AsyncStepExecutor(HandlerRegistry([InterleavingHandler()]))
+    steps = [DummyTestStep(id="s1", name="s1"), DummyTestStep(id="s2", name="s2")]
+
+    async def run_both():
+        return await asyncio.gather(
+            executor.execute(steps, RunContext(run_id="a"), _deps()),
+            executor.execute(steps, RunContext(run_id="b"), _deps()),
+        )
+
+    results = asyncio.run(run_both())
+
+    assert all(r.ok for r in results)
+    assert order[:2] == [("a", "s1"), ("b", "s1")]
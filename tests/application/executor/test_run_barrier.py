@@ -0,0 +1,176 @@
+# tests/application/executor/test_run_barrier.py
+import asyncio
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import formatdate
+from types import SimpleNamespace
+
+from application.executor.async_step_executor import AsyncStepExecutor
+from application.executor.handler_registry import HandlerRegistry
+from application.executor.step_executor import StepExecutor
+from application.handlers.async_base import SyncStepHandlerAdapter
+from application.handlers.base import StepHandler
+from application.outcome import StepOutcome
+from application.ports.run_scheduler import RunSlotPort
+from application.services.execution_deps import ExecutionDeps
+from application.services.precision_timer import PrecisionTimer
+from application.services.server_clock import ServerClockRegistry
+from domain.run import RunBarrier, RunContext
+from domain.steps.base import Step
+
+
+class DummyStep(Step):
+    pass
+
+
+@dataclass(frozen=True)
+class UrlStep(DummyStep):
+    request: object = None
+
+
+class ShopResolver:
+    def resolve_url(self, url):
+        return "https://shop.example" + url
+
+
+class RecordingHandler(StepHandler):
+    def __init__(self):
+        self.calls = []
+
+    def supports(self, step):
+        return isinstance(step, DummyStep)
+
+    def prewarm(self, step, ctx, deps):
+        self.calls.append(("prewarm", step.id, time.time()))
+
+    def rewarm(self, step, ctx, deps, timeout_sec):
+        self.calls.append(("rewarm", step.id, time.time()))
+
+    def handle(self, step, ctx, deps):
+        self.calls.append(("handle", step.id, time.time()))
+        return StepOutcome(ok=True)
+
+
+class RecordingSlot(RunSlotPort):
+    def __init__(self):
+        self.events = []
+
+    @contextmanager
+    def hold(self):
+        self.events.append("hold")
+        yield
+        self.events.append("resume")
+
+
+class ListLogger:
+    def __init__(self, logs=None):
+        self.logs = [] if logs is None else logs
+
+    def info(self, event, **fields):
+        self.logs.append((event, fields))
+
+    def bind(self, **_fields):
+        return ListLogger(self.logs)
+
+
+def _deps(logger):
+    return ExecutionDeps(secret_provider=None, url_resolver=None, logger=logger)
+
+
+def _steps():
+    return [DummyStep(id="login", name="login"), DummyStep(id="submit", name="submit")]
+
+
+def test_precision_timer_releases_on_time():
+    timer = PrecisionTimer()
+    fire_at = datetime.now(timezone.utc) + timedelta(milliseconds=50)
+
+    late = timer.wait_until(fire_at)
+
+    assert time.time() >= fire_at.timestamp() - 0.001
+    assert 0 <= late < 0.005
+
+
+def test_sync_executor_runs_warmup_steps_then_holds_barrier_step():
+    handler = RecordingHandler()
+    logger = ListLogger()
+    fire_at = datetime.now(timezone.utc) + timedelta(milliseconds=100)
+    ctx = RunContext(barrier=RunBarrier(step_id="submit", fire_at=fire_at))
+
+    result = StepExecutor(HandlerRegistry(handlers=[handler])).execute(_steps(), ctx, _deps(logger))
+
+    assert result.ok is True
+    assert [c[:2] for c in handler.calls] == [("handle", "login"), ("prewarm", "submit"), ("handle", "submit")]
+    assert handler.calls[0][2] < fire_at.timestamp()
+    assert handler.calls[2][2] >= fire_at.timestamp() - 0.001
+    events = [event for event, _ in logger.logs]
+    assert events.index("run.barrier.hold") < events.index("run.barrier.release")
+
+
+def test_async_executor_holds_barrier_step():
+    handler = RecordingHandler()
+    fire_at = datetime.now(timezone.utc) + timedelta(milliseconds=100)
+    ctx = RunContext(barrier=RunBarrier(step_id="submit", fire_at=fire_at))
+    registry = HandlerRegistry(handlers=[SyncStepHandlerAdapter(handler, offload=False)])
+
+    result = asyncio.run(AsyncStepExecutor(registry).execute(_steps(), ctx, _deps(ListLogger())))
+
+    assert result.ok is True
+    assert [c[:2] for c in handler.calls] == [("handle", "login"), ("prewarm", "submit"), ("handle", "submit")]
+    assert handler.calls[2][2] >= fire_at.timestamp() - 0.001
+
+
+def test_sync_executor_rewarms_shortly_before_release_inside_the_slot_hold():
+    handler = RecordingHandler()
+    slot = RecordingSlot()
+    fire_at = datetime.now(timezone.utc) + timedelta(milliseconds=150)
+    ctx = RunContext(barrier=RunBarrier(step_id="submit", fire_at=fire_at))
+    deps = ExecutionDeps(secret_provider=None, url_resolver=None, logger=ListLogger(), run_slot=slot)
+
+    result = StepExecutor(HandlerRegistry(handlers=[handler]), rewarm_lead_sec=0.05).execute(_steps(), ctx, deps)
+
+    assert result.ok is True
+    assert [c[:2] for c in handler.calls] == [
+        ("handle", "login"), ("prewarm", "submit"), ("rewarm", "submit"), ("handle", "submit"),
+    ]
+    assert handler.calls[2][2] >= fire_at.timestamp() - 0.05 - 0.001
+    assert slot.events == ["hold", "resume"]
+
+
+def test_async_executor_rewarms_shortly_before_release():
+    handler = RecordingHandler()
+    fire_at = datetime.now(timezone.utc) + timedelta(milliseconds=150)
+    ctx = RunContext(barrier=RunBarrier(step_id="submit", fire_at=fire_at))
+    registry = HandlerRegistry(handlers=[SyncStepHandlerAdapter(handler, offload=False)])
+
+    result = asyncio.run(AsyncStepExecutor(registry, rewarm_lead_sec=0.05).execute(_steps(), ctx, _deps(ListLogger())))
+
+    assert result.ok is True
+    assert [c[:2] for c in handler.calls][2:] == [("rewarm", "submit"), ("handle", "submit")]
+
+
+def test_server_clock_barrier_is_shifted_by_estimated_offset():
+    clocks = ServerClockRegistry()
+    now = time.time()
+    # server runs 30s ahead; two samples straddling a Date second boundary
+    base = int(now) - 5
+    clocks.observe("https://shop.example/", base + 0.95 - 30, base + 0.96 - 30, {"Date": formatdate(base, usegmt=True)})
+    clocks.observe("https://shop.example/", base + 1.05 - 30, base + 1.06 - 30, {"Date": formatdate(base + 1, usegmt=True)})
+    logger = ListLogger()
+    deps = ExecutionDeps(secret_provider=None, url_resolver=ShopResolver(), logger=logger, server_clocks=clocks)
+    server_fire_at = datetime.fromtimestamp(now + 30 + 0.1, tz=timezone.utc)
+    step = UrlStep(id="submit", name="submit", request=SimpleNamespace(url="/buy"))
+    handler = RecordingHandler()
+    ctx = RunContext(barrier=RunBarrier(step_id="submit", fire_at=server_fire_at, clock="server"))
+
+    result = StepExecutor(HandlerRegistry(handlers=[handler])).execute([step], ctx, deps)
+
+    assert result.ok is True
+    fired = handler.calls[-1][2]
+    assert now + 0.1 - 0.001 <= fired < now + 0.1 + 0.06
+    hold = next(fields for event, fields in logger.logs if event == "run.barrier.hold")
+    assert hold["clock"] == "server"
+    assert hold["server_host"] == "shop.example"
+    assert abs(hold["server_offset_ms"] - 30_000) < 60
@@ -107,3 +107,21 @@ def test_assert_handler_uses_step_message_on_failure() -> None:
     # Assert
     assert outcome.ok is False
     assert outcome.error_message == "custom failure"
+
+
+def test_assert_handler_reports_invalid_expression_as_failure() -> None:
+    # Arrange
+    handler = AssertStepHandler()
+    step = AssertStep(
+        id="assert-invalid",
+        name="assert-invalid",
+        conditions=[ConditionSpec(expr="${last.status} ==")],
+    )
+    ctx = RunContext(vars={}, state={}, last=None, result={})
+
+    # Act
+    outcome = handler.handle(step, ctx, _deps())
+
+    # Assert
+    assert outcome.ok is False
+    assert "invalid assert expression" in outcome.error_message
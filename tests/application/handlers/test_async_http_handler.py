@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from application.handlers.async_http_handler import AsyncHttpStepHandler
+from application.ports.async_http_client import AsyncHttpClientPort
+from application.ports.http_client import HttpResponse
+from application.services.execution_deps import ExecutionDeps
+from application.services.template_renderer import TemplateRenderer
+from domain.run import RunContext
+from domain.steps.http import HttpRequestSpec, HttpStep
+from infrastructure.http.artifact_store import ArtifactStore
+
+
+class DummySecretProvider:
+    def get(self) -> dict:
+        return {"password": "pw"}
+
+
+class DummyUrlResolver:
+    def resolve_url(self, url: str) -> str:
+        return url
+
+
+class DummyLogger:
+    def info(self, _message: str, **_kwargs) -> None:
+        return None
+
+    def error(self, _message: str, **_kwargs) -> None:
+        return None
+
+    def debug(self, _message: str, **_kwargs) -> None:
+        return None
+
+    def bind(self, **_kwargs) -> "DummyLogger":
+        return self
+
+
+class DummyAsyncHttpClient(AsyncHttpClientPort):
+    def __init__(self) -> None:
+        self.requests = []
+
+    async def request(self, method, url, headers=None, form_list=None, allow_redirects=None) -> HttpResponse:
+        self.requests.append((method, url, form_list, allow_redirects))
+        return HttpResponse(
+            status=200,
+            url=url,
+            text="<html><title>ok</title></html>",
+            headers={"Content-Type": "text/html; charset=utf-8"},
+            content=b"<html><title>ok</title></html>",
+        )
+
+    def snapshot_cookies(self):
+        return []
+
+    async def aclose(self) -> None:
+        return None
+
+
+def _deps() -> ExecutionDeps:
+    return ExecutionDeps(
+        secret_provider=DummySecretProvider(),
+        url_resolver=DummyUrlResolver(),
+        logger=DummyLogger(),
+    )
+
+
+def test_async_http_handler_renders_form_and_saves_last(tmp_path) -> None:
+    # Arrange
+    client = DummyAsyncHttpClient()
+    handler = AsyncHttpStepHandler(
+        client, TemplateRenderer(), artifact_store=ArtifactStore(tmp_path / "http")
+    )
+    step = HttpStep(
+        id="login",
+        name="login",
+        request=HttpRequestSpec(
+            method="POST",
+            url="https://example.com/login",
+            form_list=[("user", "${vars.user}"), ("password", "${secrets.password}")],
+        ),
+    )
+    ctx = RunContext(run_id="run-async", vars={"user": "alice"}, state={}, last=None, result={})
+
+    # Act
+    outcome = asyncio.run(handler.handle(step, ctx, _deps()))
+
+    # Assert
+    assert outcome.ok is True
+    assert client.requests == [
+        ("POST", "https://example.com/login", [("user", "alice"), ("password", "pw")], False)
+    ]
+    assert ctx.last is not None
+    assert ctx.last.status == 200
+    assert "ok" in ctx.last.text
+
+
+def test_async_http_handler_returns_failure_on_client_error(tmp_path) -> None:
+    class FailingClient(DummyAsyncHttpClient):
+        async def request(self, *args, **kwargs) -> HttpResponse:
+            raise ConnectionError("boom")
+
+    handler = AsyncHttpStepHandler(
+        FailingClient(), TemplateRenderer(), artifact_store=ArtifactStore(tmp_path / "http")
+    )
+    step = HttpStep(id="get", name="get", request=HttpRequestSpec(method="GET", url="https://example.com"))
+    ctx = RunContext(run_id="run-async", vars={}, state={}, last=None, result={})
+
+    outcome = asyncio.run(handler.handle(step, ctx, _deps()))
+
+    assert outcome.ok is False
+    assert outcome.error_message == "boom"
+
+
+def test_async_http_handler_records_the_response_off_the_event_loop_thread(tmp_path) -> None:
+    # Arrange
+    handler = AsyncHttpStepHandler(
+        DummyAsyncHttpClient(), TemplateRenderer(), artifact_store=ArtifactStore(tmp_path / "http")
+    )
+    record = handler._workflow.record
+    threads: list = []
+
+    def tracking_record(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return record(*args, **kwargs)
+
+    handler._workflow.record = tracking_record
+    step = HttpStep(id="get", name="get", request=HttpRequestSpec(method="GET", url="https://example.com"))
+    ctx = RunContext(run_id="run-async", vars={}, state={}, last=None, result={})
+
+    async def run():
+        outcome = await handler.handle(step, ctx, _deps())
+        return outcome, threading.current_thread()
+
+    # Act
+    outcome, loop_thread = asyncio.run(run())
+
+    # Assert
+    assert outcome.ok is True
+    assert threads and threads[0] is not loop_thread
@@ -8,6 +8,7 @@ from application.services.execution_deps import ExecutionDeps
 from application.services.template_renderer import TemplateRenderer
 from domain.run import RunContext
 from domain.steps.http import HttpRequestSpec, HttpStep
+from infrastructure.http.artifact_store import ArtifactStore
 
 
 @dataclass(frozen=True)
@@ -51,9 +52,11 @@ class DummyHttpClient(HttpClientPort):
         return []
 
 
-def test_http_handler_respects_save_as_last_false() -> None:
+def test_http_handler_respects_save_as_last_false(tmp_path) -> None:
     # Arrange
-    handler = HttpStepHandler(DummyHttpClient(), TemplateRenderer())
+    handler = HttpStepHandler(
+        DummyHttpClient(), TemplateRenderer(), artifact_store=ArtifactStore(tmp_path / "http")
+    )
     step = HttpStep(
         id="http-no-last",
         name="http-no-last",
@@ -73,3 +76,279 @@ def test_http_handler_respects_save_as_last_false() -> None:
     # Assert
     assert outcome.ok is True
     assert ctx.last is None
+
+
+def test_http_response_is_parsed_once_for_title_signals_and_scrape(tmp_path) -> None:
+    from application.handlers.scrape_handler import ScrapeStepHandler
+    from domain.steps.scrape import ScrapeStep
+
+    class HtmlHttpClient(DummyHttpClient):
+        def request(self, method, url, headers=None, form_list=None, allow_redirects=None) -> HttpResponse:
+            html = b"<html><title>Login</title><form action='/x'><input type='hidden' name='screenID' value='S1'></form></html>"
+            return HttpResponse(status=200, url=url, text="", headers={"Content-Type": "text/html; charset=utf-8"}, content=html)
+
+    class ScrapeLogger(DummyLogger):
+        def warning(self, _message: str, **_kwargs) -> None:
+            return None
+
+    handler = HttpStepHandler(
+        HtmlHttpClient(), TemplateRenderer(), artifact_store=ArtifactStore(tmp_path / "http")
+    )
+    step = HttpStep(
+        id="login_get",
+        name="login_get",
+        request=HttpRequestSpec(method="GET", url="https://example.com/login"),
+    )
+    ctx = RunContext(run_id="run-parse-once", vars={}, state={}, last=None, result={})
+    deps = ExecutionDeps(
+        secret_provider=DummySecretProvider(),
+        url_resolver=DummyUrlResolver(),
+        logger=ScrapeLogger(),
+    )
+
+    assert handler.handle(step, ctx, deps).ok is True
+    scrape = ScrapeStep(id="hidden", name="hidden", command="hidden_inputs", save_as="login_hidden")
+    assert ScrapeStepHandler().handle(scrape, ctx, deps).ok is True
+
+    assert ctx.vars["login_hidden"] == {"screenID": "S1"}
+    assert ctx.last.body_sha256 is not None
+    assert deps.documents.parse_count == 1
+
+
+def test_prewarmed_request_is_sent_once_as_rendered(tmp_path) -> None:
+    # Arrange
+    sent = []
+
+    class RecordingHttpClient(DummyHttpClient):
+        def request(self, method, url, headers=None, form_list=None, allow_redirects=None) -> HttpResponse:
+            sent.append(form_list)
+            return super().request(method, url, headers, form_list, allow_redirects)
+
+    handler = HttpStepHandler(
+        RecordingHttpClient(), TemplateRenderer(), artifact_store=ArtifactStore(tmp_path / "http")
+    )
+    step = HttpStep(
+        id="submit",
+        name="submit",
+        request=HttpRequestSpec(method="POST", url="https://example.com", form_list=[["slot", "${vars.slot}"]]),
+        save_as_last=False,
+    )
+    ctx = RunContext(vars={"slot": "A"}, state={}, last=None, result={})
+    deps = ExecutionDeps(
+        secret_provider=DummySecretProvider(),
+        url_resolver=DummyUrlResolver(),
+        logger=DummyLogger(),
+    )
+
+    # Act
+    handler.prewarm(step, ctx, deps)
+    ctx.vars["slot"] = "B"
+    handler.handle(step, ctx, deps)
+    handler.handle(step, ctx, deps)
+
+    # Assert
+    assert sent == [[("slot", "A")], [("slot", "B")]]
+
+
+def test_profiled_http_step_reports_each_phase(tmp_path) -> None:
+    from application.http_trace_emitter import HttpTraceEmitter
+    from application.handlers.http_handler import HttpStepWorkflow
+    from application.services.phase_profiler import PhaseProfiler
+    from application.trace_enrichers.core import HttpCoreTraceLogger
+
+    # Arrange
+    handler = HttpStepHandler(
+        DummyHttpClient(), TemplateRenderer(), artifact_store=ArtifactStore(tmp_path / "http")
+    )
+    handler._workflow = HttpStepWorkflow(TemplateRenderer(), HttpTraceEmitter([HttpCoreTraceLogger()]))
+    step = HttpStep(
+        id="login",
+        name="login",
+        request=HttpRequestSpec(method="POST", url="https://example.com", form_list=[("user", "${vars.user}")]),
+    )
+    ctx = RunContext(vars={"user": "alice"}, state={}, last=None, result={})
+    profiler = PhaseProfiler(enabled=True)
+    deps = ExecutionDeps(
+        secret_provider=DummySecretProvider(),
+        url_resolver=DummyUrlResolver(),
+        logger=DummyLogger(),
+        profiler=profiler,
+    )
+
+    # Act
+    outcome = handler.handle(step, ctx, deps)
+
+    # Assert
+    assert outcome.ok is True
+    assert set(profiler.snapshot()) == {
+        "render", "compose", "http", "decode", "hash", "parse", "trace.HttpCoreTraceLogger",
+    }
+
+
+def test_decoded_body_is_shared_by_last_response_and_trace(tmp_path) -> None:
+    # Arrange
+    traces = []
+
+    class SjisHttpClient(DummyHttpClient):
+        def request(self, method, url, headers=None, form_list=None, allow_redirects=None) -> HttpResponse:
+            html = "<html><title>予約完了</title></html>".encode("cp932")
+            return HttpResponse(status=200, url=url, text=None, headers={"Content-Type": "text/html; charset=Shift_JIS"}, content=html)
+
+    class CapturingEmitter:
+        def emit(self, trace, deps) -> None:
+            traces.append(trace)
+
+    handler = HttpStepHandler(
+        SjisHttpClient(), TemplateRenderer(), artifact_store=ArtifactStore(tmp_path / "http")
+    )
+    handler._workflow._trace = CapturingEmitter()
+    step = HttpStep(id="get", name="get", request=HttpRequestSpec(method="GET", url="https://example.com"))
+    ctx = RunContext(vars={}, state={}, last=None, result={})
+    deps = ExecutionDeps(
+        secret_provider=DummySecretProvider(),
+        url_resolver=DummyUrlResolver(),
+        logger=DummyLogger(),
+    )
+
+    # Act
+    outcome = handler.handle(step, ctx, deps)
+
+    # Assert
+    assert outcome.ok is True
+    (trace,) = traces
+    assert "予約完了" in ctx.last.text
+    assert trace.full_text is ctx.last.text
+    assert trace.html_title == "予約完了"
+    assert trace.response.encoding == "cp932"
+
+
+def test_file_body_is_not_decoded_until_ctx_last_text_is_read(tmp_path) -> None:
+    from application.services.response_body import ResponseBody
+
+    # Arrange
+    traces = []
+    decoded = []
+    path = tmp_path / "big.html"
+    html = "<html><title>大きいページ</title>" + "x" * 10_000 + "</html>"
+    path.write_bytes(html.encode("utf-8"))
+
+    class CountingBody(ResponseBody):
+        def _decode(self):
+            decoded.append(self.path)
+            return super()._decode()
+
+    class FileHttpClient(DummyHttpClient):
+        def request(self, method, url, headers=None, form_list=None, allow_redirects=None) -> HttpResponse:
+            headers = {"Content-Type": "text/html"}
+            body = CountingBody.from_file(str(path), headers, size=path.stat().st_size, sha256="abc")
+            return HttpResponse(status=200, url=url, text=None, headers=headers, streamed_body=body)
+
+    class CapturingEmitter:
+        def emit(self, trace, deps) -> None:
+            traces.append(trace)
+
+    handler = HttpStepHandler(
+        FileHttpClient(), TemplateRenderer(), artifact_store=ArtifactStore(tmp_path / "http")
+    )
+    handler._workflow._trace = CapturingEmitter()
+    step = HttpStep(id="get", name="get", request=HttpRequestSpec(method="GET", url="https://example.com"))
+    ctx = RunContext(vars={}, state={}, last=None, result={})
+    deps = ExecutionDeps(
+        secret_provider=DummySecretProvider(),
+        url_resolver=DummyUrlResolver(),
+        logger=DummyLogger(),
+    )
+
+    # Act
+    outcome = handler.handle(step, ctx, deps)
+
+    # Assert
+    assert outcome.ok is True
+    (trace,) = traces
+    assert decoded == []
+    assert trace.text_head.startswith("<html><title>大きいページ</title>")
+    assert len(trace.text_head) == 4000
+    assert trace.full_text == ""
+    assert trace.html_title is None
+    assert trace.response.body_len == path.stat().st_size
+    assert ctx.last.text == html
+    assert decoded == [str(path)]
+
+
+def test_title_is_not_parsed_for_non_html_responses(tmp_path) -> None:
+    # Arrange
+    traces = []
+
+    class JsonHttpClient(DummyHttpClient):
+        def request(self, method, url, headers=None, form_list=None, allow_redirects=None) -> HttpResponse:
+            content = b'{"title": "<title>not html</title>"}'
+            return HttpResponse(status=200, url=url, text=None, headers={"Content-Type": "application/json"}, content=content)
+
+    class CapturingEmitter:
+        def emit(self, trace, deps) -> None:
+            traces.append(trace)
+
+    class FailingDocuments:
+        def get(self, html, key=None):
+            raise AssertionError("JSON body was parsed as HTML")
+
+    handler = HttpStepHandler(
+        JsonHttpClient(), TemplateRenderer(), artifact_store=ArtifactStore(tmp_path / "http")
+    )
+    handler._workflow._trace = CapturingEmitter()
+    step = HttpStep(id="api", name="api", request=HttpRequestSpec(method="GET", url="https://example.com"))
+    ctx = RunContext(vars={}, state={}, last=None, result={})
+    deps = ExecutionDeps(
+        secret_provider=DummySecretProvider(),
+        url_resolver=DummyUrlResolver(),
+        logger=DummyLogger(),
+        documents=FailingDocuments(),
+    )
+
+    # Act
+    outcome = handler.handle(step, ctx, deps)
+
+    # Assert
+    assert outcome.ok is True
+    assert traces[0].html_title is None
+    assert ctx.last.text.startswith('{"title"')
+
+
+def test_save_to_file_rendered_outside_the_download_root_fails_the_step(tmp_path) -> None:
+    # Arrange
+    sent = []
+
+    class RecordingHttpClient(DummyHttpClient):
+        def request(self, method, url, headers=None, form_list=None, allow_redirects=None, body_limits=None):
+            sent.append(body_limits)
+            return super().request(method, url, headers, form_list, allow_redirects)
+
+    root = tmp_path / "downloads"
+    handler = HttpStepHandler(
+        RecordingHttpClient(),
+        TemplateRenderer(),
+        artifact_store=ArtifactStore(tmp_path / "http"),
+        download_root=str(root),
+    )
+    handler._workflow._trace = type("NullEmitter", (), {"emit": lambda self, trace, deps: None})()
+    step = HttpStep(
+        id="download",
+        name="download",
+        request=HttpRequestSpec(method="GET", url="https://example.com/report"),
+        save_to_file="${vars.name}.pdf",
+    )
+    deps = ExecutionDeps(
+        secret_provider=DummySecretProvider(),
+        url_resolver=DummyUrlResolver(),
+        logger=DummyLogger(),
+    )
+
+    # Act
+    inside = handler.handle(step, RunContext(vars={"name": "report"}, state={}, last=None, result={}), deps)
+    escaped = handler.handle(step, RunContext(vars={"name": "../../evil"}, state={}, last=None, result={}), deps)
+
+    # Assert
+    assert inside.ok is True
+    assert [limits.save_to for limits in sent] == [str(root.resolve() / "report.pdf")]
+    assert escaped.ok is False
+    assert "save_to_file must stay inside" in escaped.error_message
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import pytest
+
+from application.ports.requests_client import RequestsConnectionPool, RequestsSessionHttpClient
+from application.services.response_body import BodyLimits, ResponseBodyTooLargeError
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    client_ports: list[int] = []
+
+    def do_GET(self) -> None:  # noqa: N802
+        type(self).client_ports.append(self.client_address[1])
+        body = b"x" * 100_000 if self.path == "/big" else b"ok"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        if self.path == "/login":
+            self.send_header("Set-Cookie", "sid=abc; Path=/")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args) -> None:
+        return None
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    _KeepAliveHandler.client_ports = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_shared_pool_reuses_connection_across_runs(server_url: str) -> None:
+    pool = RequestsConnectionPool(pool_maxsize=2)
+    run_a = RequestsSessionHttpClient(pool=pool)
+    run_b = RequestsSessionHttpClient(pool=pool)
+
+    run_a.request("GET", f"{server_url}/page")
+    run_b.request("GET", f"{server_url}/page")
+
+    ports = _KeepAliveHandler.client_ports
+    assert len(ports) == 2
+    assert ports[0] == ports[1]
+    pool.close()
+
+
+def test_shared_pool_keeps_cookies_per_run(server_url: str) -> None:
+    pool = RequestsConnectionPool()
+    run_a = RequestsSessionHttpClient(pool=pool)
+    run_b = RequestsSessionHttpClient(pool=pool)
+
+    run_a.request("GET", f"{server_url}/login")
+
+    assert [c["name"] for c in run_a.snapshot_cookies()] == ["sid"]
+    assert run_b.snapshot_cookies() == []
+    pool.close()
+
+
+def test_large_body_is_streamed_to_a_spill_file(server_url: str, tmp_path) -> None:
+    client = RequestsSessionHttpClient(body_limits=BodyLimits(spill_bytes=10_000, spill_dir=str(tmp_path)))
+
+    resp = client.request("GET", f"{server_url}/big")
+
+    assert resp.content is None
+    assert resp.body.size == 100_000
+    assert open(resp.body.path, "rb").read() == b"x" * 100_000
+
+
+def test_step_max_body_bytes_fails_the_request(server_url: str) -> None:
+    client = RequestsSessionHttpClient(body_limits=BodyLimits(spill_bytes=10_000))
+
+    with pytest.raises(ResponseBodyTooLargeError):
+        client.request("GET", f"{server_url}/big", body_limits=BodyLimits(max_bytes=50_000))
@@ -0,0 +1,36 @@
+# tests/application/services/test_html_document_cache.py
+from application.services.html_document_cache import HtmlDocumentCache
+
+
+class TestHtmlDocumentCache:
+    def test_same_key_is_parsed_once(self):
+        cache = HtmlDocumentCache()
+
+        first = cache.get("<html><title>a</title></html>", key="sha-a")
+        second = cache.get("<html><title>a</title></html>", key="sha-a")
+
+        assert first is second
+        assert cache.parse_count == 1
+
+    def test_key_is_derived_from_html_when_missing(self):
+        cache = HtmlDocumentCache()
+
+        first = cache.get("<p>x</p>")
+        second = cache.get("<p>x</p>")
+        third = cache.get("<p>y</p>")
+
+        assert first is second
+        assert third is not first
+        assert cache.parse_count == 2
+
+    def test_least_recently_used_document_is_evicted(self):
+        cache = HtmlDocumentCache(max_documents=2)
+
+        cache.get("<p>1</p>", key="1")
+        cache.get("<p>2</p>", key="2")
+        cache.get("<p>1</p>", key="1")
+        cache.get("<p>3</p>", key="3")
+        cache.get("<p>1</p>", key="1")
+        cache.get("<p>2</p>", key="2")
+
+        assert cache.parse_count == 4
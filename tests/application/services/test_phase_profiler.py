@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from application.services.phase_profiler import PhaseProfiler
+
+
+class StepClock:
+    def __init__(self, *times: float) -> None:
+        self._times = list(times)
+
+    def __call__(self) -> float:
+        return self._times.pop(0)
+
+
+def test_disabled_profiler_hands_out_one_shared_noop_span() -> None:
+    # Arrange
+    profiler = PhaseProfiler()
+
+    # Act
+    with profiler.span("decode"):
+        pass
+    profiler.add("http", 1.0)
+
+    # Assert
+    assert profiler.span("a") is profiler.span("b")
+    assert profiler.snapshot() == {}
+    assert profiler.take_step() == {}
+
+
+def test_enabled_profiler_aggregates_count_total_and_max() -> None:
+    # Arrange
+    profiler = PhaseProfiler(enabled=True, clock=StepClock(0.0, 0.010, 1.0, 1.030))
+
+    # Act
+    with profiler.span("http"):
+        pass
+    with profiler.span("http"):
+        pass
+
+    # Assert
+    assert profiler.snapshot() == {"http": {"count": 2, "total_ms": 40.0, "max_ms": 30.0}}
+
+
+def test_take_step_returns_and_resets_the_current_step_phases() -> None:
+    # Arrange
+    profiler = PhaseProfiler(enabled=True)
+    profiler.add("render", 0.002)
+    profiler.add("http", 0.050)
+
+    # Act
+    first = profiler.take_step()
+    profiler.add("decode", 0.001)
+    second = profiler.take_step()
+
+    # Assert
+    assert first == {"render": 2.0, "http": 50.0}
+    assert second == {"decode": 1.0}
+    assert set(profiler.snapshot()) == {"render", "http", "decode"}
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import gc
+import hashlib
+import os
+
+import pytest
+
+from application.ports.http_client import HttpResponse
+from application.services import response_body
+from application.services.response_body import (
+    BodyCollector,
+    BodyLimits,
+    DownloadPathError,
+    ResponseBody,
+    ResponseBodyTooLargeError,
+    resolve_download_path,
+)
+
+SJIS_PAGE = "<html><head><meta charset=\"Shift_JIS\"></head><body>予約番号 ①</body></html>".encode("cp932")
+
+
+def test_header_charset_wins_over_meta() -> None:
+    # Arrange
+    body = ResponseBody("<meta charset='cp932'>予約".encode("utf-8"), {"Content-Type": "text/html; charset=UTF-8"})
+
+    # Act / Assert
+    assert body.text.endswith("予約")
+    assert body.encoding == "UTF-8"
+
+
+def test_meta_charset_is_sniffed_and_shift_jis_decodes_as_cp932() -> None:
+    # Arrange
+    body = ResponseBody(SJIS_PAGE, {"content-type": "text/html"})
+
+    # Act / Assert
+    assert "予約番号 ①" in body.text
+    assert body.encoding == "cp932"
+
+
+def test_undeclared_body_falls_back_from_utf8_to_cp932() -> None:
+    # Arrange
+    utf8 = ResponseBody("予約".encode("utf-8"), {})
+    sjis = ResponseBody("予約".encode("cp932"), {})
+
+    # Act / Assert
+    assert (utf8.text, utf8.encoding) == ("予約", "utf-8")
+    assert (sjis.text, sjis.encoding) == ("予約", "cp932")
+
+
+def test_body_is_decoded_once_and_shared(monkeypatch) -> None:
+    # Arrange
+    calls = []
+    original = response_body.decode_body
+
+    def counting_decode(raw, headers):
+        calls.append(len(raw))
+        return original(raw, headers)
+
+    monkeypatch.setattr(response_body, "decode_body", counting_decode)
+    resp = HttpResponse(status=200, url="https://example.com", text=None, headers={}, content=b"<p>ok</p>")
+
+    # Act
+    first = resp.body.text
+    second = resp.body.text
+
+    # Assert
+    assert first is second
+    assert calls == [9]
+    assert resp.body.sha256 == hashlib.sha256(b"<p>ok</p>").hexdigest()
+
+
+def test_text_only_response_serves_text_as_is() -> None:
+    # Arrange
+    resp = HttpResponse(status=200, url="https://example.com", text="plain", headers={})
+
+    # Act / Assert
+    assert resp.body.text == "plain"
+    assert resp.body.raw is None
+    assert resp.body.encoding is None
+    assert resp.body.sha256 == hashlib.sha256(b"plain").hexdigest()
+
+
+def test_collector_spills_large_body_to_temp_file_and_decodes_it(tmp_path) -> None:
+    # Arrange
+    page = ("<html><body>" + "予約" * 2000 + "</body></html>").encode("utf-8")
+    collector = BodyCollector(BodyLimits(spill_bytes=1024, spill_dir=str(tmp_path)))
+
+    # Act
+    for start in range(0, len(page), 500):
+        collector.feed(page[start : start + 500])
+    body = collector.finish({"Content-Type": "text/html; charset=utf-8"})
+
+    # Assert
+    assert body.raw is None
+    assert body.path is not None and body.path.startswith(str(tmp_path))
+    assert body.size == len(page)
+    assert body.sha256 == hashlib.sha256(page).hexdigest()
+    assert body.text == page.decode("utf-8")
+
+
+def test_spilled_temp_file_is_removed_with_the_body(tmp_path) -> None:
+    # Arrange
+    collector = BodyCollector(BodyLimits(spill_bytes=1, spill_dir=str(tmp_path)))
+    collector.feed(b"%PDF-1.7 ...")
+    body = collector.finish({"Content-Type": "application/pdf"})
+    path = body.path
+
+    # Act
+    text = body.text
+    del body
+    gc.collect()
+
+    # Assert
+    assert text == ""
+    assert not os.path.exists(path)
+
+
+def test_collector_rejects_body_over_max_bytes(tmp_path) -> None:
+    # Arrange
+    collector = BodyCollector(BodyLimits(max_bytes=10, spill_bytes=4, spill_dir=str(tmp_path)))
+    collector.feed(b"12345678")
+
+    # Act / Assert
+    with pytest.raises(ResponseBodyTooLargeError):
+        collector.feed(b"9012")
+    assert list(tmp_path.iterdir()) == []
+    with pytest.raises(ResponseBodyTooLargeError):
+        BodyCollector(BodyLimits(max_bytes=10), expected_length=11)
+
+
+def test_collector_saves_body_to_requested_file(tmp_path) -> None:
+    # Arrange
+    target = tmp_path / "downloads" / "report.csv"
+    collector = BodyCollector(BodyLimits(save_to=str(target)))
+
+    # Act
+    collector.feed(b"a,b\n")
+    collector.feed(b"1,2\n")
+    body = collector.finish({"Content-Type": "text/csv"})
+    del body
+    gc.collect()
+
+    # Assert
+    assert target.read_bytes() == b"a,b\n1,2\n"
+
+
+def test_step_limits_override_client_defaults() -> None:
+    # Arrange
+    defaults = BodyLimits(max_bytes=100, spill_bytes=10, spill_dir="/tmp/spill")
+
+    # Act
+    merged = defaults.override(BodyLimits(max_bytes=5, save_to="out.bin"))
+
+    # Assert
+    assert merged == BodyLimits(max_bytes=5, spill_bytes=10, spill_dir="/tmp/spill", save_to="out.bin")
+
+
+def test_download_path_is_resolved_inside_the_root(tmp_path) -> None:
+    # Act
+    path = resolve_download_path(str(tmp_path), "run-1/report.pdf")
+
+    # Assert
+    assert path == str(tmp_path.resolve() / "run-1" / "report.pdf")
+
+
+@pytest.mark.parametrize("rendered", ["../escape.pdf", "run-1/../../escape.pdf", "/etc/cron.d/job", "."])
+def test_download_path_outside_the_root_is_rejected(tmp_path, rendered) -> None:
+    # Act / Assert
+    with pytest.raises(DownloadPathError):
+        resolve_download_path(str(tmp_path / "downloads"), rendered)
+
+
+def test_download_path_through_a_symlink_out_of_the_root_is_rejected(tmp_path) -> None:
+    # Arrange
+    root = tmp_path / "downloads"
+    root.mkdir()
+    (root / "link").symlink_to(tmp_path)
+
+    # Act / Assert
+    with pytest.raises(DownloadPathError):
+        resolve_download_path(str(root), "link/escape.pdf")
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import pytest
+
+from application.ports.requests_client import RequestsSessionHttpClient
+from application.services.server_clock import ServerClockEstimator, ServerClockRegistry, host_of
+
+SKEW_SEC = 42.37
+
+
+def _date(epoch: float) -> str:
+    return formatdate(epoch, usegmt=True)
+
+
+class _SkewedClockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def date_time_string(self, timestamp=None) -> str:
+        return _date(time.time() + SKEW_SEC)
+
+    def do_GET(self) -> None:  # noqa: N802
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args) -> None:
+        return None
+
+
+@pytest.fixture
+def skewed_server_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SkewedClockHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_single_sample_bounds_offset_by_rtt_plus_date_resolution():
+    estimator = ServerClockEstimator()
+
+    estimate = estimator.observe(1000.2, 1000.4, _date(1010))
+
+    # server time in [1010, 1011) happened between 1000.2 and 1000.4
+    assert estimate.offset_sec == pytest.approx((9.6 + 10.8) / 2)
+    assert estimate.uncertainty_sec == pytest.approx((10.8 - 9.6) / 2)
+    assert estimate.rtt_sec == pytest.approx(0.2)
+
+
+def test_samples_across_a_second_boundary_narrow_the_offset():
+    estimator = ServerClockEstimator()
+    true_offset = 10.25
+
+    for sent in (1000.50, 1000.70, 1000.74, 1000.76, 1000.90):
+        received = sent + 0.01
+        server_at = int((sent + received) / 2 + true_offset)
+        estimate = estimator.observe(sent, received, _date(server_at))
+
+    assert estimate.offset_sec == pytest.approx(true_offset, abs=0.03)
+    assert estimate.uncertainty_sec < 0.03
+
+
+def test_high_rtt_sample_keeps_the_tighter_bound_and_reports_min_rtt():
+    estimator = ServerClockEstimator()
+    first = estimator.observe(1000.0, 1000.01, _date(1010))
+
+    estimate = estimator.observe(1001.0, 1003.0, _date(1012))
+
+    assert estimate.samples == 2
+    assert estimate.rtt_sec == pytest.approx(0.01)
+    assert estimate.offset_sec == pytest.approx(first.offset_sec)
+
+
+def test_clock_step_restarts_the_estimate():
+    estimator = ServerClockEstimator()
+    estimator.observe(1000.0, 1000.01, _date(1010))
+
+    estimate = estimator.observe(1001.0, 1001.01, _date(1101))
+
+    assert estimate.samples == 1
+    assert estimate.offset_sec == pytest.approx(100.5, abs=0.01)
+
+
+def test_missing_or_invalid_date_is_ignored():
+    estimator = ServerClockEstimator()
+
+    assert estimator.observe(1000.0, 1000.01, None) is None
+    assert estimator.observe(1000.0, 1000.01, "not a date") is None
+
+
+def test_registry_keeps_one_estimate_per_host():
+    registry = ServerClockRegistry()
+
+    registry.observe("https://a.example/login", 1000.0, 1000.01, {"Date": _date(1010)})
+    registry.observe("https://b.example/", 1000.0, 1000.01, {"date": _date(990)})
+    registry.observe("https://c.example/", 1000.0, 1000.01, {"Date": _date(900), "Age": "120"})
+
+    assert registry.estimate("a.example").offset_sec > 9
+    assert registry.estimate("b.example").offset_sec < -9
+    assert registry.estimate("c.example") is None
+
+
+def test_estimates_skewed_local_server_clock(skewed_server_url: str):
+    client = RequestsSessionHttpClient()
+    registry = ServerClockRegistry()
+
+    # Reason: Date has 1s resolution; sampling across a second boundary is what sharpens it.
+    deadline = time.time() + 1.3
+    while time.time() < deadline:
+        resp = client.request("GET", f"{skewed_server_url}/")
+        registry.observe(resp.url, resp.sent_at, resp.received_at, resp.headers)
+        time.sleep(0.02)
+
+    estimate = registry.estimate(host_of(skewed_server_url))
+    assert estimate is not None
+    assert estimate.offset_sec == pytest.approx(SKEW_SEC, abs=0.1)
+    assert estimate.uncertainty_sec < 0.1
+
+    server_fire_at = datetime.fromtimestamp(time.time() + SKEW_SEC, tz=timezone.utc)
+    assert abs(estimate.to_local(server_fire_at).timestamp() - time.time()) < 0.1
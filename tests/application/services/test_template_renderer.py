@@ -1,9 +1,11 @@
 # tests/application/services/test_template_renderer.py
 import pytest
 from application.services.template_renderer import (
+    PathSegment,
     TemplateRenderer,
     TemplateRenderError,
-    RenderSources
+    RenderSources,
+    _compile_path,
 )
 
 
@@ -171,44 +173,94 @@ class TestTemplateRenderer:
         result = renderer.render_value(value, src)
         assert result == value
 
-    def test_split_root(self):
-        renderer = TemplateRenderer()
-        assert renderer._split_root("vars.name") == ("vars", "name")
-        assert renderer._split_root("state.counter.value") == ("state", "counter.value")
-        assert renderer._split_root("vars") == ("vars", "")
+    def test_compile_path_splits_root(self):
+        assert _compile_path("vars.name") == PathSegment(root="vars", parts=((0, "name"),))
+        assert _compile_path("state.counter.value") == PathSegment(root="state", parts=((0, "counter"), (0, "value")))
+        assert _compile_path("vars") == PathSegment(root="vars", parts=())
 
-    def test_resolve_path_simple(self):
-        renderer = TemplateRenderer()
-        obj = {"name": "Alice", "age": 30}
-        result = renderer._resolve_path(obj, "name")
+    def test_eval_segment_simple(self):
+        result = _resolve({"name": "Alice", "age": 30}, "name")
         assert result == "Alice"
 
-    def test_resolve_path_nested(self):
-        renderer = TemplateRenderer()
-        obj = {"user": {"profile": {"name": "Bob"}}}
-        result = renderer._resolve_path(obj, "user.profile.name")
+    def test_eval_segment_nested(self):
+        result = _resolve({"user": {"profile": {"name": "Bob"}}}, "user.profile.name")
         assert result == "Bob"
 
-    def test_resolve_path_list_index(self):
-        renderer = TemplateRenderer()
-        obj = {"items": ["first", "second", "third"]}
-        result = renderer._resolve_path(obj, "items.0")
+    def test_eval_segment_list_index(self):
+        result = _resolve({"items": ["first", "second", "third"]}, "items.0")
         assert result == "first"
 
-    def test_resolve_path_out_of_bounds_index(self):
-        renderer = TemplateRenderer()
-        obj = {"items": ["first", "second"]}
-        result = renderer._resolve_path(obj, "items.10")
+    def test_eval_segment_out_of_bounds_index(self):
+        result = _resolve({"items": ["first", "second"]}, "items.10")
         assert result == ""
 
-    def test_resolve_path_list_expansion(self):
-        renderer = TemplateRenderer()
-        obj = {"items": [1, 2, 3]}
-        result = renderer._resolve_path(obj, "items[*]")
+    def test_eval_segment_list_expansion(self):
+        result = _resolve({"items": [1, 2, 3]}, "items[*]")
         assert result == [1, 2, 3]
 
-    def test_resolve_path_invalid_list_expansion_raises_error(self):
-        renderer = TemplateRenderer()
-        obj = {"value": "not_a_list"}
+    def test_eval_segment_invalid_list_expansion_raises_error(self):
         with pytest.raises(TemplateRenderError, match="is not list"):
-            renderer._resolve_path(obj, "value[*]")
+            _resolve({"value": "not_a_list"}, "value[*]")
+
+
+def _resolve(vars_: dict, path: str):
+    src = RenderSources(vars=vars_, state={}, secrets={}, last={})
+    return TemplateRenderer()._eval_segment(_compile_path(f"vars.{path}"), src)
+
+
+class TestCompiledTemplates:
+    def test_compile_template_splits_literals_and_paths(self):
+        from application.services.template_renderer import PathSegment, compile_template
+
+        compiled = compile_template("id=${vars.user.id}&d=${vars.dates[*]}")
+
+        assert compiled.segments[0] == "id="
+        assert compiled.segments[1] == PathSegment(root="vars", parts=((0, "user"), (0, "id")))
+        assert compiled.segments[2] == "&d="
+        assert compiled.segments[3].parts == ((2, "dates"),)
+
+    def test_compile_template_is_cached(self):
+        from application.services.template_renderer import compile_template
+
+        assert compile_template("${vars.cached_key}") is compile_template("${vars.cached_key}")
+
+    def test_compile_template_rejects_unknown_root(self):
+        from application.services.template_renderer import TemplateRenderError, compile_template
+
+        with pytest.raises(TemplateRenderError):
+            compile_template("${other.value}")
+
+    def test_precompile_templates_walks_steps(self):
+        from application.services.template_renderer import compile_template, precompile_templates
+        from domain.steps.http import HttpRequestSpec, HttpStep
+        from domain.steps.result import ResultStep
+
+        steps = [
+            HttpStep(
+                id="post",
+                name="post",
+                request=HttpRequestSpec(
+                    method="POST",
+                    url="/x",
+                    form_list=[("a", "${vars.precompiled_a}"), ("b", "plain")],
+                ),
+            ),
+            ResultStep(id="r", name="r", fields={"no": "${state.precompiled_no}", "bad": "${oops"}),
+        ]
+        compile_template.cache_clear()
+
+        visited = precompile_templates(steps)
+
+        assert visited == 3
+        assert compile_template.cache_info().currsize == 2
+
+    def test_rendering_compiled_template_matches_values(self):
+        renderer = TemplateRenderer()
+        src = RenderSources(
+            vars={"user": {"id": 7}, "dates": ["d1", "d2"]},
+            state={},
+            secrets={},
+            last={},
+        )
+
+        assert renderer._render_str("u${vars.user.id}:${vars.dates[*]}", src) == "u7:d1,d2"
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List
+
+from application.http_trace import HttpTrace
+from application.http_trace_emitter import HttpTraceEmitter
+from application.http_trace_enricher import HttpTraceEnricher
+from application.services.execution_deps import ExecutionDeps
+from application.services.trace_pipeline import TracePipeline
+
+
+class MockLogger:
+    def __init__(self) -> None:
+        self.calls: List[Dict[str, Any]] = []
+
+    def debug(self, event: str, **fields: Any) -> None:
+        self.calls.append({"event": event, **fields})
+
+    def info(self, event: str, **fields: Any) -> None:
+        self.calls.append({"event": event, **fields})
+
+    def error(self, event: str, **fields: Any) -> None:
+        self.calls.append({"event": event, **fields})
+
+    def bind(self, **fields: Any) -> "MockLogger":
+        return self
+
+    def events(self, name: str) -> List[Dict[str, Any]]:
+        return [call for call in self.calls if call["event"] == name]
+
+
+class MockSecretProvider:
+    def get(self) -> Dict[str, Any]:
+        return {}
+
+
+class MockUrlResolver:
+    def resolve_url(self, url: str) -> str:
+        return url
+
+
+class RecordingEnricher(HttpTraceEnricher):
+    deferrable = True
+
+    def __init__(self, gate: threading.Event | None = None) -> None:
+        self.seen: List[str] = []
+        self.threads: List[str] = []
+        self._gate = gate
+
+    def enrich_and_log(self, trace: HttpTrace, deps: ExecutionDeps) -> None:
+        if self._gate is not None:
+            self._gate.wait(5)
+        self.threads.append(threading.current_thread().name)
+        self.seen.append(trace.step_id)
+
+
+class InlineEnricher(RecordingEnricher):
+    deferrable = False
+
+
+def _deps(logger: MockLogger, pipeline: TracePipeline | None = None) -> ExecutionDeps:
+    return ExecutionDeps(
+        secret_provider=MockSecretProvider(),
+        url_resolver=MockUrlResolver(),
+        logger=logger,
+        trace_pipeline=pipeline,
+    )
+
+
+def _trace(step_id: str, run_id: str = "run1") -> HttpTrace:
+    return HttpTrace(run_id=run_id, step_id=step_id, method="GET", url="https://example.com")
+
+
+def _wait_until_idle_queue(pipeline: TracePipeline) -> None:
+    while pipeline.stats().queued:
+        time.sleep(0.001)
+
+
+def test_flush_waits_for_run_traces_in_submission_order() -> None:
+    # Arrange
+    pipeline = TracePipeline(workers=2, batch_size=2)
+    deps = _deps(MockLogger())
+    enricher = RecordingEnricher()
+
+    # Act
+    for i in range(10):
+        pipeline.submit(_trace(f"s{i}"), deps, [enricher])
+    flushed = pipeline.flush("run1", timeout_sec=5)
+
+    # Assert
+    assert flushed is True
+    assert enricher.seen == [f"s{i}" for i in range(10)]
+    assert pipeline.stats().processed == 10
+    pipeline.close()
+
+
+def test_drop_newest_discards_new_traces_when_full() -> None:
+    # Arrange
+    gate = threading.Event()
+    logger = MockLogger()
+    pipeline = TracePipeline(workers=1, queue_size=1, batch_size=1, overflow="drop_newest")
+    enricher = RecordingEnricher(gate)
+    deps = _deps(logger)
+    pipeline.submit(_trace("busy"), deps, [enricher])
+    _wait_until_idle_queue(pipeline)
+    pipeline.submit(_trace("queued"), deps, [enricher])
+
+    # Act
+    accepted = pipeline.submit(_trace("dropped"), deps, [enricher])
+    gate.set()
+    pipeline.flush("run1", timeout_sec=5)
+
+    # Assert
+    assert accepted is False
+    assert enricher.seen == ["busy", "queued"]
+    assert [call["step_id"] for call in logger.events("http.trace.dropped")] == ["dropped"]
+    pipeline.close()
+
+
+def test_drop_oldest_evicts_the_oldest_queued_trace() -> None:
+    # Arrange
+    gate = threading.Event()
+    logger = MockLogger()
+    pipeline = TracePipeline(workers=1, queue_size=1, batch_size=1, overflow="drop_oldest")
+    enricher = RecordingEnricher(gate)
+    deps = _deps(logger)
+    pipeline.submit(_trace("busy"), deps, [enricher])
+    _wait_until_idle_queue(pipeline)
+    pipeline.submit(_trace("old"), deps, [enricher])
+
+    # Act
+    accepted = pipeline.submit(_trace("new"), deps, [enricher])
+    gate.set()
+    pipeline.flush("run1", timeout_sec=5)
+
+    # Assert
+    assert accepted is True
+    assert enricher.seen == ["busy", "new"]
+    assert pipeline.stats().dropped == 1
+    pipeline.close()
+
+
+def test_block_falls_back_to_enriching_in_the_caller() -> None:
+    # Arrange
+    gate = threading.Event()
+    pipeline = TracePipeline(workers=1, queue_size=1, batch_size=1, block_timeout_sec=0.01)
+    busy = RecordingEnricher(gate)
+    enricher = RecordingEnricher()
+    deps = _deps(MockLogger())
+    pipeline.submit(_trace("busy"), deps, [busy])
+    _wait_until_idle_queue(pipeline)
+    pipeline.submit(_trace("queued"), deps, [enricher])
+
+    # Act
+    accepted = pipeline.submit(_trace("inline"), deps, [enricher])
+
+    # Assert
+    assert accepted is True
+    assert enricher.seen == ["inline"]
+    assert enricher.threads == [threading.current_thread().name]
+    gate.set()
+    assert pipeline.flush("run1", timeout_sec=5) is True
+    pipeline.close()
+
+
+def test_block_does_not_wait_on_an_event_loop_thread() -> None:
+    # Arrange
+    gate = threading.Event()
+    logger = MockLogger()
+    pipeline = TracePipeline(workers=1, queue_size=1, batch_size=1, block_timeout_sec=5)
+    enricher = RecordingEnricher()
+    deps = _deps(logger)
+    pipeline.submit(_trace("busy"), deps, [RecordingEnricher(gate)])
+    _wait_until_idle_queue(pipeline)
+    pipeline.submit(_trace("queued"), deps, [enricher])
+
+    async def submit_on_loop() -> bool:
+        return pipeline.submit(_trace("loop"), deps, [enricher])
+
+    # Act
+    started = time.monotonic()
+    accepted = asyncio.run(submit_on_loop())
+    elapsed = time.monotonic() - started
+
+    # Assert
+    assert accepted is False
+    assert elapsed < 1
+    assert [(call["step_id"], call["policy"]) for call in logger.events("http.trace.dropped")] == [
+        ("loop", "drop_newest"),
+    ]
+    gate.set()
+    assert pipeline.flush("run1", timeout_sec=5) is True
+    assert enricher.seen == ["queued"]
+    pipeline.close()
+
+
+def test_enricher_timeout_is_logged_and_the_next_trace_proceeds() -> None:
+    # Arrange
+    gate = threading.Event()
+    logger = MockLogger()
+    pipeline = TracePipeline(workers=1, enricher_timeout_sec=0.05)
+    stuck = RecordingEnricher(gate)
+    enricher = RecordingEnricher()
+    deps = _deps(logger)
+
+    # Act
+    pipeline.submit(_trace("stuck"), deps, [stuck, enricher])
+    pipeline.submit(_trace("next"), deps, [enricher])
+    flushed = pipeline.flush("run1", timeout_sec=5)
+    gate.set()
+
+    # Assert
+    assert flushed is True
+    assert enricher.seen == ["stuck", "next"]
+    timeouts = logger.events("http.trace.enricher_timeout")
+    assert [(call["step_id"], call["enricher"]) for call in timeouts] == [("stuck", "RecordingEnricher")]
+    pipeline.close()
+
+
+class TimingOutEnricher(RecordingEnricher):
+    def enrich_and_log(self, trace: HttpTrace, deps: ExecutionDeps) -> None:
+        self.threads.append(threading.current_thread().name)
+        raise TimeoutError("upstream read timed out")
+
+
+def test_enricher_raising_timeout_error_is_a_failure_not_a_pipeline_timeout() -> None:
+    # Arrange
+    logger = MockLogger()
+    pipeline = TracePipeline(workers=1, enricher_timeout_sec=5)
+    failing = TimingOutEnricher()
+    deps = _deps(logger)
+
+    # Act
+    pipeline.submit(_trace("s1"), deps, [failing])
+    pipeline.submit(_trace("s2"), deps, [failing])
+    pipeline.flush("run1", timeout_sec=5)
+
+    # Assert
+    stats = pipeline.stats()
+    assert (stats.failures, stats.timeouts) == (2, 0)
+    assert [call["step_id"] for call in logger.events("http.trace.enricher_failed")] == ["s1", "s2"]
+    # the healthy runner thread was kept
+    assert len(set(failing.threads)) == 1
+    pipeline.close()
+
+
+def test_caller_enricher_raising_timeout_error_is_logged_as_a_failure() -> None:
+    # Arrange
+    gate = threading.Event()
+    logger = MockLogger()
+    pipeline = TracePipeline(workers=1, queue_size=1, batch_size=1, block_timeout_sec=0.01)
+    deps = _deps(logger)
+    pipeline.submit(_trace("busy"), deps, [RecordingEnricher(gate)])
+    _wait_until_idle_queue(pipeline)
+    pipeline.submit(_trace("queued"), deps, [RecordingEnricher()])
+
+    # Act
+    accepted = pipeline.submit(_trace("inline"), deps, [TimingOutEnricher()])
+
+    # Assert
+    assert accepted is True
+    assert [call["step_id"] for call in logger.events("http.trace.enricher_failed")] == ["inline"]
+    gate.set()
+    assert pipeline.flush("run1", timeout_sec=5) is True
+    pipeline.close()
+
+
+def test_emitter_defers_only_deferrable_enrichers() -> None:
+    # Arrange
+    pipeline = TracePipeline(workers=1)
+    inline = InlineEnricher()
+    deferred = RecordingEnricher()
+    emitter = HttpTraceEmitter([inline, deferred])
+
+    # Act
+    emitter.emit(_trace("s1"), _deps(MockLogger(), pipeline))
+    pipeline.flush("run1", timeout_sec=5)
+
+    # Assert
+    assert inline.threads == [threading.current_thread().name]
+    assert deferred.seen == ["s1"]
+    assert deferred.threads != [threading.current_thread().name]
+    pipeline.close()
+
+
+def test_emitter_runs_everything_inline_without_a_pipeline() -> None:
+    # Arrange
+    deferred = RecordingEnricher()
+    emitter = HttpTraceEmitter([deferred])
+
+    # Act
+    emitter.emit(_trace("s1"), _deps(MockLogger()))
+
+    # Assert
+    assert deferred.threads == [threading.current_thread().name]
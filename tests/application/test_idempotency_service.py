@@ -16,6 +16,9 @@ class FakeIdempotencyStore(IdempotencyStorePort):
         self._keys.add(key.value)
         return True
 
+    def release(self, key: IdempotencyKey) -> None:
+        self._keys.discard(key.value)
+
 
 def test_register_or_raise_accepts_new_key() -> None:
     # Arrange
@@ -42,3 +45,17 @@ def test_register_or_raise_rejects_duplicate_key() -> None:
         assert str(exc) == "Idempotency key already used"
         return
     raise AssertionError("Expected IdempotencyError to be raised")
+
+
+def test_release_lets_the_key_be_registered_again() -> None:
+    # Arrange
+    store = FakeIdempotencyStore()
+    service = IdempotencyService(store)
+    service.register_or_raise(IdempotencyKey("key-1"))
+
+    # Act
+    service.release(IdempotencyKey("key-1"))
+    service.register_or_raise(IdempotencyKey("key-1"))
+
+    # Assert
+    assert "key-1" in store._keys
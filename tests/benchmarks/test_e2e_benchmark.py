@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import json
+
+from benchmarks import e2e
+from benchmarks.stats import percentile
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    # Arrange
+    samples = [float(value) for value in range(1, 101)]
+
+    # Act / Assert
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([], 50) == 0.0
+
+
+def test_executor_benchmark_completes_runs_against_stand_in_site(tmp_path) -> None:
+    # Arrange
+    output = tmp_path / "e2e.json"
+
+    # Act
+    e2e.main(["--runs", "3", "--concurrency", "1,2", "--warmup", "1", "--page-kb", "2", "--output", str(output)])
+
+    # Assert
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert [level["concurrency"] for level in report["levels"]] == [1, 2]
+    for level in report["levels"]:
+        assert level["runs"] == 3
+        assert level["failures"] == 0
+        assert level["runs_per_sec"] > 0
+        assert set(level["latency_ms"]) >= {"p50", "p95", "p99"}
+        assert level["cpu_ms_per_run"] > 0
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+
+from benchmarks import micro
+
+
+def test_compare_flags_cases_slower_than_threshold() -> None:
+    # Arrange
+    baseline = {"cases": {"a": {"min_us": 100.0}, "b": {"min_us": 100.0}, "c": {"min_us": 100.0}}}
+    current = {"cases": {"a": {"min_us": 130.0}, "b": {"min_us": 105.0}, "c": {"min_us": 50.0}, "d": {"min_us": 1.0}}}
+
+    # Act
+    rows = {row["case"]: row["status"] for row in micro.compare_results(current, baseline, threshold=0.2)}
+
+    # Assert
+    assert rows == {"a": "regression", "b": "ok", "c": "improvement", "d": "new"}
+
+
+def test_every_case_builds_and_runs_once() -> None:
+    # Arrange
+    cases = [case for case in micro.all_cases() if not case.name.endswith((".medium", ".large", ".medium.cached", ".large.cached"))]
+
+    # Act / Assert
+    assert {"scrape.hidden_inputs.small", "scrape.css.small", "scrape.label_next_td.small"} <= {case.name for case in cases}
+    for case in cases:
+        case.build()()
+
+
+def test_baseline_round_trip_exits_nonzero_on_regression(tmp_path) -> None:
+    # Arrange
+    baseline_path = tmp_path / "baseline.json"
+    args = ["--filter", r"^mask_dict\.100$", "--repeat", "1", "--min-time", "0.001", "--output", str(tmp_path / "out.json")]
+    assert micro.main(args + ["--save-baseline", str(baseline_path)]) == 0
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    baseline["cases"]["mask_dict.100"]["min_us"] /= 100
+    baseline_path.write_text(json.dumps(baseline), encoding="utf-8")
+
+    # Act
+    exit_code = micro.main(args + ["--compare", str(baseline_path)])
+
+    # Assert
+    report = json.loads((tmp_path / "out.json").read_text(encoding="utf-8"))
+    assert exit_code == 1
+    assert report["regressions"] == ["mask_dict.100"]
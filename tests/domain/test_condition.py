@@ -0,0 +1,99 @@
+# tests/domain/test_condition.py
+import pytest
+
+from domain.exceptions import ExpressionError
+from domain.run import LastResponse, RunContext
+from domain.steps.assertion import AssertStep, ConditionSpec
+from domain.steps.base import OnErrorRule
+from domain.steps.condition import compile_condition, precompile_conditions, tokenize
+
+
+def _ctx(status=200, text="<html>ok</html>", **vars):
+    return RunContext(
+        vars=dict(vars),
+        state={"token": "abc", "items": ["a", "b"]},
+        last=LastResponse(status=status, url="https://example.com/done", text=text, headers={}),
+    )
+
+
+def _eval(expr, ctx=None):
+    return compile_condition(expr).evaluate(ctx or _ctx())
+
+
+class TestTokenizer:
+    def test_tokenize_comparison_without_spaces(self):
+        kinds = [t.kind for t in tokenize("${last.status}>=500")]
+        assert kinds == ["ref", "op", "word"]
+
+    def test_tokenize_quoted_regex_is_single_token(self):
+        tokens = tokenize("matches(${vars.no}, '^[0-9]{11}$')")
+        assert [t.kind for t in tokens] == ["word", "lparen", "ref", "comma", "str", "rparen"]
+
+
+class TestCompiledCondition:
+    @pytest.mark.parametrize(
+        "expr, expected",
+        [
+            ("${last.status}==200", True),
+            ("${last.status} == 200.0", True),
+            ("${last.status}!=200", False),
+            ("${last.status}>=500", False),
+            ("${last.status}<300", True),
+            ("${state.token} == abc", True),
+            ("${state.token} == 'abc'", True),
+            ("${state.token} > 1", False),
+        ],
+    )
+    def test_comparisons(self, expr, expected):
+        assert _eval(expr) is expected
+
+    def test_numeric_comparison_is_typed(self):
+        # "10" > "9" is False as text, True as numbers
+        assert _eval("${vars.n} > 9", _ctx(n="10")) is True
+
+    @pytest.mark.parametrize("expr, expected", [("true", True), ("false", False), ("0", False), ("", False)])
+    def test_bare_values_use_truthiness(self, expr, expected):
+        assert _eval(expr) is expected
+
+    def test_missing_reference_is_falsy(self):
+        assert _eval("${vars.missing}") is False
+        assert _eval("${vars.missing} == ''") is True
+
+    def test_matches_function(self):
+        expr = "matches(${vars.reservationNo}, '^[0-9]{11}$')"
+        assert _eval(expr, _ctx(reservationNo="00003217694")) is True
+        assert _eval(expr, _ctx(reservationNo="ABC")) is False
+
+    def test_contains_operators(self):
+        assert _eval("${last.text} contains 'ok'") is True
+        assert _eval("not_contains(${last.text}, 'error')") is True
+        assert _eval("${state.items} contains b") is True
+
+    def test_logical_operators(self):
+        assert _eval("${last.status} == 200 and not ${last.text} contains 'error'") is True
+        assert _eval("(${last.status} >= 500 or ${last.status} == 401) and true", _ctx(status=401)) is True
+
+    def test_evaluation_reads_context_at_call_time(self):
+        compiled = compile_condition("${last.status} >= 500")
+        assert compiled.evaluate(_ctx(status=200)) is False
+        assert compiled.evaluate(_ctx(status=503)) is True
+
+    def test_compile_is_cached(self):
+        assert compile_condition("${last.status}==200") is compile_condition("${last.status}==200")
+
+    @pytest.mark.parametrize("expr", ["${secrets.x} == 1", "${last.status} ==", "unknown(1, 2)", "(true"])
+    def test_invalid_expression_raises(self, expr):
+        with pytest.raises(ExpressionError):
+            compile_condition(expr)
+
+
+def test_precompile_conditions_skips_invalid_expressions():
+    steps = [
+        AssertStep(
+            id="a",
+            name="a",
+            conditions=[ConditionSpec(expr="${last.status}==200"), ConditionSpec(expr="(broken")],
+            on_error=[OnErrorRule(when_expr="${last.status}>=500", action="retry"), OnErrorRule(when_expr=None, action="abort")],
+        )
+    ]
+    assert precompile_conditions(steps) == 3
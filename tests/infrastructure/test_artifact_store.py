@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+
+from application.http_trace import HttpResponseMeta, HttpTrace
+from application.services.execution_deps import ExecutionDeps
+from infrastructure.http.artifact_store import ArtifactRetention, ArtifactStore
+from infrastructure.http.http_artifact_saver import HttpArtifactSaver
+
+LOGIN_PAGE = ("<html><body><form>" + "<input type='hidden' name='h' value='x'>" * 200 + "</form></body></html>").encode()
+NOW = 1_000_000.0
+
+
+class MockLogger:
+    def __init__(self) -> None:
+        self.calls: List[Dict[str, Any]] = []
+
+    def debug(self, event: str, **fields: Any) -> None:
+        self.calls.append({"event": event, **fields})
+
+    def info(self, event: str, **fields: Any) -> None:
+        self.calls.append({"event": event, **fields})
+
+    def error(self, event: str, **fields: Any) -> None:
+        self.calls.append({"event": event, **fields})
+
+    def bind(self, **fields: Any) -> "MockLogger":
+        return self
+
+
+class MockSecretProvider:
+    def get(self) -> Dict[str, Any]:
+        return {}
+
+
+class MockUrlResolver:
+    def resolve_url(self, url: str) -> str:
+        return url
+
+
+def _sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _store_run(store: ArtifactStore, run_id: str, body: bytes, age_sec: float = 0.0) -> None:
+    blob = store.put_blob(_sha(body), data=body)
+    manifest = store.append(run_id, {"step_id": "login", "body_sha256": _sha(body)})
+    for path in (blob, manifest):
+        os.utime(path, (NOW - age_sec, NOW - age_sec))
+
+
+def _trace(run_id: str, body: bytes) -> HttpTrace:
+    return HttpTrace(
+        run_id=run_id,
+        step_id="login",
+        method="POST",
+        url="https://example.com/login",
+        request_headers={"Accept": "text/html"},
+        request_form=[("user", "u1")],
+        response=HttpResponseMeta(
+            status=200,
+            url="https://example.com/login",
+            headers={"Content-Type": "text/html"},
+            encoding="utf-8",
+            content_type="text/html",
+            history=[],
+            body_len=len(body),
+            body_sha256=_sha(body),
+        ),
+        raw_bytes=body,
+    )
+
+
+def test_saver_stores_identical_bodies_once_across_runs(tmp_path: Path) -> None:
+    # Arrange
+    store = ArtifactStore(tmp_path)
+    saver = HttpArtifactSaver(store=store)
+    deps = ExecutionDeps(secret_provider=MockSecretProvider(), url_resolver=MockUrlResolver(), logger=MockLogger())
+
+    # Act
+    for run_id in ("run1", "run2", "run3"):
+        saver.enrich_and_log(_trace(run_id, LOGIN_PAGE), deps)
+
+    # Assert
+    blobs = list((tmp_path / "blobs").rglob("*.gz"))
+    assert blobs == [store.blob_path(_sha(LOGIN_PAGE))]
+    assert blobs[0].stat().st_size < len(LOGIN_PAGE) / 10
+    assert store.read_blob(_sha(LOGIN_PAGE)) == LOGIN_PAGE
+    entry = store.manifest("run2")[0]
+    assert entry["body_sha256"] == _sha(LOGIN_PAGE)
+    assert entry["request_form"] == [["user", "u1"]]
+    assert entry["status"] == 200
+
+
+def test_prune_drops_expired_runs_and_their_unshared_blobs(tmp_path: Path) -> None:
+    # Arrange
+    store = ArtifactStore(tmp_path, ArtifactRetention(ttl_sec=3600), orphan_grace_sec=60, clock=lambda: NOW)
+    _store_run(store, "old", b"old page", age_sec=7200)
+    _store_run(store, "old-shared", LOGIN_PAGE, age_sec=7200)
+    _store_run(store, "fresh", LOGIN_PAGE, age_sec=10)
+
+    # Act
+    evicted = store.prune()
+
+    # Assert
+    assert sorted(evicted) == ["old", "old-shared"]
+    assert store.manifest("fresh") != []
+    assert not store.blob_path(_sha(b"old page")).exists()
+    assert store.blob_path(_sha(LOGIN_PAGE)).exists()
+    assert store.retention_stats().evicted_ttl == 2
+
+
+def test_prune_evicts_oldest_runs_until_under_max_bytes(tmp_path: Path) -> None:
+    # Arrange
+    store = ArtifactStore(tmp_path, orphan_grace_sec=60, clock=lambda: NOW)
+    pages = [os.urandom(4000) for _ in range(3)]
+    for age, (run_id, page) in zip((3000, 2000, 1000), zip(("r1", "r2", "r3"), pages)):
+        _store_run(store, run_id, page, age_sec=age)
+    store.retention = ArtifactRetention(max_bytes=store.disk_usage() - 1000)
+
+    # Act
+    evicted = store.prune()
+
+    # Assert
+    assert evicted == ["r1"]
+    assert not store.blob_path(_sha(pages[0])).exists()
+    assert store.blob_path(_sha(pages[1])).exists()
+    assert store.disk_usage() <= store.retention.max_bytes
+
+
+def test_max_bytes_leaves_runs_inside_the_grace_window_alone(tmp_path: Path) -> None:
+    # Arrange
+    store = ArtifactStore(tmp_path, orphan_grace_sec=300, clock=lambda: NOW)
+    old_pages = [os.urandom(1000) for _ in range(2)]
+    fresh_pages = [os.urandom(1000) for _ in range(10)]
+    for i, page in enumerate(old_pages):
+        _store_run(store, f"old{i}", page, age_sec=1000 - i)
+    for i, page in enumerate(fresh_pages):
+        _store_run(store, f"fresh{i}", page, age_sec=10)
+    store.retention = ArtifactRetention(max_bytes=5000)
+
+    # Act
+    evicted = store.prune()
+
+    # Assert
+    assert evicted == ["old0", "old1"]
+    assert all(store.manifest(f"fresh{i}") != [] for i in range(10))
+    assert all(store.blob_path(_sha(page)).exists() for page in fresh_pages)
+    assert not any(store.blob_path(_sha(page)).exists() for page in old_pages)
+
+
+def test_recent_blob_without_manifest_survives_prune(tmp_path: Path) -> None:
+    # Arrange
+    store = ArtifactStore(tmp_path, ArtifactRetention(ttl_sec=3600), orphan_grace_sec=60, clock=lambda: NOW)
+    blob = store.put_blob(_sha(b"in flight"), data=b"in flight")
+    os.utime(blob, (NOW - 5, NOW - 5))
+
+    # Act
+    store.prune()
+
+    # Assert
+    assert blob.exists()
+
+
+def test_prune_keeps_files_written_to_after_its_scan(tmp_path: Path) -> None:
+    # Arrange
+    class RacingStore(ArtifactStore):
+        # another process writes while prune is deciding, right after each scan
+        def _scan_manifests(self):
+            manifests = super()._scan_manifests()
+            self.append("old", {"step_id": "retry", "body_sha256": _sha(b"old page")})
+            return manifests
+
+        def _scan_blobs(self):
+            blobs = super()._scan_blobs()
+            self.put_blob(_sha(b"shared page"), data=b"shared page")
+            return blobs
+
+    store = RacingStore(tmp_path, ArtifactRetention(ttl_sec=3600), orphan_grace_sec=60, clock=lambda: NOW)
+    _store_run(store, "old", b"old page", age_sec=7200)
+    _store_run(store, "shared", b"shared page", age_sec=7200)
+    _store_run(store, "gone", b"gone page", age_sec=7200)
+
+    # Act
+    evicted = store.prune()
+
+    # Assert
+    assert sorted(evicted) == ["gone", "shared"]
+    assert [entry["step_id"] for entry in store.manifest("old")] == ["login", "retry"]
+    assert store.read_blob(_sha(b"old page")) == b"old page"
+    assert store.read_blob(_sha(b"shared page")) == b"shared page"
+    assert not store.blob_path(_sha(b"gone page")).exists()
+
+
+def test_concurrent_writers_of_the_same_body_leave_one_complete_blob(tmp_path: Path) -> None:
+    # Arrange
+    store = ArtifactStore(tmp_path)
+    body = os.urandom(256 * 1024)
+    threads = [threading.Thread(target=store.put_blob, args=(_sha(body),), kwargs={"data": body}) for _ in range(8)]
+
+    # Act
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    assert [p.name for p in (tmp_path / "blobs").rglob("*") if p.is_file()] == [f"{_sha(body)}.gz"]
+    assert store.read_blob(_sha(body)) == body
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import io
+import json
+import threading
+import time
+
+from infrastructure.logging.async_log_writer import AsyncLogWriter
+from infrastructure.logging.console_logger import ConsoleLogger
+
+
+class BlockingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, text: str) -> int:
+        self.release.wait(5)
+        return super().write(text)
+
+
+def test_console_logger_with_writer_emits_lines_in_batches() -> None:
+    # Arrange
+    stream = io.StringIO()
+    writer = AsyncLogWriter(stream=stream, batch_size=50, flush_interval_sec=1.0)
+    logger = ConsoleLogger(writer=writer).bind(run_id="r1")
+
+    # Act
+    for i in range(120):
+        logger.info("step.start", step_id=f"s{i}")
+    flushed = writer.flush(timeout_sec=5)
+
+    # Assert
+    lines = stream.getvalue().splitlines()
+    assert flushed is True
+    assert len(lines) == 120
+    event, payload = lines[-1].split(" ", 1)
+    assert event == "step.start"
+    assert json.loads(payload) == {"run_id": "r1", "step_id": "s119", "type": "step.start"}
+    assert writer.stats().written == 120
+    assert writer.stats().batches < 120
+    writer.close()
+
+
+def test_full_queue_drops_and_counts_events() -> None:
+    # Arrange
+    stream = BlockingStream()
+    writer = AsyncLogWriter(stream=stream, max_queue=5, batch_size=1, flush_interval_sec=0.01)
+    writer.submit("first", {})
+    while writer.stats().queued:
+        time.sleep(0.001)
+
+    # Act
+    accepted = [writer.submit("e", {"i": i}) for i in range(8)]
+    stream.release.set()
+    writer.flush(timeout_sec=5)
+
+    # Assert
+    assert accepted == [True] * 5 + [False] * 3
+    assert writer.stats().dropped == 3
+    assert len(stream.getvalue().splitlines()) == 6
+    writer.close()
+
+
+def test_unserializable_payload_does_not_stop_the_writer() -> None:
+    # Arrange
+    stream = io.StringIO()
+    writer = AsyncLogWriter(stream=stream)
+    circular: dict = {"type": "bad"}
+    circular["self"] = circular
+
+    # Act
+    writer.submit("bad", circular)
+    writer.submit("good", {"type": "good"})
+    writer.flush(timeout_sec=5)
+
+    # Assert
+    lines = stream.getvalue().splitlines()
+    assert lines[0].startswith("bad ") and "log_error" in lines[0]
+    assert json.loads(lines[1].split(" ", 1)[1]) == {"type": "good"}
+    writer.close()
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from infrastructure.run.asyncio_run_scheduler import AsyncioRunScheduler
+
+
+def test_asyncio_scheduler_runs_coroutine_tasks_on_loop_thread() -> None:
+    scheduler = AsyncioRunScheduler()
+    seen = {}
+
+    async def task() -> None:
+        await asyncio.sleep(0)
+        seen["thread"] = threading.current_thread().name
+
+    try:
+        scheduler.submit("run-1", task)
+        assert scheduler.wait("run-1", timeout_sec=1) is True
+        assert seen["thread"] == "run-scheduler-loop"
+    finally:
+        scheduler.shutdown()
+
+
+def test_asyncio_scheduler_runs_sync_tasks_off_loop_thread() -> None:
+    scheduler = AsyncioRunScheduler()
+    seen = {}
+
+    def task() -> None:
+        seen["thread"] = threading.current_thread().name
+
+    try:
+        scheduler.submit("run-2", task)
+        assert scheduler.wait("run-2", timeout_sec=1) is True
+        assert seen["thread"] != "run-scheduler-loop"
+    finally:
+        scheduler.shutdown()
+
+
+def test_asyncio_scheduler_wait_unknown_run_returns_false() -> None:
+    scheduler = AsyncioRunScheduler()
+    try:
+        assert scheduler.wait("missing", timeout_sec=0.1) is False
+    finally:
+        scheduler.shutdown()
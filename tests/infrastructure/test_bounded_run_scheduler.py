@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from threading import Event
+
+import pytest
+
+from application.ports.run_scheduler import RunQueueFullError
+from infrastructure.run.bounded_run_scheduler import BoundedRunScheduler
+from infrastructure.run.in_memory_run_scheduler import InMemoryRunScheduler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _blocking_task(release: Event, started: list, name: str):
+    def task() -> None:
+        started.append(name)
+        release.wait(timeout=5)
+    return task
+
+
+def test_rejects_when_queue_is_full_with_default_retry_after() -> None:
+    release = Event()
+    started: list = []
+    scheduler = BoundedRunScheduler(
+        InMemoryRunScheduler(max_workers=1), max_active=1, max_queue_depth=1, default_retry_after_sec=7
+    )
+    scheduler.submit("a", _blocking_task(release, started, "a"))
+    scheduler.submit("b", _blocking_task(release, started, "b"))
+
+    with pytest.raises(RunQueueFullError) as exc_info:
+        scheduler.submit("c", _blocking_task(release, started, "c"))
+
+    release.set()
+    assert scheduler.wait("b", timeout_sec=2) is True
+    assert exc_info.value.retry_after_sec == 7
+    assert scheduler.stats().rejected == 1
+    assert scheduler.get_future("c") is None
+
+
+def test_per_key_limit_lets_other_keys_run() -> None:
+    release = Event()
+    started: list = []
+    scheduler = BoundedRunScheduler(InMemoryRunScheduler(max_workers=4), max_active=4, per_key_limit=1)
+
+    scheduler.submit("a1", _blocking_task(release, started, "a1"), concurrency_key="a")
+    scheduler.submit("a2", _blocking_task(release, started, "a2"), concurrency_key="a")
+    scheduler.submit("b1", _blocking_task(release, started, "b1"), concurrency_key="b")
+    stats = scheduler.stats()
+
+    release.set()
+    assert scheduler.wait("a2", timeout_sec=2) is True
+    assert stats.active == 2
+    assert stats.pending == 1
+    assert started.index("b1") < started.index("a2")
+
+
+def test_retry_after_follows_observed_drain_rate() -> None:
+    clock = FakeClock()
+    scheduler = BoundedRunScheduler(InMemoryRunScheduler(max_workers=1), max_active=1, clock=clock)
+    for i in range(4):
+        clock.now = float(i)
+        scheduler.submit(f"r{i}", lambda: None)
+        scheduler.wait(f"r{i}", timeout_sec=1)
+
+    # 4 completions over the last 4 seconds -> about 1 run/sec
+    clock.now = 4.0
+    assert scheduler.retry_after_sec() == 1
+
+
+def test_task_exception_is_propagated_and_slot_released() -> None:
+    scheduler = BoundedRunScheduler(InMemoryRunScheduler(max_workers=1), max_active=1, max_queue_depth=0)
+
+    def boom() -> None:
+        raise RuntimeError("boom")
+
+    future = scheduler.submit("x", boom)
+
+    with pytest.raises(RuntimeError):
+        future.result(timeout=1)
+    scheduler.submit("y", lambda: None).result(timeout=1)
+    assert scheduler.stats().active == 0
+
+
+def test_held_run_lends_its_slot_to_queued_runs() -> None:
+    # Arrange
+    scheduler = BoundedRunScheduler(
+        InMemoryRunScheduler(max_workers=2), max_active=1, max_queue_depth=10, max_held=1
+    )
+    holding = Event()
+    release = Event()
+    ran: list = []
+
+    def scheduled() -> None:
+        with scheduler.slot("scheduled").hold():
+            holding.set()
+            release.wait(timeout=5)
+
+    # Act
+    held_future = scheduler.submit("scheduled", scheduled)
+    assert holding.wait(timeout=1)
+    scheduler.submit("other", lambda: ran.append("other")).result(timeout=1)
+    stats_during_hold = scheduler.stats()
+    release.set()
+    held_future.result(timeout=1)
+
+    # Assert
+    assert ran == ["other"]
+    assert stats_during_hold.held == 1
+    assert stats_during_hold.active == 0
+    assert scheduler.stats().active == 0
+    assert scheduler.stats().held == 0
+
+
+def test_hold_keeps_the_slot_when_no_held_room_is_left() -> None:
+    # Arrange
+    scheduler = BoundedRunScheduler(InMemoryRunScheduler(max_workers=2), max_active=1, max_held=0)
+    stats: list = []
+
+    def scheduled() -> None:
+        with scheduler.slot("scheduled").hold():
+            stats.append(scheduler.stats())
+
+    # Act
+    scheduler.submit("scheduled", scheduled).result(timeout=1)
+
+    # Assert
+    assert stats[0].active == 1
+    assert stats[0].held == 0
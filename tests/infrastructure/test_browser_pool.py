@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from infrastructure.browser.browser_pool import BrowserPool, BrowserPoolTimeout, LaunchedBrowser
+
+
+class FakePage:
+    def __init__(self) -> None:
+        self.thread = ""
+
+    def goto(self, url: str, timeout: Optional[int] = None) -> None:
+        self.thread = threading.current_thread().name
+
+
+class FakeContext:
+    def __init__(self, options: Dict[str, Any]) -> None:
+        self.options = options
+        self.page = FakePage()
+        self.closed = False
+
+    def new_page(self) -> FakePage:
+        return self.page
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self) -> None:
+        self.connected = True
+        self.contexts: List[FakeContext] = []
+        self.stopped = False
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def new_context(self, **options: Any) -> FakeContext:
+        context = FakeContext(options)
+        self.contexts.append(context)
+        return context
+
+
+class FakeLauncher:
+    def __init__(self, rss: Optional[int] = None) -> None:
+        self.browsers: List[FakeBrowser] = []
+        self.rss = rss
+
+    def __call__(self, headless: bool) -> LaunchedBrowser:
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return LaunchedBrowser(browser=browser, stop=lambda: setattr(browser, "stopped", True), rss=lambda: self.rss)
+
+
+def test_runs_reuse_one_warm_browser_with_a_fresh_context_each() -> None:
+    # Arrange
+    launcher = FakeLauncher()
+    pool = BrowserPool(size=2, launcher=launcher)
+
+    # Act
+    first = pool.acquire(locale="ja-JP")
+    first.goto("https://example.com")
+    first.close()
+    second = pool.acquire()
+    second.close()
+
+    # Assert
+    assert len(launcher.browsers) == 1
+    browser = launcher.browsers[0]
+    assert [c.options for c in browser.contexts] == [{"locale": "ja-JP"}, {}]
+    assert all(c.closed for c in browser.contexts)
+    assert browser.contexts[0].page.thread.startswith("browser-")
+    assert pool.stats().contexts == 2
+    pool.close()
+    assert browser.stopped
+
+
+def test_acquire_queues_until_a_browser_is_released_then_times_out() -> None:
+    # Arrange
+    pool = BrowserPool(size=1, launcher=FakeLauncher())
+    held = pool.acquire()
+    released = threading.Timer(0.05, held.close)
+
+    # Act
+    released.start()
+    waited = pool.acquire(timeout_sec=2.0)
+
+    # Assert
+    with pytest.raises(BrowserPoolTimeout):
+        pool.acquire(timeout_sec=0.05)
+    waited.close()
+    assert pool.stats().waiting == 0
+    pool.close()
+
+
+def test_browser_is_recycled_after_max_contexts_or_memory_or_disconnect() -> None:
+    # Arrange
+    launcher = FakeLauncher()
+    pool = BrowserPool(size=1, max_contexts_per_browser=2, max_rss_bytes=1000, launcher=launcher)
+
+    # Act
+    for _ in range(2):
+        pool.acquire().close()
+    launcher.rss = 5000
+    pool.acquire().close()
+    launcher.rss = None
+    client = pool.acquire()
+    launcher.browsers[-1].connected = False
+    client.close()
+    pool.acquire().close()
+
+    # Assert
+    pool.close()
+    assert len(launcher.browsers) == 4
+    assert pool.stats().recycles == 3
+    # retired browsers are stopped on their old threads, shortly after release
+    deadline = time.monotonic() + 2.0
+    while not all(browser.stopped for browser in launcher.browsers) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert all(browser.stopped for browser in launcher.browsers)
+
+
+def test_closed_client_rejects_calls() -> None:
+    pool = BrowserPool(size=1, launcher=FakeLauncher())
+    client = pool.acquire()
+    client.close()
+
+    with pytest.raises(RuntimeError):
+        client.goto("https://example.com")
+    pool.close()
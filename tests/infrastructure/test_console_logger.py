@@ -2,7 +2,13 @@ from __future__ import annotations
 
 import json
 
+import pytest
+
+from application.ports.logger import LogLevelPolicy, lazy
+from infrastructure.logging.composite_logger import CompositeLogger
 from infrastructure.logging.console_logger import ConsoleLogger
+from infrastructure.logging.run_log_logger import RunLogLogger
+from infrastructure.run.in_memory_run_log_store import InMemoryRunLogStore
 
 
 def test_console_logger_emits_type_field(capsys) -> None:
@@ -17,3 +23,64 @@ def test_console_logger_emits_type_field(capsys) -> None:
     payload = json.loads(line.replace("step.start ", "", 1))
     assert payload["type"] == "step.start"
     assert payload["step_id"] == "s1"
+
+
+def test_console_logger_skips_disabled_levels_without_building_lazy_fields(capsys) -> None:
+    # Arrange
+    built: list[str] = []
+    logger = ConsoleLogger(levels=LogLevelPolicy("info")).bind(run_id="r1")
+
+    def payload() -> list[str]:
+        built.append("form")
+        return ["masked"]
+
+    # Act
+    logger.debug("http.form_composed", form=lazy(payload))
+    logger.info("http.trace", form=lazy(payload))
+
+    # Assert
+    lines = capsys.readouterr().out.strip().splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0].split(" ", 1)[1]) == {"run_id": "r1", "form": ["masked"], "type": "http.trace"}
+    assert built == ["form"]
+
+
+def test_event_override_beats_logger_level() -> None:
+    # Arrange
+    policy = LogLevelPolicy.parse("info", "scrape=debug, http.form_composed=warning")
+
+    # Act / Assert
+    assert policy.allows("debug", "scrape.hidden_inputs")
+    assert not policy.allows("debug", "scrape_other")
+    assert not policy.allows("info", "http.form_composed")
+    assert policy.allows("info", "http.trace")
+    assert not policy.allows("debug", None)
+
+
+def test_invalid_level_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        LogLevelPolicy.parse("verbose")
+    with pytest.raises(ValueError):
+        LogLevelPolicy.parse("info", "scrape")
+
+
+def test_composite_logger_resolves_lazy_fields_once_for_enabled_children() -> None:
+    # Arrange
+    store = InMemoryRunLogStore()
+    calls: list[int] = []
+    composite = CompositeLogger(
+        [
+            ConsoleLogger(levels=LogLevelPolicy("info")),
+            RunLogLogger(run_id="r1", log_store=store),
+            RunLogLogger(run_id="r1", log_store=store, levels=LogLevelPolicy("error")),
+        ]
+    )
+
+    # Act
+    composite.debug("scrape.hidden_inputs", keys_preview=lazy(lambda: calls.append(1) or ["a"]))
+
+    # Assert
+    assert calls == [1]
+    assert [entry.fields["keys_preview"] for entry in store.list("r1")] == [["a"]]
+    assert composite.is_enabled("debug", "scrape.hidden_inputs")
+    assert not CompositeLogger([ConsoleLogger(levels=LogLevelPolicy("info"))]).is_enabled("debug")
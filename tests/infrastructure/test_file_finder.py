@@ -30,3 +30,18 @@ def test_file_finder_uses_yaml_when_no_json(tmp_path: Path) -> None:
 
     assert found is not None
     assert found.suffix == ".yaml"
+
+
+def test_file_finder_index_all_applies_priority(tmp_path: Path) -> None:
+    base_dir = tmp_path / "scenarios"
+    (base_dir / "nested").mkdir(parents=True)
+    (base_dir / "sample.yaml").write_text("meta: {}", encoding="utf-8")
+    (base_dir / "nested" / "sample.json").write_text("{}", encoding="utf-8")
+    (base_dir / "other.yml").write_text("meta: {}", encoding="utf-8")
+    (base_dir / "notes.txt").write_text("x", encoding="utf-8")
+
+    index = ScenarioFileFinder(base_dir).index_all()
+
+    assert set(index) == {"sample", "other"}
+    assert index["sample"].suffix == ".json"
+    assert index["sample"] == ScenarioFileFinder(base_dir).find_by_id("sample")
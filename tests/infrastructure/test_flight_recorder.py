@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, List
+
+from application.http_trace import HttpResponseMeta, HttpTrace
+from application.services.execution_deps import ExecutionDeps
+from infrastructure.http.artifact_store import ArtifactStore
+from infrastructure.http.flight_recorder import FlightRecorder
+from infrastructure.http.http_artifact_saver import HttpArtifactSaver
+
+
+class MockLogger:
+    def __init__(self) -> None:
+        self.calls: List[Dict[str, Any]] = []
+
+    def debug(self, event: str, **fields: Any) -> None:
+        self.calls.append({"event": event, **fields})
+
+    def info(self, event: str, **fields: Any) -> None:
+        self.calls.append({"event": event, **fields})
+
+    def error(self, event: str, **fields: Any) -> None:
+        self.calls.append({"event": event, **fields})
+
+    def bind(self, **fields: Any) -> "MockLogger":
+        return self
+
+
+class MockSecretProvider:
+    def get(self) -> Dict[str, Any]:
+        return {}
+
+
+class MockUrlResolver:
+    def resolve_url(self, url: str) -> str:
+        return url
+
+
+def _trace(run_id: str, step_id: str, body: bytes = b"<html>ok</html>") -> HttpTrace:
+    return HttpTrace(
+        run_id=run_id,
+        step_id=step_id,
+        method="GET",
+        url=f"https://example.com/{step_id}",
+        response=HttpResponseMeta(
+            status=200,
+            url=f"https://example.com/{step_id}",
+            headers={},
+            encoding="utf-8",
+            content_type="text/html",
+            history=[],
+            body_len=len(body),
+            body_sha256=hashlib.sha256(body).hexdigest(),
+        ),
+        raw_bytes=body,
+    )
+
+
+def _record(recorder: FlightRecorder, run_id: str, count: int) -> None:
+    for i in range(count):
+        recorder.record(_trace(run_id, f"s{i}", f"<html>{i}</html>".encode()))
+
+
+def test_successful_run_writes_nothing_and_releases_its_ring(tmp_path: Path) -> None:
+    # Arrange
+    store = ArtifactStore(tmp_path)
+    recorder = FlightRecorder(store, max_traces=5)
+    saver = HttpArtifactSaver(store=store, recorder=recorder)
+    deps = ExecutionDeps(secret_provider=MockSecretProvider(), url_resolver=MockUrlResolver(), logger=MockLogger())
+    for i in range(3):
+        saver.enrich_and_log(_trace("run1", f"s{i}"), deps)
+
+    # Act
+    written = recorder.finish("run1", failed=False)
+
+    # Assert
+    assert written == 0
+    assert recorder.buffered("run1") == 0
+    assert list((tmp_path / "runs").iterdir()) == []
+    assert list((tmp_path / "blobs").rglob("*.gz")) == []
+
+
+def test_failed_run_writes_its_last_traces_in_order(tmp_path: Path) -> None:
+    # Arrange
+    store = ArtifactStore(tmp_path)
+    recorder = FlightRecorder(store, max_traces=3)
+    logger = MockLogger()
+    _record(recorder, "run1", 5)
+
+    # Act
+    written = recorder.finish("run1", failed=True, logger=logger)
+
+    # Assert
+    assert written == 3
+    assert [entry["step_id"] for entry in store.manifest("run1")] == ["s2", "s3", "s4"]
+    assert store.read_blob(store.manifest("run1")[-1]["body_sha256"]) == b"<html>4</html>"
+    assert logger.calls[-1]["reason"] == "failed"
+    assert logger.calls[-1]["dropped"] == 2
+
+
+def test_ring_is_bounded_by_bytes_per_run(tmp_path: Path) -> None:
+    # Arrange
+    recorder = FlightRecorder(ArtifactStore(tmp_path), max_traces=100, max_bytes=2500)
+
+    # Act
+    for i in range(10):
+        recorder.record(_trace("run1", f"s{i}", b"x" * 1000))
+    recorder.record(_trace("run2", "s0", b"y" * 1000))
+
+    # Assert
+    # each trace holds 1000 raw bytes; full_text is empty here
+    assert recorder.buffered("run1") == 2
+    assert recorder.buffered("run2") == 1
+
+
+def test_sampled_successful_run_is_written(tmp_path: Path) -> None:
+    # Arrange
+    store = ArtifactStore(tmp_path)
+    recorder = FlightRecorder(store, sample_rate=0.1, sampler=lambda: 0.05)
+    logger = MockLogger()
+    _record(recorder, "run1", 2)
+
+    # Act
+    written = recorder.finish("run1", failed=False, logger=logger)
+
+    # Assert
+    assert written == 2
+    assert logger.calls[-1]["reason"] == "sampled"
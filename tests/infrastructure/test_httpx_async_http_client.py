@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from infrastructure.http.httpx_async_http_client import HttpxAsyncHttpClient
+
+
+def test_httpx_client_preserves_duplicate_form_keys_and_cookies() -> None:
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["body"] = request.content.decode()
+        seen["content_type"] = request.headers.get("content-type")
+        return httpx.Response(
+            200,
+            headers=[("Content-Type", "text/html"), ("Set-Cookie", "sid=abc; Path=/")],
+            content=b"<html>ok</html>",
+        )
+
+    async def run():
+        client = HttpxAsyncHttpClient(transport=httpx.MockTransport(handler))
+        try:
+            resp = await client.request(
+                "post",
+                "https://example.com/form",
+                form_list=[("date", "d1"), ("date", "d2")],
+            )
+            return resp, client.snapshot_cookies()
+        finally:
+            await client.aclose()
+
+    resp, cookies = asyncio.run(run())
+
+    assert seen["body"] == "date=d1&date=d2"
+    assert seen["content_type"] == "application/x-www-form-urlencoded"
+    assert resp.status == 200
+    assert resp.headers["Content-Type"] == "text/html"
+    assert resp.content == b"<html>ok</html>"
+    assert [c["name"] for c in cookies] == ["sid"]
+
+
+def test_httpx_client_records_redirect_history() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/start":
+            return httpx.Response(302, headers={"Location": "/done"})
+        return httpx.Response(200, content=b"done")
+
+    async def run():
+        client = HttpxAsyncHttpClient(transport=httpx.MockTransport(handler))
+        try:
+            return await client.request("GET", "https://example.com/start")
+        finally:
+            await client.aclose()
+
+    resp = asyncio.run(run())
+
+    assert resp.status == 200
+    assert resp.url == "https://example.com/done"
+    assert resp.history[0].status == 302
+    assert resp.history[0].location == "/done"
+
+
+def test_httpx_connection_pool_shares_transport_but_not_cookies() -> None:
+    from infrastructure.http.httpx_async_http_client import HttpxConnectionPool
+
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        headers = {"Set-Cookie": "sid=abc; Path=/"} if request.url.path == "/login" else {}
+        return httpx.Response(200, headers=headers, content=b"ok")
+
+    pool = HttpxConnectionPool()
+    pool._transport = httpx.MockTransport(handler)
+
+    async def run():
+        run_a = HttpxAsyncHttpClient(pool=pool)
+        run_b = HttpxAsyncHttpClient(pool=pool)
+        await run_a.request("GET", "https://example.com/login")
+        await run_a.aclose()
+        # Closing one run must not close the shared transport.
+        await run_b.request("GET", "https://example.com/other")
+        cookies_b = run_b.snapshot_cookies()
+        await run_b.aclose()
+        return cookies_b
+
+    cookies_b = asyncio.run(run())
+
+    assert calls == ["/login", "/other"]
+    assert cookies_b == []
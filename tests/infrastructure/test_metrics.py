@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import pytest
+
+from infrastructure.metrics import Counter, Gauge, Histogram, MetricsRegistry, ForwardingMetrics, WebPostMetrics
+from infrastructure.run.in_memory_run_log_store import InMemoryRunLogStore
+from infrastructure.run.in_memory_run_repository import InMemoryRunRepository
+from infrastructure.run.run_event_forwarding import RunEventApplier
+
+
+def test_histogram_renders_cumulative_buckets_sum_and_count():
+    registry = MetricsRegistry()
+    histogram = registry.register(Histogram("req_seconds", "Request time", ("host",), buckets=(0.1, 1.0)))
+
+    histogram.observe(0.05, "a.example")
+    histogram.observe(0.5, "a.example")
+    histogram.observe(3.0, "a.example")
+
+    text = registry.render()
+    assert "# TYPE req_seconds histogram" in text
+    assert 'req_seconds_bucket{host="a.example",le="0.1"} 1' in text
+    assert 'req_seconds_bucket{host="a.example",le="1"} 2' in text
+    assert 'req_seconds_bucket{host="a.example",le="+Inf"} 3' in text
+    assert 'req_seconds_sum{host="a.example"} 3.55' in text
+    assert 'req_seconds_count{host="a.example"} 3' in text
+
+
+def test_counter_and_gauges_render_with_escaped_labels():
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("runs_total", "Runs", ("scenario",)))
+    gauge = registry.register(Gauge("browsers", "Browsers"))
+    depth = registry.register(Gauge("queue_depth", "Queue", function=lambda: 7))
+
+    counter.inc('say "hi"')
+    gauge.inc()
+    gauge.inc(amount=-1)
+    gauge.inc()
+
+    text = registry.render()
+    assert 'runs_total{scenario="say \\"hi\\""} 1' in text
+    assert "browsers 1" in text
+    assert "queue_depth 7" in text
+    assert depth.value() == 7
+
+
+def test_log_writer_drops_are_exposed_as_a_counter():
+    metrics = WebPostMetrics()
+    dropped = [0]
+    metrics.bind_log_writer(depth=lambda: 2, dropped=lambda: dropped[0])
+
+    dropped[0] = 5
+    text = metrics.render()
+
+    assert "# TYPE webpost_log_events_dropped_total counter" in text
+    assert "webpost_log_events_dropped_total 5" in text
+    assert "webpost_log_queue_depth 2" in text
+
+
+def test_labels_must_match_declaration():
+    histogram = Histogram("h", "h", ("a", "b"))
+
+    with pytest.raises(ValueError):
+        histogram.observe(1.0, "only-one")
+
+
+def test_duplicate_registration_is_rejected():
+    registry = MetricsRegistry()
+    registry.register(Counter("c", "c"))
+
+    with pytest.raises(ValueError):
+        registry.register(Counter("c", "c"))
+
+
+def test_run_metrics_are_labelled_by_scenario():
+    metrics = WebPostMetrics()
+    run = metrics.for_run("shop")
+
+    run.observe_step("HttpStep", True, 0.2)
+    run.observe_http("shop.example", 200, 0.1)
+    metrics.observe_run("shop", "succeeded", 1.5)
+
+    assert metrics.step_duration.count("shop", "HttpStep", "true") == 1
+    assert metrics.http_duration.count("shop.example", "200") == 1
+    assert metrics.runs.value("shop", "succeeded") == 1
+
+
+def test_worker_metrics_are_forwarded_and_applied():
+    events = []
+    worker = ForwardingMetrics(events.append)
+    api = WebPostMetrics()
+    applier = RunEventApplier(InMemoryRunRepository(), InMemoryRunLogStore(), metrics=api)
+
+    worker.for_run("shop").observe_step("LogStep", False, 0.01)
+    worker.browser_opened()
+    for event in events:
+        applier(event)
+
+    assert worker.step_duration.count("shop", "LogStep", "false") == 0
+    assert api.step_duration.count("shop", "LogStep", "false") == 1
+    assert api.browser_instances.value() == 1
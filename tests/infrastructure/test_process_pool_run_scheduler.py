@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import os
+from datetime import datetime, timezone
+from functools import partial
+
+import pytest
+
+from domain.run_log import RunLogEntry
+from infrastructure.run.process_pool_run_scheduler import ProcessPoolRunScheduler, WorkerRunError
+
+# Worker-side state (set by _init in each spawned worker)
+_SINK = None
+
+
+def _init(sink, tag: str) -> None:
+    global _SINK
+    _SINK = sink
+    os.environ["TEST_WORKER_TAG"] = tag
+
+
+def _emit_logs(run_id: str, count: int) -> None:
+    for i in range(count):
+        entry = RunLogEntry(
+            timestamp=datetime.now(timezone.utc),
+            event=f"e{i}",
+            fields={"pid": os.getpid(), "tag": os.environ.get("TEST_WORKER_TAG")},
+        )
+        _SINK(("log", run_id, entry))
+
+
+def _fail() -> None:
+    raise ValueError("boom in worker")
+
+
+@pytest.fixture
+def scheduler_and_events():
+    events: list = []
+    scheduler = ProcessPoolRunScheduler(
+        max_workers=2,
+        event_handler=events.append,
+        worker_initializer=_init,
+        initargs=("t1",),
+    )
+    yield scheduler, events
+    scheduler.shutdown()
+
+
+def test_run_events_are_applied_before_future_resolves(scheduler_and_events) -> None:
+    scheduler, events = scheduler_and_events
+
+    scheduler.submit("r1", partial(_emit_logs, "r1", 3))
+
+    assert scheduler.wait("r1", timeout_sec=30) is True
+    assert [e[2].event for e in events] == ["e0", "e1", "e2"]
+    assert events[0][2].fields["pid"] != os.getpid()
+    assert events[0][2].fields["tag"] == "t1"
+
+
+def test_worker_exception_fails_the_future(scheduler_and_events) -> None:
+    scheduler, _events = scheduler_and_events
+
+    future = scheduler.submit("r2", _fail)
+
+    with pytest.raises(WorkerRunError, match="boom in worker"):
+        future.result(timeout=30)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import List
+
+import pytest
+
+from application.ports.http_client import HttpResponse
+from domain.scenario import HttpRateLimit
+from infrastructure.http.rate_limited_http_client import RateLimitedAsyncHttpClient, RateLimitedHttpClient
+from infrastructure.http.rate_limiter import InMemoryRateLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RecordingClient:
+    def __init__(self) -> None:
+        self.urls: List[str] = []
+
+    def request(self, method, url, headers=None, form_list=None, allow_redirects=None):
+        self.urls.append(url)
+        return HttpResponse(status=200, url=url, text="ok", headers={})
+
+    def snapshot_cookies(self):
+        return [{"name": "sid"}]
+
+
+class RecordingAsyncClient(RecordingClient):
+    async def request(self, method, url, headers=None, form_list=None, allow_redirects=None):
+        return RecordingClient.request(self, method, url)
+
+    async def aclose(self):
+        return None
+
+
+def test_burst_is_free_then_requests_queue_in_arrival_order():
+    clock = FakeClock()
+    limiter = InMemoryRateLimiter(clock=clock)
+    limit = HttpRateLimit(rate_per_sec=2, burst=2)
+
+    waits = [limiter.reserve("shop.example", limit) for _ in range(4)]
+
+    assert waits == [0.0, 0.0, pytest.approx(0.5), pytest.approx(1.0)]
+
+
+def test_tokens_refill_at_rate():
+    clock = FakeClock()
+    limiter = InMemoryRateLimiter(clock=clock)
+    limit = HttpRateLimit(rate_per_sec=2, burst=1)
+    limiter.reserve("shop.example", limit)
+
+    clock.now += 0.5
+
+    assert limiter.reserve("shop.example", limit) == 0.0
+
+
+def test_hosts_have_separate_buckets():
+    limiter = InMemoryRateLimiter(clock=FakeClock())
+    limit = HttpRateLimit(rate_per_sec=1, burst=1)
+    limiter.reserve("a.example", limit)
+
+    assert limiter.reserve("b.example", limit) == 0.0
+    assert limiter.reserve("a.example", limit) == pytest.approx(1.0)
+
+
+def test_full_buckets_are_dropped_when_too_many_hosts():
+    clock = FakeClock()
+    limiter = InMemoryRateLimiter(clock=clock, max_keys=2)
+    limit = HttpRateLimit(rate_per_sec=1, burst=1)
+    limiter.reserve("a.example", limit)
+    limiter.reserve("b.example", limit)
+    clock.now += 5
+
+    limiter.reserve("c.example", limit)
+
+    assert set(limiter._buckets) == {"c.example"}
+
+
+def test_rate_limited_client_sleeps_and_reports_wait():
+    slept: List[float] = []
+    inner = RecordingClient()
+    limiter = InMemoryRateLimiter(clock=FakeClock())
+    client = RateLimitedHttpClient(inner, limiter, HttpRateLimit(rate_per_sec=4, burst=1), sleep=slept.append)
+
+    first = client.request("GET", "https://shop.example/a")
+    second = client.request("GET", "https://shop.example/b")
+
+    assert slept == [pytest.approx(0.25)]
+    assert first.rate_limit_wait_sec == 0.0
+    assert second.rate_limit_wait_sec == pytest.approx(0.25)
+    assert inner.urls == ["https://shop.example/a", "https://shop.example/b"]
+    assert client.snapshot_cookies() == [{"name": "sid"}]
+
+
+def test_async_rate_limited_client_paces_concurrent_runs():
+    limiter = InMemoryRateLimiter()
+    limit = HttpRateLimit(rate_per_sec=20, burst=1)
+    clients = [RateLimitedAsyncHttpClient(RecordingAsyncClient(), limiter, limit) for _ in range(3)]
+
+    async def run_all():
+        return await asyncio.gather(*(c.request("GET", "https://shop.example/") for c in clients))
+
+    responses = asyncio.run(run_all())
+
+    waits = sorted(r.rate_limit_wait_sec for r in responses)
+    assert waits[0] == 0.0
+    assert waits[1] == pytest.approx(0.05, abs=0.01)
+    assert waits[2] == pytest.approx(0.10, abs=0.01)
+
+
+def test_async_rate_limited_client_reserves_off_the_event_loop_thread():
+    class RecordingLimiter:
+        def __init__(self) -> None:
+            self.threads: List[int] = []
+
+        def reserve(self, key, limit):
+            self.threads.append(threading.get_ident())
+            return 0.0
+
+    limiter = RecordingLimiter()
+    client = RateLimitedAsyncHttpClient(RecordingAsyncClient(), limiter, HttpRateLimit(rate_per_sec=20, burst=1))
+
+    async def run():
+        await client.request("GET", "https://shop.example/")
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+
+    assert len(limiter.threads) == 1
+    assert limiter.threads[0] != loop_thread
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from datetime import datetime, timezone
+
+from domain.ids import IdempotencyKey
+from domain.run_log import RunLogEntry
+from domain.run_record import RunRecord, RunStatus
+from infrastructure.idempotency.in_memory_idempotency_store import InMemoryIdempotencyStore
+from infrastructure.retention import RetentionPolicy, RetentionReaper
+from infrastructure.run.future_registry import FutureRegistry
+from infrastructure.run.in_memory_run_log_store import InMemoryRunLogStore
+from infrastructure.run.in_memory_run_repository import InMemoryRunRepository
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _record(run_id: str, status: RunStatus = RunStatus.QUEUED) -> RunRecord:
+    now = datetime.now(timezone.utc)
+    return RunRecord(run_id, "1", status, now, now, None, None, None)
+
+
+def _entry() -> RunLogEntry:
+    return RunLogEntry(timestamp=datetime.now(timezone.utc), event="e", fields={})
+
+
+def test_idempotency_store_caps_keys_and_expires_by_ttl() -> None:
+    clock = FakeClock()
+    store = InMemoryIdempotencyStore(policy=RetentionPolicy(ttl_sec=10, max_entries=2), clock=clock)
+    for i, value in enumerate(["k1", "k2", "k3"]):
+        clock.now = float(i)
+        store.register(IdempotencyKey(value))
+
+    clock.now = 11.5
+    evicted = store.prune()
+    stats = store.retention_stats()
+
+    assert "k1" not in store._keys
+    assert evicted == ["k2"]
+    assert list(store._keys) == ["k3"]
+    assert (stats.size, stats.evicted_lru, stats.evicted_ttl) == (1, 1, 1)
+    assert store.register(IdempotencyKey("k1")) is True
+
+
+def test_repository_never_evicts_active_runs() -> None:
+    clock = FakeClock()
+    repo = InMemoryRunRepository(policy=RetentionPolicy(ttl_sec=10, max_entries=1), clock=clock)
+    repo.create(_record("running", RunStatus.RUNNING))
+    repo.create(_record("done-1", RunStatus.SUCCEEDED))
+    repo.create(_record("done-2", RunStatus.FAILED))
+
+    clock.now = 1.0
+    lru_evicted = repo.prune()
+    clock.now = 100.0
+    ttl_evicted = repo.prune()
+
+    assert lru_evicted == ["done-1", "done-2"]
+    assert ttl_evicted == []
+    assert repo.get("running") is not None
+
+
+def test_reaper_cascades_run_eviction_to_logs() -> None:
+    clock = FakeClock()
+    repo = InMemoryRunRepository(policy=RetentionPolicy(ttl_sec=10), clock=clock)
+    logs = InMemoryRunLogStore(clock=clock)
+    repo.create(_record("old", RunStatus.SUCCEEDED))
+    logs.append("old", _entry())
+    clock.now = 20.0
+    repo.create(_record("new", RunStatus.SUCCEEDED))
+    logs.append("new", _entry())
+    reaper = RetentionReaper().register(repo).register(logs).link(repo, logs)
+
+    evicted = reaper.run_once()
+
+    assert evicted == 1
+    assert repo.get("old") is None
+    assert logs.list("old") == []
+    assert len(logs.list("new")) == 1
+    assert [s.name for s in reaper.stats()] == ["run_records", "run_logs"]
+
+
+def test_future_registry_releases_completed_futures() -> None:
+    registry = FutureRegistry(keep_finished=1)
+    first, second = Future(), Future()
+    registry.add("a", first)
+    registry.add("b", second)
+
+    first.set_result(None)
+    second.set_result(None)
+
+    assert registry.active_count() == 0
+    assert registry.finished_count() == 1
+    assert registry.get("a") is None
+    assert registry.get("b") is second
+
+
+def test_run_log_store_caps_least_recently_used_runs_across_shards() -> None:
+    clock = FakeClock()
+    logs = InMemoryRunLogStore(policy=RetentionPolicy(max_entries=2), clock=clock, shards=4)
+    for i, run_id in enumerate(["a", "b", "c", "d"]):
+        clock.now = float(i)
+        logs.append(run_id, _entry())
+    clock.now = 10.0
+    logs.list("a")
+
+    evicted = logs.prune()
+
+    assert sorted(evicted) == ["b", "c"]
+    assert len(logs.list("a")) == 1
+    assert len(logs.list("d")) == 1
+    assert logs.retention_stats().evicted_lru == 2
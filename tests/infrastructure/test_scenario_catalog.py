@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from infrastructure.scenario.scenario_catalog import ScenarioCatalog
+
+SCENARIO_YAML = """
+meta:
+  id: 1
+  name: {name}
+steps:
+  - id: log
+    type: log
+    message: hello
+"""
+
+
+def _write(path: Path, name: str) -> None:
+    path.write_text(SCENARIO_YAML.format(name=name), encoding="utf-8")
+
+
+def test_catalog_returns_cached_scenario_on_second_lookup(tmp_path: Path) -> None:
+    _write(tmp_path / "sample.yaml", "first")
+    catalog = ScenarioCatalog(tmp_path)
+
+    first = catalog.get("sample")
+    second = catalog.get("sample")
+
+    assert first is second
+    assert first.meta.name == "first"
+    stats = catalog.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.rescans == 1
+
+
+def test_catalog_reloads_when_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "sample.yaml"
+    _write(path, "first")
+    catalog = ScenarioCatalog(tmp_path)
+    catalog.get("sample")
+
+    _write(path, "second-version")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded = catalog.get("sample")
+
+    assert reloaded.meta.name == "second-version"
+    assert catalog.stats().reloads == 1
+
+
+def test_catalog_picks_up_new_files_and_reports_unknown_ids(tmp_path: Path) -> None:
+    now = [0.0]
+    catalog = ScenarioCatalog(tmp_path, rescan_interval_sec=2.0, clock=lambda: now[0])
+    assert catalog.get("later") is None
+
+    _write(tmp_path / "later.yaml", "later")
+    now[0] += 2.0
+
+    assert catalog.get("later").meta.name == "later"
+
+
+def test_catalog_rescans_for_unknown_ids_at_most_once_per_interval(tmp_path: Path) -> None:
+    now = [0.0]
+    catalog = ScenarioCatalog(tmp_path, rescan_interval_sec=2.0, clock=lambda: now[0])
+
+    for i in range(50):
+        assert catalog.get(f"missing-{i}") is None
+    now[0] += 2.0
+    catalog.get("missing-again")
+
+    assert catalog.stats().rescans == 2
+    assert catalog.stats().misses == 51
+
+
+def test_catalog_handles_deleted_file(tmp_path: Path) -> None:
+    path = tmp_path / "sample.yaml"
+    _write(path, "first")
+    catalog = ScenarioCatalog(tmp_path)
+    catalog.get("sample")
+
+    path.unlink()
+
+    assert catalog.get("sample") is None
+
+
+def test_catalog_preload_compiles_every_scenario(tmp_path: Path) -> None:
+    _write(tmp_path / "one.yaml", "one")
+    _write(tmp_path / "two.yaml", "two")
+    (tmp_path / "broken.yaml").write_text("meta: [", encoding="utf-8")
+    catalog = ScenarioCatalog(tmp_path)
+
+    loaded = catalog.preload()
+    catalog.get("one")
+
+    assert loaded == 2
+    assert catalog.stats().size == 2
+    assert catalog.stats().hits == 1
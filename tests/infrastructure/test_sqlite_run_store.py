@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from domain.exceptions import RunStateError
+from domain.run_log import RunLogEntry
+from domain.run_record import RunRecord, RunStatus
+from infrastructure.run.sqlite_run_log_store import SqliteRunLogStore
+from infrastructure.run.sqlite_run_repository import SqliteRunRepository
+
+
+def _record(run_id: str = "run-1") -> RunRecord:
+    now = datetime.now(timezone.utc)
+    return RunRecord(
+        run_id=run_id,
+        scenario_id="1",
+        status=RunStatus.QUEUED,
+        created_at=now,
+        updated_at=now,
+        result=None,
+        error=None,
+        error_detail=None,
+    )
+
+
+def _entry(event: str, **fields) -> RunLogEntry:
+    return RunLogEntry(timestamp=datetime.now(timezone.utc), event=event, fields=fields)
+
+
+def test_repository_persists_runs_across_instances(tmp_path: Path) -> None:
+    db = tmp_path / "runs.sqlite3"
+    repo = SqliteRunRepository(db)
+    repo.create(_record())
+    repo.transition_status("run-1", RunStatus.QUEUED, RunStatus.RUNNING)
+    repo.transition_status(
+        "run-1",
+        RunStatus.RUNNING,
+        RunStatus.FAILED,
+        result={"n": 1},
+        error="boom",
+        error_detail={"step_id": "s1"},
+    )
+    repo.close()
+
+    reopened = SqliteRunRepository(db)
+    record = reopened.get("run-1")
+
+    assert record is not None
+    assert record.status == RunStatus.FAILED
+    assert record.result == {"n": 1}
+    assert record.error == "boom"
+    assert record.error_detail == {"step_id": "s1"}
+    assert record.created_at.tzinfo is not None
+
+
+def test_repository_rejects_duplicate_and_invalid_transition(tmp_path: Path) -> None:
+    repo = SqliteRunRepository(tmp_path / "runs.sqlite3")
+    repo.create(_record())
+
+    with pytest.raises(RunStateError, match="already exists"):
+        repo.create(_record())
+    with pytest.raises(RunStateError, match="Invalid run transition"):
+        repo.transition_status("run-1", RunStatus.RUNNING, RunStatus.SUCCEEDED)
+    with pytest.raises(RunStateError, match="not found"):
+        repo.update_result("missing", {})
+
+
+def test_repository_transition_keeps_existing_result_when_none(tmp_path: Path) -> None:
+    repo = SqliteRunRepository(tmp_path / "runs.sqlite3")
+    repo.create(_record())
+    repo.update_result("run-1", {"kept": True})
+
+    record = repo.transition_status("run-1", RunStatus.QUEUED, RunStatus.RUNNING)
+
+    assert record.result == {"kept": True}
+
+
+def test_repository_delete_forgets_the_run(tmp_path: Path) -> None:
+    repo = SqliteRunRepository(tmp_path / "runs.sqlite3")
+    repo.create(_record())
+
+    repo.delete("run-1")
+    repo.delete("missing")
+
+    assert repo.get("run-1") is None
+    repo.create(_record())
+
+
+def test_repository_uses_wal_and_indexes(tmp_path: Path) -> None:
+    repo = SqliteRunRepository(tmp_path / "runs.sqlite3")
+
+    mode = repo._conn.execute("PRAGMA journal_mode").fetchone()[0]
+    indexes = {row[1] for row in repo._conn.execute("PRAGMA index_list(runs)")}
+
+    assert mode == "wal"
+    assert {"ix_runs_scenario_id", "ix_runs_status", "ix_runs_created_at"} <= indexes
+
+
+def test_log_store_buffers_until_batch_size(tmp_path: Path) -> None:
+    store = SqliteRunLogStore(tmp_path / "runs.sqlite3", batch_size=3, flush_interval_sec=60)
+
+    store.append("run-1", _entry("a"))
+    store.append("run-1", _entry("b"))
+    written = store._conn.execute("SELECT COUNT(*) FROM run_logs").fetchone()[0]
+    store.append("run-1", _entry("c"))
+    written_after_batch = store._conn.execute("SELECT COUNT(*) FROM run_logs").fetchone()[0]
+
+    assert written == 0
+    assert written_after_batch == 3
+
+
+def test_log_store_list_sees_pending_entries_in_order(tmp_path: Path) -> None:
+    store = SqliteRunLogStore(tmp_path / "runs.sqlite3", batch_size=100, flush_interval_sec=60)
+    store.append("run-1", _entry("step.start", step_id="s1"))
+    store.append("run-2", _entry("other"))
+    store.append("run-1", _entry("step.end", step_id="s1", ok=True))
+
+    entries = store.list("run-1")
+
+    assert [e.event for e in entries] == ["step.start", "step.end"]
+    assert entries[1].fields == {"step_id": "s1", "ok": True}
+
+
+def test_log_store_close_flushes_pending_entries(tmp_path: Path) -> None:
+    db = tmp_path / "runs.sqlite3"
+    store = SqliteRunLogStore(db, batch_size=100, flush_interval_sec=60)
+    store.append("run-1", _entry("run.end", obj=object.__name__))
+    store.close()
+
+    assert [e.event for e in SqliteRunLogStore(db).list("run-1")] == ["run.end"]
+
+
+class FlakyConnection:
+    """Fails the next `failures` INSERT batches like a locked database, then behaves."""
+
+    def __init__(self, conn: sqlite3.Connection, failures: int) -> None:
+        self._conn = conn
+        self.failures = failures
+
+    def executemany(self, sql: str, rows):
+        if self.failures > 0:
+            self.failures -= 1
+            raise sqlite3.OperationalError("database is locked")
+        return self._conn.executemany(sql, rows)
+
+    def __getattr__(self, name: str):
+        return getattr(self._conn, name)
+
+
+def test_log_store_append_survives_a_failed_write_and_retries_the_batch(tmp_path: Path, caplog) -> None:
+    # Arrange
+    store = SqliteRunLogStore(tmp_path / "runs.sqlite3", batch_size=2, flush_interval_sec=0)
+    store._conn = FlakyConnection(store._conn, failures=1)
+
+    # Act
+    store.append("run-1", _entry("a"))
+    store.append("run-1", _entry("b"))
+    store.append("run-1", _entry("c"))
+
+    # Assert
+    assert "keeping them for retry" in caplog.text
+    assert [e.event for e in store.list("run-1")] == ["a", "b", "c"]
+
+
+def test_log_store_list_serves_committed_entries_when_the_flush_fails(tmp_path: Path, caplog) -> None:
+    # Arrange
+    store = SqliteRunLogStore(tmp_path / "runs.sqlite3", batch_size=100, flush_interval_sec=60)
+    store.append("run-1", _entry("a"))
+    store.flush()
+    store.append("run-1", _entry("b"))
+    store._conn = FlakyConnection(store._conn, failures=1)
+
+    # Act
+    first = store.list("run-1")
+    second = store.list("run-1")
+
+    # Assert
+    assert [e.event for e in first] == ["a"]
+    assert "keeping them for retry" in caplog.text
+    assert [e.event for e in second] == ["a", "b"]
+
+
+def test_log_store_list_since_skips_entries_already_read(tmp_path: Path) -> None:
+    store = SqliteRunLogStore(tmp_path / "runs.sqlite3")
+    for event in ("a", "b", "c"):
+        store.append("run-1", _entry(event))
+
+    assert [e.event for e in store.list("run-1", since=2)] == ["c"]
+    assert store.list("run-1", since=5) == []
+
+
+def test_repository_stores_phases(tmp_path: Path) -> None:
+    repo = SqliteRunRepository(tmp_path / "runs.sqlite3")
+    repo.create(_record())
+
+    repo.update_phases("run-1", {"http": {"count": 1, "total_ms": 12.5, "max_ms": 12.5}})
+
+    assert repo.get("run-1").phases == {"http": {"count": 1, "total_ms": 12.5, "max_ms": 12.5}}
+
+
+def test_repository_adds_phases_column_to_older_files(tmp_path: Path) -> None:
+    db = tmp_path / "runs.sqlite3"
+    conn = sqlite3.connect(db)
+    conn.execute(
+        "CREATE TABLE runs (run_id TEXT PRIMARY KEY, scenario_id TEXT NOT NULL, status TEXT NOT NULL,"
+        " created_at TEXT NOT NULL, updated_at TEXT NOT NULL, result TEXT, error TEXT, error_detail TEXT)"
+    )
+    conn.commit()
+    conn.close()
+
+    repo = SqliteRunRepository(db)
+    repo.create(_record())
+
+    assert repo.get("run-1").phases is None
@@ -2,6 +2,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
+from domain.scenario import HttpRateLimit
+from infrastructure.scenario.base_loader import ScenarioLoadError
 from infrastructure.scenario.file_finder import ScenarioFileFinder
 from infrastructure.scenario.yaml_loader import YamlScenarioLoader
 from domain.steps.http import HttpStep
@@ -110,3 +114,102 @@ steps:
     assert scenario.steps[2].source == "last.text"
     assert isinstance(scenario.steps[3], LogStep)
     assert isinstance(scenario.steps[4], BrowserStep)
+
+
+def test_yaml_loader_parses_http_rate_limit(tmp_path: Path) -> None:
+    scenario_path = tmp_path / "scenario.yaml"
+    scenario_path.write_text(
+        """
+meta:
+  id: 1
+  name: paced
+  version: 1
+defaults:
+  http:
+    base_url: https://example.com
+    rate_limit:
+      rate_per_sec: 2.5
+      burst: 4
+steps:
+  - id: done
+    type: result
+    fields:
+      status: ok
+""".lstrip(),
+        encoding="utf-8",
+    )
+
+    scenario = YamlScenarioLoader().load_from_file(str(scenario_path))
+
+    assert scenario.defaults.http.rate_limit == HttpRateLimit(rate_per_sec=2.5, burst=4)
+
+
+def test_yaml_loader_rejects_invalid_rate_limit(tmp_path: Path) -> None:
+    scenario_path = tmp_path / "scenario.yaml"
+    scenario_path.write_text(
+        """
+meta:
+  id: 1
+  name: paced
+  version: 1
+defaults:
+  http:
+    rate_limit:
+      rate_per_sec: 0
+steps: []
+""".lstrip(),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ScenarioLoadError):
+        YamlScenarioLoader().load_from_file(str(scenario_path))
+
+
+def test_yaml_loader_parses_http_body_limits(tmp_path: Path) -> None:
+    scenario_path = tmp_path / "scenario.yaml"
+    scenario_path.write_text(
+        """
+meta:
+  id: 1
+  name: download
+  version: 1
+steps:
+  - id: report
+    type: http
+    max_body_bytes: 1048576
+    save_to_file: "tmp/downloads/${vars.run}.pdf"
+    request:
+      method: GET
+      url: https://example.com/report.pdf
+""".lstrip(),
+        encoding="utf-8",
+    )
+
+    step = YamlScenarioLoader().load_from_file(str(scenario_path)).steps[0]
+
+    assert step.max_body_bytes == 1048576
+    assert step.save_to_file == "tmp/downloads/${vars.run}.pdf"
+
+
+@pytest.mark.parametrize("value", [0, -1, "1MB", True])
+def test_yaml_loader_rejects_invalid_max_body_bytes(tmp_path: Path, value) -> None:
+    scenario_path = tmp_path / "scenario.yaml"
+    scenario_path.write_text(
+        f"""
+meta:
+  id: 1
+  name: download
+  version: 1
+steps:
+  - id: report
+    type: http
+    max_body_bytes: {value!r}
+    request:
+      method: GET
+      url: https://example.com/report.pdf
+""".lstrip(),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ScenarioLoadError):
+        YamlScenarioLoader().load_from_file(str(scenario_path))